@@ -3,6 +3,7 @@ API Serializers
 Django REST Framework serializers for request/response validation
 """
 from rest_framework import serializers
+from config.constants import DatabaseConstants
 from chat_bot_api.domain.enums import ActionTypeEnum
 
 
@@ -15,8 +16,13 @@ class ConversationRequestSerializer(serializers.Serializer):
         help_text="Action type to perform"
     )
     documenturl = serializers.URLField(
-        required=True,
-        help_text="URL of the PDF document"
+        required=False,
+        help_text="URL of the PDF document (or use document_id)"
+    )
+    document_id = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        help_text="Id of a document uploaded through /documents/upload/"
     )
     question = serializers.CharField(
         required=False,
@@ -33,6 +39,12 @@ class ConversationRequestSerializer(serializers.Serializer):
         min_value=1,
         help_text="Maximum page number to process"
     )
+    session_id = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        max_length=255,
+        help_text="Chat session id; follow-up questions in a session reuse its document context"
+    )
 
     def validate(self, data):
         """
@@ -67,12 +79,17 @@ class ConversationRequestSerializer(serializers.Serializer):
                     'max_page': 'Maximum page must be greater than or equal to minimum page'
                 })
 
-        # Validate PDF URL
+        # Validate document reference
         documenturl = data.get('documenturl', '')
-        if not documenturl.lower().endswith('.pdf'):
-            raise serializers.ValidationError({
-                'documenturl': 'URL must point to a PDF file'
-            })
+        if data.get('document_id') is None:
+            if not documenturl:
+                raise serializers.ValidationError({
+                    'documenturl': 'Either documenturl or document_id is required'
+                })
+            if not documenturl.lower().endswith('.pdf'):
+                raise serializers.ValidationError({
+                    'documenturl': 'URL must point to a PDF file'
+                })
 
         return data
 
@@ -92,6 +109,29 @@ class OptionsRequestSerializer(serializers.Serializer):
     )
 
 
+class SearchRequestSerializer(serializers.Serializer):
+    """Serializer for full-text search requests"""
+
+    q = serializers.CharField(
+        required=True,
+        max_length=500,
+        help_text="Search terms (pages must contain all of them)"
+    )
+    limit = serializers.IntegerField(
+        required=False,
+        default=DatabaseConstants.DEFAULT_PAGE_SIZE,
+        min_value=1,
+        max_value=DatabaseConstants.MAX_PAGE_SIZE,
+        help_text="Maximum number of hits"
+    )
+    offset = serializers.IntegerField(
+        required=False,
+        default=0,
+        min_value=0,
+        help_text="Number of hits to skip"
+    )
+
+
 class ConversationResponseSerializer(serializers.Serializer):
     """Serializer for conversation responses"""
 
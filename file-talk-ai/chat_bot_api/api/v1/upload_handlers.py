@@ -0,0 +1,110 @@
+"""
+Upload Handlers
+Streams uploaded PDFs straight into storage
+"""
+from dataclasses import dataclass
+from typing import Optional
+from django.core.files.uploadhandler import FileUploadHandler
+from config.constants import FileConstants
+from chat_bot_api.domain.exceptions import PDFInvalidFormatError, PDFTooLargeError
+from chat_bot_api.infrastructure.storage import StorageBackend, StoredBlob
+
+
+@dataclass
+class StreamedUpload:
+    """A PDF upload written to storage"""
+    blob: StoredBlob
+    original_name: Optional[str] = None
+
+
+class StreamingPDFUploadHandler(FileUploadHandler):
+    """
+    Upload handler that writes the PDF field to storage as it arrives
+
+    Chunks go to a storage writer (a temp file for local storage, a
+    multipart upload for S3) that hashes them on the way; the first chunk
+    must carry the PDF signature and the size limit is enforced per chunk,
+    so a bad upload is rejected without buffering it in memory. The stored
+    upload is exposed as ``self.upload``.
+
+    Meant to be the only handler of the request; other file fields are
+    dropped.
+    """
+
+    chunk_size = FileConstants.DOWNLOAD_CHUNK_SIZE
+
+    def __init__(self, request, storage: StorageBackend, field_name: str = FileConstants.UPLOAD_FIELD_NAME):
+        """
+        Initialize handler
+
+        Args:
+            request: Django request
+            storage: Storage backend receiving the file
+            field_name: Multipart field carrying the PDF
+        """
+        super().__init__(request)
+        self.storage = storage
+        # Not self.field_name: FileUploadHandler.new_file sets that to each incoming field
+        self.pdf_field_name = field_name
+        self.upload: Optional[StreamedUpload] = None
+        self._writer = None
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # Reject oversized bodies before reading any of them
+        if content_length and content_length > FileConstants.MAX_FILE_SIZE_BYTES + self.chunk_size:
+            raise PDFTooLargeError(max_size_mb=FileConstants.MAX_FILE_SIZE_MB)
+        return None
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+
+        if field_name != self.pdf_field_name or self.upload is not None:
+            return
+
+        self._writer = self.storage.open_writer()
+
+    def receive_data_chunk(self, raw_data, start):
+        if self._writer is None:
+            return raw_data
+
+        try:
+            if self._writer.size_bytes == 0 and FileConstants.PDF_MAGIC_BYTES not in raw_data[:FileConstants.PDF_MAGIC_SEARCH_BYTES]:
+                raise PDFInvalidFormatError("Uploaded file is not a PDF file")
+
+            if self._writer.size_bytes + len(raw_data) > FileConstants.MAX_FILE_SIZE_BYTES:
+                raise PDFTooLargeError(max_size_mb=FileConstants.MAX_FILE_SIZE_MB)
+
+            self._writer.write(raw_data)
+        except Exception:
+            self._abort()
+            raise
+
+        return None
+
+    def file_complete(self, file_size):
+        if self._writer is None:
+            return None
+
+        if self._writer.size_bytes == 0:
+            self._abort()
+            raise PDFInvalidFormatError("Uploaded file is empty")
+
+        try:
+            blob = self._writer.commit()
+        except Exception:
+            self._abort()
+            raise
+        self._writer = None
+
+        self.upload = StreamedUpload(blob=blob, original_name=self.file_name)
+        # The file lives in storage, not in request.FILES
+        return None
+
+    def upload_interrupted(self):
+        self._abort()
+
+    def _abort(self):
+        """Discard whatever an unfinished upload has written"""
+        if self._writer is not None:
+            self._writer.abort()
+            self._writer = None
@@ -8,7 +8,7 @@ from rest_framework import status
 
 from chat_bot_api.core.utils.logger import get_logger
 from chat_bot_api.domain.enums import ActionTypeEnum
-from chat_bot_api.domain.exceptions import BaseAppException
+from chat_bot_api.domain.exceptions import BaseAppException, ValidationError
 from chat_bot_api.application.dto import (
     ConversationRequestDTO,
     ConversationResponseDTO,
@@ -16,14 +16,18 @@ from chat_bot_api.application.dto import (
     ErrorResponseDTO
 )
 from chat_bot_api.application.services import (
+    DocumentService,
     QuestionAnswerService,
     SummaryService,
-    QuestionGenerationService
+    QuestionGenerationService,
+    SearchService
 )
 from .serializers import (
     ConversationRequestSerializer,
-    OptionsRequestSerializer
+    OptionsRequestSerializer,
+    SearchRequestSerializer
 )
+from .upload_handlers import StreamingPDFUploadHandler
 
 logger = get_logger(__name__)
 
@@ -49,7 +53,9 @@ def conversation_handler(request):
             'version': 'v1',
             'endpoints': {
                 'POST /conversation/': 'Process conversation',
-                'POST /options/': 'Get available options'
+                'POST /options/': 'Get available options',
+                'POST /documents/upload/': 'Upload a PDF document (multipart field "file")',
+                'GET /search/?q=': 'Search the pages of all processed documents'
             }
         })
 
@@ -77,6 +83,10 @@ def conversation_handler(request):
         # Validate DTO
         request_dto.validate()
 
+        # Uploaded documents are referenced by id
+        if request_dto.document_id is not None:
+            request_dto.document_url = DocumentService().resolve_document_url(request_dto.document_id)
+
         # Process based on action type
         action = request_dto.action
 
@@ -137,6 +147,127 @@ def conversation_handler(request):
         )
 
 
+@api_view(['POST'])
+def document_upload_handler(request):
+    """
+    Handle PDF uploads
+
+    The multipart "file" field is streamed straight into storage,
+    hashed and size-checked while it arrives. The returned document_id can
+    be sent to /conversation/ instead of a documenturl.
+
+    Args:
+        request: HTTP request (multipart/form-data)
+
+    Returns:
+        Response: HTTP response with the document id
+    """
+    try:
+        service = DocumentService()
+        upload_handler = StreamingPDFUploadHandler(request, service.storage)
+        # Replace the default memory/temp-file handlers for this request
+        request.upload_handlers[:] = [upload_handler]
+
+        # Parsing the body runs the upload handler
+        request.FILES
+
+        upload = upload_handler.upload
+        if upload is None:
+            raise ValidationError("A PDF file is required in the 'file' field")
+
+        document = service.register_upload(upload.blob)
+        document['file_name'] = upload.original_name
+
+        logger.info("Document uploaded successfully", extra={'extra_data': {
+            'document_id': document['document_id'],
+            'size_bytes': upload.blob.size_bytes
+        }})
+
+        response_dto = ConversationResponseDTO.success(
+            data=document,
+            message="Document uploaded successfully"
+        )
+        return Response(response_dto.to_dict(), status=status.HTTP_201_CREATED)
+
+    except BaseAppException as e:
+        logger.error(f"Upload error: {str(e)}", extra={'extra_data': {
+            'error_code': e.error_code,
+            'error': str(e)
+        }})
+
+        error_dto = ErrorResponseDTO.from_exception(e)
+        return Response(
+            error_dto.to_dict(),
+            status=error_dto.status_code
+        )
+
+    except Exception as e:
+        logger.error(f"Unexpected upload error: {str(e)}", exc_info=True)
+
+        return Response(
+            {'error': 'Failed to upload document'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['GET'])
+def search_handler(request):
+    """
+    Handle full-text search requests
+
+    Query parameters:
+        q: Search terms (pages must contain all of them)
+        limit: Maximum number of hits (default 20)
+        offset: Number of hits to skip
+
+    Args:
+        request: HTTP request
+
+    Returns:
+        Response: HTTP response with ranked page hits
+    """
+    try:
+        serializer = SearchRequestSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(
+                {'error': serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        params = serializer.validated_data
+        results = SearchService().search(
+            query=params['q'],
+            limit=params['limit'],
+            offset=params['offset']
+        )
+
+        response_dto = ConversationResponseDTO.success(
+            data=results,
+            message="Search completed successfully"
+        )
+        return Response(response_dto.to_dict(), status=status.HTTP_200_OK)
+
+    except BaseAppException as e:
+        logger.error(f"Search error: {str(e)}", extra={'extra_data': {
+            'error_code': e.error_code,
+            'error': str(e)
+        }})
+
+        error_dto = ErrorResponseDTO.from_exception(e)
+        return Response(
+            error_dto.to_dict(),
+            status=error_dto.status_code
+        )
+
+    except Exception as e:
+        logger.error(f"Unexpected search error: {str(e)}", exc_info=True)
+
+        return Response(
+            {'error': 'Failed to search documents'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
 @api_view(['POST'])
 def options_handler(request):
     """
@@ -207,7 +338,8 @@ def _handle_question_answer(request_dto: ConversationRequestDTO) -> Conversation
     service = QuestionAnswerService()
     answer = service.answer_question(
         document_url=request_dto.document_url,
-        question=request_dto.question
+        question=request_dto.question,
+        session_id=request_dto.session_id
     )
 
     return ConversationResponseDTO.success(
@@ -15,6 +15,8 @@ class ConversationRequestDTO:
     question: Optional[str] = None
     min_page: Optional[int] = None
     max_page: Optional[int] = None
+    document_id: Optional[int] = None
+    session_id: Optional[str] = None
 
     def __post_init__(self):
         """Validate and normalize data after initialization"""
@@ -42,7 +44,9 @@ class ConversationRequestDTO:
             document_url=data.get('documenturl', ''),
             question=data.get('question'),
             min_page=data.get('min_page'),
-            max_page=data.get('max_page')
+            max_page=data.get('max_page'),
+            document_id=data.get('document_id'),
+            session_id=(data.get('session_id') or '').strip() or None
         )
 
     def validate(self) -> bool:
@@ -58,16 +62,15 @@ class ConversationRequestDTO:
         from chat_bot_api.core.utils.validators import Validator
 
         # Validate required fields
-        Validator.validate_required_fields(
-            {'action': self.action, 'documenturl': self.document_url},
-            ['action', 'documenturl']
-        )
+        Validator.validate_required_fields({'action': self.action}, ['action'])
 
         # Validate action type
         Validator.validate_action_type(self.action)
 
-        # Validate PDF URL
-        Validator.validate_pdf_url(self.document_url)
+        # Validate document reference: an uploaded document id or a PDF URL
+        if self.document_id is None:
+            Validator.validate_required_fields({'documenturl': self.document_url}, ['documenturl'])
+            Validator.validate_pdf_url(self.document_url)
 
         # Validate question for question_answer action
         if self.action == ActionTypeEnum.QUESTION_ANSWER.value:
@@ -1,16 +1,20 @@
 """Application Services"""
 from .base_service import BaseService
 from .pdf_service import PDFService
+from .document_service import DocumentService
 from .agent_service import AgentService
 from .question_answer_service import QuestionAnswerService
 from .summary_service import SummaryService
 from .question_generation_service import QuestionGenerationService
+from .search_service import SearchService
 
 __all__ = [
     'BaseService',
     'PDFService',
+    'DocumentService',
     'AgentService',
     'QuestionAnswerService',
     'SummaryService',
     'QuestionGenerationService',
+    'SearchService',
 ]
@@ -2,11 +2,15 @@
 Agent Service
 Base service for AI agent operations
 """
-import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from phi.agent import Agent
-from phi.model.groq import Groq
-from typing import Optional, List
+from typing import Callable, Hashable, List, Optional, Sequence, TypeVar
 from config.env_config import config
+from chat_bot_api.core.utils.single_flight import get_single_flight
+from chat_bot_api.infrastructure.cache import get_result_cache
+from chat_bot_api.infrastructure.external import get_llm_registry
+from chat_bot_api.infrastructure.text import TokenEstimator, prompt_token_budget
 from chat_bot_api.domain.exceptions import (
     AgentInitializationError,
     AgentProcessingError,
@@ -14,6 +18,12 @@ from chat_bot_api.domain.exceptions import (
 )
 from .base_service import BaseService
 
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Cached responses are long markdown texts; zlib shrinks them several times
+RESPONSE_COMPRESS_LEVEL = 6
+
 
 class AgentService(BaseService):
     """Base service for AI agent operations"""
@@ -21,69 +31,143 @@ class AgentService(BaseService):
     def __init__(self):
         """Initialize agent service"""
         super().__init__()
-        self._setup_groq_api()
+        self.token_estimator = TokenEstimator()
+        self.result_cache = get_result_cache()
+        self.flight = get_single_flight()
+        self.llm = get_llm_registry()
+
+    def context_token_budget(self, *fixed_parts: str, model_id: Optional[str] = None) -> int:
+        """
+        Get tokens left for document text in a prompt
+
+        Args:
+            fixed_parts: Prompt text sent alongside the document (header, footer, ...)
+            model_id: Model ID (defaults to config value)
+
+        Returns:
+            int: Token budget for the document pages
+        """
+        budget = prompt_token_budget(
+            model_id or config.GROQ_MODEL_ID,
+            reserved_output_tokens=config.AI_MAX_TOKENS,
+            limit=config.PROMPT_MAX_TOKENS
+        )
+        return max(budget - sum(self.token_estimator.estimate(part) for part in fixed_parts), 0)
+
+    def cached_response(
+        self,
+        flight_key: Hashable,
+        resolve_key: Callable[[], Optional[str]],
+        compute: Callable[[], str]
+    ) -> str:
+        """
+        Get a response from the result cache, computing it once when missing
 
-    def _setup_groq_api(self):
-        """Setup Groq API key"""
-        os.environ["GROQ_API_KEY"] = config.GROQ_API_KEY
+        Identical requests share one computation: within the process they
+        wait for the running call, and other processes wait on its
+        single-flight lock and then find the stored result. Results are
+        stored zlib-compressed.
+
+        Args:
+            flight_key: Identity of the request (e.g. action, URL and page range)
+            resolve_key: Returns the cache key, or None while the document is unknown;
+                called again after computing, once the document has been registered
+            compute: Produces the response
+
+        Returns:
+            str: Cached or computed response
+        """
+        if not config.RESPONSE_CACHE_ENABLED:
+            return compute()
+
+        def load_or_compute() -> str:
+            key = resolve_key()
+            if key is not None:
+                payload = self.result_cache.get(key)
+                if payload is not None:
+                    self.log_info("Serving cached response", cache_key=key)
+                    return zlib.decompress(payload).decode('utf-8')
+
+            result = compute()
+
+            key = key or resolve_key()
+            if key is not None and result and result.strip():
+                self.result_cache.set(key, zlib.compress(result.encode('utf-8'), RESPONSE_COMPRESS_LEVEL))
+            return result
+
+        # Long map-reduce runs must not time out into a duplicate run
+        return self.flight.do(
+            flight_key,
+            load_or_compute,
+            cross_process=True,
+            timeout=config.SINGLE_FLIGHT_RESPONSE_TIMEOUT
+        )
+
+    @staticmethod
+    def map_parallel(fn: Callable[[T], R], items: Sequence[T], max_workers: int, name: str = 'agent') -> List[R]:
+        """
+        Apply fn to items with at most max_workers calls in flight
+
+        Args:
+            fn: Function to apply (typically one agent run per item)
+            items: Inputs
+            max_workers: Maximum concurrent calls
+            name: Thread name prefix
+
+        Returns:
+            list: Results in input order
+
+        Raises:
+            Exception: The first failure; calls not started yet are cancelled
+        """
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+
+        pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))), thread_name_prefix=name)
+        try:
+            return list(pool.map(fn, items))
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
 
     def create_agent(
         self,
-        name: str,
+        action: str,
         description: str,
-        role: str,
         instructions: List[str],
         model_id: Optional[str] = None,
-        markdown: bool = True,
-        fallback_messages: Optional[List[str]] = None,
         knowledge_base = None
     ) -> Agent:
         """
-        Create AI agent
+        Create AI agent from the action's template
 
         Args:
-            name: Agent name
+            action: Action type (see ActionType); selects name, role and fallbacks
             description: Agent description
-            role: Agent role
             instructions: List of instructions
-            model_id: Model ID (defaults to config value)
-            markdown: Enable markdown output
-            fallback_messages: Fallback messages
+            model_id: Model ID (defaults to the template's)
             knowledge_base: IGNORED - Groq does not support knowledge_base tools
 
         Returns:
-            Agent: Initialized agent
+            Agent: Initialized agent sharing the process-wide Groq client
 
         Raises:
             AgentInitializationError: If agent creation fails
         """
         try:
-            self.log_info(f"Creating agent: {name}")
-
-            model_id = model_id or config.GROQ_MODEL_ID
-
             # WARNING: Do NOT pass knowledge_base to Agent() when using Groq
             # Groq models don't support the search_knowledge_base function calling
             # Instead, manually query the knowledge base and pass context in the prompt
-            agent = Agent(
-                name=name,
-                description=description,
-                role=role,
-                instructions=instructions,
-                model=Groq(id=model_id),
-                markdown=markdown,
-                fallback_messages=fallback_messages or []
-                # DO NOT add: knowledge_base=knowledge_base
-            )
+            overrides = {'model_id': model_id} if model_id else {}
+            agent = self.llm.create_agent(action, description, instructions, **overrides)
 
-            self.log_info(f"Agent created successfully: {name}")
+            self.log_info(f"Agent created successfully: {agent.name}", action=action)
             return agent
 
         except Exception as e:
-            self.log_error(f"Failed to create agent: {str(e)}", error=str(e), agent_name=name)
+            self.log_error(f"Failed to create agent: {str(e)}", error=str(e), action=action)
             raise AgentInitializationError(
-                f"Failed to create agent {name}: {str(e)}",
-                agent_name=name
+                f"Failed to create agent for {action}: {str(e)}",
+                agent_name=action
             )
 
     def run_agent(self, agent: Agent, prompt: str) -> str:
@@ -0,0 +1,87 @@
+"""
+Document Service
+Handles uploaded documents and document id lookups
+"""
+from typing import Any, Dict
+import fitz  # PyMuPDF
+from chat_bot_api.domain.exceptions import InternalServerError, NotFoundError, PDFInvalidFormatError
+from chat_bot_api.infrastructure.storage import StoredBlob
+from .base_service import BaseService
+from .pdf_service import PDFService
+
+
+class DocumentService(BaseService):
+    """Service for uploaded documents"""
+
+    def __init__(self):
+        """Initialize document service"""
+        super().__init__()
+        self.pdf_service = PDFService()
+        self.storage = self.pdf_service.storage
+
+    def register_upload(self, blob: StoredBlob) -> Dict[str, Any]:
+        """
+        Register a PDF streamed into storage
+
+        Args:
+            blob: Blob written by the upload handler
+
+        Returns:
+            dict: Document id, content hash, size and page count
+
+        Raises:
+            PDFInvalidFormatError: If the file cannot be opened as a PDF
+            InternalServerError: If the document registry is unavailable
+        """
+        content_hash = blob.key
+        size_bytes = blob.size_bytes
+        document_url = PDFService.upload_url(content_hash)
+
+        try:
+            source = self.pdf_service.get_uploaded_file(document_url)
+            total_pages = self.pdf_service.get_page_count(source, content_hash)
+        except (fitz.FileDataError, RuntimeError) as e:
+            if blob.created:
+                self.storage.delete(content_hash)
+            self.log_error(f"Uploaded file is not a valid PDF: {str(e)}", content_hash=content_hash)
+            raise PDFInvalidFormatError(f"Invalid PDF file format: {str(e)}")
+
+        record = (
+            self.pdf_service.documents.register(document_url, content_hash, total_pages, size_bytes)
+            if self.pdf_service.documents else None
+        )
+        if record is None:
+            raise InternalServerError("Uploaded document could not be registered")
+
+        self.log_info(
+            "Document uploaded",
+            document_id=record.id,
+            content_hash=content_hash,
+            size_bytes=size_bytes,
+            total_pages=total_pages
+        )
+
+        return {
+            'document_id': record.id,
+            'content_sha256': content_hash,
+            'size_bytes': size_bytes,
+            'total_pages': total_pages,
+        }
+
+    def resolve_document_url(self, document_id: int) -> str:
+        """
+        Get the URL services use for a registered document
+
+        Args:
+            document_id: Document id returned by the upload endpoint
+
+        Returns:
+            str: Document URL (upload:// for uploaded files)
+
+        Raises:
+            NotFoundError: If the id is unknown
+        """
+        record = self.pdf_service.documents.get_by_id(document_id) if self.pdf_service.documents else None
+        if record is None:
+            raise NotFoundError(f"Document {document_id} not found", details={'document_id': document_id})
+        return record.url
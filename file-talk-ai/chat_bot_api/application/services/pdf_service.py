@@ -4,39 +4,158 @@ Handles all PDF-related operations (download, extraction, etc.)
 Consolidates duplicate PDF processing code
 """
 import os
+import hashlib
 import requests
 import fitz  # PyMuPDF
-from typing import Dict, Any, Optional
+from contextlib import ExitStack
+from dataclasses import dataclass, replace
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 from config.env_config import config
+from config.constants import CacheKey, FileConstants
 from chat_bot_api.core.utils.helpers import FileHelper
+from chat_bot_api.core.utils.single_flight import get_single_flight
+from chat_bot_api.core.utils.validators import Validator
 from chat_bot_api.core.decorators.retry import retry
+from chat_bot_api.infrastructure.cache import NullCache, get_cache, get_download_cache
+from chat_bot_api.infrastructure.external import get_http_client
+from chat_bot_api.infrastructure.repositories import DocumentRecord, DocumentRepository
+from chat_bot_api.infrastructure.storage import get_storage_backend
+from chat_bot_api.infrastructure.pdf import (
+    PageExtractionError,
+    ParallelPageExtractor,
+    RangeFetcher,
+    RangeFetchUnsupported,
+    get_extraction_stats
+)
+from chat_bot_api.infrastructure.text import ContextPacker, PackedContext, TextNormalizer, TokenEstimator
+from chat_bot_api.infrastructure.search import (
+    BM25Index,
+    PageIndexWriter,
+    TextChunk,
+    TextChunker,
+    VectorIndex,
+    build_embedder,
+    get_fulltext_index,
+    get_index_cache,
+    get_vector_store
+)
+from chat_bot_api.domain.enums import ExtractionStatusEnum
+from chat_bot_api.domain.models import PageRecord
 from chat_bot_api.domain.exceptions import (
+    KnowledgeBaseLoadError,
+    PDFException,
     PDFDownloadError,
     PDFExtractionError,
     PDFInvalidFormatError,
-    PDFTooLargeError
+    PDFTooLargeError,
+    NotFoundError,
+    ValidationError
 )
 from .base_service import BaseService
 
 
+@dataclass
+class PDFBuffer:
+    """
+    PDF document held in memory
+
+    A partial fetch holds only some pages; ``page_numbers`` then maps its
+    pages, in order, to their numbers in the original document.
+    """
+    data: bytearray
+    content_hash: str
+    page_numbers: Optional[List[int]] = None
+    total_pages: Optional[int] = None
+    path: Optional[str] = None  # File with the same bytes, handed to extraction workers
+
+    @property
+    def extraction_source(self) -> Union[str, bytearray]:
+        """What the page extractor opens: the file if there is one, else the bytes"""
+        return self.path or self.data
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the document in bytes"""
+        return len(self.data)
+
+
 class PDFService(BaseService):
     """Service for PDF processing operations"""
 
     def __init__(self):
         """Initialize PDF service"""
         super().__init__()
-        self.storage_path = config.PDF_STORAGE_PATH
-        self._ensure_storage_path()
+        self.http_client = get_http_client()
+        self.flight = get_single_flight()
+        self.documents = DocumentRepository() if config.DOCUMENT_REGISTRY_ENABLED else None
+        self.download_cache = get_download_cache() if config.PDF_DOWNLOAD_CACHE_ENABLED else None
+        self.storage = get_storage_backend()
+        self.text_cache = get_cache()
+        # Without a persistent text cache, processes waiting on a cross-process
+        # single-flight lock would find nothing and redo the work in turn
+        self.text_cache_shared = not isinstance(self.text_cache, NullCache)
+        self.page_extractor = ParallelPageExtractor(
+            max_workers=config.PDF_EXTRACTION_WORKERS,
+            min_parallel_pages=config.PDF_PARALLEL_MIN_PAGES,
+            error_policy=config.PDF_PAGE_ERROR_POLICY,
+            start_method=config.PDF_EXTRACTION_START_METHOD,
+            engine=config.PDF_EXTRACTION_ENGINE,
+            skip_textless=config.PDF_SKIP_TEXTLESS_PAGES,
+            logger=self.logger
+        )
+        self.token_estimator = TokenEstimator()
+        self.normalizer = TextNormalizer(
+            min_pages=config.TEXT_BOILERPLATE_MIN_PAGES,
+            boilerplate_ratio=config.TEXT_BOILERPLATE_PAGE_RATIO,
+            edge_lines=config.TEXT_BOILERPLATE_EDGE_LINES,
+            estimator=self.token_estimator
+        )
+        self.chunker = TextChunker(
+            chunk_tokens=config.QA_CHUNK_TOKENS,
+            overlap_tokens=config.QA_CHUNK_OVERLAP_TOKENS,
+            estimator=self.token_estimator
+        )
+        self.index_cache = get_index_cache()
+        self.embedder = build_embedder(config.QA_EMBEDDER, config.QA_EMBEDDING_DIM)
+        self.vector_store = get_vector_store()
+        self.fulltext_index = get_fulltext_index()
+        self.range_fetcher = RangeFetcher(
+            http_get=self.http_client.get,
+            http_head=self.http_client.head,
+            timeout=self.http_client.timeout,
+            max_size_bytes=FileConstants.MAX_FILE_SIZE_BYTES
+        ) if config.PDF_PARTIAL_FETCH_ENABLED else None
 
-    def _ensure_storage_path(self):
-        """Ensure storage directory exists"""
-        os.makedirs(self.storage_path, exist_ok=True)
-
-    @retry(max_attempts=3, delay=2, exceptions=(requests.RequestException,))
     def download_pdf(self, document_url: str) -> str:
         """
         Download PDF from URL
 
+        When the download cache is enabled, a cached copy is revalidated with
+        If-None-Match / If-Modified-Since and reused on 304 Not Modified, and
+        concurrent downloads of the same URL share one transfer (across
+        worker processes too, through the single-flight file lock).
+
+        Args:
+            document_url: URL of the PDF document
+
+        Returns:
+            str: Path to downloaded PDF file
+
+        Raises:
+            PDFDownloadError: If download fails
+            PDFTooLargeError: If file is too large
+        """
+        if not self.download_cache:
+            # Uncached downloads are private temp files that callers delete
+            return self._download_pdf(document_url)
+
+        return self.flight.do(('download', document_url), lambda: self._download_pdf(document_url))
+
+    @retry(max_attempts=3, delay=2, exceptions=(requests.RequestException,))
+    def _download_pdf(self, document_url: str) -> str:
+        """
+        Download PDF from URL (without deduplication)
+
         Args:
             document_url: URL of the PDF document
 
@@ -49,65 +168,410 @@ class PDFService(BaseService):
         """
         self.log_info(f"Downloading PDF from {document_url}")
 
+        cached_entry = self.download_cache.get_entry(document_url) if self.download_cache else None
+
+        if cached_entry and self.download_cache.is_fresh(cached_entry):
+            self.download_cache.record_hit(cached_entry)
+            self.log_info(f"Serving fresh cached PDF for {document_url}", content_hash=cached_entry.content_hash)
+            return self.download_cache.blob_path(cached_entry.content_hash)
+
+        headers = {}
+        if cached_entry and cached_entry.can_revalidate:
+            headers = self.download_cache.conditional_headers(cached_entry)
+
+        file_path = None
+        response = None
         try:
-            response = requests.get(
-                document_url,
-                timeout=config.PDF_DOWNLOAD_TIMEOUT,
-                stream=True
-            )
+            response = self.http_client.get(document_url, stream=True, headers=headers)
+
+            if cached_entry and response.status_code == 304:
+                self.download_cache.touch(cached_entry)
+                self.download_cache.record_hit(cached_entry, revalidated=True)
+                self.log_info(f"Cached PDF revalidated for {document_url}", content_hash=cached_entry.content_hash)
+                return self.download_cache.blob_path(cached_entry.content_hash)
+
             response.raise_for_status()
+            self._validate_response_headers(response, document_url)
+
+            if self.download_cache:
+                file_path = self.download_cache.create_temp_file()
+            else:
+                # Private scratch file in the store's temp area, removed by the caller
+                file_path = self.storage.create_temp_file(suffix='.pdf')
 
-            # Check content type
-            content_type = response.headers.get('content-type', '')
-            if 'pdf' not in content_type.lower() and not document_url.lower().endswith('.pdf'):
-                raise PDFInvalidFormatError("URL does not point to a PDF file")
-
-            # Check file size
-            content_length = response.headers.get('content-length')
-            if content_length:
-                file_size = int(content_length)
-                from config.constants import FileConstants
-                if file_size > FileConstants.MAX_FILE_SIZE_BYTES:
-                    raise PDFTooLargeError(
-                        max_size_mb=FileConstants.MAX_FILE_SIZE_MB
-                    )
-
-            # Generate unique filename
-            filename = FileHelper.generate_unique_filename(prefix='pdf_', extension='pdf')
-            file_path = os.path.join(self.storage_path, filename)
-
-            # Download file
+            # Download file, hashing the content as it arrives
+            content_hash = hashlib.sha256()
+            size_bytes = 0
             with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+                for chunk in self._iter_validated_chunks(response):
+                    f.write(chunk)
+                    content_hash.update(chunk)
+                    size_bytes += len(chunk)
+
+            if self.download_cache:
+                entry = self.download_cache.store(
+                    document_url,
+                    file_path,
+                    content_hash=content_hash.hexdigest(),
+                    size_bytes=size_bytes,
+                    etag=response.headers.get('etag'),
+                    last_modified=response.headers.get('last-modified')
+                )
+                self.download_cache.record_miss(size_bytes)
+                file_path = self.download_cache.blob_path(entry.content_hash)
 
             self.log_info(f"PDF downloaded successfully to {file_path}")
+            self._log_connection_stats()
             return file_path
 
+        except (PDFInvalidFormatError, PDFTooLargeError):
+            self._discard_partial_download(file_path)
+            raise
+
         except requests.exceptions.Timeout:
+            self._discard_partial_download(file_path)
             self.log_error(f"Timeout downloading PDF from {document_url}")
             raise PDFDownloadError(f"Timeout downloading PDF from URL", url=document_url)
 
         except requests.exceptions.RequestException as e:
+            self._discard_partial_download(file_path)
             self.log_error(f"Error downloading PDF: {str(e)}", error=str(e), url=document_url)
             raise PDFDownloadError(f"Failed to download PDF: {str(e)}", url=document_url)
 
         except IOError as e:
+            self._discard_partial_download(file_path)
             self.log_error(f"File write error: {str(e)}", error=str(e))
             raise PDFDownloadError(f"Failed to save PDF file: {str(e)}")
 
+        finally:
+            if response is not None:
+                response.close()
+
+    def download_pdf_to_memory(self, document_url: str) -> PDFBuffer:
+        """
+        Stream PDF from URL straight into memory
+
+        Concurrent callers in this process share one buffer.
+
+        Args:
+            document_url: URL of the PDF document
+
+        Returns:
+            PDFBuffer: Downloaded document
+
+        Raises:
+            PDFDownloadError: If download fails
+            PDFInvalidFormatError: If the content is not a PDF
+            PDFTooLargeError: If file is too large
+        """
+        return self.flight.do(
+            ('download_memory', document_url),
+            lambda: self._download_pdf_to_memory(document_url),
+            cross_process=False
+        )
+
+    @retry(max_attempts=3, delay=2, exceptions=(requests.RequestException,))
+    def _download_pdf_to_memory(self, document_url: str) -> PDFBuffer:
+        """
+        Stream PDF from URL straight into memory (without deduplication)
+
+        The buffer is pre-sized from Content-Length when the server sends it,
+        and the body is validated while it streams so nothing touches disk.
+
+        Args:
+            document_url: URL of the PDF document
+
+        Returns:
+            PDFBuffer: Downloaded document
+
+        Raises:
+            PDFDownloadError: If download fails
+            PDFInvalidFormatError: If the content is not a PDF
+            PDFTooLargeError: If file is too large
+        """
+        self.log_info(f"Streaming PDF into memory from {document_url}")
+
+        response = None
+        try:
+            response = self.http_client.get(document_url, stream=True)
+            response.raise_for_status()
+            content_length = self._validate_response_headers(response, document_url)
+
+            data = bytearray(content_length or 0)
+            content_hash = hashlib.sha256()
+            size_bytes = 0
+
+            for chunk in self._iter_validated_chunks(response):
+                # Fills the pre-sized buffer in place; grows it if the server under-reported
+                data[size_bytes:size_bytes + len(chunk)] = chunk
+                content_hash.update(chunk)
+                size_bytes += len(chunk)
+
+            if size_bytes < len(data):
+                del data[size_bytes:]
+
+            self.log_info(f"PDF streamed into memory ({size_bytes} bytes)")
+            self._log_connection_stats()
+            return PDFBuffer(data=data, content_hash=content_hash.hexdigest())
+
+        except requests.exceptions.Timeout:
+            self.log_error(f"Timeout downloading PDF from {document_url}")
+            raise PDFDownloadError(f"Timeout downloading PDF from URL", url=document_url)
+
+        except requests.exceptions.RequestException as e:
+            self.log_error(f"Error downloading PDF: {str(e)}", error=str(e), url=document_url)
+            raise PDFDownloadError(f"Failed to download PDF: {str(e)}", url=document_url)
+
+        finally:
+            if response is not None:
+                response.close()
+
+    def fetch_document(
+        self,
+        document_url: str,
+        min_page: Optional[int] = None,
+        max_page: Optional[int] = None
+    ) -> Union[str, PDFBuffer]:
+        """
+        Fetch PDF using the configured download mode
+
+        When a small page range is given and partial fetching is enabled,
+        only that range is fetched with HTTP Range requests; any problem
+        with that falls back to a full download.
+
+        Args:
+            document_url: URL of the PDF document
+            min_page: First page that will be read (optional)
+            max_page: Last page that will be read (optional; without either
+                bound the whole document is fetched)
+
+        Returns:
+            str or PDFBuffer: Local file path ('file' mode or uploaded document)
+            or in-memory buffer ('memory' mode or partial fetch)
+        """
+        if self.is_upload_url(document_url):
+            return self.get_uploaded_file(document_url)
+
+        if self._should_fetch_partially(document_url, min_page, max_page):
+            try:
+                return self.fetch_partial_document(document_url, min_page, max_page)
+            except RangeFetchUnsupported as e:
+                self.log_info(f"Partial fetch not possible, downloading full PDF: {str(e)}", url=document_url)
+            except Exception as e:
+                self.log_warning(f"Partial fetch failed, downloading full PDF: {str(e)}", url=document_url)
+
+        if config.PDF_DOWNLOAD_MODE == 'memory':
+            return self.download_pdf_to_memory(document_url)
+        return self.download_pdf(document_url)
+
+    @staticmethod
+    def upload_url(content_hash: str) -> str:
+        """Get the document URL of an uploaded file"""
+        return f"{FileConstants.UPLOAD_URL_PREFIX}{content_hash}"
+
+    @staticmethod
+    def is_upload_url(document_url: str) -> bool:
+        """Check whether a document URL refers to an uploaded file"""
+        return document_url.startswith(FileConstants.UPLOAD_URL_PREFIX)
+
+    def get_uploaded_file(self, document_url: str) -> Union[str, PDFBuffer]:
+        """
+        Get an uploaded document from storage
+
+        Args:
+            document_url: upload:// URL of the document
+
+        Returns:
+            Path to the stored PDF when the backend keeps files on local
+            disk, otherwise the PDF read into a PDFBuffer
+
+        Raises:
+            NotFoundError: If the file is no longer stored
+        """
+        content_hash = document_url[len(FileConstants.UPLOAD_URL_PREFIX):]
+        try:
+            if not self.storage.exists(content_hash):
+                raise FileNotFoundError(content_hash)
+            # Local blobs are opened in place; only remote ones are read into memory
+            file_path = self.storage.local_path(content_hash)
+            if file_path:
+                return file_path
+            return PDFBuffer(data=self.storage.read_buffer(content_hash), content_hash=content_hash)
+        except (ValueError, FileNotFoundError):
+            raise NotFoundError("Uploaded document is no longer available", details={'document': document_url})
+
+    def fetch_partial_document(
+        self,
+        document_url: str,
+        min_page: Optional[int] = None,
+        max_page: Optional[int] = None
+    ) -> PDFBuffer:
+        """
+        Fetch only the objects needed for a page range
+
+        Args:
+            document_url: URL of the PDF document
+            min_page: Minimum page number (1-indexed)
+            max_page: Maximum page number (1-indexed)
+
+        Returns:
+            PDFBuffer: Rebuilt document holding the requested pages
+
+        Raises:
+            RangeFetchUnsupported: If the document has to be downloaded in full
+        """
+        first_page = max(min_page or config.PDF_DEFAULT_MIN_PAGE, 1)
+        last_page = max_page or config.PDF_DEFAULT_MAX_PAGE
+
+        partial = self.range_fetcher.fetch_pages(document_url, first_page, last_page)
+
+        self.log_info(
+            f"Fetched {len(partial.page_numbers)} of {partial.total_pages} pages with range requests",
+            url=document_url,
+            bytes_fetched=partial.bytes_fetched,
+            source_size=partial.source_size
+        )
+        return PDFBuffer(
+            data=bytearray(partial.data),
+            content_hash=partial.document_key,
+            page_numbers=partial.page_numbers,
+            total_pages=partial.total_pages
+        )
+
+    def _should_fetch_partially(self, document_url: str, min_page: Optional[int], max_page: Optional[int]) -> bool:
+        """Whether a page range is small enough to be worth range requests"""
+        if not self.range_fetcher or (min_page is None and max_page is None):
+            return False
+
+        # A cached copy is cheaper than any network round trip
+        if self.download_cache and self.download_cache.get_entry(document_url):
+            return False
+
+        first_page = min_page or config.PDF_DEFAULT_MIN_PAGE
+        last_page = max_page or config.PDF_DEFAULT_MAX_PAGE
+        return last_page - first_page + 1 <= config.PDF_PARTIAL_FETCH_MAX_PAGES
+
+    def _validate_response_headers(self, response, document_url: str) -> Optional[int]:
+        """
+        Validate content type and announced size of a download response
+
+        Args:
+            response: Streaming HTTP response
+            document_url: URL of the PDF document
+
+        Returns:
+            int or None: Announced content length
+
+        Raises:
+            PDFInvalidFormatError: If the response is not a PDF
+            PDFTooLargeError: If the announced size exceeds the limit
+        """
+        # Check content type
+        content_type = response.headers.get('content-type', '')
+        if 'pdf' not in content_type.lower() and not document_url.lower().endswith('.pdf'):
+            raise PDFInvalidFormatError("URL does not point to a PDF file")
+
+        # Check file size
+        content_length = response.headers.get('content-length')
+        if not content_length:
+            return None
+
+        file_size = int(content_length)
+        if file_size > FileConstants.MAX_FILE_SIZE_BYTES:
+            raise PDFTooLargeError(
+                max_size_mb=FileConstants.MAX_FILE_SIZE_MB
+            )
+        return file_size
+
+    def _iter_validated_chunks(self, response) -> Iterator[bytes]:
+        """
+        Yield response body chunks, validating them while they arrive
+
+        The first chunk must carry the PDF signature and the running total may
+        not exceed the size limit, so mislabelled or oversized responses are
+        aborted without reading the rest of the body.
+
+        Args:
+            response: Streaming HTTP response
+
+        Yields:
+            bytes: Body chunks
+
+        Raises:
+            PDFInvalidFormatError: If the content is not a PDF
+            PDFTooLargeError: If the body exceeds the size limit
+        """
+        size_bytes = 0
+        for chunk in response.iter_content(chunk_size=FileConstants.DOWNLOAD_CHUNK_SIZE):
+            if not chunk:
+                continue
+
+            if size_bytes == 0 and FileConstants.PDF_MAGIC_BYTES not in chunk[:FileConstants.PDF_MAGIC_SEARCH_BYTES]:
+                raise PDFInvalidFormatError("Downloaded content is not a PDF file")
+
+            size_bytes += len(chunk)
+            if size_bytes > FileConstants.MAX_FILE_SIZE_BYTES:
+                raise PDFTooLargeError(
+                    max_size_mb=FileConstants.MAX_FILE_SIZE_MB
+                )
+
+            yield chunk
+
+    def _log_connection_stats(self):
+        """Log connection reuse of the shared HTTP client"""
+        stats = self.http_client.stats()
+        self.log_debug(
+            "HTTP connection reuse",
+            requests=stats['requests'],
+            connections_opened=stats['connections_opened'],
+            reuse_rate=round(stats['reuse_rate'], 3)
+        )
+
+    @staticmethod
+    def get_extraction_stats() -> Dict[str, Any]:
+        """
+        Get extraction throughput of this process per engine
+
+        Returns:
+            dict: engine -> pages, skipped pages, chars, seconds, chars/s and ms/page
+        """
+        return get_extraction_stats().snapshot()
+
+    def _discard_partial_download(self, file_path: Optional[str]):
+        """Remove a partially written download"""
+        if file_path and not self.is_cached_file(file_path):
+            self.cleanup_file(file_path)
+
+    def is_cached_file(self, file_path: str) -> bool:
+        """
+        Check whether a file is a cached download or a stored upload
+
+        Both are named after their content hash.
+
+        Args:
+            file_path: Path to check
+
+        Returns:
+            bool: True if the file is a stored copy that must be kept
+        """
+        if self.storage.contains_path(file_path):
+            return True
+        return bool(self.download_cache) and self.download_cache.is_cached_path(file_path)
+
     def extract_text_from_pdf(
         self,
-        file_path: str,
+        file_path: Union[str, PDFBuffer],
         min_page: Optional[int] = None,
         max_page: Optional[int] = None
     ) -> str:
         """
         Extract text from PDF file
 
+        Materializes iter_pages() into one string; prefer iter_pages() when
+        the pages can be consumed one at a time.
+
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file or in-memory PDFBuffer
             min_page: Minimum page number (1-indexed)
             max_page: Maximum page number (1-indexed)
 
@@ -118,61 +582,747 @@ class PDFService(BaseService):
             PDFExtractionError: If extraction fails
             PDFInvalidFormatError: If PDF format is invalid
         """
-        self.log_info(f"Extracting text from {file_path}", min_page=min_page, max_page=max_page)
+        return self.render_pages(self.iter_pages(file_path, min_page, max_page))
+
+    def iter_pages(
+        self,
+        document: Union[str, PDFBuffer],
+        min_page: Optional[int] = None,
+        max_page: Optional[int] = None
+    ) -> Iterator[PageRecord]:
+        """
+        Lazily yield the pages of a PDF
 
-        if not os.path.exists(file_path):
-            raise PDFExtractionError(f"PDF file not found: {file_path}")
+        Pages are read from the text cache or extracted one batch at a time,
+        so only the current batch is held in memory.
 
-        try:
-            doc = fitz.open(file_path)
-            total_pages = len(doc)
+        Args:
+            document: Path to PDF file or in-memory PDFBuffer
+            min_page: Minimum page number (1-indexed)
+            max_page: Maximum page number (1-indexed)
+
+        Yields:
+            PageRecord: Page number, text and character offsets
+
+        Raises:
+            PDFExtractionError: If extraction fails
+            PDFInvalidFormatError: If PDF format is invalid
+        """
+        self.log_info(f"Extracting text from {self._describe_source(document)}", min_page=min_page, max_page=max_page)
 
-            # Set page range
-            min_page = min_page or config.PDF_DEFAULT_MIN_PAGE
-            max_page = max_page or min(config.PDF_DEFAULT_MAX_PAGE, total_pages)
+        if not isinstance(document, PDFBuffer) and not os.path.exists(document):
+            raise PDFExtractionError(f"PDF file not found: {document}")
 
-            # Validate page range
-            min_page = max(min_page, 1)
-            max_page = min(max_page, total_pages)
+        try:
+            document_hash = self.get_document_hash(document)
+            total_pages = self.get_page_count(document, document_hash)
 
-            if min_page > max_page:
-                raise PDFExtractionError("Minimum page cannot be greater than maximum page")
+            min_page, max_page = self.resolve_page_range(min_page, max_page, total_pages)
 
-            full_text = ""
+            # Windows give every extraction worker a full batch; an in-memory
+            # document is written to disk once so workers open it from there
+            # instead of receiving the bytes with every batch
+            batch_size = self.page_extractor.window_pages
+            offset = 0
+            fulltext = self._fulltext_writer(document, document_hash)
 
-            # Extract text from each page
-            for i in range(min_page - 1, max_page):
-                try:
-                    page = doc.load_page(i)
-                    full_text += f"\n\n--- Page {i + 1} ---\n"
-                    full_text += page.get_text()
-                except Exception as e:
-                    self.log_warning(f"Error extracting page {i + 1}: {str(e)}", page=i + 1)
-                    continue
+            with ExitStack() as resources:
+                if fulltext:
+                    resources.callback(fulltext.close)
+                if isinstance(document, PDFBuffer) and not document.path \
+                        and self.page_extractor.is_parallel(max_page - min_page + 1):
+                    document = replace(document, path=resources.enter_context(self.page_extractor.spill(document.data)))
 
-            doc.close()
+                for batch_start in range(min_page, max_page + 1, batch_size):
+                    batch_end = min(batch_start + batch_size - 1, max_page)
+                    for page_number, text, tokens in self.get_page_texts(document, batch_start, batch_end, document_hash):
+                        if fulltext:
+                            fulltext.add(page_number, text)
+                        yield PageRecord(page_number, text, offset, offset + len(text), tokens)
+                        offset += len(text)
 
-            if not full_text.strip():
-                raise PDFExtractionError("No text could be extracted from PDF")
+            self.log_info(
+                f"Successfully extracted text from {max_page - min_page + 1} pages",
+                engine=self.page_extractor.engine
+            )
 
-            self.log_info(f"Successfully extracted text from {max_page - min_page + 1} pages")
-            return full_text
+        except PDFException:
+            raise
 
         except fitz.FileDataError as e:
             self.log_error(f"Invalid PDF file: {str(e)}", error=str(e))
             raise PDFInvalidFormatError(f"Invalid PDF file format: {str(e)}")
 
+        except PageExtractionError as e:
+            self.log_error(str(e), page=e.page)
+            raise PDFExtractionError(str(e), page=e.page)
+
         except Exception as e:
             self.log_error(f"Error extracting PDF text: {str(e)}", error=str(e))
             raise PDFExtractionError(f"Failed to extract text from PDF: {str(e)}")
 
-    def cleanup_file(self, file_path: str):
+    def _fulltext_writer(self, document: Union[str, PDFBuffer], document_hash: str) -> Optional[PageIndexWriter]:
+        """Writer feeding extracted pages to the full-text index (None if disabled or partial)"""
+        # Partial fetches are hashed by their own bytes, not the document's
+        if self.fulltext_index is None or (isinstance(document, PDFBuffer) and document.page_numbers is not None):
+            return None
+        return self.fulltext_index.writer(document_hash)
+
+    @staticmethod
+    def resolve_page_range(
+        min_page: Optional[int],
+        max_page: Optional[int],
+        total_pages: int
+    ) -> Tuple[int, int]:
+        """
+        Apply default page range and clamp it to the document
+
+        Args:
+            min_page: Requested minimum page (optional)
+            max_page: Requested maximum page (optional)
+            total_pages: Pages in the document
+
+        Returns:
+            tuple: (min_page, max_page)
+
+        Raises:
+            PDFExtractionError: If the resulting range is empty
+        """
+        # Set page range
+        min_page = min_page or config.PDF_DEFAULT_MIN_PAGE
+        max_page = max_page or min(config.PDF_DEFAULT_MAX_PAGE, total_pages)
+
+        # Validate page range
+        min_page = max(min_page, 1)
+        max_page = min(max_page, total_pages)
+
+        if min_page > max_page:
+            raise PDFExtractionError("Minimum page cannot be greater than maximum page")
+
+        return min_page, max_page
+
+    @staticmethod
+    def validate_page_range(min_page: Optional[int], max_page: Optional[int], total_pages: int):
+        """
+        Reject requested pages that the document does not have
+
+        Args:
+            min_page: Requested minimum page (optional)
+            max_page: Requested maximum page (optional)
+            total_pages: Pages in the document
+
+        Raises:
+            ValidationError: If the range lies beyond the last page
+        """
+        if max_page is not None:
+            Validator.validate_page_range(min_page or config.PDF_DEFAULT_MIN_PAGE, max_page, total_pages)
+        elif min_page is not None and min_page > total_pages:
+            raise ValidationError(f"Minimum page ({min_page}) exceeds total pages ({total_pages})")
+
+    def iter_document_pages(
+        self,
+        document_url: str,
+        min_page: Optional[int] = None,
+        max_page: Optional[int] = None,
+        cleanup: bool = True
+    ) -> Iterator[PageRecord]:
+        """
+        Download a PDF and lazily yield its pages
+
+        With the document registry enabled, a known document has its page
+        range validated before anything is downloaded, and when all
+        requested pages are already in the text cache (and the registry
+        entry is recent) they are served without a download.
+
+        Args:
+            document_url: URL of the PDF
+            min_page: Minimum page number
+            max_page: Maximum page number
+            cleanup: Whether to cleanup file once iteration ends (cached copies are kept)
+
+        Yields:
+            PageRecord: Page number, text and character offsets
+
+        Raises:
+            ValidationError: If the page range exceeds the document
+            PDFDownloadError: If download fails
+            PDFExtractionError: If extraction fails
+        """
+        record = self.lookup_document(document_url)
+        if record and record.total_pages:
+            self.validate_page_range(min_page, max_page, record.total_pages)
+
+            cached_pages = self._get_registered_pages(record, min_page, max_page)
+            if cached_pages is not None:
+                self.log_info("Serving registered document from the text cache", document_id=record.id)
+                yield from cached_pages
+                return
+
+        document = None
+        previous_status = None
+        try:
+            # Unset bounds mean the default range, which is what partial fetching targets
+            document = self.fetch_document(
+                document_url,
+                min_page or config.PDF_DEFAULT_MIN_PAGE,
+                max_page or config.PDF_DEFAULT_MAX_PAGE
+            )
+            total_pages, registered = self._register_document(document_url, document)
+            self.validate_page_range(min_page, max_page, total_pages)
+
+            previous_status = ExtractionStatusEnum.PENDING
+            if registered and registered.extraction_status != ExtractionStatusEnum.PROCESSING.value:
+                previous_status = ExtractionStatusEnum(registered.extraction_status)
+
+            self._set_extraction_status(document_url, ExtractionStatusEnum.PROCESSING)
+            yield from self.iter_pages(document, min_page, max_page)
+            self._set_extraction_status(document_url, ExtractionStatusEnum.COMPLETED)
+
+        except GeneratorExit:
+            # The consumer stopped early, so the range was not fully extracted
+            if previous_status is not None:
+                self._set_extraction_status(document_url, previous_status)
+            raise
+
+        except Exception as e:
+            if previous_status is not None or isinstance(e, PDFException):
+                self._set_extraction_status(document_url, ExtractionStatusEnum.FAILED)
+            raise
+
+        finally:
+            if cleanup and document is not None:
+                self.cleanup_file(document)
+
+    def lookup_document(self, document_url: str) -> Optional[DocumentRecord]:
+        """
+        Get registry entry of a document
+
+        Args:
+            document_url: URL of the PDF document
+
+        Returns:
+            DocumentRecord or None: Entry, if the registry is enabled and knows the URL
+        """
+        return self.documents.get_by_url(document_url) if self.documents else None
+
+    def lookup_fresh_document(self, document_url: str) -> Optional[DocumentRecord]:
+        """
+        Get registry entry of a document if it is recent enough to trust
+
+        Args:
+            document_url: URL of the PDF document
+
+        Returns:
+            DocumentRecord or None: Entry with content hash and page count, confirmed
+            against the origin within DOCUMENT_REGISTRY_FRESHNESS seconds
+        """
+        record = self.lookup_document(document_url)
+        if not record or not record.content_sha256 or not record.total_pages:
+            return None
+        if record.age_seconds() > config.DOCUMENT_REGISTRY_FRESHNESS:
+            return None
+        return record
+
+    def register_document(self, document_url: str, document: Union[str, PDFBuffer]) -> int:
+        """
+        Record a fetched document in the registry
+
+        Args:
+            document_url: URL of the PDF document
+            document: Fetched document
+
+        Returns:
+            int: Total number of pages
+        """
+        return self._register_document(document_url, document)[0]
+
+    def _register_document(
+        self,
+        document_url: str,
+        document: Union[str, PDFBuffer]
+    ) -> Tuple[int, Optional[DocumentRecord]]:
+        """Record a fetched document, returning its page count and registry entry"""
+        document_hash = self.get_document_hash(document)
+        total_pages = self.get_page_count(document, document_hash)
+
+        # Partial fetches have no real content hash or size to record
+        record = None
+        if self.documents and not (isinstance(document, PDFBuffer) and document.page_numbers is not None):
+            size_bytes = document.size_bytes if isinstance(document, PDFBuffer) else os.path.getsize(document)
+            record = self.documents.register(document_url, document_hash, total_pages, size_bytes)
+
+        return total_pages, record
+
+    def _set_extraction_status(self, document_url: str, status: ExtractionStatusEnum):
+        """Update extraction status in the registry"""
+        if self.documents:
+            self.documents.set_extraction_status(document_url, status)
+
+    def _get_registered_pages(
+        self,
+        record: DocumentRecord,
+        min_page: Optional[int],
+        max_page: Optional[int]
+    ) -> Optional[List[PageRecord]]:
+        """
+        Get pages of a registered document straight from the text cache
+
+        Returns:
+            list or None: Page records, or None if the entry is stale or any page is missing
+        """
+        if not record.content_sha256 or record.age_seconds() > config.DOCUMENT_REGISTRY_FRESHNESS:
+            return None
+
+        min_page, max_page = self.resolve_page_range(min_page, max_page, record.total_pages)
+        page_keys = [
+            CacheKey.pdf_page_key(record.content_sha256, page_number, self.page_extractor.engine)
+            for page_number in range(min_page, max_page + 1)
+        ]
+
+        page_numbers = range(min_page, max_page + 1)
+        cached = self.text_cache.get_many(
+            page_keys + list(self._token_keys(record.content_sha256, page_numbers).values())
+        )
+        if any(key not in cached for key in page_keys):
+            return None
+
+        texts = {page_number: cached[key] for page_number, key in zip(page_numbers, page_keys)}
+        tokens = self._get_token_counts(record.content_sha256, texts, cached)
+
+        pages = []
+        offset = 0
+        for page_number, text in texts.items():
+            pages.append(PageRecord(page_number, text, offset, offset + len(text), tokens[page_number]))
+            offset += len(text)
+        return pages
+
+    def normalize_pages(self, pages: Iterable[PageRecord]) -> Iterable[PageRecord]:
+        """
+        Strip boilerplate, duplicate pages and extra whitespace before prompting
+
+        Materializes the pages, since repeated lines can only be found across
+        the whole range. Returns them untouched when normalization is disabled.
+
+        Args:
+            pages: Page records of one document
+
+        Returns:
+            Normalized page records
+        """
+        if not config.TEXT_NORMALIZATION_ENABLED:
+            return pages
+
+        normalized, report = self.normalizer.normalize(pages)
+        self.log_info("Document text normalized", **report.to_dict())
+        return normalized
+
+    def pack_pages(
+        self,
+        pages: Iterable[PageRecord],
+        budget_tokens: int,
+        scores: Optional[Dict[int, float]] = None
+    ) -> PackedContext:
+        """
+        Select the pages that fit a prompt token budget
+
+        Args:
+            pages: Page records (consumed only as far as needed when unscored)
+            budget_tokens: Tokens available for page text and markers
+            scores: Optional page_number -> priority; document order otherwise
+
+        Returns:
+            PackedContext: Selected pages in document order
+        """
+        packed = ContextPacker(budget_tokens, self.token_estimator).pack(pages, scores)
+        if packed.exhausted:
+            self.log_info("Document text packed into token budget", **packed.to_dict())
+        return packed
+
+    def load_search_index(self, document_hash: str) -> Optional[BM25Index]:
+        """
+        Get the search index of a document if one was already built
+
+        Args:
+            document_hash: Content hash of the PDF
+
+        Returns:
+            BM25Index or None: Cached index
+        """
+        key = self._search_index_key(document_hash)
+        index = self.index_cache.get(key)
+        if index is None:
+            index = self.text_cache.get(key)
+            if index is not None:
+                self.index_cache.set(key, index)
+        return index
+
+    def get_search_index(self, document: Union[str, PDFBuffer]) -> BM25Index:
+        """
+        Get the search index of a document, building it on first use
+
+        All pages are extracted, normalized and split into overlapping
+        chunks. The index is cached per content hash (in memory, and in the
+        text cache tiers when enabled), and concurrent builds of the same
+        document are collapsed into one.
+
+        Args:
+            document: Path to PDF file or in-memory PDFBuffer
+
+        Returns:
+            BM25Index: Index over the document's chunks
+
+        Raises:
+            PDFExtractionError: If extraction fails
+        """
+        document_hash = self.get_document_hash(document)
+        key = self._search_index_key(document_hash)
+
+        def build() -> BM25Index:
+            # Another process may have built it while we waited for the lock
+            index = self.load_search_index(document_hash)
+            if index is not None:
+                return index
+
+            index = BM25Index(self._chunk_document(document, document_hash))
+
+            self.index_cache.set(key, index)
+            self.text_cache.set(key, index)
+            self.log_info(
+                "Search index built",
+                content_hash=document_hash,
+                chunks=len(index),
+                terms=len(index.terms),
+                postings=len(index.doc_ids)
+            )
+            return index
+
+        index = self.load_search_index(document_hash)
+        return index if index is not None else self.flight.do(key, build, cross_process=self.text_cache_shared)
+
+    def _search_index_key(self, document_hash: str) -> str:
+        return CacheKey.search_index_key(
+            document_hash,
+            self.page_extractor.engine,
+            self.chunker.chunk_tokens,
+            self.chunker.overlap_tokens
+        )
+
+    def load_vector_index(self, document_hash: str) -> Optional[VectorIndex]:
+        """
+        Get the stored chunk vectors of a document if they were already built
+
+        A damaged index is deleted and reported as missing so it gets rebuilt.
+
+        Args:
+            document_hash: Content hash of the PDF
+
+        Returns:
+            VectorIndex or None: Memory-mapped index
+        """
+        name = self._vector_index_name(document_hash)
+        try:
+            return self.vector_store.load(name, self.embedder.signature)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.log_warning(f"Discarding unreadable vector index: {str(e)}", content_hash=document_hash)
+            self.vector_store.delete(name, self.embedder.signature)
+            return None
+
+    def get_vector_index(self, document: Union[str, PDFBuffer]) -> VectorIndex:
+        """
+        Get the chunk vectors of a document, embedding it on first use
+
+        Reuses the chunks of the search index when it is already built,
+        so both retrievers rank the same chunks.
+
+        Args:
+            document: Path to PDF file or in-memory PDFBuffer
+
+        Returns:
+            VectorIndex: Memory-mapped index over the document's chunks
+
+        Raises:
+            PDFExtractionError: If extraction fails
+            KnowledgeBaseLoadError: If the chunks cannot be embedded or stored
+        """
+        document_hash = self.get_document_hash(document)
+        name = self._vector_index_name(document_hash)
+
+        def build() -> VectorIndex:
+            index = self.load_vector_index(document_hash)
+            if index is not None:
+                return index
+
+            search_index = self.load_search_index(document_hash)
+            chunks = search_index.chunks if search_index is not None else self._chunk_document(document, document_hash)
+
+            try:
+                vectors = self.embedder.embed([chunk.text for chunk in chunks])
+                index = self.vector_store.save(name, self.embedder.signature, chunks, vectors)
+            except Exception as e:
+                self.log_error(f"Failed to build vector index: {str(e)}", error=str(e), content_hash=document_hash)
+                raise KnowledgeBaseLoadError(f"Failed to build vector index: {str(e)}", source=document_hash)
+
+            self.log_info(
+                "Vector index built",
+                content_hash=document_hash,
+                chunks=len(index),
+                embedder=self.embedder.signature
+            )
+            return index
+
+        index = self.load_vector_index(document_hash)
+        return index if index is not None else self.flight.do(('vectors', name), build)
+
+    def embed_query(self, text: str):
+        """
+        Embed a query in the vector space of the stored indexes
+
+        Args:
+            text: Query text
+
+        Returns:
+            np.ndarray: Normalized query vector
+        """
+        return self.embedder.embed([text])[0]
+
+    def _vector_index_name(self, document_hash: str) -> str:
+        return "-".join([
+            document_hash,
+            self.page_extractor.engine,
+            str(self.chunker.chunk_tokens),
+            str(self.chunker.overlap_tokens)
+        ])
+
+    def _chunk_document(self, document: Union[str, PDFBuffer], document_hash: str) -> List[TextChunk]:
+        """Extract, normalize and chunk all pages of a document"""
+        total_pages = self.get_page_count(document, document_hash)
+        pages = self.normalize_pages(self.iter_pages(document, 1, total_pages))
+        return self.chunker.chunk(pages)
+
+    def split_pages(self, pages: Iterable[PageRecord], section_tokens: int) -> List[PackedContext]:
+        """
+        Split pages into consecutive sections of at most ``section_tokens``
+
+        Args:
+            pages: Page records in document order
+            section_tokens: Token budget of each section (page text and markers)
+
+        Returns:
+            list: Sections in document order
+        """
+        return ContextPacker(section_tokens, self.token_estimator).split(pages)
+
+    @staticmethod
+    def render_pages(pages: Iterable[PageRecord], header: str = '', footer: str = '') -> str:
+        """
+        Join pages into one text with '--- Page N ---' markers in a single pass
+
+        Args:
+            pages: Page records (typically a lazy iterator)
+            header: Text placed before the first page
+            footer: Text placed after the last page
+
+        Returns:
+            str: Rendered text
+
+        Raises:
+            PDFExtractionError: If the pages contain no text
+        """
+        parts = [header]
+        has_text = False
+
+        for page in pages:
+            parts.append(page.marker)
+            parts.append(page.text)
+            has_text = has_text or bool(page.text.strip())
+
+        if not has_text:
+            raise PDFExtractionError("No text could be extracted from PDF")
+
+        parts.append(footer)
+        return "".join(parts)
+
+    @staticmethod
+    def open_document(source: Union[str, PDFBuffer]) -> fitz.Document:
+        """
+        Open PDF from a file path or an in-memory buffer
+
+        Args:
+            source: Path to PDF file or PDFBuffer
+
+        Returns:
+            fitz.Document: Opened document
+        """
+        if isinstance(source, PDFBuffer):
+            return fitz.open(stream=source.data, filetype='pdf')
+        return fitz.open(source)
+
+    @staticmethod
+    def _describe_source(source: Union[str, PDFBuffer]) -> str:
+        """Human-readable description of a document source for logs"""
+        if isinstance(source, PDFBuffer):
+            return f"in-memory PDF {source.content_hash[:12]} ({source.size_bytes} bytes)"
+        return source
+
+    def get_document_hash(self, source: Union[str, PDFBuffer]) -> str:
+        """
+        Get SHA-256 content hash of a PDF
+
+        Cached downloads and uploads are named after their hash and buffers carry it,
+        so no re-read is needed for either.
+
+        Args:
+            source: Path to PDF file or PDFBuffer
+
+        Returns:
+            str: Content hash
+        """
+        if isinstance(source, PDFBuffer):
+            return source.content_hash
+        if self.is_cached_file(source):
+            return os.path.splitext(os.path.basename(source))[0]
+        return FileHelper.get_path_hash(source)
+
+    def get_page_count(self, source: Union[str, PDFBuffer], document_hash: Optional[str] = None) -> int:
+        """
+        Get number of pages in a PDF, using cached metadata when available
+
+        Args:
+            source: Path to PDF file or PDFBuffer
+            document_hash: Content hash (computed when omitted)
+
+        Returns:
+            int: Total number of pages
+        """
+        if isinstance(source, PDFBuffer) and source.total_pages is not None:
+            return source.total_pages
+
+        document_hash = document_hash or self.get_document_hash(source)
+        meta_key = CacheKey.pdf_meta_key(document_hash)
+
+        meta = self.text_cache.get(meta_key)
+        if meta is not None:
+            return meta['total_pages']
+
+        with self.open_document(source) as doc:
+            total_pages = len(doc)
+
+        self.text_cache.set(meta_key, {'total_pages': total_pages})
+        return total_pages
+
+    def get_page_texts(
+        self,
+        source: Union[str, PDFBuffer],
+        min_page: int,
+        max_page: int,
+        document_hash: Optional[str] = None
+    ) -> List[Tuple[int, str, int]]:
+        """
+        Get text of each page in a range, parsing only pages missing from the cache
+
+        Missing pages are extracted in parallel for large ranges. Pages that
+        fail are handled according to PDF_PAGE_ERROR_POLICY. Estimated token
+        counts are cached next to the page text.
+
+        Args:
+            source: Path to PDF file or PDFBuffer
+            min_page: First page number (1-indexed, inclusive)
+            max_page: Last page number (1-indexed, inclusive)
+            document_hash: Content hash (computed when omitted)
+
+        Returns:
+            list: (page_number, text, tokens) tuples in page order
+        """
+        document_hash = document_hash or self.get_document_hash(source)
+        page_keys = {
+            page_number: CacheKey.pdf_page_key(document_hash, page_number, self.page_extractor.engine)
+            for page_number in range(min_page, max_page + 1)
+        }
+
+        cached = self.text_cache.get_many(
+            list(page_keys.values()) + list(self._token_keys(document_hash, page_keys).values())
+        )
+        missing = [page_number for page_number, key in page_keys.items() if key not in cached]
+
+        extracted = {}
+        if missing:
+            extracted = self._extract_pages(source, missing)
+            self.text_cache.set_many({page_keys[n]: text for n, text in extracted.items()})
+
+        self.log_debug(
+            "Page text lookup completed",
+            cached_pages=len(page_keys) - len(missing),
+            extracted_pages=len(extracted)
+        )
+
+        texts = {}
+        for page_number, key in page_keys.items():
+            text = cached.get(key, extracted.get(page_number))
+            if text is not None:
+                texts[page_number] = text
+
+        tokens = self._get_token_counts(document_hash, texts, cached)
+        return [(page_number, text, tokens[page_number]) for page_number, text in texts.items()]
+
+    def _token_keys(self, document_hash: str, page_numbers: Iterable[int]) -> Dict[int, str]:
+        """Cache keys of the token counts of some pages"""
+        return {
+            page_number: CacheKey.pdf_page_tokens_key(document_hash, page_number, self.page_extractor.engine)
+            for page_number in page_numbers
+        }
+
+    def _get_token_counts(self, document_hash: str, texts: Dict[int, str], cached: Dict[str, Any]) -> Dict[int, int]:
+        """
+        Get token counts of page texts, estimating and caching missing ones
+
+        Args:
+            document_hash: Content hash
+            texts: page_number -> text
+            cached: Cache lookup result that may already hold token counts
+
+        Returns:
+            dict: page_number -> estimated tokens
+        """
+        token_keys = self._token_keys(document_hash, texts)
+        counts = {}
+        missing = {}
+        for page_number, text in texts.items():
+            key = token_keys[page_number]
+            if key in cached:
+                counts[page_number] = cached[key]
+            else:
+                counts[page_number] = missing[key] = self.token_estimator.estimate(text)
+
+        if missing:
+            self.text_cache.set_many(missing)
+        return counts
+
+    def _extract_pages(self, source: Union[str, PDFBuffer], page_numbers: List[int]) -> Dict[int, str]:
+        """Run the page extractor, translating page numbers of partial buffers"""
+        if isinstance(source, PDFBuffer) and source.page_numbers is not None:
+            local_numbers = {page: index + 1 for index, page in enumerate(source.page_numbers)}
+            original_numbers = {index: page for page, index in local_numbers.items()}
+            texts = self.page_extractor.extract(
+                source.extraction_source,
+                [local_numbers[page] for page in page_numbers if page in local_numbers]
+            )
+            return {original_numbers[index]: text for index, text in texts.items()}
+
+        raw_source = source.extraction_source if isinstance(source, PDFBuffer) else os.path.abspath(source)
+        return self.page_extractor.extract(raw_source, page_numbers)
+
+    def cleanup_file(self, file_path: Union[str, PDFBuffer]):
         """
         Delete PDF file
 
+        Cached copies, uploads and in-memory buffers are left alone.
+
         Args:
             file_path: Path to file to delete
         """
+        if isinstance(file_path, PDFBuffer) or self.is_cached_file(file_path):
+            return
+
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
@@ -190,11 +1340,16 @@ class PDFService(BaseService):
         """
         Download and extract text from PDF (convenience method)
 
+        Concurrent calls for the same URL and page range share one download
+        and extraction. Other worker processes wait for it only when the
+        text cache lets them reuse the result; otherwise only the download
+        itself is shared across processes.
+
         Args:
             document_url: URL of the PDF
             min_page: Minimum page number
             max_page: Maximum page number
-            cleanup: Whether to cleanup file after extraction
+            cleanup: Whether to cleanup file after extraction (cached copies are kept)
 
         Returns:
             str: Extracted text
@@ -203,11 +1358,18 @@ class PDFService(BaseService):
             PDFDownloadError: If download fails
             PDFExtractionError: If extraction fails
         """
-        file_path = None
-        try:
-            file_path = self.download_pdf(document_url)
-            text = self.extract_text_from_pdf(file_path, min_page, max_page)
-            return text
-        finally:
-            if cleanup and file_path:
-                self.cleanup_file(file_path)
+        return self.flight.do(
+            ('process_pdf', document_url, min_page, max_page, cleanup),
+            lambda: self._process_pdf(document_url, min_page, max_page, cleanup),
+            cross_process=self.text_cache_shared
+        )
+
+    def _process_pdf(
+        self,
+        document_url: str,
+        min_page: Optional[int],
+        max_page: Optional[int],
+        cleanup: bool
+    ) -> str:
+        """Download and extract text from PDF (without deduplication)"""
+        return self.render_pages(self.iter_document_pages(document_url, min_page, max_page, cleanup))
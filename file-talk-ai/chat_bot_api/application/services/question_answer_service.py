@@ -1,59 +1,90 @@
-import os
 import logging
-import tempfile
-import requests
-import fitz  # PyMuPDF
-from phi.agent import Agent
-from phi.model.groq import Groq
+from typing import List, Optional, Tuple
+from config.env_config import config
+from config.constants import ActionType
+from chat_bot_api.infrastructure.search import (
+    BM25Index,
+    TextChunk,
+    VectorIndex,
+    get_answer_cache,
+    reciprocal_rank_fusion
+)
+from chat_bot_api.infrastructure.external import get_llm_registry
+from chat_bot_api.infrastructure.repositories import SessionRepository
+from chat_bot_api.infrastructure.sessions import SessionContext, get_session_store
+from chat_bot_api.infrastructure.text import prompt_token_budget
+from .pdf_service import PDFService
 
 logger = logging.getLogger(__name__)
 
-os.environ["GROQ_API_KEY"] = os.environ.get("groqApiKey")
+# Agent context; the PDF text is packed to fit the model's token budget
+QA_CONTEXT_PROMPT = (
+    "You are an AI assistant that answers questions using **only** "
+    "the following PDF content. Do not use external knowledge, "
+    "inference, or assumptions. If the answer cannot be found, say: "
+    "'I'm sorry, but I couldn't find the answer to your question in the provided PDF document.'\n\n"
+    "=== PDF CONTENT START ===\n"
+    "{pdf_text}\n"
+    "=== PDF CONTENT END ==="
+)
+
+# Chunk rankers selectable with QA_RETRIEVAL_METHOD
+QA_RETRIEVAL_METHODS = ('bm25', 'vector', 'hybrid')
+
+# Bump when the QA prompt changes so cached answers are not reused
+QA_PROMPT_VERSION = 1
+
+QA_NOT_FOUND_MESSAGE = "I'm sorry, but I couldn't find the answer to your question in the provided PDF document."
+QA_ERROR_MESSAGE = "Error processing the question."
 
 class QuestionAnswerService:
     """
     PDF-based QA service for Groq models.
-    Uses direct text extraction (PyMuPDF) for reliability.
+    Uses direct text extraction (PyMuPDF) for reliability; with retrieval
+    enabled only the chunks most relevant to the question are sent.
+    Answers are cached per document content hash, so repeated and
+    reworded questions skip the model call. With a session id the
+    document context (indexes or extracted text) is kept warm, so
+    follow-up questions in the session skip ingestion entirely.
     """
 
     def __init__(self):
         self.model_id = "llama-3.3-70b-versatile"
+        self.pdf_service = PDFService()
+        self.answer_cache = get_answer_cache()
+        self.sessions = get_session_store()
+        self.llm = get_llm_registry()
 
-    def download_pdf(self, url: str) -> str:
-        """Download the PDF and return its local path."""
+    def download_pdf(self, url: str):
+        """Download the PDF (or reuse the cached copy) and return its local path or in-memory buffer."""
         try:
             logger.info(f"Downloading PDF from {url}")
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            for chunk in response.iter_content(1024):
-                temp_file.write(chunk)
-            temp_file.close()
-            logger.info(f"✅ PDF downloaded to {temp_file.name}")
-            return temp_file.name
+            document = self.pdf_service.fetch_document(url)
+            logger.info("✅ PDF downloaded")
+            return document
         except Exception as e:
             logger.error(f"❌ Failed to download PDF: {e}")
             raise RuntimeError("Failed to download PDF") from e
 
-    def extract_pdf_text(self, file_path: str) -> str:
+    def extract_pdf_text(self, file_path) -> str:
         """Extract readable text from a PDF file using PyMuPDF."""
         try:
-            logger.info(f"Extracting text from {file_path}")
-            pdf_document = fitz.open(file_path)
-            text = ""
-            for page_num in range(pdf_document.page_count):
-                page = pdf_document.load_page(page_num)
-                text += page.get_text("text") + "\n\n"
+            logger.info("Extracting text from PDF")
+            total_pages = self.pdf_service.get_page_count(file_path)
 
-            pdf_document.close()
-            os.remove(file_path)  # cleanup temp file
+            # Consume pages lazily and stop extracting once the token budget is full
+            packed = self.pdf_service.pack_pages(
+                self.pdf_service.iter_pages(file_path, 1, total_pages),
+                self.context_token_budget()
+            )
+            text = "".join(f"{page.text}\n\n" for page in packed.pages)
 
             if not text.strip():
                 raise ValueError("No text found in the PDF.")
 
-            # Limit text size for Groq model safety
-            if len(text) > 100000:
-                text = text[:100000] + "\n\n...[Content truncated for model limit]..."
+            # Pages (or their tail) left out to fit the model
+            if packed.exhausted:
+                text += "...[Content truncated for model limit]..."
 
             logger.info("✅ Text extracted successfully.")
             return text
@@ -62,29 +93,109 @@ class QuestionAnswerService:
             logger.error(f"❌ Error extracting text from PDF: {e}")
             raise RuntimeError("Failed to extract text from PDF") from e
 
+        finally:
+            # Also on failure, so uncached downloads are not left behind (cached copies are kept)
+            self.pdf_service.cleanup_file(file_path)
+
+    def retrieve_pdf_text(
+        self,
+        document_url: str,
+        question: str,
+        indexes: Optional[Tuple[Optional[BM25Index], Optional[VectorIndex]]] = None
+    ) -> str:
+        """Build the PDF context from the chunks most relevant to the question (optionally from given indexes)."""
+        try:
+            hits, chunks = self.rank_chunks(document_url, question, indexes)
+            budget = self.context_token_budget()
+
+            if not hits:
+                # Nothing similar to the question; fall back to the start of the document
+                logger.info("No matching chunks, using leading chunks")
+                hits = chunks[:config.QA_RETRIEVAL_TOP_K]
+
+            # Best chunks first until the budget is full, then back in document order
+            selected = []
+            used = 0
+            for chunk in hits:
+                cost = chunk.tokens + self.pdf_service.token_estimator.estimate(chunk.marker)
+                if used + cost > budget:
+                    continue
+                selected.append(chunk)
+                used += cost
+
+            if not selected:
+                raise ValueError("No text found in the PDF.")
+
+            selected.sort(key=lambda chunk: chunk.index)
+            logger.info(f"✅ Retrieved {len(selected)} of {len(chunks)} chunks ({used} tokens)")
+            return "".join(f"{chunk.marker}{chunk.text}\n" for chunk in selected).strip()
+
+        except Exception as e:
+            logger.error(f"❌ Error retrieving PDF context: {e}")
+            raise RuntimeError("Failed to retrieve PDF context") from e
+
+    def rank_chunks(
+        self,
+        document_url: str,
+        question: str,
+        indexes: Optional[Tuple[Optional[BM25Index], Optional[VectorIndex]]] = None
+    ) -> Tuple[List[TextChunk], List[TextChunk]]:
+        """Rank the document's chunks for the question; returns (top chunks, all chunks)."""
+        search_index, vector_index = indexes or self.load_indexes(document_url)
+        top_k = config.QA_RETRIEVAL_TOP_K
+        rankings = []
+
+        if search_index is not None:
+            rankings.append([chunk for chunk, _ in search_index.search(question, top_k)])
+        if vector_index is not None:
+            query = self.pdf_service.embed_query(question)
+            rankings.append([chunk for chunk, _ in vector_index.search(query, top_k)[0]])
+
+        hits = reciprocal_rank_fusion(rankings)[:top_k] if len(rankings) > 1 else rankings[0]
+        chunks = search_index.chunks if search_index is not None else vector_index.chunks
+        return hits, chunks
+
+    def load_indexes(self, document_url: str) -> Tuple[Optional[BM25Index], Optional[VectorIndex]]:
+        """Get the indexes QA_RETRIEVAL_METHOD needs, skipping the download when they are already built."""
+        method = config.QA_RETRIEVAL_METHOD
+        if method not in QA_RETRIEVAL_METHODS:
+            raise ValueError(f"Unknown retrieval method: {method}")
+        use_bm25 = method in ('bm25', 'hybrid')
+        use_vectors = method in ('vector', 'hybrid')
+
+        record = self.pdf_service.lookup_document(document_url)
+        if record and record.content_sha256:
+            search_index = self.pdf_service.load_search_index(record.content_sha256) if use_bm25 else None
+            vector_index = self.pdf_service.load_vector_index(record.content_sha256) if use_vectors else None
+            if (search_index is not None or not use_bm25) and (vector_index is not None or not use_vectors):
+                logger.info("✅ Reusing indexes of registered document")
+                return search_index, vector_index
+
+        document = self.download_pdf(document_url)
+        try:
+            self.pdf_service.register_document(document_url, document)
+            search_index = self.pdf_service.get_search_index(document) if use_bm25 else None
+            vector_index = self.pdf_service.get_vector_index(document) if use_vectors else None
+            return search_index, vector_index
+        finally:
+            self.pdf_service.cleanup_file(document)
+
+    def context_token_budget(self) -> int:
+        """Tokens available for PDF text in the agent context."""
+        budget = prompt_token_budget(self.model_id, config.AI_MAX_TOKENS, config.PROMPT_MAX_TOKENS)
+        return budget - self.pdf_service.token_estimator.estimate(QA_CONTEXT_PROMPT)
+
     def initialize_agent(self, pdf_text: str):
         """Initialize Groq QA agent with PDF context."""
         try:
             logger.info("Initializing Groq QA agent with PDF context...")
-            context_prompt = (
-                "You are an AI assistant that answers questions using **only** "
-                "the following PDF content. Do not use external knowledge, "
-                "inference, or assumptions. If the answer cannot be found, say: "
-                "'I'm sorry, but I couldn't find the answer to your question in the provided PDF document.'\n\n"
-                "=== PDF CONTENT START ===\n"
-                f"{pdf_text}\n"
-                "=== PDF CONTENT END ==="
-            )
+            context_prompt = QA_CONTEXT_PROMPT.format(pdf_text=pdf_text)
 
-            agent = Agent(
-                description=context_prompt,
-                model=Groq(id=self.model_id),
-                markdown=True,
-                fallback_messages=[
-                    "I'm sorry, but I couldn't find the answer to your question in the provided PDF document."
-                ],
+            return self.llm.create_agent(
+                ActionType.QUESTION_ANSWER,
+                context_prompt,
+                model_id=self.model_id
             )
-            return agent
         except Exception as e:
             logger.error(f"❌ Error initializing agent: {e}")
             raise RuntimeError("Failed to initialize agent") from e
@@ -97,17 +208,100 @@ class QuestionAnswerService:
             answer = response.content.strip()
 
             if not answer or "I'm sorry" in answer:
-                return "I'm sorry, but I couldn't find the answer to your question in the provided PDF document."
+                return QA_NOT_FOUND_MESSAGE
 
             return answer
         except Exception as e:
             logger.error(f"❌ Error processing question: {e}")
-            return "Error processing the question."
+            return QA_ERROR_MESSAGE
 
-    def answer_question(self, document_url: str, question: str) -> str:
+    def answer_question(self, document_url: str, question: str, session_id: Optional[str] = None) -> str:
         """Full workflow."""
-        logger.info("Starting question answering process (direct PDF mode)...")
-        local_pdf = self.download_pdf(document_url)
-        pdf_text = self.extract_pdf_text(local_pdf)
+        context = self.session_context(document_url, session_id)
+        content_hash = context.content_hash if context else self.cached_document_hash(document_url)
+        if content_hash and self.answer_cache is not None:
+            hit = self.answer_cache.get(content_hash, self.answer_variant(), question)
+            if hit is not None:
+                logger.info(f"✅ Reusing cached answer ({'exact' if hit.exact else f'similarity {hit.similarity:.2f}'})")
+                return hit.answer
+
+        if context is None and session_id and self.sessions is not None:
+            context = self.warm_session(document_url, session_id)
+
+        if config.QA_RETRIEVAL_ENABLED:
+            logger.info("Starting question answering process (retrieval mode)...")
+            indexes = (context.search_index, context.vector_index) if context else None
+            pdf_text = self.retrieve_pdf_text(document_url, question, indexes)
+        elif context is not None:
+            pdf_text = context.pdf_text
+        else:
+            logger.info("Starting question answering process (direct PDF mode)...")
+            pdf_text = self.load_pdf_text(document_url)
         agent = self.initialize_agent(pdf_text)
-        return self.ask_question(agent, question)
+        answer = self.ask_question(agent, question)
+
+        if self.answer_cache is not None and answer not in (QA_NOT_FOUND_MESSAGE, QA_ERROR_MESSAGE):
+            content_hash = context.content_hash if context else self.cached_document_hash(document_url)
+            if content_hash:
+                self.answer_cache.put(content_hash, self.answer_variant(), question, answer)
+
+        return answer
+
+    def load_pdf_text(self, document_url: str) -> str:
+        """Download, register and extract the document for direct mode."""
+        local_pdf = self.download_pdf(document_url)
+        # Registered so the answer can be cached under the content hash
+        self.pdf_service.register_document(document_url, local_pdf)
+        return self.extract_pdf_text(local_pdf)
+
+    def session_context(self, document_url: str, session_id: Optional[str]) -> Optional[SessionContext]:
+        """Warm context of the session, if it is about this document and built with the current settings."""
+        if not session_id or self.sessions is None:
+            return None
+
+        context = self.sessions.get(session_id)
+        if context is None or not context.matches(document_url, self.answer_variant()):
+            return None
+
+        logger.info("✅ Reusing session document context")
+        return context
+
+    def warm_session(self, document_url: str, session_id: str) -> SessionContext:
+        """Ingest the document once and keep its context for the session's follow-up questions."""
+        logger.info("Warming session document context...")
+        if config.QA_RETRIEVAL_ENABLED:
+            search_index, vector_index = self.load_indexes(document_url)
+            pdf_text = None
+        else:
+            search_index = vector_index = None
+            pdf_text = self.load_pdf_text(document_url)
+
+        record = self.pdf_service.lookup_fresh_document(document_url)
+        context = SessionContext(
+            session_id=session_id,
+            document_url=document_url,
+            content_hash=record.content_sha256 if record else None,
+            variant=self.answer_variant(),
+            search_index=search_index,
+            vector_index=vector_index,
+            pdf_text=pdf_text
+        )
+        self.sessions.put(context)
+
+        if record is not None:
+            SessionRepository().bind(session_id, record.id)
+        return context
+
+    def cached_document_hash(self, document_url: str) -> Optional[str]:
+        """Content hash of a registered document, if the entry is recent enough to trust."""
+        record = self.pdf_service.lookup_fresh_document(document_url)
+        return record.content_sha256 if record else None
+
+    def answer_variant(self) -> str:
+        """Everything besides the document that shapes an answer."""
+        if not config.QA_RETRIEVAL_ENABLED:
+            return f"v{QA_PROMPT_VERSION}:{self.model_id}:direct"
+        return (
+            f"v{QA_PROMPT_VERSION}:{self.model_id}:{config.QA_RETRIEVAL_METHOD}:{config.QA_RETRIEVAL_TOP_K}:"
+            f"{config.QA_CHUNK_TOKENS}:{config.QA_CHUNK_OVERLAP_TOKENS}"
+        )
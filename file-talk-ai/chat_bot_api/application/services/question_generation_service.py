@@ -2,15 +2,44 @@
 Question Generation Service
 Handles generation of questions from PDF documents
 """
-from typing import Optional
+import math
+import re
+from typing import List, Optional, Tuple
 from config.env_config import config
-from config.constants import AgentConstants
+from config.constants import ActionType, CacheKey
+from chat_bot_api.domain.exceptions import AgentProcessingError
+from chat_bot_api.domain.models import PageRecord
+from chat_bot_api.infrastructure.search import deduplicate
+from chat_bot_api.infrastructure.text import PackedContext
 from .agent_service import AgentService
 from .pdf_service import PDFService
 
+# Bump when the question prompts change so cached responses are not reused
+QUESTIONS_PROMPT_VERSION = 1
+
+# Sections are asked for more questions than their share, to leave room for dedupe
+QUESTIONS_OVERSAMPLE = 1.5
+SECTION_MIN_QUESTIONS = 3
+
+# "1. What ...?", "2) ...", "- ..." or "Q3: ..." list items
+_QUESTION_LINE = re.compile(r'^\s*(?:\d+[.)]|[-*•]|Q\d+[:.)])\s+(.+?)\s*$')
+_KEY_POINT_LINE = re.compile(r'^\W*key\s+points?\W*[:\-]\s*(.+?)\s*$', re.IGNORECASE)
+
 
 class QuestionGenerationService(AgentService):
-    """Service for generating questions from PDF documents"""
+    """
+    Service for generating questions from PDF documents
+
+    Ranges up to QUESTIONS_SECTIONED_THRESHOLD_TOKENS are handled in one
+    call. Longer ranges are split into sections of QUESTIONS_SECTION_TOKENS
+    that get their own questions concurrently; near-duplicate questions
+    across sections are dropped (MinHash over word shingles) and the final
+    list is taken round-robin from the sections, so every part of the range
+    is covered instead of mostly its first pages.
+
+    Complete responses are cached by content hash, page range, model and
+    prompt version, and identical concurrent requests share one run.
+    """
 
     def __init__(self):
         """Initialize question generation service"""
@@ -46,41 +75,180 @@ class QuestionGenerationService(AgentService):
             max_page=max_page
         )
 
-        # Download and extract PDF text
-        text = self.pdf_service.process_pdf(
+        result = self.cached_response(
+            (CacheKey.QUESTIONS, document_url, min_page, max_page),
+            lambda: self._response_key(document_url, min_page, max_page),
+            lambda: self._generate(document_url, min_page, max_page)
+        )
+
+        if not result or not result.strip():
+            raise AgentProcessingError("Empty response from question generation agent")
+
+        return result
+
+    def _generate(self, document_url: str, min_page: Optional[int], max_page: Optional[int]) -> str:
+        # Drop repeated headers, footers and pages before they reach the prompt
+        pages = list(self.pdf_service.normalize_pages(self.pdf_service.iter_document_pages(
             document_url,
             min_page=min_page,
             max_page=max_page,
             cleanup=True
+        )))
+        sections = self.pdf_service.split_pages(pages, config.QUESTIONS_SECTION_TOKENS)
+        total_tokens = sum(section.tokens for section in sections)
+
+        threshold = config.QUESTIONS_SECTIONED_THRESHOLD_TOKENS
+        if threshold > 0 and total_tokens > threshold and len(sections) > 1:
+            return self._generate_sectioned(sections, total_tokens)
+        return self._generate_single(pages)
+
+    def _response_key(self, document_url: str, min_page: Optional[int], max_page: Optional[int]) -> Optional[str]:
+        """Cache key of the complete response, if the document is registered"""
+        record = self.pdf_service.lookup_fresh_document(document_url)
+        if record is None:
+            return None
+
+        self.pdf_service.validate_page_range(min_page, max_page, record.total_pages)
+        first_page, last_page = self.pdf_service.resolve_page_range(min_page, max_page, record.total_pages)
+        variant = (
+            f"v{QUESTIONS_PROMPT_VERSION}:{config.GROQ_MODEL_ID}:{self.pdf_service.page_extractor.engine}:"
+            f"{config.QUESTIONS_COUNT}:{config.QUESTIONS_SECTIONED_THRESHOLD_TOKENS}:{config.QUESTIONS_SECTION_TOKENS}"
         )
+        return CacheKey.response_key(CacheKey.QUESTIONS, record.content_sha256, variant, first_page, last_page)
+
+    def _generate_single(self, pages: List[PageRecord]) -> str:
+        """Generate all questions in one call"""
+        header = """
+You are an educational assistant. Based on the following academic text:
+
+"""
+        footer = f"""
+
+Please do the following:
+1. Generate {config.QUESTIONS_COUNT} thoughtful and relevant questions that test understanding of the content.
+2. Highlight the most important concept or point from the text.
+"""
+
+        packed = self.pdf_service.pack_pages(pages, self.context_token_budget(header, footer))
+        prompt = self.pdf_service.render_pages(packed.pages, header=header, footer=footer)
 
         # Create question generation agent
         agent = self.create_agent(
-            name=AgentConstants.QUESTION_GEN_AGENT_NAME,
+            action=ActionType.GENERATE_QUESTIONS,
             description="Generates questions with Number and highlights key points from academic text.",
-            role=AgentConstants.QUESTION_GEN_AGENT_ROLE,
             instructions=[
                 f"Generate {config.QUESTIONS_COUNT} questions based on the input text.",
                 "Identify the most important point from the text."
             ]
         )
 
-        # Create generation prompt
-        prompt = f"""
-You are an educational assistant. Based on the following academic text:
+        # Generate questions
+        return self.run_agent(agent, prompt)
 
-{text}
+    def _generate_sectioned(self, sections: List[PackedContext], total_tokens: int) -> str:
+        """Generate questions per section concurrently, then merge them without near-duplicates"""
+        count = config.QUESTIONS_COUNT
+        per_section = max(SECTION_MIN_QUESTIONS, math.ceil(count * QUESTIONS_OVERSAMPLE / len(sections)))
+
+        self.log_info(
+            "Generating questions in sections",
+            sections=len(sections),
+            total_tokens=total_tokens,
+            questions_per_section=per_section
+        )
+
+        results = self.map_parallel(
+            lambda section: self._parse_section_output(self._generate_section(section, per_section)),
+            sections,
+            config.QUESTIONS_MAP_WORKERS,
+            name='questions-map'
+        )
+
+        # Round-robin order, so deduplication keeps the first section's
+        # version of a repeated question but no section crowds out the others
+        candidates: List[Tuple[int, int, str]] = []
+        for position in range(max((len(questions) for questions, _ in results), default=0)):
+            for section_index, (questions, _) in enumerate(results):
+                if position < len(questions):
+                    candidates.append((section_index, position, questions[position]))
+
+        kept = deduplicate([question for _, _, question in candidates], config.QUESTIONS_DEDUPE_THRESHOLD)
+        selected = sorted(candidates[index] for index in kept[:count])
+
+        self.log_info(
+            "Merged section questions",
+            candidates=len(candidates),
+            near_duplicates=len(candidates) - len(kept),
+            selected=len(selected)
+        )
+
+        if not selected:
+            raise AgentProcessingError("No questions found in question generation output")
+
+        lines = ["## Questions", ""]
+        lines.extend(f"{number}. {question}" for number, (_, _, question) in enumerate(selected, start=1))
+
+        key_points = [
+            (self._section_title(section), key_point)
+            for section, (_, key_point) in zip(sections, results) if key_point
+        ]
+        if key_points:
+            lines.extend(["", "## Most Important Points", ""])
+            lines.extend(f"- **{title}:** {key_point}" for title, key_point in key_points)
+
+        return "\n".join(lines)
+
+    def _generate_section(self, section: PackedContext, questions: int) -> str:
+        """Ask for questions about one section of a longer document"""
+        title = self._section_title(section)
+        header = f"""
+You are an educational assistant. The following content is one section ({title}) of a longer academic text:
+
+"""
+        footer = f"""
 
 Please do the following:
-1. Generate {config.QUESTIONS_COUNT} thoughtful and relevant questions that test understanding of the content.
-2. Highlight the most important concept or point from the text.
+1. Generate {questions} thoughtful and relevant questions that test understanding of this section, as a numbered list with one question per line.
+2. On a final line starting with "Key point:", state the most important concept or point of this section.
 """
+        prompt = self.pdf_service.render_pages(section.pages, header=header, footer=footer)
 
-        # Generate questions
-        result = self.run_agent(agent, prompt)
+        agent = self.create_agent(
+            action=ActionType.GENERATE_QUESTIONS,
+            description="Generates numbered questions and the key point of one section of an academic text.",
+            instructions=[
+                f"Generate {questions} questions based only on the given section, one per numbered line.",
+                'End with one line starting with "Key point:".'
+            ]
+        )
+        return self.run_agent(agent, prompt)
 
-        if not result or not result.strip():
-            from chat_bot_api.domain.exceptions import AgentProcessingError
-            raise AgentProcessingError("Empty response from question generation agent")
+    @staticmethod
+    def _parse_section_output(output: str) -> Tuple[List[str], Optional[str]]:
+        """
+        Extract the questions and the key point from a section's output
 
-        return result
+        Returns:
+            tuple: (questions in order, key point or None)
+        """
+        questions: List[str] = []
+        key_point = None
+
+        for line in output.splitlines():
+            key_match = _KEY_POINT_LINE.match(line.replace('*', ''))
+            if key_match:
+                key_point = key_match.group(1)
+                continue
+
+            match = _QUESTION_LINE.match(line)
+            if match:
+                text = match.group(1).replace('**', '').strip()
+                if text.endswith('?'):
+                    questions.append(text)
+
+        return questions, key_point
+
+    @staticmethod
+    def _section_title(section: PackedContext) -> str:
+        first, last = section.pages[0].number, section.pages[-1].number
+        return f"Page {first}" if first == last else f"Pages {first}-{last}"
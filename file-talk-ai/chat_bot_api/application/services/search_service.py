@@ -0,0 +1,65 @@
+"""
+Search Service
+Full-text search across all registered documents
+"""
+from typing import Any, Dict, List
+from chat_bot_api.domain.exceptions import NotFoundError
+from chat_bot_api.infrastructure.repositories import DocumentRepository
+from chat_bot_api.infrastructure.search import get_fulltext_index
+from .base_service import BaseService
+
+
+class SearchService(BaseService):
+    """Service for corpus-wide page search"""
+
+    def __init__(self):
+        """Initialize search service"""
+        super().__init__()
+        self.index = get_fulltext_index()
+        self.documents = DocumentRepository()
+
+    def search(self, query: str, limit: int, offset: int = 0) -> Dict[str, Any]:
+        """
+        Find pages matching every term of a query
+
+        Pages are indexed as documents are extracted, so only documents
+        that were processed at least once (and only their extracted pages)
+        can match. Hits are resolved to registered documents; pages of
+        unregistered content are left out.
+
+        Args:
+            query: Free-text query
+            limit: Maximum index hits to return
+            offset: Index hits to skip
+
+        Returns:
+            dict: Ranked page hits with snippets, and the offset of the next page of hits
+
+        Raises:
+            NotFoundError: If full-text search is disabled
+        """
+        if self.index is None:
+            raise NotFoundError("Full-text search is not enabled")
+
+        hits = self.index.search(query, limit=limit, offset=offset)
+        documents = self.documents.get_by_content_hashes(hit.content_sha256 for hit in hits)
+
+        results: List[Dict[str, Any]] = []
+        for hit in hits:
+            for document in documents.get(hit.content_sha256, []):
+                results.append({
+                    'document_id': document.id,
+                    'url': document.url,
+                    'title': document.title,
+                    'page': hit.page_number,
+                    'score': round(hit.score, 4),
+                    'snippet': hit.snippet,
+                })
+
+        self.log_info("Full-text search completed", query=query, hits=len(hits), results=len(results))
+
+        return {
+            'query': query,
+            'results': results,
+            'next_offset': offset + len(hits) if len(hits) == limit else None,
+        }
@@ -2,20 +2,51 @@
 Summary Service
 Handles PDF document summarization
 """
-from typing import Optional
+import math
+from typing import Dict, List, Optional, Tuple
 from config.env_config import config
-from config.constants import AgentConstants
+from config.constants import ActionType, CacheKey
+from chat_bot_api.domain.exceptions import AgentProcessingError
+from chat_bot_api.domain.models import PageRecord
+from chat_bot_api.infrastructure.text import PackedContext, SummaryNode, SummaryTree
 from .agent_service import AgentService
 from .pdf_service import PDFService
 
+# Section summaries are never asked to be shorter than this
+SECTION_MIN_WORDS = 150
+
+# Bump when the summary prompts change so cached tree nodes are not reused
+SUMMARY_PROMPT_VERSION = 1
+
 
 class SummaryService(AgentService):
-    """Service for summarizing PDF documents"""
+    """
+    Service for summarizing PDF documents
+
+    Complete summaries are cached by content hash, page range, model and
+    prompt version, and identical concurrent requests share one run.
+
+    Documents up to SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS are summarized in
+    one call. Larger ones are split into sections of SUMMARY_SECTION_TOKENS
+    that are summarized concurrently (map), after which one call writes an
+    overview from the section summaries (reduce). The overview is followed
+    by the section summaries in document order, so the long output is
+    produced in parallel rather than by one sequential generation.
+
+    With SUMMARY_TREE_ENABLED, ranges of registered documents are instead
+    summarized from a ``SummaryTree``: summaries of aligned page blocks and
+    of their merges are cached by content hash and prompt version, so a
+    range only summarizes the blocks no earlier range has covered, and a
+    fully cached range needs no download at all. Its summaries are sized by
+    the SUMMARY_TREE_*_WORDS settings rather than SUMMARY_MIN_WORDS, so the
+    tree is opt-in.
+    """
 
     def __init__(self):
         """Initialize summary service"""
         super().__init__()
         self.pdf_service = PDFService()
+        self.tree = SummaryTree(config.SUMMARY_TREE_LEAF_PAGES, config.SUMMARY_TREE_FANOUT)
 
     def summarize_document(
         self,
@@ -46,37 +77,350 @@ class SummaryService(AgentService):
             max_page=max_page
         )
 
-        # Download and extract PDF text
-        text = self.pdf_service.process_pdf(
+        summary = self.cached_response(
+            (CacheKey.SUMMARY, document_url, min_page, max_page),
+            lambda: self._response_key(document_url, min_page, max_page),
+            lambda: self._summarize(document_url, min_page, max_page)
+        )
+
+        if not summary or not summary.strip():
+            raise AgentProcessingError("Empty response from summarization agent")
+
+        return summary
+
+    def _summarize(self, document_url: str, min_page: Optional[int], max_page: Optional[int]) -> str:
+        if config.SUMMARY_TREE_ENABLED:
+            return self._summarize_tree(document_url, min_page, max_page)
+        return self._summarize_pages(self._load_pages(document_url, min_page, max_page))
+
+    def _response_key(self, document_url: str, min_page: Optional[int], max_page: Optional[int]) -> Optional[str]:
+        """Cache key of the complete summary, if the document is registered"""
+        record = self.pdf_service.lookup_fresh_document(document_url)
+        if record is None:
+            return None
+
+        self.pdf_service.validate_page_range(min_page, max_page, record.total_pages)
+        first_page, last_page = self.pdf_service.resolve_page_range(min_page, max_page, record.total_pages)
+        variant = (
+            f"{self._summary_variant()}:{self.pdf_service.page_extractor.engine}:{config.SUMMARY_MIN_WORDS}:"
+            f"{config.SUMMARY_TREE_ENABLED}:{config.SUMMARY_TREE_LEAF_PAGES}:{config.SUMMARY_TREE_FANOUT}"
+        )
+        return CacheKey.response_key(CacheKey.SUMMARY, record.content_sha256, variant, first_page, last_page)
+
+    def _load_pages(self, document_url: str, min_page: Optional[int], max_page: Optional[int]) -> List[PageRecord]:
+        """Extract a page range, without repeated headers, footers and pages"""
+        return list(self.pdf_service.normalize_pages(self.pdf_service.iter_document_pages(
             document_url,
             min_page=min_page,
             max_page=max_page,
             cleanup=True
+        )))
+
+    def _summarize_pages(self, pages: List[PageRecord]) -> str:
+        """Summarize extracted pages in one call, or map-reduce style when they are long"""
+        sections = self.pdf_service.split_pages(pages, config.SUMMARY_SECTION_TOKENS)
+        total_tokens = sum(section.tokens for section in sections)
+
+        threshold = config.SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS
+        if threshold > 0 and total_tokens > threshold and len(sections) > 1:
+            return self._summarize_map_reduce(sections, total_tokens)
+        return self._summarize_single(pages)
+
+    def _summarize_tree(self, document_url: str, min_page: Optional[int], max_page: Optional[int]) -> str:
+        """Summarize a page range from cached tree nodes, summarizing only the missing ones"""
+        record = self.pdf_service.lookup_fresh_document(document_url)
+        pages = None
+        if record is None:
+            # Unknown (or stale) document: extracting the range registers it
+            pages = self._load_pages(document_url, min_page, max_page)
+            record = self.pdf_service.lookup_fresh_document(document_url)
+            if record is None:
+                # No content hash to key the tree on
+                return self._summarize_pages(pages)
+        else:
+            self.pdf_service.validate_page_range(min_page, max_page, record.total_pages)
+
+        document_hash = record.content_sha256
+        first_page, last_page = self.pdf_service.resolve_page_range(min_page, max_page, record.total_pages)
+        parts = self.tree.decompose(first_page, last_page)
+
+        overview_key = None
+        if len(parts) > 1:
+            overview_key = CacheKey.summary_overview_key(
+                document_hash, self.pdf_service.page_extractor.engine, self._summary_variant(), first_page, last_page
+            )
+
+        part_keys = {node: self._node_key(document_hash, node) for node in parts}
+        cached = self.result_cache.get_many(list(part_keys.values()) + ([overview_key] if overview_key else []))
+        summaries: Dict[SummaryNode, str] = {
+            node: cached[key] for node, key in part_keys.items() if key in cached
+        }
+        overview = cached.get(overview_key) if overview_key else None
+        cached_parts = len(summaries)
+
+        leaves, merges = self._plan_tree(document_hash, [node for node in parts if node not in summaries], summaries)
+
+        self.log_info(
+            "Summarizing page range from summary tree",
+            first_page=first_page,
+            last_page=last_page,
+            parts=len(parts),
+            cached_parts=cached_parts,
+            leaves_to_summarize=len(leaves),
+            merges=len(merges)
+        )
+
+        if leaves:
+            first_needed = min(node.first_page for node in leaves)
+            last_needed = max(node.last_page for node in leaves)
+            if pages is None:
+                pages = self._load_pages(document_url, first_needed, last_needed)
+                current = self.pdf_service.lookup_fresh_document(document_url)
+                if current is not None and current.content_sha256 != document_hash:
+                    # The document changed under its URL; cached nodes describe the old content
+                    self.log_warning("Document content changed, summarizing without the tree", document_id=record.id)
+                    return self._summarize_pages(self._load_pages(document_url, min_page, max_page))
+
+            budget = self.context_token_budget(self._section_header("", config.SUMMARY_TREE_LEAF_WORDS), "\n")
+
+            def summarize_leaf(node: SummaryNode) -> str:
+                node_pages = [page for page in pages if node.first_page <= page.number <= node.last_page]
+                if not node_pages:
+                    return ""
+                packed = self.pdf_service.pack_pages(node_pages, budget)
+                return self._summarize_section(packed, config.SUMMARY_TREE_LEAF_WORDS)
+
+            self._store_nodes(document_hash, summaries, leaves, self._map_sections(summarize_leaf, leaves))
+
+        # Merge bottom-up; every level only needs the one below it
+        for level in sorted({node.level for node in merges}):
+            level_nodes = [node for node in merges if node.level == level]
+            results = self._map_sections(
+                lambda node: self._merge_node(node, [
+                    (child.title, summaries[child]) for child in self.tree.children(node)
+                ]),
+                level_nodes
+            )
+            self._store_nodes(document_hash, summaries, level_nodes, results)
+
+        part_summaries = [(node.title, summaries[node]) for node in parts if summaries[node].strip()]
+        if overview_key is None or len(part_summaries) < 2:
+            return "\n\n".join(summary for _, summary in part_summaries)
+
+        if overview is None:
+            titles, notes = zip(*part_summaries)
+            overview = self._write_overview(list(titles), list(notes))
+            if overview and overview.strip():
+                self.result_cache.set(overview_key, overview)
+
+        sections = [overview]
+        sections.extend(f"## {title}\n\n{summary}" for title, summary in part_summaries)
+        return "\n\n".join(sections)
+
+    def _plan_tree(
+        self,
+        document_hash: str,
+        missing: List[SummaryNode],
+        summaries: Dict[SummaryNode, str]
+    ) -> Tuple[List[SummaryNode], List[SummaryNode]]:
+        """
+        Find the nodes that have to be computed for the missing ones
+
+        Cached descendants are loaded into ``summaries``, one lookup per level.
+
+        Returns:
+            tuple: (leaves to summarize from pages, internal nodes to merge)
+        """
+        leaves: List[SummaryNode] = []
+        merges: List[SummaryNode] = []
+
+        while missing:
+            children: List[SummaryNode] = []
+            for node in missing:
+                if node.is_leaf:
+                    leaves.append(node)
+                else:
+                    merges.append(node)
+                    children.extend(self.tree.children(node))
+
+            if not children:
+                break
+
+            child_keys = {node: self._node_key(document_hash, node) for node in children}
+            cached = self.result_cache.get_many(list(child_keys.values()))
+            missing = []
+            for node, key in child_keys.items():
+                if key in cached:
+                    summaries[node] = cached[key]
+                else:
+                    missing.append(node)
+
+        return leaves, merges
+
+    def _store_nodes(
+        self,
+        document_hash: str,
+        summaries: Dict[SummaryNode, str],
+        nodes: List[SummaryNode],
+        results: List[str]
+    ):
+        """Record computed node summaries and cache them"""
+        summaries.update(zip(nodes, results))
+        self.result_cache.set_many({self._node_key(document_hash, node): result for node, result in zip(nodes, results)})
+
+    def _node_key(self, document_hash: str, node: SummaryNode) -> str:
+        return CacheKey.summary_node_key(
+            document_hash,
+            self.pdf_service.page_extractor.engine,
+            self._summary_variant(),
+            node.level,
+            node.first_page,
+            node.last_page
+        )
+
+    @staticmethod
+    def _summary_variant() -> str:
+        """Everything besides the pages that shapes a node summary"""
+        return (
+            f"v{SUMMARY_PROMPT_VERSION}:{config.GROQ_MODEL_ID}:"
+            f"{config.SUMMARY_TREE_LEAF_WORDS}:{config.SUMMARY_TREE_NODE_WORDS}"
         )
 
+    def _map_sections(self, fn, items: list) -> list:
+        """Run one summary call per item, at most SUMMARY_MAP_WORKERS at a time"""
+        return self.map_parallel(fn, items, config.SUMMARY_MAP_WORKERS, name='summary-map')
+
+    def _summarize_single(self, pages: List[PageRecord]) -> str:
+        """Summarize the pages in one call"""
+        header = f"""
+You are a professional summarizer AI. Summarize the following academic content in **at least {config.SUMMARY_MIN_WORDS} words**. Ensure clarity, depth, and structure with sections, bullet points, and examples if relevant.
+
+"""
+        footer = "\n"
+
+        packed = self.pdf_service.pack_pages(pages, self.context_token_budget(header, footer))
+        prompt = self.pdf_service.render_pages(packed.pages, header=header, footer=footer)
+
         # Create summarization agent
         agent = self.create_agent(
-            name=AgentConstants.SUMMARY_AGENT_NAME,
+            action=ActionType.SUMMARIZER,
             description=f"Summarizes a PDF document in a minimum of {config.SUMMARY_MIN_WORDS} words.",
-            role=AgentConstants.SUMMARY_AGENT_ROLE,
             instructions=[
                 f"Provide a clear, structured summary with at least {config.SUMMARY_MIN_WORDS} words.",
                 "Use headings and bullet points where appropriate."
             ]
         )
 
-        # Create summarization prompt
-        prompt = f"""
-You are a professional summarizer AI. Summarize the following academic content in **at least {config.SUMMARY_MIN_WORDS} words**. Ensure clarity, depth, and structure with sections, bullet points, and examples if relevant.
+        # Generate summary
+        return self.run_agent(agent, prompt)
+
+    def _summarize_map_reduce(self, sections: List[PackedContext], total_tokens: int) -> str:
+        """Summarize sections concurrently, then write an overview from their summaries"""
+        section_words = max(SECTION_MIN_WORDS, math.ceil(config.SUMMARY_MIN_WORDS / len(sections)))
+        workers = max(1, min(config.SUMMARY_MAP_WORKERS, len(sections)))
+
+        self.log_info(
+            "Summarizing document in sections",
+            sections=len(sections),
+            total_tokens=total_tokens,
+            section_words=section_words,
+            workers=workers
+        )
+
+        # Map: one call per section, at most `workers` in flight
+        summaries = self._map_sections(lambda section: self._summarize_section(section, section_words), sections)
+
+        titles = [self._section_title(section) for section in sections]
+
+        # Reduce: overview of the whole document from the section summaries
+        overview = self._write_overview(titles, summaries)
+
+        parts = [overview]
+        parts.extend(f"## {title}\n\n{summary}" for title, summary in zip(titles, summaries))
+        return "\n\n".join(parts)
+
+    def _summarize_section(self, section: PackedContext, words: int) -> str:
+        """Summarize one section of a longer document"""
+        header = self._section_header(self._section_title(section), words)
+        prompt = self.pdf_service.render_pages(section.pages, header=header, footer="\n")
+
+        agent = self.create_agent(
+            action=ActionType.SUMMARIZER,
+            description=f"Summarizes one section of a PDF document in about {words} words.",
+            instructions=[
+                f"Summarize only the given section in about {words} words.",
+                "Use bullet points where appropriate; do not add top-level headings."
+            ]
+        )
+        return self.run_agent(agent, prompt)
+
+    @staticmethod
+    def _section_header(title: str, words: int) -> str:
+        return f"""
+You are a professional summarizer AI. The following content is one section ({title}) of a longer academic document. Summarize it in **about {words} words**. Keep its key arguments, definitions, results and examples. Do not write an introduction or conclusion for the whole document.
 
-{text}
 """
 
-        # Generate summary
-        summary = self.run_agent(agent, prompt)
+    def _merge_node(self, node: SummaryNode, children: List[Tuple[str, str]]) -> str:
+        """Combine the summaries of consecutive parts into one summary of the node's pages"""
+        children = [(title, summary) for title, summary in children if summary.strip()]
+        if not children:
+            return ""
+        if len(children) == 1:
+            return children[0][1]
 
-        if not summary or not summary.strip():
-            from chat_bot_api.domain.exceptions import AgentProcessingError
-            raise AgentProcessingError("Empty response from summarization agent")
+        words = config.SUMMARY_TREE_NODE_WORDS
+        header = f"""
+You are a professional summarizer AI. Below are summaries of consecutive parts of one section ({node.title}) of a longer academic document. Combine them into a single summary of the section in **about {words} words**. Keep its key arguments, definitions, results and examples. Do not write an introduction or conclusion for the whole document.
 
-        return summary
+"""
+        footer = "\n"
+
+        # Clip the summaries evenly if together they exceed the prompt budget
+        budget = self.context_token_budget(header, footer)
+        notes = [f"### {title}\n{summary}" for title, summary in children]
+        note_tokens = sum(self.token_estimator.estimate(note) for note in notes)
+        if note_tokens > budget:
+            ratio = budget / note_tokens
+            notes = [note[:int(len(note) * ratio)] for note in notes]
+
+        agent = self.create_agent(
+            action=ActionType.SUMMARIZER,
+            description=f"Combines summaries of parts of a PDF document into one of about {words} words.",
+            instructions=[
+                f"Summarize only the given section in about {words} words.",
+                "Use bullet points where appropriate; do not add top-level headings."
+            ]
+        )
+        return self.run_agent(agent, header + "\n\n".join(notes) + footer)
+
+    def _write_overview(self, titles: List[str], summaries: List[str]) -> str:
+        """Reduce step: overview of the document written from its section summaries"""
+        header = f"""
+You are a professional summarizer AI. Below are summaries of the consecutive sections of one academic document. Write an overview of the whole document in **about {config.SUMMARY_OVERVIEW_WORDS} words**: its purpose, main themes, how the sections connect, and its key conclusions.
+
+"""
+        footer = "\n"
+
+        # Clip the summaries evenly if together they exceed the prompt budget
+        budget = self.context_token_budget(header, footer)
+        notes = [f"### {title}\n{summary}" for title, summary in zip(titles, summaries)]
+        note_tokens = sum(self.token_estimator.estimate(note) for note in notes)
+        if note_tokens > budget:
+            ratio = budget / note_tokens
+            notes = [note[:int(len(note) * ratio)] for note in notes]
+
+        agent = self.create_agent(
+            action=ActionType.SUMMARIZER,
+            description="Writes an overview of a PDF document from its section summaries.",
+            instructions=[
+                f"Write an overview of about {config.SUMMARY_OVERVIEW_WORDS} words under a single heading.",
+                "Do not repeat the section summaries; connect them."
+            ]
+        )
+        return self.run_agent(agent, header + "\n\n".join(notes) + footer)
+
+    @staticmethod
+    def _section_title(section: PackedContext) -> str:
+        first, last = section.pages[0].number, section.pages[-1].number
+        return f"Page {first}" if first == last else f"Pages {first}-{last}"
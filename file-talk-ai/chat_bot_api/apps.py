@@ -1,6 +1,29 @@
 from django.apps import AppConfig
+from django.core.signals import request_started
+
+
+def start_storage_janitor(**kwargs):
+    """Start periodic storage cleanup in a serving process, once"""
+    from config.env_config import config
+    from chat_bot_api.core.utils.logger import get_logger
+    from chat_bot_api.infrastructure.storage import get_storage_janitor
+
+    request_started.disconnect(dispatch_uid='start_storage_janitor')
+    try:
+        get_storage_janitor().start(config.STORAGE_JANITOR_INTERVAL)
+    except Exception as e:
+        get_logger(__name__).warning(f"Storage janitor not started: {str(e)}")
 
 
 class ConversationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'chat_bot_api'
+
+    def ready(self):
+        from config.env_config import config
+
+        # Periodic storage cleanup is opt-in and starts with the first request,
+        # so management commands never sweep the storage of a running server
+        # and every forked worker (e.g. gunicorn --preload) runs its own thread
+        if config.STORAGE_JANITOR_INTERVAL > 0:
+            request_started.connect(start_storage_janitor, dispatch_uid='start_storage_janitor')
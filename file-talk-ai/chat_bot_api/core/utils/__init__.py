@@ -2,6 +2,7 @@
 from .logger import Logger, get_logger
 from .validators import Validator
 from .helpers import FileHelper, ResponseHelper, StringHelper, DateTimeHelper
+from .single_flight import SingleFlight, FileLockSingleFlight, get_single_flight
 
 __all__ = [
     'Logger',
@@ -11,4 +12,7 @@ __all__ = [
     'ResponseHelper',
     'StringHelper',
     'DateTimeHelper',
+    'SingleFlight',
+    'FileLockSingleFlight',
+    'get_single_flight',
 ]
@@ -48,6 +48,25 @@ class FileHelper:
         hash_func.update(content)
         return hash_func.hexdigest()
 
+    @staticmethod
+    def get_path_hash(file_path: str, algorithm: str = 'sha256', chunk_size: int = 1024 * 1024) -> str:
+        """
+        Generate hash of a file on disk without loading it into memory
+
+        Args:
+            file_path: Path to file
+            algorithm: Hash algorithm (md5, sha256, etc.)
+            chunk_size: Read size in bytes
+
+        Returns:
+            str: File hash
+        """
+        hash_func = getattr(hashlib, algorithm)()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                hash_func.update(chunk)
+        return hash_func.hexdigest()
+
     @staticmethod
     def get_url_hash(url: str) -> str:
         """
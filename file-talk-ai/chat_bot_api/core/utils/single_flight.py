@@ -0,0 +1,241 @@
+"""
+Single Flight
+Collapses concurrent calls for the same key into one execution
+"""
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, TypeVar
+from config.env_config import config
+from .logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+
+class _Call:
+    """An in-flight call and its outcome"""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    In-process single-flight coordinator
+
+    The first caller for a key runs the function; callers arriving while it
+    runs wait for it and receive the same result (or the same exception).
+    Nothing is remembered once the call finishes, so this is deduplication
+    of concurrent work, not a cache.
+    """
+
+    def __init__(self):
+        """Initialize coordinator"""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._executions = 0
+        self._shared = 0
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], T],
+        cross_process: bool = True,
+        timeout: Optional[float] = None
+    ) -> T:
+        """
+        Run ``fn`` once for all concurrent callers with the same key
+
+        Args:
+            key: Identifies the work (e.g. URL plus page range)
+            fn: Function producing the result
+            cross_process: Also coordinate with other processes when the
+                coordinator supports it (only useful when ``fn`` leaves its
+                result in shared storage such as a disk cache)
+            timeout: Seconds to wait for another process running the same
+                work before running anyway (coordinator default when None);
+                should exceed the longest expected run of ``fn``
+
+        Returns:
+            Result of ``fn``
+
+        Raises:
+            Whatever ``fn`` raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executions += 1
+            else:
+                self._shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._execute(key, fn, cross_process, timeout)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def _execute(self, key: Hashable, fn: Callable[[], T], cross_process: bool, timeout: Optional[float]) -> T:
+        """Run the leader's function"""
+        return fn()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get deduplication counters
+
+        Returns:
+            dict: Executions, shared results and calls currently in flight
+        """
+        with self._lock:
+            return {
+                'executions': self._executions,
+                'shared': self._shared,
+                'in_flight': len(self._calls),
+            }
+
+
+class FileLockSingleFlight(SingleFlight):
+    """
+    Single-flight coordinator that also spans processes on one host
+
+    Within a process it behaves like SingleFlight. The leader additionally
+    takes an exclusive flock on a per-key lock file, so the same work in
+    other worker processes runs one after another. Results cannot be handed
+    across processes, so this pays off when ``fn`` is cache-aware: the
+    first process fills the shared cache and the ones waiting on the lock
+    find it there.
+    """
+
+    def __init__(self, lock_dir: str, timeout: float = 120, poll_interval: float = 0.05):
+        """
+        Initialize coordinator
+
+        Args:
+            lock_dir: Directory for lock files
+            timeout: Default seconds to wait for another process before running anyway
+            poll_interval: Seconds between lock attempts
+        """
+        super().__init__()
+        self.lock_dir = lock_dir
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        os.makedirs(self.lock_dir, exist_ok=True)
+
+    def _execute(self, key: Hashable, fn: Callable[[], T], cross_process: bool, timeout: Optional[float]) -> T:
+        if not cross_process:
+            return fn()
+
+        with self._file_lock(key, self.timeout if timeout is None else timeout):
+            return fn()
+
+    @contextmanager
+    def _file_lock(self, key: Hashable, timeout: float) -> Iterator[bool]:
+        """
+        Hold an exclusive lock on the key's lock file
+
+        Args:
+            key: Work key
+            timeout: Seconds to wait for the lock
+
+        Yields:
+            bool: False if the wait timed out and the lock is not held
+        """
+        name = hashlib.sha256(repr(key).encode()).hexdigest()
+        path = os.path.join(self.lock_dir, f"{name}.lock")
+        deadline = time.monotonic() + timeout
+        fd = None
+        acquired = False
+        try:
+            while True:
+                if fd is None:
+                    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        logger.warning(f"Timed out waiting for single-flight lock {name[:12]}; running anyway")
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+
+                # The janitor may have removed the file while we waited on it;
+                # a lock on an unlinked file excludes nobody, so start over
+                if self._is_current(fd, path):
+                    acquired = True
+                    # flock does not touch the mtime the janitor's idle check reads
+                    os.utime(path)
+                    break
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+                fd = None
+
+            yield acquired
+        finally:
+            if acquired:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            if fd is not None:
+                os.close(fd)
+
+    @staticmethod
+    def _is_current(fd: int, path: str) -> bool:
+        """Check whether an open lock file is still the one at its path"""
+        try:
+            linked = os.stat(path)
+        except FileNotFoundError:
+            return False
+        opened = os.fstat(fd)
+        return (linked.st_dev, linked.st_ino) == (opened.st_dev, opened.st_ino)
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """
+    Get process-wide single-flight coordinator
+
+    Returns:
+        SingleFlight: File-lock variant when enabled and supported, else in-process only
+    """
+    global _single_flight
+
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                if config.SINGLE_FLIGHT_FILE_LOCKS and fcntl is not None:
+                    _single_flight = FileLockSingleFlight(
+                        config.SINGLE_FLIGHT_LOCK_PATH,
+                        timeout=config.SINGLE_FLIGHT_LOCK_TIMEOUT
+                    )
+                else:
+                    _single_flight = SingleFlight()
+
+    return _single_flight
@@ -1,5 +1,6 @@
 """Domain Enums"""
 from .action_types import ActionTypeEnum
 from .user_types import UserTypeEnum
+from .extraction_status import ExtractionStatusEnum
 
-__all__ = ['ActionTypeEnum', 'UserTypeEnum']
+__all__ = ['ActionTypeEnum', 'UserTypeEnum', 'ExtractionStatusEnum']
@@ -0,0 +1,27 @@
+"""
+Extraction Status Enums
+Defines the ingestion states of a registered document
+"""
+from enum import Enum
+
+
+class ExtractionStatusEnum(str, Enum):
+    """Enumeration of document extraction states"""
+
+    PENDING = 'pending'
+    PROCESSING = 'processing'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+    @classmethod
+    def choices(cls):
+        """Return choices for Django model field"""
+        return [(item.value, item.name) for item in cls]
+
+    @classmethod
+    def values(cls):
+        """Return list of all values"""
+        return [item.value for item in cls]
+
+    def __str__(self):
+        return self.value
@@ -0,0 +1,4 @@
+"""Domain Models"""
+from .page_record import PageRecord
+
+__all__ = ['PageRecord']
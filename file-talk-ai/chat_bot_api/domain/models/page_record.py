@@ -0,0 +1,28 @@
+"""
+Page Record
+Lightweight representation of one extracted PDF page
+"""
+from typing import NamedTuple, Optional
+
+
+class PageRecord(NamedTuple):
+    """
+    Text of a single PDF page
+
+    Attributes:
+        number: Page number (1-indexed)
+        text: Extracted page text
+        start: Character offset of the page within the extracted range
+        end: Character offset just past the page within the extracted range
+        tokens: Estimated token count of the text (None if not estimated yet)
+    """
+    number: int
+    text: str
+    start: int
+    end: int
+    tokens: Optional[int] = None
+
+    @property
+    def marker(self) -> str:
+        """Page separator used when pages are joined into prompt text"""
+        return f"\n\n--- Page {self.number} ---\n"
@@ -0,0 +1,23 @@
+"""Cache Infrastructure"""
+from .base import CacheBackend, NullCache
+from .memory_cache import MemoryLRUCache
+from .disk_cache import DiskCache
+from .redis_cache import RedisCache
+from .tiered_cache import TieredCache, build_cache, build_result_cache, get_cache, get_result_cache
+from .download_cache import DownloadCacheEntry, PDFDownloadCache, get_download_cache
+
+__all__ = [
+    'CacheBackend',
+    'NullCache',
+    'MemoryLRUCache',
+    'DiskCache',
+    'RedisCache',
+    'TieredCache',
+    'build_cache',
+    'get_cache',
+    'build_result_cache',
+    'get_result_cache',
+    'DownloadCacheEntry',
+    'PDFDownloadCache',
+    'get_download_cache',
+]
@@ -0,0 +1,98 @@
+"""
+Cache Backend Base
+Common interface shared by all cache tiers
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Optional
+
+
+class CacheBackend(ABC):
+    """
+    Base class for cache backends
+
+    A backend stores arbitrary picklable values under string keys. ``None``
+    is used as the "miss" marker, so ``None`` itself cannot be cached.
+    """
+
+    name = 'base'
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None on miss
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        """
+        Store value in cache
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (backend default when None)
+        """
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Remove key from cache"""
+
+    @abstractmethod
+    def clear(self):
+        """Remove all keys from cache"""
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Get several values at once
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            dict: Mapping of found keys to values (misses are omitted)
+        """
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None):
+        """
+        Store several values at once
+
+        Args:
+            items: Mapping of keys to values
+            ttl: Time-to-live in seconds
+        """
+        for key, value in items.items():
+            self.set(key, value, ttl)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get backend statistics"""
+        return {'backend': self.name}
+
+
+class NullCache(CacheBackend):
+    """Cache that never stores anything (used when caching is disabled)"""
+
+    name = 'null'
+
+    def get(self, key: str) -> Optional[Any]:
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        pass
+
+    def delete(self, key: str):
+        pass
+
+    def clear(self):
+        pass
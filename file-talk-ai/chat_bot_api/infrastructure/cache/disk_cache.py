@@ -0,0 +1,271 @@
+"""
+Disk Cache
+Compressed on-disk cache shared by all processes on the host
+"""
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+from chat_bot_api.core.utils.logger import get_logger
+from .base import CacheBackend
+
+logger = get_logger(__name__)
+
+
+class DiskCache(CacheBackend):
+    """
+    File-per-key cache with zlib-compressed pickled values
+
+    Keys are hashed and sharded into 256 sub-directories so no single
+    directory grows too large. Each file stores the expiry timestamp
+    followed by the compressed payload; writes go through a temporary
+    file and ``os.replace`` so readers never see partial entries.
+
+    With ``max_bytes`` set, the directory is swept whenever the bytes on
+    disk (as of the last sweep, plus this process's writes since) exceed
+    the budget, or every ``sweep_interval`` seconds while writing, to
+    catch writes of other processes. A sweep drops expired entries, then
+    the least recently used ones (hits refresh a file's mtime) until the
+    cache is back under 90% of the budget.
+    """
+
+    name = 'disk'
+
+    # Sweeps free space down to this fraction of max_bytes
+    SWEEP_TARGET = 0.9
+
+    def __init__(
+        self,
+        directory: str,
+        default_ttl: Optional[int] = None,
+        compress_level: int = 6,
+        max_bytes: Optional[int] = None,
+        sweep_interval: float = 300
+    ):
+        """
+        Initialize disk cache
+
+        Args:
+            directory: Cache directory
+            default_ttl: Default time-to-live in seconds (None = no expiry)
+            compress_level: zlib compression level
+            max_bytes: Byte budget on disk (None or 0 = unbounded)
+            sweep_interval: Maximum seconds between sweeps while writing
+        """
+        self.directory = directory
+        self.default_ttl = default_ttl
+        self.compress_level = compress_level
+        self.max_bytes = max_bytes or None
+        self.sweep_interval = sweep_interval
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._sweep_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bytes_written = 0
+        self._evictions = 0
+        self._disk_bytes: Optional[int] = None  # As of the last sweep, plus own writes
+        self._last_sweep = 0.0
+
+    def _path(self, key: str) -> str:
+        """Get file path for key"""
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, digest[:2], f"{digest}.cache")
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                payload = f.read()
+        except OSError:
+            self._count(hit=False)
+            return None
+
+        try:
+            expires_at = float(payload[:20])
+            if expires_at and expires_at <= time.time():
+                self.delete(key)
+                self._count(hit=False)
+                return None
+
+            stored_key, value = pickle.loads(zlib.decompress(payload[20:]))
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry: {str(e)}")
+            self.delete(key)
+            self._count(hit=False)
+            return None
+
+        if stored_key != key:
+            self._count(hit=False)
+            return None
+
+        if self.max_bytes:
+            # mtime doubles as the last-use time of the LRU sweep
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+        self._count(hit=True)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        ttl = ttl if ttl is not None else self.default_ttl
+        expires_at = time.time() + ttl if ttl else 0
+        payload = zlib.compress(
+            pickle.dumps((key, value), protocol=pickle.HIGHEST_PROTOCOL),
+            self.compress_level
+        )
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(f"{expires_at:<20.3f}".encode()[:20])
+                f.write(payload)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry: {str(e)}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        with self._lock:
+            self._bytes_written += len(payload)
+            if self._disk_bytes is not None:
+                self._disk_bytes += len(payload) + 20
+
+        if self.max_bytes:
+            self._maybe_sweep()
+
+    def _maybe_sweep(self):
+        """Sweep if over budget or due"""
+        with self._lock:
+            due = (
+                self._disk_bytes is None
+                or self._disk_bytes > self.max_bytes
+                or time.time() - self._last_sweep >= self.sweep_interval
+            )
+        if due and self._sweep_lock.acquire(blocking=False):
+            try:
+                self.sweep()
+            finally:
+                self._sweep_lock.release()
+
+    def sweep(self) -> int:
+        """
+        Remove expired entries, then least recently used ones over budget
+
+        Returns:
+            int: Number of entries removed
+        """
+        now = time.time()
+        entries = []
+        total = 0
+        removed = 0
+
+        for path in self._entry_paths():
+            try:
+                stat = os.stat(path)
+                with open(path, 'rb') as f:
+                    expires_at = float(f.read(20))
+            except (OSError, ValueError):
+                continue
+
+            if expires_at and expires_at <= now:
+                removed += self._remove_file(path)
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if self.max_bytes and total > self.max_bytes:
+            target = self.max_bytes * self.SWEEP_TARGET
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                if self._remove_file(path):
+                    total -= size
+                    removed += 1
+
+        with self._lock:
+            self._disk_bytes = total
+            self._last_sweep = now
+            self._evictions += removed
+
+        if removed:
+            logger.info(f"Disk cache sweep removed {removed} entries", extra={'extra_data': {
+                'directory': self.directory,
+                'bytes': total,
+            }})
+        return removed
+
+    def _shards(self):
+        """Shard directories (other sub-directories, e.g. nested caches, are left alone)"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return [
+            os.path.join(self.directory, name) for name in names
+            if len(name) == 2 and os.path.isdir(os.path.join(self.directory, name))
+        ]
+
+    def _entry_paths(self):
+        for shard in self._shards():
+            try:
+                names = os.listdir(shard)
+            except OSError:
+                continue
+            for name in names:
+                if name.endswith('.cache'):
+                    yield os.path.join(shard, name)
+
+    @staticmethod
+    def _remove_file(path: str) -> int:
+        try:
+            os.remove(path)
+            return 1
+        except OSError:
+            return 0
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        for shard in self._shards():
+            shutil.rmtree(shard, ignore_errors=True)
+        with self._lock:
+            self._disk_bytes = 0
+
+    def _count(self, hit: bool):
+        """Update hit/miss counters"""
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'backend': self.name,
+                'directory': self.directory,
+                'hits': self._hits,
+                'misses': self._misses,
+                'bytes_written': self._bytes_written,
+                'disk_bytes': self._disk_bytes,
+                'max_bytes': self.max_bytes,
+                'evictions': self._evictions,
+            }
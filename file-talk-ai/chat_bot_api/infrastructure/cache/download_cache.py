@@ -0,0 +1,305 @@
+"""
+PDF Download Cache
+Persistent, content-addressed cache for downloaded PDF files
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterator, Optional, Tuple
+from config.env_config import config
+from chat_bot_api.core.utils.helpers import FileHelper
+from chat_bot_api.core.utils.logger import get_logger
+from chat_bot_api.infrastructure.storage.local_storage import LocalStorageBackend
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class DownloadCacheEntry:
+    """Metadata stored for a cached URL"""
+    url: str
+    content_hash: str
+    size_bytes: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+    hits: int = 0
+    last_used_at: float = 0.0
+
+    @property
+    def can_revalidate(self) -> bool:
+        """Whether the origin gave us a validator to revalidate with"""
+        return bool(self.etag or self.last_modified)
+
+
+class PDFDownloadCache:
+    """
+    Content-addressed on-disk cache for downloaded PDFs
+
+    PDF bytes are stored once per SHA-256 content hash, and every URL gets a
+    small metadata file pointing at its blob together with the ETag and
+    Last-Modified validators returned by the origin. Metadata lives in one
+    file per URL so several worker processes can share the same directory.
+
+    Blobs are kept on local disk whatever STORAGE_BACKEND says, since they
+    are opened directly by the extractor.
+
+    Layout:
+        <cache_dir>/blobs/<ab>/<cd>/<sha256>.pdf
+        <cache_dir>/urls/<url_hash>.json
+        <cache_dir>/tmp/<partial downloads>
+    """
+
+    def __init__(self, cache_dir: str, freshness_seconds: int = 0):
+        """
+        Initialize download cache
+
+        Args:
+            cache_dir: Root directory of the cache
+            freshness_seconds: Serve entries younger than this without revalidating
+        """
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.blobs_dir = os.path.join(self.cache_dir, 'blobs')
+        self.urls_dir = os.path.join(self.cache_dir, 'urls')
+        self.tmp_dir = os.path.join(self.cache_dir, 'tmp')
+        self.freshness_seconds = freshness_seconds
+
+        for directory in (self.urls_dir, self.tmp_dir):
+            os.makedirs(directory, exist_ok=True)
+        self.blobs = LocalStorageBackend(self.blobs_dir)
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._bytes_saved = 0
+        self._bytes_downloaded = 0
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def blob_path(self, content_hash: str) -> str:
+        """Get path of the blob stored for a content hash"""
+        return self.blobs.path_for(content_hash)
+
+    def _metadata_path(self, url: str) -> str:
+        """Get path of the metadata file for a URL"""
+        return os.path.join(self.urls_dir, f"{FileHelper.get_url_hash(url)}.json")
+
+    def get_entry(self, url: str) -> Optional[DownloadCacheEntry]:
+        """
+        Get cache entry for URL
+
+        Args:
+            url: Document URL
+
+        Returns:
+            DownloadCacheEntry or None if the URL is not cached
+        """
+        try:
+            with open(self._metadata_path(url), 'r') as f:
+                entry = DownloadCacheEntry(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+        # Blob may have been removed behind our back
+        if entry.url != url or not os.path.exists(self.blob_path(entry.content_hash)):
+            return None
+
+        return entry
+
+    def is_fresh(self, entry: DownloadCacheEntry) -> bool:
+        """Check whether entry can be served without revalidation"""
+        return self.freshness_seconds > 0 and (time.time() - entry.fetched_at) < self.freshness_seconds
+
+    @staticmethod
+    def conditional_headers(entry: DownloadCacheEntry) -> Dict[str, str]:
+        """
+        Build conditional request headers for revalidation
+
+        Args:
+            entry: Cache entry
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers
+        """
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def is_cached_path(self, file_path: str) -> bool:
+        """Check whether a path points into the blob store"""
+        return self.blobs.contains_path(file_path)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def create_temp_file(self) -> str:
+        """
+        Create a temporary file to download into
+
+        Returns:
+            str: Path of the temporary file
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.tmp_dir, suffix='.part')
+        os.close(fd)
+        return temp_path
+
+    def store(
+        self,
+        url: str,
+        temp_path: str,
+        content_hash: str,
+        size_bytes: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> DownloadCacheEntry:
+        """
+        Move a finished download into the blob store and record its metadata
+
+        Args:
+            url: Document URL
+            temp_path: Path of the completed download
+            content_hash: SHA-256 of the downloaded content
+            size_bytes: Size of the downloaded content
+            etag: ETag response header
+            last_modified: Last-Modified response header
+
+        Returns:
+            DownloadCacheEntry: Stored entry
+        """
+        # Same bytes may already be cached (possibly under another URL)
+        self.blobs.move_into_place(temp_path, content_hash)
+
+        entry = DownloadCacheEntry(
+            url=url,
+            content_hash=content_hash,
+            size_bytes=size_bytes,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.time(),
+            last_used_at=time.time()
+        )
+        self._write_metadata(entry)
+        return entry
+
+    def touch(self, entry: DownloadCacheEntry) -> DownloadCacheEntry:
+        """Mark entry as freshly validated against the origin"""
+        entry.fetched_at = time.time()
+        self._write_metadata(entry)
+        return entry
+
+    def invalidate(self, url: str):
+        """Forget the metadata stored for a URL"""
+        try:
+            os.remove(self._metadata_path(url))
+        except OSError:
+            pass
+
+    def iter_entries(self) -> Iterator[Tuple[str, DownloadCacheEntry]]:
+        """
+        Iterate over all URL metadata files
+
+        Yields:
+            tuple: (metadata path, entry); unreadable files yield None as entry
+        """
+        for name in os.listdir(self.urls_dir):
+            metadata_path = os.path.join(self.urls_dir, name)
+            try:
+                with open(metadata_path, 'r') as f:
+                    entry = DownloadCacheEntry(**json.load(f))
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError, TypeError):
+                entry = None
+            yield metadata_path, entry
+
+    def _write_metadata(self, entry: DownloadCacheEntry):
+        """Atomically write entry metadata"""
+        metadata_path = self._metadata_path(entry.url)
+        fd, temp_path = tempfile.mkstemp(dir=self.tmp_dir, suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(asdict(entry), f)
+            os.replace(temp_path, metadata_path)
+        except OSError as e:
+            logger.warning(f"Failed to write download cache metadata: {str(e)}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def record_hit(self, entry: DownloadCacheEntry, revalidated: bool = False):
+        """
+        Record a request served from the cache
+
+        Usage is persisted in the entry so the janitor can evict by recency
+        or frequency.
+        """
+        entry.hits += 1
+        entry.last_used_at = time.time()
+        self._write_metadata(entry)
+
+        with self._lock:
+            self._hits += 1
+            self._bytes_saved += entry.size_bytes
+            if revalidated:
+                self._revalidations += 1
+
+    def record_miss(self, size_bytes: int):
+        """Record a request that had to download the document"""
+        with self._lock:
+            self._misses += 1
+            self._bytes_downloaded += size_bytes
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters
+
+        Returns:
+            dict: Hit/miss counters and byte totals
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'revalidations': self._revalidations,
+                'hit_rate': (self._hits / total) if total else 0.0,
+                'bytes_saved': self._bytes_saved,
+                'bytes_downloaded': self._bytes_downloaded,
+            }
+
+
+_download_cache: Optional[PDFDownloadCache] = None
+_download_cache_lock = threading.Lock()
+
+
+def get_download_cache() -> PDFDownloadCache:
+    """
+    Get process-wide download cache instance
+
+    Returns:
+        PDFDownloadCache: Shared cache instance
+    """
+    global _download_cache
+
+    if _download_cache is None:
+        with _download_cache_lock:
+            if _download_cache is None:
+                _download_cache = PDFDownloadCache(
+                    config.PDF_DOWNLOAD_CACHE_PATH,
+                    freshness_seconds=config.PDF_DOWNLOAD_CACHE_FRESHNESS
+                )
+
+    return _download_cache
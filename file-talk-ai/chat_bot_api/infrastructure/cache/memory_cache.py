@@ -0,0 +1,170 @@
+"""
+In-Memory Cache
+Byte-budgeted LRU cache for the current process
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .base import CacheBackend
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate memory footprint of a cached value
+
+    Args:
+        value: Cached value
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+
+    return sys.getsizeof(value)
+
+
+class MemoryLRUCache(CacheBackend):
+    """
+    Least-recently-used cache bounded by total value size
+
+    Entries are evicted oldest-first once the estimated size of all stored
+    values exceeds ``max_bytes``. Values larger than the whole budget are
+    not cached at all. Expired entries are dropped when they are read, when
+    the budget evicts them or by ``purge_expired``.
+    """
+
+    name = 'memory'
+
+    def __init__(
+        self,
+        max_bytes: int,
+        default_ttl: Optional[int] = None,
+        on_evict: Optional[Callable[[str, Any], None]] = None
+    ):
+        """
+        Initialize memory cache
+
+        Args:
+            max_bytes: Byte budget for stored values
+            default_ttl: Default time-to-live in seconds (None = no expiry)
+            on_evict: Called with the key and value of entries dropped because they
+                expired or did not fit the budget (not for delete, clear or replacement)
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.on_evict = on_evict
+        self._entries: "OrderedDict[str, Tuple[Any, int, Optional[float]]]" = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, size, expires_at = entry
+            expired = expires_at is not None and expires_at <= time.time()
+            if expired:
+                self._remove(key)
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+
+        if expired:
+            self._notify([(key, value)])
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        ttl = ttl if ttl is not None else self.default_ttl
+        expires_at = time.time() + ttl if ttl else None
+
+        evicted: List[Tuple[str, Any]] = []
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, size, expires_at)
+            self._current_bytes += size
+
+            while self._current_bytes > self.max_bytes and self._entries:
+                oldest_key = next(iter(self._entries))
+                evicted.append((oldest_key, self._remove(oldest_key)))
+                self._evictions += 1
+
+        self._notify(evicted)
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def purge_expired(self) -> int:
+        """
+        Drop all expired entries
+
+        Returns:
+            int: Number of entries dropped
+        """
+        now = time.time()
+        with self._lock:
+            expired = [
+                key for key, (_, _, expires_at) in self._entries.items()
+                if expires_at is not None and expires_at <= now
+            ]
+            purged = [(key, self._remove(key)) for key in expired]
+
+        self._notify(purged)
+        return len(purged)
+
+    def _remove(self, key: str) -> Any:
+        """Remove entry and return its value (caller holds the lock)"""
+        value, size, _ = self._entries.pop(key)
+        self._current_bytes -= size
+        return value
+
+    def _notify(self, dropped: List[Tuple[str, Any]]):
+        """Report dropped entries to on_evict (outside the lock, so it may use the cache)"""
+        if self.on_evict is None:
+            return
+        for key, value in dropped:
+            self.on_evict(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'backend': self.name,
+                'entries': len(self._entries),
+                'bytes': self._current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+            }
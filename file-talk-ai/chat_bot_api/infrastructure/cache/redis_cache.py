@@ -0,0 +1,110 @@
+"""
+Redis Cache
+Optional shared cache tier speaking the Redis protocol
+"""
+import pickle
+import threading
+import zlib
+from typing import Any, Dict, Iterable, Optional
+from .base import CacheBackend
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache tier backed by a Redis-compatible server
+
+    Any client exposing ``get``, ``set(ex=...)``, ``mget``, ``delete`` and
+    ``scan_iter`` can be injected, which keeps the tier usable against a
+    local fake. When no client is given, one is created from ``url`` with
+    the optional ``redis`` package.
+    """
+
+    name = 'redis'
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        client=None,
+        prefix: str = 'file_talk_ai',
+        default_ttl: Optional[int] = None,
+        compress_level: int = 6
+    ):
+        """
+        Initialize Redis cache
+
+        Args:
+            url: Redis connection URL
+            client: Pre-built Redis-compatible client
+            prefix: Key namespace prefix
+            default_ttl: Default time-to-live in seconds
+            compress_level: zlib compression level
+
+        Raises:
+            ImportError: If no client is given and ``redis`` is not installed
+        """
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url)
+
+        self.client = client
+        self.prefix = prefix
+        self.default_ttl = default_ttl
+        self.compress_level = compress_level
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def _dumps(self, value: Any) -> bytes:
+        return zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), self.compress_level)
+
+    @staticmethod
+    def _loads(payload: bytes) -> Any:
+        return pickle.loads(zlib.decompress(payload))
+
+    def get(self, key: str) -> Optional[Any]:
+        payload = self.client.get(self._key(key))
+        self._count(hits=int(payload is not None), misses=int(payload is None))
+        return self._loads(payload) if payload is not None else None
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        payloads = self.client.mget([self._key(key) for key in keys])
+        found = {
+            key: self._loads(payload)
+            for key, payload in zip(keys, payloads)
+            if payload is not None
+        }
+        self._count(hits=len(found), misses=len(keys) - len(found))
+        return found
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        ttl = ttl if ttl is not None else self.default_ttl
+        self.client.set(self._key(key), self._dumps(value), ex=ttl or None)
+
+    def delete(self, key: str):
+        self.client.delete(self._key(key))
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=f"{self.prefix}:*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def _count(self, hits: int = 0, misses: int = 0):
+        with self._lock:
+            self._hits += hits
+            self._misses += misses
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'backend': self.name,
+                'hits': self._hits,
+                'misses': self._misses,
+            }
@@ -0,0 +1,202 @@
+"""
+Tiered Cache
+Chains cache tiers from fastest to slowest
+"""
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+from config.env_config import config
+from chat_bot_api.core.utils.logger import get_logger
+from .base import CacheBackend, NullCache
+from .memory_cache import MemoryLRUCache
+from .disk_cache import DiskCache
+from .redis_cache import RedisCache
+
+logger = get_logger(__name__)
+
+
+class TieredCache(CacheBackend):
+    """
+    Read-through chain of cache tiers
+
+    Reads try each tier in order and back-fill the faster tiers on a hit
+    further down. Writes go to every tier. A failing tier is logged and
+    skipped so a Redis outage degrades to memory + disk instead of failing
+    the request.
+    """
+
+    name = 'tiered'
+
+    def __init__(self, tiers: List[CacheBackend]):
+        """
+        Initialize tiered cache
+
+        Args:
+            tiers: Cache tiers ordered fastest first
+        """
+        self.tiers = tiers
+
+    def get(self, key: str) -> Optional[Any]:
+        for index, tier in enumerate(self.tiers):
+            try:
+                value = tier.get(key)
+            except Exception as e:
+                logger.warning(f"Cache tier {tier.name} read failed: {str(e)}")
+                continue
+
+            if value is not None:
+                self._backfill(index, {key: value})
+                return value
+
+        return None
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        missing = list(keys)
+        found: Dict[str, Any] = {}
+
+        for index, tier in enumerate(self.tiers):
+            if not missing:
+                break
+
+            try:
+                tier_found = tier.get_many(missing)
+            except Exception as e:
+                logger.warning(f"Cache tier {tier.name} read failed: {str(e)}")
+                continue
+
+            if tier_found:
+                self._backfill(index, tier_found)
+                found.update(tier_found)
+                missing = [key for key in missing if key not in tier_found]
+
+        return found
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None):
+        for tier in self.tiers:
+            try:
+                tier.set_many(items, ttl)
+            except Exception as e:
+                logger.warning(f"Cache tier {tier.name} write failed: {str(e)}")
+
+    def delete(self, key: str):
+        for tier in self.tiers:
+            try:
+                tier.delete(key)
+            except Exception as e:
+                logger.warning(f"Cache tier {tier.name} delete failed: {str(e)}")
+
+    def clear(self):
+        for tier in self.tiers:
+            try:
+                tier.clear()
+            except Exception as e:
+                logger.warning(f"Cache tier {tier.name} clear failed: {str(e)}")
+
+    def _backfill(self, index: int, items: Dict[str, Any]):
+        """Copy values found in tier ``index`` into the faster tiers"""
+        for tier in self.tiers[:index]:
+            try:
+                tier.set_many(items)
+            except Exception as e:
+                logger.warning(f"Cache tier {tier.name} backfill failed: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'backend': self.name,
+            'tiers': [tier.stats() for tier in self.tiers],
+        }
+
+
+_cache: Optional[CacheBackend] = None
+_cache_lock = threading.Lock()
+_result_cache: Optional[CacheBackend] = None
+_result_cache_lock = threading.Lock()
+
+
+def build_cache() -> CacheBackend:
+    """
+    Build cache from configuration
+
+    Returns:
+        CacheBackend: Memory + disk (+ Redis) tiers, or a NullCache when
+        caching is disabled
+    """
+    if not config.CACHE_ENABLED:
+        return NullCache()
+
+    tiers: List[CacheBackend] = [
+        MemoryLRUCache(config.CACHE_MEMORY_MAX_BYTES, default_ttl=config.CACHE_TTL),
+        DiskCache(config.CACHE_DISK_PATH, default_ttl=config.CACHE_TTL, max_bytes=config.CACHE_DISK_MAX_BYTES),
+    ]
+
+    if config.REDIS_URL:
+        try:
+            tiers.append(RedisCache(url=config.REDIS_URL, default_ttl=config.CACHE_TTL))
+        except ImportError:
+            logger.warning("REDIS_URL is set but the redis package is not installed; skipping Redis tier")
+
+    return TieredCache(tiers)
+
+
+def get_cache() -> CacheBackend:
+    """
+    Get process-wide cache instance
+
+    Returns:
+        CacheBackend: Shared cache
+    """
+    global _cache
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = build_cache()
+
+    return _cache
+
+
+def build_result_cache() -> CacheBackend:
+    """
+    Build cache for model results from configuration
+
+    Unlike the text cache this one does not depend on CACHE_ENABLED:
+    results cost model calls to recompute, so they are always kept.
+
+    Returns:
+        CacheBackend: Memory + disk (+ Redis) tiers
+    """
+    tiers: List[CacheBackend] = [
+        MemoryLRUCache(config.RESULT_CACHE_MEMORY_MAX_BYTES, default_ttl=config.RESULT_CACHE_TTL),
+        DiskCache(
+            config.RESULT_CACHE_PATH,
+            default_ttl=config.RESULT_CACHE_TTL,
+            max_bytes=config.RESULT_CACHE_DISK_MAX_BYTES
+        ),
+    ]
+
+    if config.REDIS_URL:
+        try:
+            tiers.append(RedisCache(url=config.REDIS_URL, default_ttl=config.RESULT_CACHE_TTL))
+        except ImportError:
+            logger.warning("REDIS_URL is set but the redis package is not installed; skipping Redis tier")
+
+    return TieredCache(tiers)
+
+
+def get_result_cache() -> CacheBackend:
+    """
+    Get process-wide model result cache
+
+    Returns:
+        CacheBackend: Shared result cache
+    """
+    global _result_cache
+
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                _result_cache = build_result_cache()
+
+    return _result_cache
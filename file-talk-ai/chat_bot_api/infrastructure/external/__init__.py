@@ -0,0 +1,12 @@
+"""External Service Clients"""
+from .http_client import HTTPClient, get_http_client
+from .llm_client import AgentTemplate, LLMClientRegistry, default_agent_templates, get_llm_registry
+
+__all__ = [
+    'HTTPClient',
+    'get_http_client',
+    'AgentTemplate',
+    'LLMClientRegistry',
+    'default_agent_templates',
+    'get_llm_registry',
+]
@@ -0,0 +1,162 @@
+"""
+HTTP Client
+Shared keep-alive HTTP session with per-host connection pools
+"""
+import threading
+from typing import Any, Dict, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from config.env_config import config
+from chat_bot_api.core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HTTPClient:
+    """
+    Process-wide HTTP client
+
+    Wraps one requests.Session whose adapters keep a pool of keep-alive
+    connections per host, so repeated downloads from the same origin skip
+    DNS, TCP and TLS setup. Requests get separate connect and read timeouts
+    unless the caller passes its own.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        connect_timeout: float = 5,
+        read_timeout: float = 30,
+        pool_block: bool = False
+    ):
+        """
+        Initialize HTTP client
+
+        Args:
+            pool_connections: Number of per-host pools kept alive
+            pool_maxsize: Connections kept alive per host
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait between bytes of the response
+            pool_block: Wait for a free connection instead of opening an extra one
+        """
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the shared session
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Arguments accepted by requests.Session.request
+
+        Returns:
+            requests.Response: Response (close it, or read it fully, to
+            return the connection to the pool)
+        """
+        kwargs.setdefault('timeout', self.timeout)
+
+        with self._lock:
+            self._requests += 1
+
+        try:
+            return self.session.request(method, url, **kwargs)
+        except requests.RequestException:
+            with self._lock:
+                self._errors += 1
+            raise
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request"""
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        """Send a HEAD request"""
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('HEAD', url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get connection reuse metrics
+
+        Counts come from the live urllib3 pools; pools evicted because more
+        than ``pool_connections`` hosts were used drop out of the totals.
+
+        Returns:
+            dict: Request totals and per-host connection counts
+        """
+        hosts = {}
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            opened = pool.num_connections
+            served = pool.num_requests
+            hosts[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                'requests': served,
+                'connections_opened': opened,
+                'connections_reused': max(served - opened, 0),
+            }
+
+        total_requests = sum(host['requests'] for host in hosts.values())
+        total_opened = sum(host['connections_opened'] for host in hosts.values())
+
+        with self._lock:
+            return {
+                'requests': self._requests,
+                'errors': self._errors,
+                'connections_opened': total_opened,
+                'reuse_rate': (1 - total_opened / total_requests) if total_requests else 0.0,
+                'hosts': hosts,
+            }
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+
+_http_client: Optional[HTTPClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """
+    Get process-wide HTTP client instance
+
+    Returns:
+        HTTPClient: Shared client
+    """
+    global _http_client
+
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = HTTPClient(
+                    pool_connections=config.HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=config.HTTP_POOL_MAXSIZE,
+                    connect_timeout=config.HTTP_CONNECT_TIMEOUT,
+                    read_timeout=config.PDF_DOWNLOAD_TIMEOUT
+                )
+                logger.info(
+                    "HTTP client initialized",
+                    extra={'extra_data': {
+                        'pool_connections': config.HTTP_POOL_CONNECTIONS,
+                        'pool_maxsize': config.HTTP_POOL_MAXSIZE
+                    }}
+                )
+
+    return _http_client
@@ -0,0 +1,299 @@
+"""
+LLM Client
+Process-wide Groq client with a shared connection pool and agent templates
+"""
+import threading
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+import httpx
+from groq import Groq as GroqClient
+from phi.agent import Agent
+from phi.model.groq import Groq
+from config.env_config import config
+from config.constants import ActionType, AgentConstants
+from chat_bot_api.core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class AgentTemplate:
+    """Fixed settings of the agents built for one action type"""
+    action: str
+    name: str
+    role: Optional[str]
+    model_id: str
+    markdown: bool = True
+    fallback_messages: Tuple[str, ...] = ()
+
+
+def default_agent_templates(model_id: str) -> Dict[str, AgentTemplate]:
+    """
+    Build the agent templates of every action type
+
+    Args:
+        model_id: Default model of the agents
+
+    Returns:
+        dict: Action type -> AgentTemplate
+    """
+    return {
+        # The QA context prompt states the agent's role itself
+        ActionType.QUESTION_ANSWER: AgentTemplate(
+            ActionType.QUESTION_ANSWER,
+            AgentConstants.QA_AGENT_NAME,
+            None,
+            model_id,
+            fallback_messages=(AgentConstants.QA_FALLBACK_MESSAGE,)
+        ),
+        ActionType.SUMMARIZER: AgentTemplate(
+            ActionType.SUMMARIZER,
+            AgentConstants.SUMMARY_AGENT_NAME,
+            AgentConstants.SUMMARY_AGENT_ROLE,
+            model_id
+        ),
+        ActionType.GENERATE_QUESTIONS: AgentTemplate(
+            ActionType.GENERATE_QUESTIONS,
+            AgentConstants.QUESTION_GEN_AGENT_NAME,
+            AgentConstants.QUESTION_GEN_AGENT_ROLE,
+            model_id
+        ),
+    }
+
+
+class LLMClientRegistry:
+    """
+    Process-wide registry of the Groq client and agent templates
+
+    One Groq API client, and the httpx connection pool under it, is shared
+    by every agent in the process, so model calls reuse warm keep-alive
+    connections instead of paying client construction and a TLS handshake
+    per request. Both are thread-safe.
+
+    Agents keep the messages of their runs, so each request still gets its
+    own Agent; it is built from the action's template and only receives a
+    model bound to the shared client. The API key is passed to the client
+    directly rather than through ``os.environ``.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        templates: Dict[str, AgentTemplate],
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30,
+        connect_timeout: float = 5,
+        timeout: float = 60,
+        max_retries: int = 2
+    ):
+        """
+        Initialize registry
+
+        Args:
+            api_key: Groq API key
+            templates: Action type -> AgentTemplate
+            max_connections: Maximum open connections to the API
+            max_keepalive_connections: Idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept
+            connect_timeout: Seconds to wait for a connection
+            timeout: Seconds to wait for a response
+            max_retries: Retries of failed API calls
+        """
+        self.api_key = api_key
+        self.templates = dict(templates)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.max_retries = max_retries
+
+        self.http_client: Optional[httpx.Client] = None
+        self._client: Optional[GroqClient] = None
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._connections_opened = 0
+        self._agents: Dict[str, int] = {}
+
+    @property
+    def client(self) -> GroqClient:
+        """Shared Groq API client, created on first use"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self.http_client = httpx.Client(
+                        limits=self.limits,
+                        timeout=self.timeout,
+                        event_hooks={'request': [self._on_request], 'response': [self._on_response]}
+                    )
+                    self._client = GroqClient(
+                        api_key=self.api_key,
+                        timeout=self.timeout,
+                        max_retries=self.max_retries,
+                        http_client=self.http_client
+                    )
+        return self._client
+
+    def template(self, action: str) -> AgentTemplate:
+        """
+        Get the agent template of an action type
+
+        Args:
+            action: Action type (see ActionType)
+
+        Returns:
+            AgentTemplate: Template
+
+        Raises:
+            KeyError: If the action type has no template
+        """
+        return self.templates[action]
+
+    def model(self, model_id: str) -> Groq:
+        """
+        Create a model bound to the shared client
+
+        Args:
+            model_id: Groq model ID
+
+        Returns:
+            Groq: Model for one agent
+        """
+        return Groq(id=model_id, client=self.client)
+
+    def create_agent(
+        self,
+        action: str,
+        description: str,
+        instructions: Optional[List[str]] = None,
+        **overrides
+    ) -> Agent:
+        """
+        Create an agent from an action's template
+
+        Args:
+            action: Action type (see ActionType)
+            description: Agent description (the request-specific prompt context)
+            instructions: List of instructions
+            **overrides: Template fields to replace (name, role, model_id, ...)
+
+        Returns:
+            Agent: Agent for one request
+        """
+        template = self.template(action)
+        if overrides:
+            template = replace(template, **overrides)
+
+        agent = Agent(
+            name=template.name,
+            description=description,
+            role=template.role,
+            instructions=instructions or [],
+            model=self.model(template.model_id),
+            markdown=template.markdown,
+            fallback_messages=list(template.fallback_messages)
+        )
+
+        with self._lock:
+            self._agents[action] = self._agents.get(action, 0) + 1
+        return agent
+
+    def _on_request(self, request: httpx.Request):
+        # httpcore reports every new TCP connection through the trace extension
+        request.extensions['trace'] = self._trace
+        with self._lock:
+            self._requests += 1
+
+    def _on_response(self, response: httpx.Response):
+        if response.status_code >= 400:
+            with self._lock:
+                self._errors += 1
+
+    def _trace(self, event_name: str, info: Dict[str, Any]):
+        if event_name == 'connection.connect_tcp.complete':
+            with self._lock:
+                self._connections_opened += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get connection reuse and agent metrics
+
+        Returns:
+            dict: Request totals, pool state (None when it cannot be read)
+            and agents built per action
+        """
+        open_connections, idle_connections = self._pool_state()
+
+        with self._lock:
+            return {
+                'client_ready': self._client is not None,
+                'requests': self._requests,
+                'errors': self._errors,
+                'connections_opened': self._connections_opened,
+                'connections_open': open_connections,
+                'connections_idle': idle_connections,
+                'reuse_rate': (1 - self._connections_opened / self._requests) if self._requests else 0.0,
+                'agents_created': dict(self._agents),
+            }
+
+    def _pool_state(self) -> Tuple[Optional[int], Optional[int]]:
+        """Open and idle connections of the pool, read from httpx internals"""
+        if self.http_client is None:
+            return 0, 0
+
+        # httpx exposes no pool metrics; its private layout may change between releases
+        try:
+            connections = list(self.http_client._transport._pool.connections)
+            return len(connections), sum(1 for connection in connections if connection.is_idle())
+        except Exception as e:
+            logger.debug(f"Connection pool state unavailable: {str(e)}")
+            return None, None
+
+    def close(self):
+        """Close all pooled connections"""
+        with self._lock:
+            if self.http_client is not None:
+                self.http_client.close()
+            self.http_client = None
+            self._client = None
+
+
+_llm_registry: Optional[LLMClientRegistry] = None
+_llm_registry_lock = threading.Lock()
+
+
+def get_llm_registry() -> LLMClientRegistry:
+    """
+    Get process-wide LLM client registry
+
+    Returns:
+        LLMClientRegistry: Shared registry
+    """
+    global _llm_registry
+
+    if _llm_registry is None:
+        with _llm_registry_lock:
+            if _llm_registry is None:
+                _llm_registry = LLMClientRegistry(
+                    config.GROQ_API_KEY,
+                    default_agent_templates(config.GROQ_MODEL_ID),
+                    max_connections=config.GROQ_POOL_MAX_CONNECTIONS,
+                    max_keepalive_connections=config.GROQ_POOL_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=config.GROQ_KEEPALIVE_EXPIRY,
+                    connect_timeout=config.HTTP_CONNECT_TIMEOUT,
+                    timeout=config.GROQ_TIMEOUT,
+                    max_retries=config.GROQ_MAX_RETRIES
+                )
+                logger.info(
+                    "LLM client registry initialized",
+                    extra={'extra_data': {
+                        'max_connections': config.GROQ_POOL_MAX_CONNECTIONS,
+                        'keepalive_connections': config.GROQ_POOL_KEEPALIVE_CONNECTIONS,
+                        'templates': sorted(_llm_registry.templates)
+                    }}
+                )
+
+    return _llm_registry
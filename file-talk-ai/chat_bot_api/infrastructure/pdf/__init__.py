@@ -0,0 +1,23 @@
+"""PDF Infrastructure"""
+from .engines import ExtractionEngine, ExtractionStats, get_extraction_stats, is_textless
+from .parallel_extractor import (
+    PageErrorPolicy,
+    PageExtractionError,
+    ParallelPageExtractor,
+    extract_page_batch
+)
+from .range_fetcher import PartialPDF, RangeFetcher, RangeFetchUnsupported
+
+__all__ = [
+    'ExtractionEngine',
+    'ExtractionStats',
+    'get_extraction_stats',
+    'is_textless',
+    'PageErrorPolicy',
+    'PageExtractionError',
+    'ParallelPageExtractor',
+    'extract_page_batch',
+    'PartialPDF',
+    'RangeFetcher',
+    'RangeFetchUnsupported',
+]
@@ -0,0 +1,192 @@
+"""
+Text Extraction Engines
+Page text extraction strategies and per-engine throughput stats
+"""
+import threading
+from typing import Any, Callable, Dict, List, Optional
+import fitz  # PyMuPDF
+
+# Only clip to the page; no ligature/whitespace preservation, no images
+FAST_FLAGS = fitz.TEXT_MEDIABOX_CLIP
+
+# PyMuPDF defaults for block output
+STRUCTURED_FLAGS = fitz.TEXTFLAGS_BLOCKS
+
+# Block tuples: (x0, y0, x1, y1, text, block_no, block_type)
+_TEXT_BLOCK = 0
+
+
+class ExtractionEngine:
+    """Text extraction engines"""
+    FAST = 'fast'              # Raw text in content-stream order
+    STRUCTURED = 'structured'  # Text blocks sorted into reading order
+    AUTO = 'auto'              # Fast, re-ordered only when blocks are out of order
+
+    @classmethod
+    def get_all(cls) -> list:
+        """Get all engines"""
+        return [cls.FAST, cls.STRUCTURED, cls.AUTO]
+
+
+def is_textless(page: fitz.Page) -> bool:
+    """
+    Cheaply detect a page that has no text to extract
+
+    Blank pages have no content stream. Scanned pages draw images without
+    any text operator, so for pages with images the content streams are
+    searched for a ``BT`` (begin text) operator. Form XObjects may hold
+    text themselves, so pages using them are never skipped.
+
+    Args:
+        page: Loaded page
+
+    Returns:
+        bool: True if the page is blank or image-only
+    """
+    contents = page.get_contents()
+    if not contents:
+        return True
+    if not page.get_images(full=False) or page.get_xobjects():
+        return False
+
+    doc = page.parent
+    return not any(b'BT' in (doc.xref_stream(xref) or b'') for xref in contents)
+
+
+def _join_blocks(blocks: List[tuple]) -> str:
+    return "".join(block[4] for block in blocks if block[6] == _TEXT_BLOCK)
+
+
+def _in_reading_order(blocks: List[tuple]) -> bool:
+    """
+    Check that no text block sits above the previous one in the same column
+
+    Jumping up to a block beside the previous one is a column break and
+    is fine; jumping up within the same column (headers written last,
+    overlays) is not.
+    """
+    previous = None
+    for block in blocks:
+        if block[6] != _TEXT_BLOCK:
+            continue
+        if previous is not None:
+            above = block[3] <= previous[1]
+            same_column = block[0] < previous[2] and block[2] > previous[0]
+            if above and same_column:
+                return False
+        previous = block
+    return True
+
+
+def extract_fast(page: fitz.Page) -> str:
+    """Raw text with minimal flags, in content-stream order"""
+    return page.get_text('text', flags=FAST_FLAGS)
+
+
+def extract_structured(page: fitz.Page) -> str:
+    """Text blocks sorted top-to-bottom, left-to-right"""
+    return _join_blocks(page.get_text('blocks', flags=STRUCTURED_FLAGS, sort=True))
+
+
+def extract_auto(page: fitz.Page) -> str:
+    """Fast extraction, sorted like the structured engine only when blocks are out of order"""
+    blocks = page.get_textpage(flags=FAST_FLAGS).extractBLOCKS()
+    if not _in_reading_order(blocks):
+        blocks = sorted(blocks, key=lambda block: (block[3], block[0]))
+    return _join_blocks(blocks)
+
+
+_EXTRACTORS: Dict[str, Callable[[fitz.Page], str]] = {
+    ExtractionEngine.FAST: extract_fast,
+    ExtractionEngine.STRUCTURED: extract_structured,
+    ExtractionEngine.AUTO: extract_auto,
+}
+
+
+def get_extractor(engine: str) -> Callable[[fitz.Page], str]:
+    """
+    Get the page extraction function of an engine
+
+    Raises:
+        ValueError: If the engine is unknown
+    """
+    try:
+        return _EXTRACTORS[engine]
+    except KeyError:
+        raise ValueError(f"Unknown extraction engine: {engine}")
+
+
+class ExtractionStats:
+    """
+    Thread-safe per-engine throughput counters
+
+    Fed with batch totals, including those measured in worker processes,
+    so ``seconds`` is extraction time summed over workers, not wall time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines: Dict[str, Dict[str, float]] = {}
+
+    def record(self, engine: str, pages: int, skipped_pages: int, chars: int, seconds: float):
+        """
+        Add the totals of one extraction batch
+
+        Args:
+            engine: Engine name
+            pages: Pages processed (including skipped ones)
+            skipped_pages: Pages skipped as blank or scanned
+            chars: Characters extracted
+            seconds: Time spent extracting
+        """
+        with self._lock:
+            totals = self._engines.setdefault(
+                engine, {'pages': 0, 'skipped_pages': 0, 'chars': 0, 'seconds': 0.0}
+            )
+            totals['pages'] += pages
+            totals['skipped_pages'] += skipped_pages
+            totals['chars'] += chars
+            totals['seconds'] += seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get counters per engine
+
+        Returns:
+            dict: engine -> pages, skipped pages, chars, seconds, chars/s and ms/page
+        """
+        with self._lock:
+            result = {}
+            for engine, totals in self._engines.items():
+                seconds = totals['seconds']
+                pages = totals['pages']
+                result[engine] = {
+                    'pages': pages,
+                    'skipped_pages': totals['skipped_pages'],
+                    'chars': totals['chars'],
+                    'seconds': round(seconds, 4),
+                    'chars_per_second': round(totals['chars'] / seconds) if seconds else 0,
+                    'ms_per_page': round(seconds * 1000 / pages, 3) if pages else 0.0,
+                }
+            return result
+
+
+_extraction_stats: Optional[ExtractionStats] = None
+_extraction_stats_lock = threading.Lock()
+
+
+def get_extraction_stats() -> ExtractionStats:
+    """
+    Get process-wide extraction stats
+
+    Returns:
+        ExtractionStats: Shared counters
+    """
+    global _extraction_stats
+
+    if _extraction_stats is None:
+        with _extraction_stats_lock:
+            if _extraction_stats is None:
+                _extraction_stats = ExtractionStats()
+
+    return _extraction_stats
@@ -0,0 +1,298 @@
+"""
+Parallel Page Extractor
+Splits PDF page extraction across a process pool
+"""
+import math
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import fitz  # PyMuPDF
+from .engines import ExtractionEngine, get_extraction_stats, get_extractor, is_textless
+
+# Raw document source that can be shipped to a worker process
+DocumentSource = Union[str, bytes, bytearray]
+
+# (page_number, text, error) as returned by workers
+PageResult = Tuple[int, Optional[str], Optional[str]]
+
+# (pages, skipped_pages, chars, seconds) measured by a worker for one batch
+BatchTotals = Tuple[int, int, int, float]
+
+
+class PageErrorPolicy:
+    """What to do with a page whose text cannot be extracted"""
+    SKIP = 'skip'                # Leave the page out of the result
+    PLACEHOLDER = 'placeholder'  # Keep the page with a placeholder text
+    RAISE = 'raise'              # Fail the whole extraction
+
+    PLACEHOLDER_TEXT = "[Page {page} could not be extracted]"
+
+    @classmethod
+    def get_all(cls) -> list:
+        """Get all policies"""
+        return [cls.SKIP, cls.PLACEHOLDER, cls.RAISE]
+
+
+class PageExtractionError(Exception):
+    """Raised when a page fails under the RAISE policy"""
+
+    def __init__(self, page: int, message: str):
+        self.page = page
+        super().__init__(f"Error extracting page {page}: {message}")
+
+
+def _open(source: DocumentSource) -> fitz.Document:
+    """Open a document from a path or raw bytes"""
+    if isinstance(source, (bytes, bytearray)):
+        return fitz.open(stream=source, filetype='pdf')
+    return fitz.open(source)
+
+
+def extract_page_batch(
+    source: DocumentSource,
+    page_numbers: Sequence[int],
+    engine: str = ExtractionEngine.FAST,
+    skip_textless: bool = True
+) -> Tuple[List[PageResult], BatchTotals]:
+    """
+    Extract a batch of pages (runs inside worker processes)
+
+    Each call opens the document itself so nothing but the source and page
+    numbers has to cross the process boundary. Per-page failures are
+    returned instead of raised so the caller can apply its error policy.
+
+    Args:
+        source: Path to PDF file or raw PDF bytes
+        page_numbers: 1-indexed page numbers
+        engine: One of ExtractionEngine values
+        skip_textless: Return blank and scanned pages as empty text without extracting them
+
+    Returns:
+        tuple: (page_number, text, error) tuples in input order, and the
+        batch totals for the engine stats
+    """
+    extract = get_extractor(engine)
+    results = []
+    skipped = 0
+    chars = 0
+    start = time.perf_counter()
+
+    with _open(source) as doc:
+        for page_number in page_numbers:
+            try:
+                page = doc.load_page(page_number - 1)
+                if skip_textless and is_textless(page):
+                    skipped += 1
+                    text = ''
+                else:
+                    text = extract(page)
+                chars += len(text)
+                results.append((page_number, text, None))
+            except Exception as e:
+                results.append((page_number, None, str(e)))
+
+    return results, (len(page_numbers), skipped, chars, time.perf_counter() - start)
+
+
+class ParallelPageExtractor:
+    """
+    Page extraction engine with an optional process pool
+
+    Small requests run in-process; larger ones are split into contiguous
+    batches that are extracted concurrently by a shared, lazily created
+    process pool. Results always come back in page order. Time spent per
+    engine is added to the process-wide extraction stats.
+
+    In-memory documents are written to a temporary file for the duration
+    of a parallel call, so workers open the file instead of receiving the
+    bytes with every batch; callers extracting one in-memory document in
+    several calls can ``spill`` it once themselves and pass the path.
+    """
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        min_parallel_pages: int = 24,
+        error_policy: str = PageErrorPolicy.SKIP,
+        start_method: str = 'spawn',
+        engine: str = ExtractionEngine.FAST,
+        skip_textless: bool = True,
+        logger=None
+    ):
+        """
+        Initialize extractor
+
+        Args:
+            max_workers: Worker processes (0 = one per CPU)
+            min_parallel_pages: Below this many pages, extract in-process
+            error_policy: One of PageErrorPolicy values
+            start_method: multiprocessing start method for the pool
+            engine: One of ExtractionEngine values
+            skip_textless: Skip blank and scanned pages
+            logger: Optional logger for per-page warnings
+        """
+        if error_policy not in PageErrorPolicy.get_all():
+            raise ValueError(f"Unknown page error policy: {error_policy}")
+        if engine not in ExtractionEngine.get_all():
+            raise ValueError(f"Unknown extraction engine: {engine}")
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel_pages = min_parallel_pages
+        self.error_policy = error_policy
+        self.start_method = start_method
+        self.engine = engine
+        self.skip_textless = skip_textless
+        self.stats = get_extraction_stats()
+        self.logger = logger
+
+    @property
+    def window_pages(self) -> int:
+        """Pages per call that keep every worker busy with full-size batches"""
+        return max(self.max_workers, 1) * max(self.min_parallel_pages, 1)
+
+    def is_parallel(self, page_count: int) -> bool:
+        """Whether extracting this many pages uses the process pool"""
+        return self.max_workers > 1 and page_count >= self.min_parallel_pages
+
+    @staticmethod
+    @contextmanager
+    def spill(source: DocumentSource) -> Iterator[str]:
+        """
+        Write an in-memory document to a temporary file for the workers
+
+        Workers then open the file themselves, so the document crosses the
+        process boundary once instead of once per batch.
+
+        Args:
+            source: Path to PDF file or raw PDF bytes
+
+        Yields:
+            str: Path to the document (the given path, or the temporary file)
+        """
+        if not isinstance(source, (bytes, bytearray, memoryview)):
+            yield source
+            return
+
+        fd, path = tempfile.mkstemp(suffix='.pdf')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(source)
+            yield path
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def extract(self, source: DocumentSource, page_numbers: Sequence[int]) -> Dict[int, str]:
+        """
+        Extract text for the given pages
+
+        Args:
+            source: Path to PDF file or raw PDF bytes
+            page_numbers: 1-indexed page numbers
+
+        Returns:
+            dict: page_number -> text, ordered by page number
+
+        Raises:
+            PageExtractionError: If a page fails and the policy is RAISE
+        """
+        page_numbers = sorted(page_numbers)
+        if not page_numbers:
+            return {}
+
+        if not self.is_parallel(len(page_numbers)):
+            results = self._extract_batch(source, page_numbers)
+        else:
+            results = self._extract_parallel(source, page_numbers)
+
+        return self._apply_error_policy(results)
+
+    def _extract_batch(self, source: DocumentSource, page_numbers: List[int]) -> List[PageResult]:
+        """Extract pages in this process"""
+        results, totals = extract_page_batch(source, page_numbers, self.engine, self.skip_textless)
+        self.stats.record(self.engine, *totals)
+        return results
+
+    def _extract_parallel(self, source: DocumentSource, page_numbers: List[int]) -> List[PageResult]:
+        """Extract pages in contiguous batches on the process pool"""
+        # Two batches per worker evens out pages of very different cost
+        batch_count = min(len(page_numbers), self.max_workers * 2)
+        batch_size = math.ceil(len(page_numbers) / batch_count)
+        batches = [
+            page_numbers[i:i + batch_size]
+            for i in range(0, len(page_numbers), batch_size)
+        ]
+
+        try:
+            executor = self._get_executor()
+            with self.spill(source) as path:
+                futures = [
+                    executor.submit(extract_page_batch, path, batch, self.engine, self.skip_textless)
+                    for batch in batches
+                ]
+                results: List[PageResult] = []
+                for future in futures:
+                    batch_results, totals = future.result()
+                    results.extend(batch_results)
+                    self.stats.record(self.engine, *totals)
+            return results
+        except BrokenProcessPool:
+            self._warn("Extraction process pool broke; falling back to in-process extraction")
+            self._reset_executor()
+            return self._extract_batch(source, page_numbers)
+
+    def _apply_error_policy(self, results: List[PageResult]) -> Dict[int, str]:
+        """Turn worker results into page texts according to the error policy"""
+        pages = {}
+        for page_number, text, error in results:
+            if error is None:
+                pages[page_number] = text
+                continue
+
+            if self.error_policy == PageErrorPolicy.RAISE:
+                raise PageExtractionError(page_number, error)
+
+            self._warn(f"Error extracting page {page_number}: {error}", page=page_number)
+            if self.error_policy == PageErrorPolicy.PLACEHOLDER:
+                pages[page_number] = PageErrorPolicy.PLACEHOLDER_TEXT.format(page=page_number)
+
+        return pages
+
+    def _warn(self, message: str, **context):
+        if self.logger:
+            self.logger.warning(message, extra={'extra_data': context} if context else None)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the shared process pool, creating it on first use"""
+        cls = ParallelPageExtractor
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method)
+                )
+            return cls._executor
+
+    @classmethod
+    def _reset_executor(cls):
+        """Drop a broken pool so the next call starts a fresh one"""
+        with cls._executor_lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False)
+                cls._executor = None
+
+    @classmethod
+    def shutdown(cls):
+        """Shut down the shared process pool"""
+        cls._reset_executor()
@@ -0,0 +1,698 @@
+"""
+Range Fetcher
+Fetches only the objects needed for a page subset of a remote PDF
+"""
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+import fitz  # PyMuPDF
+
+_WHITESPACE = b' \t\r\n\f\x00'
+_DELIMITERS = b'()<>[]{}/%'
+
+_STARTXREF_RE = re.compile(rb'startxref\s+(\d+)')
+_OBJ_HEADER_RE = re.compile(rb'\s*(\d+)\s+(\d+)\s+obj')
+_REF_RE = re.compile(rb'(\d+)\s+(\d+)\s+R(?![A-Za-z0-9])')
+_CONTENT_RANGE_RE = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+)')
+
+# Page keys that point back into the rest of the document and are not needed for text
+_DROPPED_PAGE_KEYS = {b'/Parent', b'/Annots', b'/B', b'/Thumb'}
+
+# Page attributes that may be inherited from ancestor /Pages nodes
+_INHERITABLE_KEYS = (b'/Resources', b'/MediaBox', b'/CropBox', b'/Rotate')
+
+
+class RangeFetchUnsupported(Exception):
+    """Raised when a partial fetch is not possible and the whole file is needed"""
+
+
+@dataclass
+class PartialPDF:
+    """Minimal PDF rebuilt from the objects of a page subset"""
+    data: bytes
+    page_numbers: List[int]
+    total_pages: int
+    source_size: int
+    bytes_fetched: int
+    document_key: str
+
+
+# ----------------------------------------------------------------------
+# Minimal PDF syntax helpers
+# ----------------------------------------------------------------------
+
+def _skip_whitespace(data: bytes, i: int) -> int:
+    """Skip whitespace and comments"""
+    length = len(data)
+    while i < length:
+        c = data[i]
+        if c in _WHITESPACE:
+            i += 1
+        elif c == 0x25:  # '%'
+            while i < length and data[i] not in b'\r\n':
+                i += 1
+        else:
+            break
+    return i
+
+
+def _token_end(data: bytes, i: int) -> int:
+    """Find end of a regular (non-delimited) token"""
+    length = len(data)
+    while i < length and data[i] not in _WHITESPACE and data[i] not in _DELIMITERS:
+        i += 1
+    return i
+
+
+def _value_end(data: bytes, i: int) -> int:
+    """
+    Find the end of the PDF object starting at ``i``
+
+    Handles dictionaries, arrays, literal and hex strings, names, numbers
+    and indirect references (``N G R``).
+    """
+    if data.startswith(b'<<', i):
+        i += 2
+        while True:
+            i = _skip_whitespace(data, i)
+            if i >= len(data):
+                raise RangeFetchUnsupported("Unterminated dictionary")
+            if data.startswith(b'>>', i):
+                return i + 2
+            i = _value_end(data, i)
+
+    c = data[i:i + 1]
+
+    if c == b'[':
+        i += 1
+        while True:
+            i = _skip_whitespace(data, i)
+            if i >= len(data):
+                raise RangeFetchUnsupported("Unterminated array")
+            if data[i:i + 1] == b']':
+                return i + 1
+            i = _value_end(data, i)
+
+    if c == b'(':
+        depth = 0
+        while i < len(data):
+            ch = data[i]
+            if ch == 0x5C:  # backslash escape
+                i += 2
+                continue
+            if ch == 0x28:
+                depth += 1
+            elif ch == 0x29:
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+            i += 1
+        raise RangeFetchUnsupported("Unterminated string")
+
+    if c == b'<':
+        end = data.find(b'>', i)
+        if end < 0:
+            raise RangeFetchUnsupported("Unterminated hex string")
+        return end + 1
+
+    if c == b'/':
+        return _token_end(data, i + 1)
+
+    end = _token_end(data, i)
+    if end == i:
+        raise RangeFetchUnsupported(f"Unexpected byte {c!r} in object")
+
+    # Indirect reference: "<int> <int> R"
+    if data[i:end].isdigit():
+        j = _skip_whitespace(data, end)
+        k = _token_end(data, j)
+        if k > j and data[j:k].isdigit():
+            m = _skip_whitespace(data, k)
+            if data[m:m + 1] == b'R' and _token_end(data, m) == m + 1:
+                return m + 1
+
+    return end
+
+
+def _parse_dict(data: bytes, i: int = 0) -> Tuple[Dict[bytes, bytes], int]:
+    """
+    Parse top-level entries of the dictionary starting at ``i``
+
+    Returns:
+        tuple: (key -> raw value bytes, index after the dictionary)
+    """
+    i = _skip_whitespace(data, i)
+    if not data.startswith(b'<<', i):
+        raise RangeFetchUnsupported("Expected dictionary")
+
+    entries = {}
+    i += 2
+    while True:
+        i = _skip_whitespace(data, i)
+        if data.startswith(b'>>', i):
+            return entries, i + 2
+        if data[i:i + 1] != b'/':
+            raise RangeFetchUnsupported("Expected name key in dictionary")
+
+        key_end = _token_end(data, i + 1)
+        key = data[i:key_end]
+        value_start = _skip_whitespace(data, key_end)
+        value_end = _value_end(data, value_start)
+        entries[key] = data[value_start:value_end]
+        i = value_end
+
+
+def _ref(value: Optional[bytes]) -> Optional[int]:
+    """Object number of an indirect reference value"""
+    if not value:
+        return None
+    match = _REF_RE.fullmatch(value.strip())
+    return int(match.group(1)) if match else None
+
+
+def _refs(value: bytes) -> List[int]:
+    """Object numbers of all indirect references inside a value"""
+    return [int(match.group(1)) for match in _REF_RE.finditer(value)]
+
+
+@dataclass
+class _PDFObject:
+    """Raw indirect object"""
+    number: int
+    generation: int
+    raw: bytes          # "N G obj ... endobj"
+    body: bytes         # object value (dictionary part for streams)
+    is_stream: bool
+
+    @property
+    def entries(self) -> Dict[bytes, bytes]:
+        return _parse_dict(self.body)[0] if self.body.lstrip().startswith(b'<<') else {}
+
+
+def _parse_object(number: int, raw: bytes) -> _PDFObject:
+    """Parse raw bytes of an indirect object"""
+    header = _OBJ_HEADER_RE.match(raw)
+    if not header or int(header.group(1)) != number:
+        raise RangeFetchUnsupported(f"Object {number} is not where the xref table says")
+
+    end = raw.rfind(b'endobj')
+    if end < 0:
+        raise RangeFetchUnsupported(f"Object {number} is truncated")
+
+    raw = raw[:end + len(b'endobj')]
+    value_start = _skip_whitespace(raw, header.end())
+    value_end = _value_end(raw, value_start)
+    after = _skip_whitespace(raw, value_end)
+
+    return _PDFObject(
+        number=number,
+        generation=int(header.group(2)),
+        raw=raw,
+        body=raw[value_start:value_end],
+        is_stream=raw.startswith(b'stream', after)
+    )
+
+
+# ----------------------------------------------------------------------
+# Fetcher
+# ----------------------------------------------------------------------
+
+@dataclass
+class _RemoteFile:
+    """Byte ranges fetched so far from one remote file"""
+    url: str
+    size: int
+    validator: str
+    segments: List[Tuple[int, bytes]] = field(default_factory=list)
+    bytes_fetched: int = 0
+
+
+class RangeFetcher:
+    """
+    Partial PDF download over HTTP Range requests
+
+    Reads the trailer and classic cross-reference tables from the end of
+    the file, walks the page tree to the requested pages and fetches only
+    the objects those pages reference (content streams, resources, fonts).
+    The objects are reassembled into a small, valid PDF whose pages are the
+    requested subset.
+
+    Anything the reader does not handle (xref streams, encryption, servers
+    without range support, or subsets that would need most of the file)
+    raises RangeFetchUnsupported so the caller can download the whole file.
+    """
+
+    def __init__(
+        self,
+        http_get: Callable,
+        http_head: Callable,
+        timeout=30,
+        tail_bytes: int = 16 * 1024,
+        coalesce_gap: int = 16 * 1024,
+        max_fetch_ratio: float = 0.6,
+        max_size_bytes: Optional[int] = None
+    ):
+        """
+        Initialize range fetcher
+
+        Args:
+            http_get: requests-compatible GET callable
+            http_head: requests-compatible HEAD callable
+            timeout: Request timeout passed to the callables
+            tail_bytes: Bytes read from the end of the file to locate the xref
+            coalesce_gap: Ranges closer than this are fetched in one request
+            max_fetch_ratio: Give up once this share of the file has been fetched
+            max_size_bytes: Reject files larger than this
+        """
+        self.http_get = http_get
+        self.http_head = http_head
+        self.timeout = timeout
+        self.tail_bytes = tail_bytes
+        self.coalesce_gap = coalesce_gap
+        self.max_fetch_ratio = max_fetch_ratio
+        self.max_size_bytes = max_size_bytes
+
+    def fetch_pages(self, url: str, first_page: int, last_page: int) -> PartialPDF:
+        """
+        Fetch a page subset of a remote PDF
+
+        Args:
+            url: Document URL
+            first_page: First page number (1-indexed)
+            last_page: Last page number (1-indexed, clamped to the page count)
+
+        Returns:
+            PartialPDF: Rebuilt document containing only the requested pages
+
+        Raises:
+            RangeFetchUnsupported: If the whole file has to be downloaded
+        """
+        remote = self._probe(url)
+        offsets, xref_offsets, root_number = self._read_xref(remote)
+
+        # Object n spans from its offset to the next known boundary
+        boundaries = sorted(set(offset for offset, _ in offsets.values()) | xref_offsets | {remote.size})
+        spans = {}
+        for number, (offset, _) in offsets.items():
+            index = self._bisect(boundaries, offset)
+            spans[number] = (offset, boundaries[index + 1] if index + 1 < len(boundaries) else remote.size)
+
+        objects: Dict[int, _PDFObject] = {}
+
+        def load(numbers):
+            wanted = [n for n in set(numbers) if n in spans and n not in objects]
+            self._load_objects(remote, wanted, spans, objects)
+            return [objects[n] for n in numbers if n in objects]
+
+        root = load([root_number])
+        if not root:
+            raise RangeFetchUnsupported("Document catalog not found")
+
+        pages_root = _ref(root[0].entries.get(b'/Pages'))
+        if pages_root is None:
+            raise RangeFetchUnsupported("Document has no page tree")
+
+        total_pages, pages = self._collect_pages(load, pages_root, first_page, last_page)
+        if not pages:
+            raise RangeFetchUnsupported("Requested pages are outside the document")
+
+        # Pull in everything the selected pages reference, level by level
+        pending = set()
+        for page_obj, _, entries in pages:
+            for key, value in entries.items():
+                if key not in _DROPPED_PAGE_KEYS:
+                    pending.update(_refs(value))
+
+        while pending:
+            loaded = load(list(pending))
+            pending = set()
+            for obj in loaded:
+                pending.update(n for n in _refs(obj.body) if n in spans and n not in objects)
+
+        data = self._assemble(objects, pages, max(spans) if spans else 0)
+        page_numbers = [number for _, number, _ in pages]
+
+        with fitz.open(stream=data, filetype='pdf') as doc:
+            if len(doc) != len(page_numbers):
+                raise RangeFetchUnsupported("Rebuilt document does not have the expected pages")
+
+        return PartialPDF(
+            data=data,
+            page_numbers=page_numbers,
+            total_pages=total_pages,
+            source_size=remote.size,
+            bytes_fetched=remote.bytes_fetched,
+            document_key=self._document_key(remote, data)
+        )
+
+    @staticmethod
+    def _document_key(remote: _RemoteFile, data: bytes) -> str:
+        """
+        Key of the fetched pages for caching
+
+        With an ETag or Last-Modified the key follows the origin's version.
+        Without one, a replaced file of the same size would keep the key, so
+        the rebuilt bytes are hashed instead: cached text is only reused
+        for the exact objects just fetched.
+        """
+        if remote.validator:
+            return hashlib.sha256(f"{remote.url}\n{remote.validator}\n{remote.size}".encode()).hexdigest()
+        return hashlib.sha256(data).hexdigest()
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def _probe(self, url: str) -> _RemoteFile:
+        """Check that the server supports byte ranges and get the file size"""
+        response = self.http_head(url, timeout=self.timeout, allow_redirects=True)
+        response.close()
+
+        if response.status_code != 200:
+            raise RangeFetchUnsupported(f"HEAD returned {response.status_code}")
+        if 'bytes' not in response.headers.get('accept-ranges', '').lower():
+            raise RangeFetchUnsupported("Server does not advertise byte ranges")
+        if response.headers.get('content-encoding', 'identity').lower() != 'identity':
+            raise RangeFetchUnsupported("Content is served with a content encoding")
+
+        try:
+            size = int(response.headers['content-length'])
+        except (KeyError, ValueError):
+            raise RangeFetchUnsupported("Server did not report the file size")
+
+        if self.max_size_bytes and size > self.max_size_bytes:
+            raise RangeFetchUnsupported("File exceeds the size limit")
+
+        validator = response.headers.get('etag') or response.headers.get('last-modified') or ''
+        return _RemoteFile(url=url, size=size, validator=validator)
+
+    def _read(self, remote: _RemoteFile, start: int, end: int) -> bytes:
+        """
+        Read bytes [start, end), fetching only what is not held yet
+
+        A read that starts inside (or right after) a fetched segment extends
+        that segment instead of fetching the overlap again.
+        """
+        start = max(start, 0)
+        end = min(end, remote.size)
+
+        for index, (seg_start, seg_data) in enumerate(remote.segments):
+            seg_end = seg_start + len(seg_data)
+            if seg_start <= start <= seg_end:
+                if end > seg_end:
+                    seg_data += self._fetch(remote, seg_end, end)
+                    remote.segments[index] = (seg_start, seg_data)
+                return seg_data[start - seg_start:end - seg_start]
+
+        remote.segments.append((start, self._fetch(remote, start, end)))
+        return remote.segments[-1][1][:end - start]
+
+    def _fetch(self, remote: _RemoteFile, start: int, end: int) -> bytes:
+        """Fetch bytes [start, end) with a single Range request"""
+        if remote.bytes_fetched + (end - start) > remote.size * self.max_fetch_ratio:
+            raise RangeFetchUnsupported("Partial fetch would transfer most of the file")
+
+        response = self.http_get(
+            remote.url,
+            headers={'Range': f"bytes={start}-{end - 1}"},
+            timeout=self.timeout
+        )
+        try:
+            if response.status_code != 206:
+                raise RangeFetchUnsupported(f"Range request returned {response.status_code}")
+
+            match = _CONTENT_RANGE_RE.match(response.headers.get('content-range', ''))
+            if not match or int(match.group(1)) != start or int(match.group(3)) != remote.size:
+                raise RangeFetchUnsupported("Unexpected Content-Range in response")
+
+            data = response.content
+        finally:
+            response.close()
+
+        if len(data) != end - start:
+            raise RangeFetchUnsupported("Range response has an unexpected length")
+
+        remote.bytes_fetched += len(data)
+        return data
+
+    def _load_objects(self, remote: _RemoteFile, numbers: List[int], spans, objects: Dict[int, _PDFObject]):
+        """Fetch and parse objects, coalescing nearby ranges into single requests"""
+        ranges = sorted(spans[n] for n in numbers)
+        merged: List[List[int]] = []
+        for start, end in ranges:
+            if merged and start - merged[-1][1] <= self.coalesce_gap:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        for start, end in merged:
+            self._read(remote, start, end)
+
+        for number in numbers:
+            start, end = spans[number]
+            objects[number] = _parse_object(number, self._read(remote, start, end))
+
+    # ------------------------------------------------------------------
+    # Cross-reference tables
+    # ------------------------------------------------------------------
+
+    def _read_xref(self, remote: _RemoteFile) -> Tuple[Dict[int, Tuple[int, int]], Set[int], int]:
+        """
+        Read all classic xref sections following the /Prev chain
+
+        Returns:
+            tuple: (object number -> (offset, generation), xref section offsets, root object number)
+        """
+        tail_start = max(remote.size - self.tail_bytes, 0)
+        tail = self._read(remote, tail_start, remote.size)
+
+        matches = list(_STARTXREF_RE.finditer(tail))
+        if not matches:
+            raise RangeFetchUnsupported("startxref not found")
+
+        offsets: Dict[int, Optional[Tuple[int, int]]] = {}
+        xref_offsets: Set[int] = set()
+        root_number = None
+        xref_offset: Optional[int] = int(matches[-1].group(1))
+
+        while xref_offset is not None:
+            if xref_offset in xref_offsets or xref_offset >= remote.size:
+                raise RangeFetchUnsupported("Broken xref chain")
+            xref_offsets.add(xref_offset)
+
+            trailer = self._read_xref_section(remote, xref_offset, offsets)
+
+            if b'/Encrypt' in trailer:
+                raise RangeFetchUnsupported("Encrypted documents are not supported")
+            if b'/XRefStm' in trailer:
+                raise RangeFetchUnsupported("Hybrid xref files are not supported")
+
+            if root_number is None:
+                root_number = _ref(trailer.get(b'/Root'))
+
+            prev = trailer.get(b'/Prev')
+            xref_offset = int(prev) if prev and prev.strip().isdigit() else None
+
+        if root_number is None:
+            raise RangeFetchUnsupported("Trailer has no /Root")
+
+        in_use = {number: entry for number, entry in offsets.items() if entry is not None}
+        return in_use, xref_offsets, root_number
+
+    def _read_xref_section(self, remote: _RemoteFile, offset: int, offsets: Dict) -> Dict[bytes, bytes]:
+        """Parse one xref table plus its trailer; newer sections win"""
+        chunk_size = 16 * 1024
+        end = min(offset + chunk_size, remote.size)
+        data = self._read(remote, offset, end)
+
+        while True:
+            try:
+                return self._parse_xref_section(data, offsets)
+            except _NeedMoreData:
+                if end >= remote.size:
+                    raise RangeFetchUnsupported("Truncated xref section")
+                end = min(end + max(chunk_size, len(data)), remote.size)
+                data = self._read(remote, offset, end)
+
+    @staticmethod
+    def _parse_xref_section(data: bytes, offsets: Dict) -> Dict[bytes, bytes]:
+        """Parse xref entries into ``offsets`` and return the trailer dictionary"""
+        i = _skip_whitespace(data, 0)
+        if not data.startswith(b'xref', i):
+            raise RangeFetchUnsupported("Cross-reference streams are not supported")
+
+        i += 4
+        section: Dict[int, Optional[Tuple[int, int]]] = {}
+
+        while True:
+            i = _skip_whitespace(data, i)
+            if data.startswith(b'trailer', i):
+                break
+
+            line_end = data.find(b'\n', i)
+            if line_end < 0:
+                raise _NeedMoreData()
+
+            header = data[i:line_end].split()
+            if len(header) != 2 or not all(part.isdigit() for part in header):
+                raise RangeFetchUnsupported("Malformed xref subsection header")
+
+            first, count = int(header[0]), int(header[1])
+            i = line_end + 1
+            entries_end = i + count * 20
+            if entries_end > len(data):
+                raise _NeedMoreData()
+
+            for index in range(count):
+                entry = data[i + index * 20:i + index * 20 + 18].split()
+                if len(entry) != 3:
+                    raise RangeFetchUnsupported("Malformed xref entry")
+                number = first + index
+                section[number] = (int(entry[0]), int(entry[1])) if entry[2] == b'n' else None
+            i = entries_end
+
+        try:
+            trailer, _ = _parse_dict(data, i + len(b'trailer'))
+        except RangeFetchUnsupported:
+            raise _NeedMoreData()
+
+        for number, entry in section.items():
+            offsets.setdefault(number, entry)
+        return trailer
+
+    # ------------------------------------------------------------------
+    # Page tree
+    # ------------------------------------------------------------------
+
+    def _collect_pages(self, load, pages_root: int, first_page: int, last_page: int):
+        """
+        Walk the page tree down to the requested pages
+
+        Subtrees outside the range are skipped using their /Count.
+
+        Returns:
+            tuple: (total pages, [(page object, page number, effective entries)])
+        """
+        root = load([pages_root])
+        if not root:
+            raise RangeFetchUnsupported("Page tree root not found")
+
+        root_entries = root[0].entries
+        total_pages = int(root_entries.get(b'/Count', b'0'))
+        last_page = min(last_page, total_pages)
+
+        selected = []
+        # Stack of (node, first page number under node, inherited attributes)
+        stack = [(root[0], 1, {})]
+
+        while stack:
+            node, start, inherited = stack.pop()
+            entries = node.entries
+
+            if entries.get(b'/Type', b'').strip() != b'/Pages' and b'/Kids' not in entries:
+                effective = {**inherited, **entries}
+                selected.append((node, start, effective))
+                continue
+
+            inherited = {
+                **inherited,
+                **{key: entries[key] for key in _INHERITABLE_KEYS if key in entries}
+            }
+
+            kid_numbers = _refs(entries.get(b'/Kids', b''))
+            if int(entries.get(b'/Count', b'-1')) == len(kid_numbers):
+                # One page per kid: index straight into /Kids without loading the others
+                wanted = kid_numbers[max(first_page - start, 0):max(last_page - start + 1, 0)]
+                page_number = start + max(first_page - start, 0)
+                for kid in load(wanted):
+                    if b'/Kids' in kid.entries:
+                        raise RangeFetchUnsupported("Page tree /Count does not match its leaves")
+                    selected.append((kid, page_number, {**inherited, **kid.entries}))
+                    page_number += 1
+                continue
+
+            kids = load(kid_numbers)
+            children = []
+            page_number = start
+            for kid in kids:
+                kid_entries = kid.entries
+                is_pages = kid_entries.get(b'/Type', b'').strip() == b'/Pages' or b'/Kids' in kid_entries
+                count = int(kid_entries.get(b'/Count', b'0')) if is_pages else 1
+                if page_number <= last_page and page_number + count - 1 >= first_page:
+                    children.append((kid, page_number, inherited))
+                page_number += count
+
+            # Reverse so pages come off the stack in document order
+            stack.extend(reversed(children))
+
+        return total_pages, sorted(selected, key=lambda item: item[1])
+
+    # ------------------------------------------------------------------
+    # Assembly
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _assemble(objects: Dict[int, _PDFObject], pages, max_number: int) -> bytes:
+        """Write the collected objects, a new page tree and a new xref table"""
+        pages_number = max_number + 1
+        catalog_number = max_number + 2
+        page_numbers = {page_obj.number for page_obj, _, _ in pages}
+        page_entries = {page_obj.number: entries for page_obj, _, entries in pages}
+
+        out = bytearray(b'%PDF-1.7\n%\xe2\xe3\xcf\xd3\n')
+        xref: Dict[int, Tuple[int, int]] = {}
+
+        for number in sorted(objects):
+            obj = objects[number]
+            if obj.number in page_numbers:
+                continue
+            xref[number] = (len(out), obj.generation)
+            out += obj.raw + b'\n'
+
+        for page_obj, _, _ in pages:
+            entries = page_entries[page_obj.number]
+            body = b''.join(
+                b' ' + key + b' ' + value
+                for key, value in entries.items()
+                if key not in _DROPPED_PAGE_KEYS
+            )
+            xref[page_obj.number] = (len(out), page_obj.generation)
+            out += b'%d %d obj\n<<%s /Parent %d 0 R >>\nendobj\n' % (
+                page_obj.number, page_obj.generation, body, pages_number
+            )
+
+        kids = b' '.join(b'%d %d R' % (page_obj.number, page_obj.generation) for page_obj, _, _ in pages)
+        xref[pages_number] = (len(out), 0)
+        out += b'%d 0 obj\n<< /Type /Pages /Kids [%s] /Count %d >>\nendobj\n' % (pages_number, kids, len(pages))
+        xref[catalog_number] = (len(out), 0)
+        out += b'%d 0 obj\n<< /Type /Catalog /Pages %d 0 R >>\nendobj\n' % (catalog_number, pages_number)
+
+        size = catalog_number + 1
+        xref_offset = len(out)
+        out += b'xref\n0 %d\n' % size
+        for number in range(size):
+            if number in xref:
+                offset, generation = xref[number]
+                out += b'%010d %05d n \n' % (offset, generation)
+            else:
+                out += b'0000000000 65535 f \n'
+        out += b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (size, catalog_number, xref_offset)
+
+        return bytes(out)
+
+    @staticmethod
+    def _bisect(values: List[int], value: int) -> int:
+        """Index of ``value`` in sorted ``values``"""
+        lo, hi = 0, len(values)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if values[mid] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+class _NeedMoreData(Exception):
+    """Internal signal that the xref buffer must be extended"""
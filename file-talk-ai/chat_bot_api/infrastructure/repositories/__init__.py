@@ -0,0 +1,9 @@
+"""Repositories"""
+from .document_repository import DocumentRecord, DocumentRepository
+from .session_repository import SessionRepository
+
+__all__ = [
+    'DocumentRecord',
+    'DocumentRepository',
+    'SessionRepository',
+]
@@ -0,0 +1,185 @@
+"""
+Document Repository
+Persists ingested documents in the Document model
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from django.db import DatabaseError
+from django.utils import timezone
+from chat_bot_api.core.utils.helpers import FileHelper
+from chat_bot_api.core.utils.logger import get_logger
+from chat_bot_api.domain.enums import ExtractionStatusEnum
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class DocumentRecord:
+    """Registry entry of an ingested document"""
+    id: int
+    url: str
+    url_hash: str
+    content_sha256: str
+    total_pages: Optional[int]
+    file_size_bytes: Optional[int]
+    extraction_status: str
+    updated_at: datetime
+    title: Optional[str] = None
+
+    def age_seconds(self) -> float:
+        """Seconds since the record was last confirmed against the origin"""
+        return (timezone.now() - self.updated_at).total_seconds()
+
+
+class DocumentRepository:
+    """
+    Registry of fetched documents
+
+    Every document is recorded on first fetch with its URL hash, content
+    SHA-256, page count and size, so later requests can answer those
+    questions without downloading or opening the PDF.
+
+    The registry is an optimization: database errors (e.g. migrations not
+    applied yet) are logged and reported as "unknown" instead of failing
+    the request.
+    """
+
+    def get_by_url(self, url: str) -> Optional[DocumentRecord]:
+        """
+        Look up a document by URL
+
+        Args:
+            url: Document URL
+
+        Returns:
+            DocumentRecord or None: Registry entry, if any
+        """
+        from chat_bot_api.models import Document
+
+        try:
+            document = Document.objects.filter(file_hash=FileHelper.get_url_hash(url)).order_by('-updated_at').first()
+        except DatabaseError as e:
+            logger.warning(f"Document registry lookup failed: {str(e)}")
+            return None
+
+        return self._to_record(document) if document else None
+
+    def get_by_id(self, document_id: int) -> Optional[DocumentRecord]:
+        """
+        Look up a document by primary key
+
+        Args:
+            document_id: Document id
+
+        Returns:
+            DocumentRecord or None: Registry entry, if any
+        """
+        from chat_bot_api.models import Document
+
+        try:
+            document = Document.objects.filter(pk=document_id).first()
+        except DatabaseError as e:
+            logger.warning(f"Document registry lookup failed: {str(e)}")
+            return None
+
+        return self._to_record(document) if document else None
+
+    def get_by_content_hashes(self, content_hashes: Iterable[str]) -> Dict[str, List[DocumentRecord]]:
+        """
+        Look up documents by content hash
+
+        Args:
+            content_hashes: SHA-256 content hashes
+
+        Returns:
+            dict: content hash -> entries with that content (several URLs may serve the same file)
+        """
+        from chat_bot_api.models import Document
+
+        content_hashes = set(content_hashes)
+        if not content_hashes:
+            return {}
+
+        try:
+            documents = list(Document.objects.filter(content_sha256__in=content_hashes).order_by('-updated_at'))
+        except DatabaseError as e:
+            logger.warning(f"Document registry lookup failed: {str(e)}")
+            return {}
+
+        records: Dict[str, List[DocumentRecord]] = {}
+        for document in documents:
+            records.setdefault(document.content_sha256, []).append(self._to_record(document))
+        return records
+
+    def register(
+        self,
+        url: str,
+        content_sha256: str,
+        total_pages: int,
+        file_size_bytes: Optional[int] = None
+    ) -> Optional[DocumentRecord]:
+        """
+        Record (or refresh) a fetched document
+
+        Args:
+            url: Document URL
+            content_sha256: SHA-256 of the content
+            total_pages: Number of pages
+            file_size_bytes: Size of the PDF (optional)
+
+        Returns:
+            DocumentRecord or None: Stored entry (None if the database is unavailable)
+        """
+        from chat_bot_api.models import Document
+
+        url_hash = FileHelper.get_url_hash(url)
+        try:
+            document = Document.objects.filter(file_hash=url_hash).order_by('-updated_at').first()
+            if document is None:
+                document = Document(url=url, file_hash=url_hash)
+
+            if document.content_sha256 != content_sha256:
+                # New content at this URL: earlier extraction results no longer apply
+                document.extraction_status = ExtractionStatusEnum.PENDING.value
+
+            document.content_sha256 = content_sha256
+            document.total_pages = total_pages
+            if file_size_bytes is not None:
+                document.file_size_bytes = file_size_bytes
+            document.save()
+        except DatabaseError as e:
+            logger.warning(f"Document registry update failed: {str(e)}")
+            return None
+
+        return self._to_record(document)
+
+    def set_extraction_status(self, url: str, status: ExtractionStatusEnum):
+        """
+        Update extraction status of a registered document
+
+        Args:
+            url: Document URL
+            status: New status
+        """
+        from chat_bot_api.models import Document
+
+        try:
+            Document.objects.filter(file_hash=FileHelper.get_url_hash(url)).update(extraction_status=status.value)
+        except DatabaseError as e:
+            logger.warning(f"Document registry update failed: {str(e)}")
+
+    @staticmethod
+    def _to_record(document) -> DocumentRecord:
+        """Convert a Document model instance to a DocumentRecord"""
+        return DocumentRecord(
+            id=document.pk,
+            url=document.url,
+            url_hash=document.file_hash,
+            content_sha256=document.content_sha256,
+            total_pages=document.total_pages,
+            file_size_bytes=document.file_size_bytes,
+            extraction_status=document.extraction_status,
+            updated_at=document.updated_at,
+            title=document.title
+        )
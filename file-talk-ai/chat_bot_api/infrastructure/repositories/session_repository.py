@@ -0,0 +1,55 @@
+"""
+Session Repository
+Persists chat sessions in the ChatSession model
+"""
+from django.db import DatabaseError
+from chat_bot_api.core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SessionRepository:
+    """
+    Records which document a chat session is about
+
+    Like the document registry this is best-effort: database errors are
+    logged instead of failing the request.
+    """
+
+    def bind(self, session_id: str, document_id: int) -> bool:
+        """
+        Create or update a session for a document, marking it active
+
+        Args:
+            session_id: Client-supplied session identifier
+            document_id: Registered document id
+
+        Returns:
+            bool: Whether the session was stored
+        """
+        from chat_bot_api.models import ChatSession
+
+        try:
+            ChatSession.objects.update_or_create(
+                session_id=session_id,
+                defaults={'document_id': document_id, 'is_active': True}
+            )
+        except DatabaseError as e:
+            logger.warning(f"Chat session update failed: {str(e)}")
+            return False
+
+        return True
+
+    def deactivate(self, session_id: str):
+        """
+        Mark a session inactive
+
+        Args:
+            session_id: Session identifier
+        """
+        from chat_bot_api.models import ChatSession
+
+        try:
+            ChatSession.objects.filter(session_id=session_id).update(is_active=False)
+        except DatabaseError as e:
+            logger.warning(f"Chat session update failed: {str(e)}")
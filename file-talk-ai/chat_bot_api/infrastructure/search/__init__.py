@@ -0,0 +1,35 @@
+"""Search Infrastructure"""
+from .chunker import TextChunk, TextChunker
+from .bm25 import BM25Index, get_index_cache, tokenize
+from .embedder import Embedder, HashingEmbedder, build_embedder
+from .vector_store import VectorIndex, VectorStore, get_vector_store
+from .fusion import reciprocal_rank_fusion
+from .minhash import MinHasher, deduplicate, shingles
+from .fulltext import FullTextHit, FullTextIndex, PageIndexWriter, get_fulltext_index
+from .answer_cache import AnswerCache, AnswerHit, get_answer_cache, normalize_question
+
+__all__ = [
+    'TextChunk',
+    'TextChunker',
+    'BM25Index',
+    'get_index_cache',
+    'tokenize',
+    'Embedder',
+    'HashingEmbedder',
+    'build_embedder',
+    'VectorIndex',
+    'VectorStore',
+    'get_vector_store',
+    'reciprocal_rank_fusion',
+    'MinHasher',
+    'deduplicate',
+    'shingles',
+    'FullTextHit',
+    'FullTextIndex',
+    'PageIndexWriter',
+    'get_fulltext_index',
+    'AnswerCache',
+    'AnswerHit',
+    'get_answer_cache',
+    'normalize_question',
+]
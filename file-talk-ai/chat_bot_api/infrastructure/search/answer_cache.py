@@ -0,0 +1,324 @@
+"""
+Answer Cache
+Reuses answers to repeated and reworded questions about the same document
+"""
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+import numpy as np
+from config.env_config import config
+from config.constants import CacheKey
+from chat_bot_api.infrastructure.cache import CacheBackend, get_result_cache
+from .bm25 import STOPWORDS
+from .embedder import Embedder, build_embedder
+from .minhash import stem
+
+_TERMS = re.compile(r'[^\W_]+')
+
+# Stopwords that change what a question asks; they are kept in the
+# normalized form, so a reworded question only hits if they match too
+GUARD_TERMS = frozenset(
+    "no nor not how why when where who whom which before after above below more most few only same other against"
+    .split()
+)
+
+# Question vectors are short; a small space keeps the index compact
+ANSWER_EMBEDDING_DIM = 256
+
+
+def normalize_question(question: str) -> str:
+    """
+    Reduce a question to its meaningful terms
+
+    Case, punctuation, plural "s", filler words and stray letters (the "s"
+    of "what's") are dropped, so "What is the main idea?" and "main ideas"
+    normalize alike, while negations and interrogatives other than "what"
+    are kept.
+
+    Args:
+        question: Question as asked
+
+    Returns:
+        str: Space-separated terms (empty if nothing meaningful is left)
+    """
+    return " ".join(
+        stem(term) for term in _TERMS.findall(question.lower())
+        if (term not in STOPWORDS or term in GUARD_TERMS) and (len(term) > 1 or term.isdigit())
+    )
+
+
+@dataclass
+class AnswerHit:
+    """Cached answer returned for a question"""
+    answer: str
+    question: str  # Question the answer was stored for
+    similarity: float
+    exact: bool
+
+
+class _DocumentAnswers:
+    """Answers of one document generation, with their question vectors"""
+
+    def __init__(self, dim: int):
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.terms: Dict[str, FrozenSet[str]] = {}
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.keys: List[str] = []
+
+    def add(self, normalized: str, entry: Dict[str, Any], vector: np.ndarray, max_entries: int):
+        if normalized in self.entries:
+            self.entries[normalized] = entry
+            self.entries.move_to_end(normalized)
+            return
+
+        self.entries[normalized] = entry
+        self.terms[normalized] = frozenset(normalized.split())
+        self.keys.append(normalized)
+        self.vectors = np.vstack([self.vectors, vector[None, :]])
+
+        while len(self.entries) > max_entries:
+            oldest, _ = self.entries.popitem(last=False)
+            self.remove_vector(oldest)
+
+    def remove(self, normalized: str):
+        if self.entries.pop(normalized, None) is not None:
+            self.remove_vector(normalized)
+
+    def remove_vector(self, normalized: str):
+        index = self.keys.index(normalized)
+        del self.keys[index]
+        self.terms.pop(normalized, None)
+        self.vectors = np.delete(self.vectors, index, axis=0)
+
+
+class AnswerCache:
+    """
+    Answer cache keyed by document content hash and normalized question
+
+    Exact matches of the normalized question are looked up in the shared
+    result cache, so they are reused across processes. Reworded questions
+    are matched in a per-process similarity index: the question vectors of
+    a document's recent answers are compared with the new question, and
+    the best answer above ``threshold`` cosine similarity is reused only if
+    both questions have the same set of normalized terms. Similar vectors
+    alone are not enough: long questions differing in one entity or number
+    ("section 3" / "section 4") score high but ask something else, and a
+    wrong answer is worse than a miss. Reworded hits are therefore
+    differences in word order, plurals, case, punctuation and filler words.
+
+    ``variant`` identifies everything besides the document that shapes an
+    answer (model, prompt, retrieval settings). Invalidating a document
+    bumps its generation number, which is part of every key, so answers
+    stored by other processes stop matching too.
+    """
+
+    def __init__(
+        self,
+        store: CacheBackend,
+        embedder: Embedder,
+        threshold: float = 0.85,
+        ttl: int = 86400,
+        max_entries: int = 256,
+        max_documents: int = 128
+    ):
+        """
+        Initialize answer cache
+
+        Args:
+            store: Shared cache for exact matches and generation numbers
+            embedder: Question embedder of the similarity index
+            threshold: Minimum cosine similarity of a reworded question
+            ttl: Seconds an answer is reused
+            max_entries: Answers kept per document in the similarity index
+            max_documents: Documents kept in the similarity index
+        """
+        self.store = store
+        self.embedder = embedder
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_documents = max_documents
+        self._documents: "OrderedDict[Tuple[str, str, int], _DocumentAnswers]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._exact_hits = 0
+        self._similar_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._invalidations = 0
+
+    def get(self, content_hash: str, variant: str, question: str) -> Optional[AnswerHit]:
+        """
+        Find a cached answer to the question
+
+        Args:
+            content_hash: Content hash of the document
+            variant: Model / prompt / retrieval settings of the answer
+            question: Question as asked
+
+        Returns:
+            AnswerHit or None: Reusable answer, if any
+        """
+        normalized = normalize_question(question)
+        if not normalized:
+            self._count('_misses')
+            return None
+
+        generation = self._generation(content_hash)
+        document_key = (content_hash, variant, generation)
+        now = time.time()
+
+        with self._lock:
+            answers = self._documents.get(document_key)
+            entry = answers.entries.get(normalized) if answers else None
+            if entry is not None and entry['expires_at'] <= now:
+                answers.remove(normalized)
+                entry = None
+
+        if entry is None:
+            entry = self.store.get(self._answer_key(content_hash, variant, generation, normalized))
+            if entry is not None and entry['expires_at'] > now:
+                self._remember(document_key, normalized, entry)
+            else:
+                entry = None
+
+        if entry is not None:
+            self._count('_exact_hits')
+            return AnswerHit(entry['answer'], entry['question'], 1.0, exact=True)
+
+        hit = self._find_similar(document_key, normalized, now)
+        self._count('_similar_hits' if hit else '_misses')
+        return hit
+
+    def put(self, content_hash: str, variant: str, question: str, answer: str):
+        """
+        Store the answer to a question
+
+        Args:
+            content_hash: Content hash of the document
+            variant: Model / prompt / retrieval settings of the answer
+            question: Question as asked
+            answer: Answer to reuse
+        """
+        normalized = normalize_question(question)
+        if not normalized:
+            return
+
+        generation = self._generation(content_hash)
+        entry = {'question': question, 'answer': answer, 'expires_at': time.time() + self.ttl}
+        self.store.set(self._answer_key(content_hash, variant, generation, normalized), entry, ttl=self.ttl)
+        self._remember((content_hash, variant, generation), normalized, entry)
+        self._count('_stores')
+
+    def invalidate(self, content_hash: str):
+        """
+        Stop reusing any answer about a document, in every process
+
+        Args:
+            content_hash: Content hash of the document
+        """
+        generation_key = CacheKey.answer_generation_key(content_hash)
+        # Outlives every answer stored under the previous generation
+        self.store.set(generation_key, self._generation(content_hash) + 1, ttl=2 * self.ttl)
+
+        with self._lock:
+            for document_key in [key for key in self._documents if key[0] == content_hash]:
+                del self._documents[document_key]
+            self._invalidations += 1
+
+    def _find_similar(self, document_key: Tuple[str, str, int], normalized: str, now: float) -> Optional[AnswerHit]:
+        with self._lock:
+            answers = self._documents.get(document_key)
+            if answers is None or not answers.keys:
+                return None
+            vectors, keys = answers.vectors, list(answers.keys)
+
+        query = self.embedder.embed([normalized])[0]
+        similarities = vectors @ query
+        terms = frozenset(normalized.split())
+
+        for index in np.argsort(-similarities):
+            similarity = float(similarities[index])
+            if similarity < self.threshold:
+                break
+            with self._lock:
+                entry = answers.entries.get(keys[index])
+                if entry is None or entry['expires_at'] <= now or answers.terms.get(keys[index]) != terms:
+                    continue
+                self._documents.move_to_end(document_key)
+            return AnswerHit(entry['answer'], entry['question'], similarity, exact=False)
+
+        return None
+
+    def _remember(self, document_key: Tuple[str, str, int], normalized: str, entry: Dict[str, Any]):
+        """Add an answer to the similarity index"""
+        vector = self.embedder.embed([normalized])[0]
+        with self._lock:
+            answers = self._documents.get(document_key)
+            if answers is None:
+                answers = self._documents[document_key] = _DocumentAnswers(self.embedder.dim)
+                while len(self._documents) > self.max_documents:
+                    self._documents.popitem(last=False)
+            self._documents.move_to_end(document_key)
+            answers.add(normalized, entry, vector, self.max_entries)
+
+    def _generation(self, content_hash: str) -> int:
+        return self.store.get(CacheKey.answer_generation_key(content_hash)) or 0
+
+    @staticmethod
+    def _answer_key(content_hash: str, variant: str, generation: int, normalized: str) -> str:
+        question_hash = hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:32]
+        return CacheKey.answer_key(content_hash, variant, generation, question_hash)
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit counters and index size"""
+        with self._lock:
+            lookups = self._exact_hits + self._similar_hits + self._misses
+            return {
+                'exact_hits': self._exact_hits,
+                'similar_hits': self._similar_hits,
+                'misses': self._misses,
+                'hit_rate': round((self._exact_hits + self._similar_hits) / lookups, 4) if lookups else 0.0,
+                'stores': self._stores,
+                'invalidations': self._invalidations,
+                'documents': len(self._documents),
+                'entries': sum(len(answers.entries) for answers in self._documents.values()),
+            }
+
+
+_answer_cache: Optional[AnswerCache] = None
+_answer_cache_lock = threading.Lock()
+
+
+def get_answer_cache() -> Optional[AnswerCache]:
+    """
+    Get process-wide answer cache
+
+    Returns:
+        AnswerCache or None: Shared cache, or None when disabled
+    """
+    global _answer_cache
+
+    if not config.ANSWER_CACHE_ENABLED:
+        return None
+
+    if _answer_cache is None:
+        with _answer_cache_lock:
+            if _answer_cache is None:
+                _answer_cache = AnswerCache(
+                    get_result_cache(),
+                    build_embedder(config.QA_EMBEDDER, ANSWER_EMBEDDING_DIM),
+                    threshold=config.ANSWER_CACHE_SIMILARITY_THRESHOLD,
+                    ttl=config.ANSWER_CACHE_TTL,
+                    max_entries=config.ANSWER_CACHE_MAX_ENTRIES,
+                    max_documents=config.ANSWER_CACHE_MAX_DOCUMENTS
+                )
+
+    return _answer_cache
@@ -0,0 +1,164 @@
+"""
+BM25 Index
+Okapi BM25 ranking of document chunks over array-backed postings
+"""
+import heapq
+import math
+import re
+import sys
+import threading
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+from config.env_config import config
+from chat_bot_api.infrastructure.cache import MemoryLRUCache
+from .chunker import TextChunk
+
+_TERMS = re.compile(r'[^\W_]+')
+
+STOPWORDS = frozenset(
+    "a about above after again against all am an and any are as at be because been before being below "
+    "between both but by can could did do does doing down during each few for from further had has have "
+    "having he her here hers herself him himself his how i if in into is it its itself just me more most "
+    "my myself no nor not of off on once only or other our ours ourselves out over own same she should so "
+    "some such than that the their theirs them themselves then there these they this those through to too "
+    "under until up very was we were what when where which while who whom why will with would you your "
+    "yours yourself yourselves".split()
+)
+
+# Term frequencies are stored as unsigned shorts
+_MAX_TERM_FREQ = 0xFFFF
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase index terms, dropping stopwords
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        list: Terms in order
+    """
+    return [term for term in _TERMS.findall(text.lower()) if term not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Inverted index over the chunks of one document, scored with Okapi BM25
+
+    Postings are stored CSR-style in flat arrays: the postings of term id
+    ``t`` are ``doc_ids[offsets[t]:offsets[t + 1]]`` with the matching term
+    frequencies in ``term_freqs``. That is 6 bytes per posting instead of
+    a tuple of Python ints, and the arrays pickle as raw bytes, so cached
+    indexes load without rebuilding any per-posting objects.
+    """
+
+    def __init__(self, chunks: Iterable[TextChunk], k1: float = 1.2, b: float = 0.75):
+        """
+        Build index
+
+        Args:
+            chunks: Chunks of the document in order
+            k1: Term frequency saturation
+            b: Length normalization strength
+        """
+        self.chunks: List[TextChunk] = list(chunks)
+        self.k1 = k1
+        self.b = b
+        self.terms: Dict[str, int] = {}
+        self.doc_lengths = array('I')
+
+        term_docs: List[array] = []
+        term_freqs: List[array] = []
+
+        for doc_id, chunk in enumerate(self.chunks):
+            counts = Counter(tokenize(chunk.text))
+            self.doc_lengths.append(sum(counts.values()))
+
+            for term, freq in counts.items():
+                term_id = self.terms.setdefault(term, len(self.terms))
+                if term_id == len(term_docs):
+                    term_docs.append(array('I'))
+                    term_freqs.append(array('H'))
+                term_docs[term_id].append(doc_id)
+                term_freqs[term_id].append(min(freq, _MAX_TERM_FREQ))
+
+        self.offsets = array('I', [0])
+        self.doc_ids = array('I')
+        self.term_freqs = array('H')
+        for docs, freqs in zip(term_docs, term_freqs):
+            self.doc_ids.extend(docs)
+            self.term_freqs.extend(freqs)
+            self.offsets.append(len(self.doc_ids))
+
+        self.avg_length = sum(self.doc_lengths) / len(self.doc_lengths) if self.doc_lengths else 0.0
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint, used by the memory cache"""
+        arrays = (self.doc_lengths, self.offsets, self.doc_ids, self.term_freqs)
+        return (
+            sum(a.itemsize * len(a) for a in arrays)
+            + sum(sys.getsizeof(term) for term in self.terms) + sys.getsizeof(self.terms)
+            + sum(sys.getsizeof(chunk.text) for chunk in self.chunks)
+        )
+
+    def search(self, query: str, top_k: int) -> List[Tuple[TextChunk, float]]:
+        """
+        Rank chunks against a query
+
+        Args:
+            query: Free-text query
+            top_k: Maximum chunks to return
+
+        Returns:
+            list: (chunk, score) pairs, best first; only chunks sharing a term with the query
+        """
+        total = len(self.chunks)
+        scores: Dict[int, float] = {}
+        doc_ids = memoryview(self.doc_ids)
+        term_freqs = memoryview(self.term_freqs)
+
+        for term in set(tokenize(query)):
+            term_id = self.terms.get(term)
+            if term_id is None:
+                continue
+
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            doc_freq = end - start
+            idf = math.log(1 + (total - doc_freq + 0.5) / (doc_freq + 0.5))
+
+            for doc_id, freq in zip(doc_ids[start:end], term_freqs[start:end]):
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / self.avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * freq * (self.k1 + 1) / (freq + norm)
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(self.chunks[doc_id], score) for doc_id, score in best]
+
+
+_index_cache: Optional[MemoryLRUCache] = None
+_index_cache_lock = threading.Lock()
+
+
+def get_index_cache() -> MemoryLRUCache:
+    """
+    Get process-wide cache of built search indexes
+
+    Kept separate from the text cache so indexes stay in memory even when
+    CACHE_ENABLED is off.
+
+    Returns:
+        MemoryLRUCache: Shared index cache
+    """
+    global _index_cache
+
+    if _index_cache is None:
+        with _index_cache_lock:
+            if _index_cache is None:
+                _index_cache = MemoryLRUCache(config.QA_INDEX_CACHE_MAX_BYTES, default_ttl=config.CACHE_TTL)
+
+    return _index_cache
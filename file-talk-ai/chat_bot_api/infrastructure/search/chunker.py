@@ -0,0 +1,149 @@
+"""
+Text Chunker
+Splits document pages into overlapping chunks for retrieval
+"""
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple
+from chat_bot_api.domain.models import PageRecord
+from chat_bot_api.infrastructure.text import TokenEstimator
+
+# Chunks are built from sentences (or paragraphs when there is no punctuation)
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+|\n\s*\n')
+
+
+@dataclass
+class TextChunk:
+    """
+    Contiguous span of document text
+
+    Attributes:
+        index: Position of the chunk in the document
+        text: Chunk text with whitespace collapsed
+        page_start: Page the chunk starts on
+        page_end: Page the chunk ends on
+        tokens: Estimated token count of the text
+    """
+    index: int
+    text: str
+    page_start: int
+    page_end: int
+    tokens: int
+
+    @property
+    def marker(self) -> str:
+        """Separator used when chunks are joined into prompt text"""
+        if self.page_start == self.page_end:
+            return f"\n\n--- Page {self.page_start} ---\n"
+        return f"\n\n--- Pages {self.page_start}-{self.page_end} ---\n"
+
+
+class TextChunker:
+    """
+    Sliding-window chunker over sentences
+
+    Sentences are packed into chunks of up to ``chunk_tokens``; each chunk
+    repeats the trailing sentences of the previous one (up to
+    ``overlap_tokens``) so a passage cut at a chunk boundary is still found
+    whole in one of them. Chunks may span page breaks. Sentences longer
+    than a chunk are split on word boundaries.
+    """
+
+    def __init__(
+        self,
+        chunk_tokens: int = 300,
+        overlap_tokens: int = 60,
+        estimator: Optional[TokenEstimator] = None
+    ):
+        """
+        Initialize chunker
+
+        Args:
+            chunk_tokens: Maximum tokens per chunk
+            overlap_tokens: Tokens repeated from the end of the previous chunk
+            estimator: Token estimator (default TokenEstimator())
+
+        Raises:
+            ValueError: If the overlap does not leave room for new text
+        """
+        if overlap_tokens < 0 or overlap_tokens >= chunk_tokens:
+            raise ValueError("overlap_tokens must be at least 0 and less than chunk_tokens")
+
+        self.chunk_tokens = chunk_tokens
+        self.overlap_tokens = overlap_tokens
+        self.estimator = estimator or TokenEstimator()
+
+    def chunk(self, pages: Iterable[PageRecord]) -> List[TextChunk]:
+        """
+        Split pages into overlapping chunks
+
+        Args:
+            pages: Page records in document order
+
+        Returns:
+            list: Chunks in document order
+        """
+        chunks: List[TextChunk] = []
+        window: List[Tuple[int, str, int]] = []  # (page, sentence, tokens)
+        window_tokens = 0
+
+        for unit in self._units(pages):
+            if window and window_tokens + unit[2] > self.chunk_tokens:
+                chunks.append(self._make_chunk(len(chunks), window))
+                window = self._overlap(window)
+                window_tokens = sum(tokens for _, _, tokens in window)
+
+                # Never emit a chunk made only of already emitted overlap
+                while window and window_tokens + unit[2] > self.chunk_tokens:
+                    window_tokens -= window.pop(0)[2]
+
+            window.append(unit)
+            window_tokens += unit[2]
+
+        if window:
+            chunks.append(self._make_chunk(len(chunks), window))
+
+        return chunks
+
+    def _units(self, pages: Iterable[PageRecord]) -> Iterator[Tuple[int, str, int]]:
+        """Yield (page, sentence, tokens), splitting sentences too long for a chunk"""
+        max_unit_tokens = self.chunk_tokens - self.overlap_tokens
+
+        for page in pages:
+            for sentence in _SENTENCE_SPLIT.split(page.text):
+                words = sentence.split()
+                if not words:
+                    continue
+
+                text = " ".join(words)
+                tokens = self.estimator.estimate(text)
+                if tokens <= max_unit_tokens:
+                    yield page.number, text, tokens
+                    continue
+
+                step = max(1, len(words) * max_unit_tokens // tokens)
+                for start in range(0, len(words), step):
+                    part = " ".join(words[start:start + step])
+                    yield page.number, part, self.estimator.estimate(part)
+
+    def _overlap(self, window: List[Tuple[int, str, int]]) -> List[Tuple[int, str, int]]:
+        """Trailing sentences of a window that fit the overlap"""
+        overlap: List[Tuple[int, str, int]] = []
+        tokens = 0
+        for unit in reversed(window):
+            tokens += unit[2]
+            if tokens > self.overlap_tokens:
+                break
+            overlap.append(unit)
+        overlap.reverse()
+        return overlap
+
+    @staticmethod
+    def _make_chunk(index: int, window: List[Tuple[int, str, int]]) -> TextChunk:
+        return TextChunk(
+            index=index,
+            text=" ".join(text for _, text, _ in window),
+            page_start=window[0][0],
+            page_end=window[-1][0],
+            tokens=sum(tokens for _, _, tokens in window)
+        )
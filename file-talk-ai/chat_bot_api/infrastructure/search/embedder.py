@@ -0,0 +1,136 @@
+"""
+Text Embedders
+Turn text into L2-normalized dense vectors for semantic retrieval
+"""
+import math
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import List, Sequence
+import numpy as np
+from .bm25 import tokenize
+
+
+class Embedder(ABC):
+    """
+    Base class for embedders
+
+    Implementations return one float32 row per text, L2-normalized so
+    that a dot product is the cosine similarity. ``signature`` identifies
+    the vector space; vectors stored under one signature are never
+    compared with queries embedded under another.
+    """
+
+    name: str = 'base'
+
+    def __init__(self, dim: int):
+        """
+        Initialize embedder
+
+        Args:
+            dim: Vector dimension
+        """
+        self.dim = dim
+
+    @property
+    def signature(self) -> str:
+        """Name and parameters that determine the vector space"""
+        return f"{self.name}-{self.dim}"
+
+    @abstractmethod
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            np.ndarray: float32 matrix of shape (len(texts), dim), rows L2-normalized
+        """
+
+    @staticmethod
+    def normalize(vectors: np.ndarray) -> np.ndarray:
+        """L2-normalize rows in place, leaving all-zero rows as they are"""
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+class HashingEmbedder(Embedder):
+    """
+    Local feature-hashing embedder
+
+    Words (stopwords removed) and adjacent word pairs are hashed into
+    ``dim`` buckets with CRC32, which is stable across processes unlike
+    ``hash()``. A second hash bit picks the sign so collisions cancel out
+    on average, and term counts are damped with 1 + log(tf). Needs no
+    model download or network access; it captures vocabulary overlap and
+    short phrases, not synonyms.
+    """
+
+    name = 'hashing'
+
+    def __init__(self, dim: int = 1024, bigrams: bool = True):
+        """
+        Initialize embedder
+
+        Args:
+            dim: Number of hash buckets
+            bigrams: Also hash adjacent word pairs
+        """
+        super().__init__(dim)
+        self.bigrams = bigrams
+
+    @property
+    def signature(self) -> str:
+        return f"{super().signature}{'-bi' if self.bigrams else ''}"
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        rows: List[int] = []
+        columns: List[int] = []
+        weights: List[float] = []
+
+        for row, text in enumerate(texts):
+            for feature, count in self._features(text).items():
+                digest = zlib.crc32(feature.encode('utf-8'))
+                rows.append(row)
+                columns.append(digest % self.dim)
+                weights.append((1.0 + math.log(count)) * (1.0 if digest & 0x80000000 else -1.0))
+
+        # Colliding features of one text add up
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        np.add.at(vectors, (rows, columns), weights)
+        return self.normalize(vectors)
+
+    def _features(self, text: str) -> Counter:
+        terms = tokenize(text)
+        features = Counter(terms)
+        if self.bigrams:
+            features.update(f"{a} {b}" for a, b in zip(terms, terms[1:]))
+        return features
+
+
+EMBEDDERS = {
+    HashingEmbedder.name: HashingEmbedder,
+}
+
+
+def build_embedder(name: str, dim: int) -> Embedder:
+    """
+    Build an embedder by name
+
+    Args:
+        name: Registered embedder name
+        dim: Vector dimension
+
+    Returns:
+        Embedder: New embedder
+
+    Raises:
+        ValueError: If the embedder is unknown
+    """
+    try:
+        return EMBEDDERS[name](dim=dim)
+    except KeyError:
+        raise ValueError(f"Unknown embedder: {name}. Available: {', '.join(EMBEDDERS)}")
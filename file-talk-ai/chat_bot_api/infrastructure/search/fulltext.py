@@ -0,0 +1,315 @@
+"""
+Full-Text Index
+Corpus-wide page search in a SQLite FTS5 database
+"""
+import html
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from config.env_config import config
+from chat_bot_api.core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# rowid = source id << PAGE_BITS | page number, so a document's pages form one rowid range
+PAGE_BITS = 20
+MAX_PAGE_NUMBER = (1 << PAGE_BITS) - 1
+
+_QUERY_TERMS = re.compile(r'[^\W_]+')
+
+# Match delimiters of raw snippets (control characters absent from extracted text);
+# they become <mark> tags once the text around them is HTML-escaped
+_MATCH_START = '\x02'
+_MATCH_END = '\x03'
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS sources (
+        id INTEGER PRIMARY KEY,
+        content_sha256 TEXT NOT NULL UNIQUE,
+        pages_indexed INTEGER NOT NULL DEFAULT 0,
+        updated_at REAL NOT NULL
+    )
+    """,
+    "CREATE VIRTUAL TABLE IF NOT EXISTS pages USING fts5(body, tokenize = 'unicode61 remove_diacritics 2')",
+)
+
+
+@dataclass
+class FullTextHit:
+    """One matching page"""
+    content_sha256: str
+    page_number: int
+    score: float  # Higher is better
+    snippet: str  # HTML-escaped page text with matches wrapped in <mark>
+
+
+class FullTextIndex:
+    """
+    Page-level full-text index shared by all documents
+
+    Pages are stored in an FTS5 table keyed by an integer rowid that packs
+    the document's source id and the page number, so finding which pages
+    of a document are already indexed is a rowid range scan. Documents are
+    identified by content hash; mapping hits to Document rows is up to the
+    caller.
+
+    Writes go through ``PageIndexWriter`` in bulk ``executemany`` batches,
+    one transaction per batch. Each thread gets its own connection; the
+    database runs in WAL mode so searches do not block ingestion.
+    """
+
+    def __init__(self, db_path: str, batch_pages: int = 500, busy_timeout: float = 5.0):
+        """
+        Initialize index, creating the database if needed
+
+        Args:
+            db_path: SQLite database file (kept apart from the Django database)
+            batch_pages: Pages inserted per transaction
+            busy_timeout: Seconds to wait for another writer
+
+        Raises:
+            sqlite3.OperationalError: If SQLite was built without FTS5
+        """
+        self.db_path = db_path
+        self.batch_pages = batch_pages
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        connection = self._connection()
+        with connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=self.busy_timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def writer(self, content_sha256: str) -> 'PageIndexWriter':
+        """
+        Start writing the pages of a document
+
+        Args:
+            content_sha256: Content hash of the document
+
+        Returns:
+            PageIndexWriter: Buffered writer; close it to flush
+        """
+        return PageIndexWriter(self, content_sha256)
+
+    def _source_id(self, connection: sqlite3.Connection, content_sha256: str) -> int:
+        connection.execute(
+            "INSERT OR IGNORE INTO sources (content_sha256, updated_at) VALUES (?, ?)",
+            (content_sha256, time.time())
+        )
+        return connection.execute(
+            "SELECT id FROM sources WHERE content_sha256 = ?", (content_sha256,)
+        ).fetchone()[0]
+
+    def add_pages(self, content_sha256: str, pages: List[Tuple[int, str]]) -> int:
+        """
+        Insert pages that are not indexed yet, in one transaction
+
+        Args:
+            content_sha256: Content hash of the document
+            pages: (page_number, text) pairs
+
+        Returns:
+            int: Pages inserted
+        """
+        pages = [
+            (number, text) for number, text in dict(pages).items()
+            if 0 < number <= MAX_PAGE_NUMBER and text.strip()
+        ]
+        if not pages:
+            return 0
+
+        connection = self._connection()
+        with connection:
+            source_id = self._source_id(connection, content_sha256)
+            base = source_id << PAGE_BITS
+            numbers = [number for number, _ in pages]
+
+            existing = {
+                rowid - base for (rowid,) in connection.execute(
+                    "SELECT rowid FROM pages WHERE rowid BETWEEN ? AND ?",
+                    (base + min(numbers), base + max(numbers))
+                )
+            }
+            rows = [(base + number, text) for number, text in pages if number not in existing]
+
+            connection.executemany("INSERT INTO pages (rowid, body) VALUES (?, ?)", rows)
+            connection.execute(
+                "UPDATE sources SET pages_indexed = pages_indexed + ?, updated_at = ? WHERE id = ?",
+                (len(rows), time.time(), source_id)
+            )
+        return len(rows)
+
+    def remove(self, content_sha256: str):
+        """Remove all pages of a document"""
+        connection = self._connection()
+        with connection:
+            row = connection.execute("SELECT id FROM sources WHERE content_sha256 = ?", (content_sha256,)).fetchone()
+            if row is None:
+                return
+            base = row[0] << PAGE_BITS
+            connection.execute("DELETE FROM pages WHERE rowid BETWEEN ? AND ?", (base, base + MAX_PAGE_NUMBER))
+            connection.execute("DELETE FROM sources WHERE id = ?", (row[0],))
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        content_hashes: Optional[Iterable[str]] = None,
+        snippet_tokens: int = 24
+    ) -> List[FullTextHit]:
+        """
+        Rank pages matching all terms of a free-text query
+
+        Args:
+            query: Free-text query; FTS5 operators are not interpreted
+            limit: Maximum hits
+            offset: Hits to skip
+            content_hashes: Only search these documents (optional)
+            snippet_tokens: Approximate snippet length in tokens
+
+        Returns:
+            list: Hits, best first
+        """
+        match = self.build_match_expression(query)
+        if not match:
+            return []
+
+        sql = (
+            "SELECT sources.content_sha256, pages.rowid & ?, bm25(pages), "
+            "snippet(pages, 0, ?, ?, '…', ?) "
+            "FROM pages JOIN sources ON sources.id = (pages.rowid >> ?) "
+            "WHERE pages MATCH ?"
+        )
+        params: list = [MAX_PAGE_NUMBER, _MATCH_START, _MATCH_END, snippet_tokens, PAGE_BITS, match]
+
+        if content_hashes is not None:
+            content_hashes = list(content_hashes)
+            if not content_hashes:
+                return []
+            sql += f" AND sources.content_sha256 IN ({','.join('?' * len(content_hashes))})"
+            params.extend(content_hashes)
+
+        sql += " ORDER BY bm25(pages) LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        # bm25() is lower-is-better; flip it so scores read naturally
+        return [
+            FullTextHit(content_sha256, page_number, -rank, self.highlight(snippet))
+            for content_sha256, page_number, rank, snippet in self._connection().execute(sql, params)
+        ]
+
+    @staticmethod
+    def highlight(snippet: str) -> str:
+        """
+        Render a raw snippet as HTML
+
+        Page text comes from arbitrary PDFs, so it is escaped before the
+        match delimiters are turned into <mark> tags.
+        """
+        return html.escape(snippet).replace(_MATCH_START, '<mark>').replace(_MATCH_END, '</mark>')
+
+    @staticmethod
+    def build_match_expression(query: str) -> str:
+        """
+        Turn free text into an FTS5 query that requires every term
+
+        Each term is quoted, so user input can never be parsed as FTS5
+        syntax (column filters, NEAR, unbalanced quotes).
+        """
+        return " ".join(f'"{term}"' for term in _QUERY_TERMS.findall(query))
+
+    def stats(self) -> Dict[str, int]:
+        """Get document and page counts"""
+        documents, pages = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(pages_indexed), 0) FROM sources"
+        ).fetchone()
+        return {'documents': documents, 'pages': pages}
+
+
+class PageIndexWriter:
+    """
+    Buffers the pages of one document and writes them in batches
+
+    Extraction hands pages over one at a time; they are inserted every
+    ``batch_pages`` pages and on close. Indexing is best-effort: a failed
+    batch is logged and dropped so it never fails the extraction feeding it.
+    """
+
+    def __init__(self, index: FullTextIndex, content_sha256: str):
+        self.index = index
+        self.content_sha256 = content_sha256
+        self.pages_written = 0
+        self._buffer: List[Tuple[int, str]] = []
+
+    def add(self, page_number: int, text: str):
+        """Queue a page, flushing when the batch is full"""
+        self._buffer.append((page_number, text))
+        if len(self._buffer) >= self.index.batch_pages:
+            self.flush()
+
+    def flush(self):
+        """Write queued pages"""
+        if not self._buffer:
+            return
+
+        pages, self._buffer = self._buffer, []
+        try:
+            self.pages_written += self.index.add_pages(self.content_sha256, pages)
+        except sqlite3.Error as e:
+            logger.warning(f"Full-text indexing failed for {self.content_sha256[:12]}: {str(e)}")
+
+    def close(self):
+        """Flush remaining pages"""
+        self.flush()
+
+
+_fulltext_index: Optional[FullTextIndex] = None
+_fulltext_index_failed = False
+_fulltext_index_lock = threading.Lock()
+
+
+def get_fulltext_index() -> Optional[FullTextIndex]:
+    """
+    Get process-wide full-text index
+
+    Returns:
+        FullTextIndex or None: Shared index, or None when disabled or when
+        SQLite lacks FTS5
+    """
+    global _fulltext_index, _fulltext_index_failed
+
+    if not config.FULLTEXT_INDEX_ENABLED or _fulltext_index_failed:
+        return None
+
+    if _fulltext_index is None:
+        with _fulltext_index_lock:
+            if _fulltext_index is None and not _fulltext_index_failed:
+                try:
+                    _fulltext_index = FullTextIndex(
+                        config.FULLTEXT_INDEX_PATH,
+                        batch_pages=config.FULLTEXT_INDEX_BATCH_PAGES
+                    )
+                except sqlite3.Error as e:
+                    logger.warning(f"Full-text index unavailable: {str(e)}")
+                    _fulltext_index_failed = True
+
+    return _fulltext_index
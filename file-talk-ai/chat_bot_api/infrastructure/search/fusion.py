@@ -0,0 +1,32 @@
+"""
+Rank Fusion
+Combines chunk rankings from several retrievers
+"""
+from typing import Dict, List, Sequence
+from .chunker import TextChunk
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[TextChunk]], k: int = 60) -> List[TextChunk]:
+    """
+    Merge rankings with reciprocal rank fusion
+
+    Each chunk scores sum(1 / (k + rank)) over the rankings it appears in,
+    so scores from retrievers with incomparable scales (BM25, cosine) never
+    have to be normalized against each other.
+
+    Args:
+        rankings: Chunk lists, best first
+        k: Damping constant; larger values flatten the rank weights
+
+    Returns:
+        list: Chunks by fused score, best first
+    """
+    scores: Dict[int, float] = {}
+    chunks: Dict[int, TextChunk] = {}
+
+    for ranking in rankings:
+        for rank, chunk in enumerate(ranking, start=1):
+            scores[chunk.index] = scores.get(chunk.index, 0.0) + 1.0 / (k + rank)
+            chunks.setdefault(chunk.index, chunk)
+
+    return [chunks[index] for index in sorted(scores, key=lambda index: (-scores[index], index))]
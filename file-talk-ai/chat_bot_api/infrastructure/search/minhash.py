@@ -0,0 +1,121 @@
+"""
+MinHash
+Near-duplicate detection of short texts from shingle signatures
+"""
+import zlib
+from typing import List, Optional, Sequence, Set
+import numpy as np
+from .bm25 import tokenize
+
+# Mersenne prime for the universal hash family (a * h + b) mod p; with
+# h, a and b below p the product fits in 64 bits
+_PRIME = np.uint64((1 << 31) - 1)
+
+
+def stem(term: str) -> str:
+    """Strip a plural "s" from a term (ideas -> idea, but not class -> clas)"""
+    return term[:-1] if len(term) > 3 and term.endswith('s') and not term.endswith('ss') else term
+
+
+def shingles(text: str) -> Set[str]:
+    """
+    Get the word unigrams and bigrams of a text
+
+    Stopwords are dropped and a plural "s" is stripped, so rewordings such
+    as "What are the main ideas?" and "main idea?" share their shingles.
+
+    Args:
+        text: Text to shingle
+
+    Returns:
+        set: Shingles
+    """
+    terms = [stem(term) for term in tokenize(text)]
+    result = set(terms)
+    result.update(f"{first} {second}" for first, second in zip(terms, terms[1:]))
+    return result
+
+
+class MinHasher:
+    """
+    MinHash signatures estimating Jaccard similarity of shingle sets
+
+    Each of ``num_perm`` hash functions keeps the minimum hash over a set's
+    shingles; the fraction of equal minima of two signatures estimates the
+    Jaccard similarity of the sets. Signatures are computed for all
+    shingles at once as a (shingles x num_perm) array.
+    """
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        """
+        Initialize hash family
+
+        Args:
+            num_perm: Hash functions per signature (accuracy ~ 1/sqrt(num_perm))
+            seed: Seed of the hash parameters; signatures are only comparable under one seed
+        """
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, int(_PRIME), num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, int(_PRIME), num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+
+    def signature(self, items: Set[str]) -> np.ndarray:
+        """
+        Compute the signature of a shingle set
+
+        Args:
+            items: Shingles
+
+        Returns:
+            np.ndarray: uint64 array of num_perm minima (all maximal for an empty set)
+        """
+        if not items:
+            return np.full(self.num_perm, _PRIME, dtype=np.uint64)
+
+        hashes = np.fromiter((zlib.crc32(item.encode('utf-8')) for item in items), dtype=np.uint64, count=len(items))
+        hashes %= _PRIME
+        return ((hashes[:, None] * self.a + self.b) % _PRIME).min(axis=0)
+
+    @staticmethod
+    def similarity(first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.mean(first == second))
+
+
+def deduplicate(texts: Sequence[str], threshold: float = 0.5, hasher: Optional[MinHasher] = None) -> List[int]:
+    """
+    Drop texts that are near-duplicates of an earlier one
+
+    Args:
+        texts: Texts in priority order; the first of a group of duplicates is kept
+        threshold: Estimated Jaccard similarity at which texts count as duplicates
+        hasher: MinHasher to use (default MinHasher())
+
+    Returns:
+        list: Indexes of the kept texts, in input order
+    """
+    hasher = hasher or MinHasher()
+    kept: List[int] = []
+    kept_signatures: List[np.ndarray] = []
+    seen_empty: Set[str] = set()
+
+    for index, text in enumerate(texts):
+        items = shingles(text)
+        if not items:
+            # Nothing but stopwords: only exact repeats are duplicates
+            key = " ".join(text.lower().split())
+            if key not in seen_empty:
+                seen_empty.add(key)
+                kept.append(index)
+            continue
+
+        signature = hasher.signature(items)
+        if kept_signatures:
+            similarities = (np.vstack(kept_signatures) == signature).mean(axis=1)
+            if similarities.max() >= threshold:
+                continue
+
+        kept.append(index)
+        kept_signatures.append(signature)
+
+    return kept
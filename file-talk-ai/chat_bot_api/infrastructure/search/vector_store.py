@@ -0,0 +1,256 @@
+"""
+Vector Store
+Memory-mapped float32 chunk vectors with batched cosine top-k search
+"""
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from config.env_config import config
+from .chunker import TextChunk
+
+_DTYPE = np.float32
+
+
+class VectorIndex:
+    """
+    Chunk vectors of one document
+
+    ``vectors`` is usually a read-only ``np.memmap``, so opening an index
+    costs no reads and the OS page cache shares the pages between worker
+    processes. Rows are L2-normalized, so cosine similarity is a dot
+    product.
+    """
+
+    def __init__(self, vectors: np.ndarray, chunks: List[TextChunk], signature: str):
+        """
+        Initialize index
+
+        Args:
+            vectors: Matrix of shape (len(chunks), dim)
+            chunks: Chunks in row order
+            signature: Embedder signature the vectors were made with
+        """
+        self.vectors = vectors
+        self.chunks = chunks
+        self.signature = signature
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    @property
+    def dim(self) -> int:
+        return self.vectors.shape[1]
+
+    def search(
+        self,
+        queries: np.ndarray,
+        top_k: int,
+        batch_rows: int = 16384
+    ) -> List[List[Tuple[TextChunk, float]]]:
+        """
+        Find the chunks most similar to each query
+
+        Rows are scored ``batch_rows`` at a time against all queries with
+        one matrix product per batch, keeping a running top-k, so memory
+        stays bounded however many chunks the document has.
+
+        Args:
+            queries: Normalized query vectors, shape (dim,) or (n_queries, dim)
+            top_k: Maximum chunks per query
+            batch_rows: Rows scored per matrix product
+
+        Returns:
+            list: Per query, (chunk, cosine) pairs best first; only positive similarities
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=_DTYPE))
+        total = len(self.chunks)
+        top_k = min(top_k, total)
+        if top_k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        best_scores = np.empty((len(queries), 0), dtype=_DTYPE)
+        best_ids = np.empty((len(queries), 0), dtype=np.int64)
+
+        for start in range(0, total, batch_rows):
+            block = np.asarray(self.vectors[start:start + batch_rows])
+            scores = queries @ block.T
+            ids = np.broadcast_to(np.arange(start, start + len(block)), scores.shape)
+
+            scores = np.concatenate([best_scores, scores], axis=1)
+            ids = np.concatenate([best_ids, ids], axis=1)
+            if scores.shape[1] > top_k:
+                keep = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+                scores = np.take_along_axis(scores, keep, axis=1)
+                ids = np.take_along_axis(ids, keep, axis=1)
+            best_scores, best_ids = scores, ids
+
+        order = np.argsort(-best_scores, axis=1, kind='stable')
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        best_ids = np.take_along_axis(best_ids, order, axis=1)
+
+        return [
+            [(self.chunks[doc_id], float(score)) for doc_id, score in zip(row_ids, row_scores) if score > 0]
+            for row_ids, row_scores in zip(best_ids.tolist(), best_scores.tolist())
+        ]
+
+
+class VectorStore:
+    """
+    Directory of per-document vector files
+
+    Each index is a raw float32 matrix (``<name>.<signature>.f32``) plus a
+    JSON sidecar with the shape and chunks. Both are written to a temp file
+    and renamed into place, sidecar last, so a reader never sees a partial
+    index. Recently opened indexes are kept open.
+    """
+
+    def __init__(self, directory: str, max_open: int = 32):
+        """
+        Initialize store
+
+        Args:
+            directory: Directory for vector files
+            max_open: Opened indexes kept in memory
+        """
+        self.directory = directory
+        self.max_open = max_open
+        self._lock = threading.Lock()
+        self._open: "OrderedDict[str, VectorIndex]" = OrderedDict()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _paths(self, name: str, signature: str) -> Tuple[str, str]:
+        base = os.path.join(self.directory, f"{name}.{signature}")
+        return f"{base}.f32", f"{base}.json"
+
+    def load(self, name: str, signature: str) -> Optional[VectorIndex]:
+        """
+        Open a stored index
+
+        Args:
+            name: Index name (document hash and chunking parameters)
+            signature: Embedder signature
+
+        Returns:
+            VectorIndex or None: Index, or None if it was never saved
+
+        Raises:
+            ValueError: If the stored files do not match each other
+        """
+        vectors_path, meta_path = self._paths(name, signature)
+        cache_key = os.path.basename(vectors_path)
+
+        with self._lock:
+            index = self._open.get(cache_key)
+            if index is not None:
+                self._open.move_to_end(cache_key)
+                return index
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        count, dim = meta['count'], meta['dim']
+        if meta.get('signature') != signature or len(meta['chunks']) != count:
+            raise ValueError(f"Vector index {cache_key} metadata is inconsistent")
+        if os.path.getsize(vectors_path) != count * dim * np.dtype(_DTYPE).itemsize:
+            raise ValueError(f"Vector index {cache_key} has the wrong size")
+
+        # An empty file cannot be memory-mapped
+        vectors = (
+            np.memmap(vectors_path, dtype=_DTYPE, mode='r', shape=(count, dim))
+            if count else np.zeros((0, dim), dtype=_DTYPE)
+        )
+        index = VectorIndex(vectors, [TextChunk(**chunk) for chunk in meta['chunks']], signature)
+        self._remember(cache_key, index)
+        return index
+
+    def save(self, name: str, signature: str, chunks: Sequence[TextChunk], vectors: np.ndarray) -> VectorIndex:
+        """
+        Store the vectors of a document
+
+        Args:
+            name: Index name
+            signature: Embedder signature
+            chunks: Chunks in row order
+            vectors: Matrix of shape (len(chunks), dim)
+
+        Returns:
+            VectorIndex: The stored index, memory-mapped
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=_DTYPE)
+        if vectors.ndim != 2 or len(vectors) != len(chunks):
+            raise ValueError("Expected one vector row per chunk")
+
+        vectors_path, meta_path = self._paths(name, signature)
+        meta = {
+            'signature': signature,
+            'count': len(chunks),
+            'dim': vectors.shape[1],
+            'chunks': [asdict(chunk) for chunk in chunks],
+        }
+
+        self._write_atomic(vectors_path, vectors.tobytes())
+        self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+
+        with self._lock:
+            self._open.pop(os.path.basename(vectors_path), None)
+        return self.load(name, signature)
+
+    def delete(self, name: str, signature: str):
+        """Remove a stored index"""
+        vectors_path, meta_path = self._paths(name, signature)
+        with self._lock:
+            self._open.pop(os.path.basename(vectors_path), None)
+
+        # Sidecar first so the index stops being visible before its data goes
+        for path in (meta_path, vectors_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _remember(self, cache_key: str, index: VectorIndex):
+        with self._lock:
+            self._open[cache_key] = index
+            self._open.move_to_end(cache_key)
+            while len(self._open) > self.max_open:
+                self._open.popitem(last=False)
+
+    def _write_atomic(self, path: str, payload: bytes):
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+_vector_store: Optional[VectorStore] = None
+_vector_store_lock = threading.Lock()
+
+
+def get_vector_store() -> VectorStore:
+    """
+    Get process-wide vector store
+
+    Returns:
+        VectorStore: Shared store under VECTOR_STORE_PATH
+    """
+    global _vector_store
+
+    if _vector_store is None:
+        with _vector_store_lock:
+            if _vector_store is None:
+                _vector_store = VectorStore(config.VECTOR_STORE_PATH)
+
+    return _vector_store
@@ -0,0 +1,8 @@
+"""Session Infrastructure"""
+from .context_store import SessionContext, SessionContextStore, get_session_store
+
+__all__ = [
+    'SessionContext',
+    'SessionContextStore',
+    'get_session_store',
+]
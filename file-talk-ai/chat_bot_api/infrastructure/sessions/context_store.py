@@ -0,0 +1,138 @@
+"""
+Session Context Store
+Keeps the warmed document context of active chat sessions in memory
+"""
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+import numpy as np
+from config.env_config import config
+from chat_bot_api.infrastructure.cache import MemoryLRUCache
+from chat_bot_api.infrastructure.repositories import SessionRepository
+
+
+@dataclass
+class SessionContext:
+    """Everything a follow-up question about the session's document needs"""
+    session_id: str
+    document_url: str
+    content_hash: Optional[str]
+    variant: str  # Answer settings the context was built for
+    search_index: Any = None  # BM25Index
+    vector_index: Any = None  # VectorIndex
+    pdf_text: Optional[str] = None  # Packed document text (direct mode)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the context"""
+        size = len(self.pdf_text or '')
+        if self.search_index is not None:
+            size += self.search_index.nbytes
+        if self.vector_index is not None:
+            vectors = self.vector_index.vectors
+            # Memory-mapped vectors live in the page cache, not the heap
+            if not isinstance(vectors, np.memmap):
+                size += vectors.nbytes
+            if self.search_index is None:
+                size += sum(len(chunk.text) for chunk in self.vector_index.chunks)
+        return size
+
+    def matches(self, document_url: str, variant: str) -> bool:
+        """Whether the context serves questions about this document with these settings"""
+        return self.document_url == document_url and self.variant == variant
+
+
+class SessionContextStore:
+    """
+    Byte-bounded LRU of session contexts with an idle timeout
+
+    Every use renews a session's time-to-live, so only sessions idle for
+    ``idle_ttl`` seconds expire; when the byte budget is full the least
+    recently used sessions are evicted first. Sessions that expire or are
+    evicted are reported to ``on_expire``; expiry is noticed when the
+    session is used again or when another session is stored.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        idle_ttl: int,
+        on_expire: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Initialize store
+
+        Args:
+            max_bytes: Memory budget for all contexts
+            idle_ttl: Seconds a session may stay unused
+            on_expire: Called with the id of each session that expired or was evicted
+        """
+        self.idle_ttl = idle_ttl
+        self.on_expire = on_expire
+        self._contexts = MemoryLRUCache(max_bytes, default_ttl=idle_ttl, on_evict=self._expired)
+
+    def get(self, session_id: str) -> Optional[SessionContext]:
+        """
+        Get a session's context, renewing its idle timeout
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            SessionContext or None: Context, if warm
+        """
+        context = self._contexts.get(session_id)
+        if context is not None:
+            self._contexts.set(session_id, context)
+        return context
+
+    def put(self, context: SessionContext):
+        """
+        Store a session's context, replacing any previous one
+
+        Args:
+            context: Warmed context
+        """
+        # Warming is rare next to reads, so sweep idle sessions here
+        self._contexts.purge_expired()
+        self._contexts.set(context.session_id, context)
+
+    def evict(self, session_id: str):
+        """Drop a session's context"""
+        self._contexts.delete(session_id)
+
+    def _expired(self, session_id: str, context: SessionContext):
+        if self.on_expire is not None:
+            self.on_expire(session_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit, eviction and size counters"""
+        return self._contexts.stats()
+
+
+_session_store: Optional[SessionContextStore] = None
+_session_store_lock = threading.Lock()
+
+
+def get_session_store() -> Optional[SessionContextStore]:
+    """
+    Get process-wide session context store
+
+    Returns:
+        SessionContextStore or None: Shared store, or None when disabled
+    """
+    global _session_store
+
+    if not config.SESSION_CONTEXT_ENABLED:
+        return None
+
+    if _session_store is None:
+        with _session_store_lock:
+            if _session_store is None:
+                _session_store = SessionContextStore(
+                    config.SESSION_CONTEXT_MAX_BYTES,
+                    config.SESSION_CONTEXT_IDLE_TTL,
+                    on_expire=SessionRepository().deactivate
+                )
+
+    return _session_store
@@ -0,0 +1,19 @@
+"""Storage Infrastructure"""
+from .base import BlobWriter, StorageBackend, StoredBlob
+from .local_storage import LocalStorageBackend
+from .s3_storage import S3StorageBackend
+from .factory import build_storage_backend, get_storage_backend
+from .janitor import JanitorReport, StorageJanitor, get_storage_janitor
+
+__all__ = [
+    'BlobWriter',
+    'StorageBackend',
+    'StoredBlob',
+    'LocalStorageBackend',
+    'S3StorageBackend',
+    'build_storage_backend',
+    'get_storage_backend',
+    'JanitorReport',
+    'StorageJanitor',
+    'get_storage_janitor',
+]
@@ -0,0 +1,170 @@
+"""
+Storage Backend Base
+Interface shared by content-addressed blob storage drivers
+"""
+import hashlib
+import os
+import re
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import closing
+from dataclasses import dataclass
+from typing import BinaryIO, Optional
+
+_KEY_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+@dataclass
+class StoredBlob:
+    """Result of writing a blob"""
+    key: str
+    size_bytes: int
+    created: bool  # False when identical content was already stored
+
+
+def validate_key(key: str) -> str:
+    """
+    Check that a key is a SHA-256 hex digest
+
+    Keys end up in file paths and object names, so anything else is refused.
+
+    Raises:
+        ValueError: If the key is malformed
+    """
+    if not isinstance(key, str) or not _KEY_PATTERN.match(key):
+        raise ValueError(f"Invalid storage key: {key!r}")
+    return key
+
+
+class BlobWriter(ABC):
+    """
+    Streaming writer for one blob
+
+    Hashes and counts the bytes as they are written; the blob is stored
+    under its SHA-256 when committed.
+    """
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+        self.size_bytes = 0
+        self._closed = False
+
+    def write(self, chunk: bytes):
+        """Append a chunk"""
+        self._hash.update(chunk)
+        self.size_bytes += len(chunk)
+        self._write(chunk)
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 of the bytes written so far"""
+        return self._hash.hexdigest()
+
+    def commit(self) -> StoredBlob:
+        """
+        Store the blob under its content hash
+
+        Returns:
+            StoredBlob: Key, size and whether the content was new
+        """
+        self._closed = True
+        return self._commit(self.content_hash)
+
+    def abort(self):
+        """Discard everything written"""
+        if not self._closed:
+            self._closed = True
+            self._abort()
+
+    @abstractmethod
+    def _write(self, chunk: bytes):
+        """Backend-specific write"""
+
+    @abstractmethod
+    def _commit(self, content_hash: str) -> StoredBlob:
+        """Backend-specific commit"""
+
+    @abstractmethod
+    def _abort(self):
+        """Backend-specific cleanup"""
+
+
+class StorageBackend(ABC):
+    """
+    Content-addressed blob storage
+
+    Blobs are immutable and keyed by the SHA-256 of their content.
+    """
+
+    name = 'base'
+
+    @abstractmethod
+    def open_writer(self) -> BlobWriter:
+        """Start writing a new blob"""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Check whether a blob is stored"""
+
+    @abstractmethod
+    def size(self, key: str) -> int:
+        """Get size of a stored blob in bytes"""
+
+    @abstractmethod
+    def open(self, key: str) -> BinaryIO:
+        """Open a stored blob for streaming reads"""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Delete a stored blob (missing blobs are ignored)"""
+
+    def read(self, key: str) -> bytes:
+        """Read a whole blob into memory"""
+        with self.open(key) as f:
+            return f.read()
+
+    def read_buffer(self, key: str, chunk_size: int = 1024 * 1024) -> bytearray:
+        """
+        Read a whole blob into a mutable buffer
+
+        The blob is streamed straight into the buffer, so it is held in
+        memory once rather than as bytes plus a bytearray copy.
+
+        Args:
+            key: Blob key
+            chunk_size: Bytes read per call
+
+        Returns:
+            bytearray: Blob content
+        """
+        buffer = bytearray()
+        with closing(self.open(key)) as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                buffer += chunk
+        return buffer
+
+    def create_temp_file(self, suffix: str = '.part') -> str:
+        """
+        Create an empty scratch file on local disk
+
+        Drivers that keep blobs on local disk create it inside the store,
+        where it is swept with the store's other temp files; others use the
+        system temp directory.
+
+        Args:
+            suffix: File name suffix
+
+        Returns:
+            str: Path of the new file (the caller removes it)
+        """
+        fd, temp_path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        return temp_path
+
+    def local_path(self, key: str) -> Optional[str]:
+        """Filesystem path of a stored blob, if the driver keeps blobs on local disk"""
+        return None
+
+    def contains_path(self, file_path: str) -> bool:
+        """Check whether a local path belongs to this store"""
+        return False
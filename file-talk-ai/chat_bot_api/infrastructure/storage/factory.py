@@ -0,0 +1,60 @@
+"""
+Storage Factory
+Builds the storage backend selected in configuration
+"""
+import threading
+from typing import Optional
+from config.env_config import config
+from .base import StorageBackend
+from .local_storage import LocalStorageBackend
+from .s3_storage import S3StorageBackend
+
+
+def build_storage_backend() -> StorageBackend:
+    """
+    Create the storage backend selected by STORAGE_BACKEND
+
+    Returns:
+        StorageBackend: Local or S3 storage
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend = config.STORAGE_BACKEND.lower()
+
+    if backend == 'local':
+        return LocalStorageBackend(config.STORAGE_LOCAL_PATH, shard_depth=config.STORAGE_SHARD_DEPTH)
+
+    if backend == 's3':
+        return S3StorageBackend(
+            bucket=config.AWS_STORAGE_BUCKET_NAME,
+            prefix=config.STORAGE_S3_PREFIX,
+            part_size=config.STORAGE_S3_PART_SIZE,
+            region_name=config.AWS_S3_REGION_NAME,
+            endpoint_url=config.AWS_S3_ENDPOINT_URL,
+            access_key_id=config.AWS_ACCESS_KEY_ID,
+            secret_access_key=config.AWS_SECRET_ACCESS_KEY
+        )
+
+    raise ValueError(f"Unknown storage backend: {config.STORAGE_BACKEND}")
+
+
+_storage_backend: Optional[StorageBackend] = None
+_storage_backend_lock = threading.Lock()
+
+
+def get_storage_backend() -> StorageBackend:
+    """
+    Get process-wide storage backend instance
+
+    Returns:
+        StorageBackend: Shared storage backend
+    """
+    global _storage_backend
+
+    if _storage_backend is None:
+        with _storage_backend_lock:
+            if _storage_backend is None:
+                _storage_backend = build_storage_backend()
+
+    return _storage_backend
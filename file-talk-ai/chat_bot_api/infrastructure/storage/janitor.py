@@ -0,0 +1,415 @@
+"""
+Storage Janitor
+Keeps the PDF storage directory within a byte budget
+"""
+import fcntl
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterable, List, Optional
+from config.env_config import config
+from chat_bot_api.core.utils.logger import get_logger
+from .local_storage import LocalStorageBackend
+
+logger = get_logger(__name__)
+
+EVICTION_POLICIES = ('lru', 'lfu')
+
+# Scratch files older versions wrote to the storage directory for uncached downloads
+SCRATCH_PREFIX = 'pdf_'
+
+
+@dataclass
+class JanitorReport:
+    """Outcome of one sweep"""
+    started_at: float
+    dry_run: bool = False
+    skipped: bool = False
+    duration_ms: float = 0.0
+    reclaimed_bytes: int = 0
+    expired_blobs: int = 0
+    evicted_blobs: int = 0
+    removed_metadata: int = 0
+    removed_temp_files: int = 0
+    removed_scratch_files: int = 0
+    removed_lock_files: int = 0
+    working_set_bytes: int = 0
+    working_set_files: int = 0
+    uploads_bytes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert report to dictionary"""
+        return asdict(self)
+
+
+@dataclass
+class _CachedBlob:
+    """Download cache blob with usage aggregated over the URLs pointing at it"""
+    key: str
+    path: str
+    size_bytes: int
+    last_used_at: float
+    hits: int
+    metadata_paths: List[str]
+
+
+class StorageJanitor:
+    """
+    Evicts cached PDFs and removes leftovers from the storage directory
+
+    Download cache blobs are expired after ``ttl_seconds`` without use and,
+    while the cache is above ``max_bytes``, evicted in LRU or LFU order.
+    Usage comes from the download cache metadata, summed over every URL
+    sharing a blob. Abandoned temp files (including scratch files of
+    uncached downloads) and idle single-flight lock files are removed once they are
+    older than ``grace_seconds``; anything used more recently is never
+    touched, so files of in-flight requests survive.
+
+    Uploaded documents are referenced by document id and are never evicted;
+    their size is only reported.
+
+    A sweep holds an exclusive lock file, so several worker processes
+    sharing the directory do not sweep at the same time.
+    """
+
+    def __init__(
+        self,
+        storage_path: str,
+        download_cache=None,
+        upload_storage=None,
+        lock_dir: Optional[str] = None,
+        max_bytes: int = 1024 * 1024 * 1024,
+        ttl_seconds: int = 7 * 24 * 3600,
+        policy: str = 'lru',
+        grace_seconds: int = 300
+    ):
+        """
+        Initialize janitor
+
+        Args:
+            storage_path: PDF storage directory
+            download_cache: PDFDownloadCache to keep within budget
+            upload_storage: Storage backend holding uploads (temp files swept, blobs reported only)
+            lock_dir: Single-flight lock directory
+            max_bytes: Byte budget for cached downloads (0 = unlimited)
+            ttl_seconds: Expire cached downloads unused for this long (0 = never)
+            policy: Eviction order above budget, 'lru' or 'lfu'
+            grace_seconds: Minimum age before anything is removed
+
+        Raises:
+            ValueError: If the policy is unknown
+        """
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy} (expected one of {', '.join(EVICTION_POLICIES)})")
+
+        self.storage_path = os.path.abspath(storage_path)
+        self.download_cache = download_cache
+        self.upload_storage = upload_storage
+        self.lock_dir = lock_dir
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.policy = policy
+        self.grace_seconds = grace_seconds
+        os.makedirs(self.storage_path, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._runs = 0
+        self._total_reclaimed = 0
+        self._last_report: Optional[JanitorReport] = None
+
+    # ------------------------------------------------------------------
+    # Sweeping
+    # ------------------------------------------------------------------
+
+    def sweep(self, dry_run: bool = False) -> JanitorReport:
+        """
+        Run one cleanup pass
+
+        Args:
+            dry_run: Only report what would be removed
+
+        Returns:
+            JanitorReport: What was (or would be) removed and what is left
+        """
+        report = JanitorReport(started_at=time.time(), dry_run=dry_run)
+        start = time.perf_counter()
+
+        with self._lock:
+            fd = os.open(os.path.join(self.storage_path, '.janitor.lock'), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    # Another process is sweeping right now
+                    report.skipped = True
+                    return report
+
+                try:
+                    self._sweep(report)
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+
+            report.duration_ms = round((time.perf_counter() - start) * 1000, 2)
+            if not dry_run:
+                self._runs += 1
+                self._total_reclaimed += report.reclaimed_bytes
+            self._last_report = report
+
+        logger.info(
+            f"Storage janitor reclaimed {report.reclaimed_bytes} bytes, "
+            f"working set {report.working_set_bytes} bytes in {report.working_set_files} files",
+            extra={'extra_data': report.to_dict()}
+        )
+        return report
+
+    def _sweep(self, report: JanitorReport):
+        """Run all cleanup steps"""
+        now = time.time()
+        cutoff = now - self.grace_seconds
+
+        temp_dirs = []
+        if self.download_cache is not None:
+            temp_dirs.extend([self.download_cache.tmp_dir, self.download_cache.blobs.tmp_dir])
+        if isinstance(self.upload_storage, LocalStorageBackend):
+            temp_dirs.append(self.upload_storage.tmp_dir)
+        report.removed_temp_files = self._remove_old_files(self._list_files(temp_dirs), cutoff, report)
+
+        if self.download_cache is not None:
+            self._sweep_download_cache(now, cutoff, report)
+
+        scratch_files = [
+            path for path in self._list_files([self.storage_path])
+            if os.path.basename(path).startswith(SCRATCH_PREFIX) and path.endswith('.pdf')
+        ]
+        report.removed_scratch_files = self._remove_old_files(scratch_files, cutoff, report)
+
+        if self.lock_dir and os.path.isdir(self.lock_dir):
+            report.removed_lock_files = self._remove_idle_locks(cutoff, report.dry_run)
+
+        if isinstance(self.upload_storage, LocalStorageBackend):
+            report.uploads_bytes = sum(stat.st_size for _, _, stat in self.upload_storage.iter_blobs())
+
+    def _sweep_download_cache(self, now: float, cutoff: float, report: JanitorReport):
+        """Expire and evict download cache blobs"""
+        blobs: Dict[str, _CachedBlob] = {}
+        for key, path, stat in self.download_cache.blobs.iter_blobs():
+            blobs[key] = _CachedBlob(
+                key=key, path=path, size_bytes=stat.st_size,
+                last_used_at=stat.st_mtime, hits=0, metadata_paths=[]
+            )
+
+        for metadata_path, entry in self.download_cache.iter_entries():
+            blob = blobs.get(entry.content_hash) if entry else None
+            if blob is None:
+                # Unreadable or pointing at a blob that is gone
+                if self._is_older(metadata_path, cutoff):
+                    self._remove(metadata_path, report.dry_run)
+                    report.removed_metadata += 1
+                continue
+            blob.metadata_paths.append(metadata_path)
+            blob.hits += entry.hits
+            blob.last_used_at = max(blob.last_used_at, entry.last_used_at, entry.fetched_at)
+
+        # Recently used blobs may be open in a request right now
+        candidates = [blob for blob in blobs.values() if blob.last_used_at < cutoff]
+
+        if self.ttl_seconds > 0:
+            for blob in candidates:
+                if now - blob.last_used_at > self.ttl_seconds:
+                    self._evict(blob, blobs, report)
+                    report.expired_blobs += 1
+
+        working_set = sum(blob.size_bytes for blob in blobs.values())
+        if self.max_bytes > 0 and working_set > self.max_bytes:
+            if self.policy == 'lfu':
+                order = sorted((b for b in candidates if b.key in blobs), key=lambda b: (b.hits, b.last_used_at))
+            else:
+                order = sorted((b for b in candidates if b.key in blobs), key=lambda b: b.last_used_at)
+
+            for blob in order:
+                if working_set <= self.max_bytes:
+                    break
+                self._evict(blob, blobs, report)
+                report.evicted_blobs += 1
+                working_set -= blob.size_bytes
+
+        report.working_set_bytes = sum(blob.size_bytes for blob in blobs.values())
+        report.working_set_files = len(blobs)
+
+    def _evict(self, blob: _CachedBlob, blobs: Dict[str, _CachedBlob], report: JanitorReport):
+        """Remove a blob together with the metadata of every URL pointing at it"""
+        for metadata_path in blob.metadata_paths:
+            self._remove(metadata_path, report.dry_run)
+            report.removed_metadata += 1
+        self._remove(blob.path, report.dry_run)
+        report.reclaimed_bytes += blob.size_bytes
+        del blobs[blob.key]
+
+    def _remove_idle_locks(self, cutoff: float, dry_run: bool) -> int:
+        """
+        Remove old lock files that nobody holds
+
+        Holders touch the file on every acquire, so the mtime is the last use.
+        A file is only unlinked while locked here; a process that opened it
+        before that notices the unlink after locking and reopens the path.
+        """
+        removed = 0
+        for path in self._list_files([self.lock_dir]):
+            if not path.endswith('.lock') or not self._is_older(path, cutoff):
+                continue
+            try:
+                fd = os.open(path, os.O_RDWR)
+            except FileNotFoundError:
+                continue
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            try:
+                self._remove(path, dry_run)
+                removed += 1
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+        return removed
+
+    def _remove_old_files(self, paths: Iterable[str], cutoff: float, report: JanitorReport) -> int:
+        """Remove files last modified before the cutoff, counting reclaimed bytes"""
+        removed = 0
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if stat.st_mtime >= cutoff:
+                continue
+            self._remove(path, report.dry_run)
+            report.reclaimed_bytes += stat.st_size
+            removed += 1
+        return removed
+
+    @staticmethod
+    def _list_files(directories: Iterable[str]) -> List[str]:
+        """List regular files directly inside the given directories"""
+        files = []
+        for directory in directories:
+            try:
+                entries = os.scandir(directory)
+            except FileNotFoundError:
+                continue
+            with entries:
+                files.extend(entry.path for entry in entries if entry.is_file(follow_symlinks=False))
+        return files
+
+    @staticmethod
+    def _is_older(path: str, cutoff: float) -> bool:
+        try:
+            return os.stat(path).st_mtime < cutoff
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _remove(path: str, dry_run: bool):
+        if dry_run:
+            return
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Storage janitor could not remove {path}: {str(e)}")
+
+    # ------------------------------------------------------------------
+    # Periodic task
+    # ------------------------------------------------------------------
+
+    def start(self, interval_seconds: float):
+        """
+        Sweep periodically in a daemon thread (no-op if already running)
+
+        Args:
+            interval_seconds: Seconds between sweeps
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run_periodically,
+                args=(interval_seconds,),
+                name='storage-janitor',
+                daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop the periodic thread"""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+        self._thread = None
+
+    def _run_periodically(self, interval_seconds: float):
+        while not self._stop.wait(interval_seconds):
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.warning(f"Storage janitor sweep failed: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get janitor counters
+
+        Returns:
+            dict: Sweep count, total reclaimed bytes and the last report
+        """
+        with self._lock:
+            return {
+                'runs': self._runs,
+                'total_reclaimed_bytes': self._total_reclaimed,
+                'policy': self.policy,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl_seconds,
+                'last_report': self._last_report.to_dict() if self._last_report else None,
+            }
+
+
+_storage_janitor: Optional[StorageJanitor] = None
+_storage_janitor_lock = threading.Lock()
+
+
+def get_storage_janitor() -> StorageJanitor:
+    """
+    Get process-wide storage janitor instance
+
+    Returns:
+        StorageJanitor: Shared janitor configured from settings
+    """
+    global _storage_janitor
+
+    if _storage_janitor is None:
+        with _storage_janitor_lock:
+            if _storage_janitor is None:
+                # Imported here: the cache package itself depends on storage
+                from chat_bot_api.infrastructure.cache import get_download_cache
+                from .factory import get_storage_backend
+
+                _storage_janitor = StorageJanitor(
+                    config.PDF_STORAGE_PATH,
+                    download_cache=get_download_cache() if config.PDF_DOWNLOAD_CACHE_ENABLED else None,
+                    upload_storage=get_storage_backend(),
+                    lock_dir=config.SINGLE_FLIGHT_LOCK_PATH,
+                    max_bytes=config.STORAGE_JANITOR_MAX_BYTES,
+                    ttl_seconds=config.STORAGE_JANITOR_TTL,
+                    policy=config.STORAGE_JANITOR_POLICY,
+                    grace_seconds=config.STORAGE_JANITOR_GRACE
+                )
+
+    return _storage_janitor
@@ -0,0 +1,147 @@
+"""
+Local Storage
+Content-addressed, hash-sharded blob storage on local disk
+"""
+import os
+import tempfile
+from typing import BinaryIO, Iterator, Optional, Tuple
+from .base import BlobWriter, StorageBackend, StoredBlob, validate_key
+
+
+class LocalBlobWriter(BlobWriter):
+    """Writes a blob to a temporary file and renames it into place"""
+
+    def __init__(self, backend: 'LocalStorageBackend'):
+        super().__init__()
+        self.backend = backend
+        self.temp_path = backend.create_temp_file()
+        self._file = open(self.temp_path, 'wb')
+
+    def _write(self, chunk: bytes):
+        self._file.write(chunk)
+
+    def _commit(self, content_hash: str) -> StoredBlob:
+        self._file.close()
+        return self.backend.move_into_place(self.temp_path, content_hash)
+
+    def _abort(self):
+        self._file.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    Blob storage on local disk
+
+    Blobs are sharded by the leading hex digits of their hash so no
+    directory grows past a few hundred entries, and are renamed into place
+    atomically so readers never see partial files.
+
+    Layout (shard_depth=2, shard_width=2):
+        <root>/ab/cd/abcd...ef.pdf
+        <root>/tmp/<writes in progress>
+    """
+
+    name = 'local'
+
+    def __init__(self, root: str, shard_depth: int = 2, shard_width: int = 2):
+        """
+        Initialize local storage
+
+        Args:
+            root: Root directory
+            shard_depth: Number of directory levels
+            shard_width: Hex digits per directory level
+        """
+        self.root = os.path.abspath(root)
+        self.tmp_dir = os.path.join(self.root, 'tmp')
+        self.shard_depth = shard_depth
+        self.shard_width = shard_width
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+    def path_for(self, key: str) -> str:
+        """Get path where a blob is (or would be) stored"""
+        validate_key(key)
+        shards = [
+            key[level * self.shard_width:(level + 1) * self.shard_width]
+            for level in range(self.shard_depth)
+        ]
+        return os.path.join(self.root, *shards, f"{key}.pdf")
+
+    def create_temp_file(self, suffix: str = '.part') -> str:
+        """Create an empty temporary file inside the store"""
+        fd, temp_path = tempfile.mkstemp(dir=self.tmp_dir, suffix=suffix)
+        os.close(fd)
+        return temp_path
+
+    def move_into_place(self, temp_path: str, key: str) -> StoredBlob:
+        """
+        Move a finished temporary file to the blob location of ``key``
+
+        Args:
+            temp_path: File inside the store's tmp directory
+            key: Content hash of the file
+
+        Returns:
+            StoredBlob: Stored blob
+        """
+        final_path = self.path_for(key)
+        size_bytes = os.path.getsize(temp_path)
+
+        if os.path.exists(final_path):
+            os.remove(temp_path)
+            return StoredBlob(key=key, size_bytes=size_bytes, created=False)
+
+        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+        os.replace(temp_path, final_path)
+        return StoredBlob(key=key, size_bytes=size_bytes, created=True)
+
+    def open_writer(self) -> LocalBlobWriter:
+        return LocalBlobWriter(self)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.path_for(key))
+
+    def size(self, key: str) -> int:
+        return os.path.getsize(self.path_for(key))
+
+    def open(self, key: str) -> BinaryIO:
+        return open(self.path_for(key), 'rb')
+
+    def delete(self, key: str):
+        try:
+            os.remove(self.path_for(key))
+        except FileNotFoundError:
+            pass
+
+    def iter_blobs(self) -> Iterator[Tuple[str, str, os.stat_result]]:
+        """
+        Iterate over stored blobs
+
+        Yields:
+            tuple: (key, path, stat result)
+        """
+        for directory, subdirs, files in os.walk(self.root):
+            if directory == self.root:
+                subdirs[:] = [d for d in subdirs if d != 'tmp']
+            for name in files:
+                path = os.path.join(directory, name)
+                if not self.contains_path(path):
+                    continue
+                try:
+                    yield os.path.splitext(name)[0], path, os.stat(path)
+                except FileNotFoundError:
+                    continue
+
+    def local_path(self, key: str) -> Optional[str]:
+        path = self.path_for(key)
+        return path if os.path.exists(path) else None
+
+    def contains_path(self, file_path: str) -> bool:
+        file_path = os.path.abspath(file_path)
+        key = os.path.splitext(os.path.basename(file_path))[0]
+        try:
+            return self.path_for(key) == file_path
+        except ValueError:
+            return False
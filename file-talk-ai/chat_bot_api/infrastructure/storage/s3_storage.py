@@ -0,0 +1,221 @@
+"""
+S3 Storage
+Content-addressed blob storage on S3 or an S3-compatible service
+"""
+import uuid
+from typing import Any, BinaryIO, Optional
+from .base import BlobWriter, StorageBackend, StoredBlob, validate_key
+
+# S3 rejects multipart parts smaller than 5 MB (except the last one)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+_MISSING_ERROR_CODES = {'404', 'NoSuchKey', 'NotFound'}
+
+
+def _is_missing(error: Exception) -> bool:
+    """Check whether a client error means the object does not exist"""
+    response = getattr(error, 'response', None) or {}
+    return str(response.get('Error', {}).get('Code')) in _MISSING_ERROR_CODES
+
+
+class S3BlobWriter(BlobWriter):
+    """
+    Streams a blob to S3 with a multipart upload
+
+    The content hash is only known at the end, so parts are uploaded to a
+    temporary key and copied to the content-addressed key on commit. Blobs
+    smaller than one part are sent with a single PUT instead.
+    """
+
+    def __init__(self, backend: 'S3StorageBackend'):
+        super().__init__()
+        self.backend = backend
+        self.temp_key = backend.object_key(f"tmp/{uuid.uuid4().hex}")
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts = []
+
+    def _write(self, chunk: bytes):
+        self._buffer += chunk
+        if len(self._buffer) >= self.backend.part_size:
+            self._upload_part()
+
+    def _upload_part(self):
+        """Send the buffered bytes as the next part"""
+        client = self.backend.client
+
+        if self._upload_id is None:
+            response = client.create_multipart_upload(
+                Bucket=self.backend.bucket,
+                Key=self.temp_key,
+                ContentType='application/pdf'
+            )
+            self._upload_id = response['UploadId']
+
+        part_number = len(self._parts) + 1
+        response = client.upload_part(
+            Bucket=self.backend.bucket,
+            Key=self.temp_key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=bytes(self._buffer)
+        )
+        self._parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+        self._buffer.clear()
+
+    def _commit(self, content_hash: str) -> StoredBlob:
+        backend = self.backend
+        final_key = backend.object_key(content_hash)
+
+        if backend.exists(content_hash):
+            self._abort()
+            return StoredBlob(key=content_hash, size_bytes=self.size_bytes, created=False)
+
+        if self._upload_id is None:
+            backend.client.put_object(
+                Bucket=backend.bucket,
+                Key=final_key,
+                Body=bytes(self._buffer),
+                ContentType='application/pdf'
+            )
+            self._buffer.clear()
+            return StoredBlob(key=content_hash, size_bytes=self.size_bytes, created=True)
+
+        try:
+            if self._buffer:
+                self._upload_part()
+            backend.client.complete_multipart_upload(
+                Bucket=backend.bucket,
+                Key=self.temp_key,
+                UploadId=self._upload_id,
+                MultipartUpload={'Parts': self._parts}
+            )
+        except Exception:
+            self._abort()
+            raise
+
+        try:
+            backend.client.copy_object(
+                Bucket=backend.bucket,
+                Key=final_key,
+                CopySource={'Bucket': backend.bucket, 'Key': self.temp_key},
+                ContentType='application/pdf',
+                MetadataDirective='REPLACE'
+            )
+        finally:
+            backend.client.delete_object(Bucket=backend.bucket, Key=self.temp_key)
+        return StoredBlob(key=content_hash, size_bytes=self.size_bytes, created=True)
+
+    def _abort(self):
+        self._buffer.clear()
+        if self._upload_id is not None:
+            self.backend.client.abort_multipart_upload(
+                Bucket=self.backend.bucket,
+                Key=self.temp_key,
+                UploadId=self._upload_id
+            )
+            self._upload_id = None
+
+
+class S3StorageBackend(StorageBackend):
+    """
+    Blob storage in an S3 bucket
+
+    Works with any service speaking the S3 API (MinIO, R2, ...) through
+    ``endpoint_url``. Objects are stored as ``<prefix><sha256>``.
+    """
+
+    name = 's3'
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = 'pdfs/',
+        part_size: int = 8 * 1024 * 1024,
+        client: Optional[Any] = None,
+        region_name: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
+        access_key_id: Optional[str] = None,
+        secret_access_key: Optional[str] = None
+    ):
+        """
+        Initialize S3 storage
+
+        Args:
+            bucket: Bucket name
+            prefix: Key prefix for stored blobs
+            part_size: Multipart upload part size in bytes (min 5 MB)
+            client: Pre-configured S3 client (created with boto3 when omitted)
+            region_name: AWS region
+            endpoint_url: Endpoint of an S3-compatible service
+            access_key_id: Access key (default credential chain when omitted)
+            secret_access_key: Secret key
+
+        Raises:
+            ImportError: If boto3 is not installed and no client is given
+            ValueError: If no bucket is configured
+        """
+        if not bucket:
+            raise ValueError("S3 storage requires a bucket name")
+
+        if client is None:
+            try:
+                import boto3
+            except ImportError:
+                raise ImportError("boto3 package is required for S3 storage. Install with: pip install boto3")
+
+            client = boto3.client(
+                's3',
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key
+            )
+
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+        self.part_size = max(part_size, MIN_PART_SIZE)
+
+    def object_key(self, name: str) -> str:
+        """Get full object key for a blob key or temporary name"""
+        return f"{self.prefix}{name}"
+
+    def open_writer(self) -> S3BlobWriter:
+        return S3BlobWriter(self)
+
+    def _head(self, key: str) -> Optional[dict]:
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=self.object_key(validate_key(key)))
+        except Exception as e:
+            if _is_missing(e):
+                return None
+            raise
+
+    def exists(self, key: str) -> bool:
+        return self._head(key) is not None
+
+    def size(self, key: str) -> int:
+        head = self._head(key)
+        if head is None:
+            raise FileNotFoundError(key)
+        return head['ContentLength']
+
+    def open(self, key: str) -> BinaryIO:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self.object_key(validate_key(key)))
+        except Exception as e:
+            if _is_missing(e):
+                raise FileNotFoundError(key)
+            raise
+        return response['Body']
+
+    def read(self, key: str) -> bytes:
+        body = self.open(key)
+        try:
+            return body.read()
+        finally:
+            body.close()
+
+    def delete(self, key: str):
+        self.client.delete_object(Bucket=self.bucket, Key=self.object_key(validate_key(key)))
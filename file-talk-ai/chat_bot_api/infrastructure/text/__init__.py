@@ -0,0 +1,16 @@
+"""Text Processing Infrastructure"""
+from .normalizer import NormalizationReport, TextNormalizer
+from .packer import ContextPacker, PackedContext
+from .tokens import TokenEstimator, prompt_token_budget
+from .summary_tree import SummaryNode, SummaryTree
+
+__all__ = [
+    'NormalizationReport',
+    'TextNormalizer',
+    'ContextPacker',
+    'PackedContext',
+    'TokenEstimator',
+    'prompt_token_budget',
+    'SummaryNode',
+    'SummaryTree',
+]
@@ -0,0 +1,191 @@
+"""
+Text Normalizer
+Strips boilerplate and duplicate content from extracted pages before prompting
+"""
+import hashlib
+import re
+from collections import Counter
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from chat_bot_api.domain.models import PageRecord
+from .tokens import TokenEstimator
+
+_HORIZONTAL_SPACE = re.compile(r'[ \t\u00a0\u2000-\u200b\u3000]+')
+_DIGITS = re.compile(r'\d+')
+_LETTERS = re.compile(r'[^\W\d_]')
+_SENTENCE_ENDS = ('.', '!', '?')
+_HYPHENATED_BREAK = re.compile(r'(\w)[-\u00ad]\n([a-z])')
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+@dataclass
+class NormalizationReport:
+    """What normalization removed from a document"""
+    pages_in: int = 0
+    pages_out: int = 0
+    original_chars: int = 0
+    normalized_chars: int = 0
+    original_tokens: int = 0
+    normalized_tokens: int = 0
+    boilerplate_lines: int = 0
+    boilerplate_lines_removed: int = 0
+    duplicate_pages_removed: int = 0
+    empty_pages_removed: int = 0
+    hyphenations_joined: int = 0
+
+    @property
+    def saved_chars(self) -> int:
+        return self.original_chars - self.normalized_chars
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.normalized_tokens
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert report to dictionary"""
+        data = asdict(self)
+        data['saved_chars'] = self.saved_chars
+        data['saved_tokens'] = self.saved_tokens
+        return data
+
+
+class TextNormalizer:
+    """
+    Normalization stage between page extraction and prompt building
+
+    1. Collapses runs of horizontal whitespace and strips every line.
+    2. Finds lines repeated across pages (running headers, footers,
+       copyright lines) by hashing a canonical form of each line and drops
+       lines found on at least ``boilerplate_ratio`` of the pages. Only the
+       first and last ``edge_lines`` lines of a page are considered, and
+       lines without letters (table cells, bare numbers) never are, so
+       body content is kept however often it repeats. Digits are masked in
+       short lines that are not sentences, so "Page 3 of 10" matches
+       "Page 4 of 10"; other lines must repeat exactly.
+    3. Joins words hyphenated across line breaks.
+    4. Drops pages left empty (blank or scanned pages, pure boilerplate)
+       and pages whose remaining text is identical to an earlier page
+       (repeated slides, duplicated scans).
+
+    Documents shorter than ``min_pages`` skip step 2, since a line seen on
+    both pages of a two-page document is not evidence of boilerplate.
+    """
+
+    def __init__(
+        self,
+        min_pages: int = 3,
+        boilerplate_ratio: float = 0.5,
+        max_line_length: int = 200,
+        mask_digits_max_length: int = 60,
+        edge_lines: int = 2,
+        estimator: Optional[TokenEstimator] = None
+    ):
+        """
+        Initialize normalizer
+
+        Args:
+            min_pages: Minimum pages before repeated lines count as boilerplate
+            boilerplate_ratio: Fraction of pages a line must appear on to be dropped
+            max_line_length: Longer lines are never treated as boilerplate
+            mask_digits_max_length: Lines up to this length match regardless of numbers
+            edge_lines: Lines at the top and at the bottom of a page that may be boilerplate
+            estimator: Token estimator for the report (default TokenEstimator())
+        """
+        self.min_pages = min_pages
+        self.boilerplate_ratio = boilerplate_ratio
+        self.max_line_length = max_line_length
+        self.mask_digits_max_length = mask_digits_max_length
+        self.edge_lines = edge_lines
+        self.estimator = estimator or TokenEstimator()
+
+    def normalize(self, pages: Iterable[PageRecord]) -> Tuple[List[PageRecord], NormalizationReport]:
+        """
+        Normalize the pages of one document
+
+        Args:
+            pages: Extracted pages in order
+
+        Returns:
+            tuple: Normalized pages (with recomputed offsets) and the report
+        """
+        report = NormalizationReport()
+        originals: List[PageRecord] = []
+        page_lines: List[List[str]] = []
+
+        for page in pages:
+            report.pages_in += 1
+            report.original_chars += len(page.text)
+            report.original_tokens += self._tokens(page)
+            originals.append(page)
+            page_lines.append([_HORIZONTAL_SPACE.sub(' ', line).strip() for line in page.text.splitlines()])
+
+        boilerplate = self._find_boilerplate(page_lines)
+        report.boilerplate_lines = len(boilerplate)
+
+        normalized: List[PageRecord] = []
+        seen_pages = set()
+        offset = 0
+
+        for page, lines in zip(originals, page_lines):
+            kept = []
+            candidates = self._candidate_lines(lines) if boilerplate else set()
+            for index, line in enumerate(lines):
+                if index in candidates and self._line_key(line) in boilerplate:
+                    report.boilerplate_lines_removed += 1
+                    continue
+                kept.append(line)
+
+            text, joined = _HYPHENATED_BREAK.subn(r'\1\2', "\n".join(kept))
+            report.hyphenations_joined += joined
+            text = _BLANK_LINES.sub('\n\n', text).strip()
+            text = f"{text}\n" if text else text
+
+            if not text:
+                report.empty_pages_removed += 1
+                continue
+
+            page_hash = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+            if page_hash in seen_pages:
+                report.duplicate_pages_removed += 1
+                continue
+            seen_pages.add(page_hash)
+
+            tokens = page.tokens if text == page.text and page.tokens is not None else self.estimator.estimate(text)
+            normalized.append(PageRecord(page.number, text, offset, offset + len(text), tokens))
+            offset += len(text)
+            report.normalized_chars += len(text)
+            report.normalized_tokens += tokens
+
+        report.pages_out = len(normalized)
+        return normalized, report
+
+    def _tokens(self, page: PageRecord) -> int:
+        return page.tokens if page.tokens is not None else self.estimator.estimate(page.text)
+
+    def _find_boilerplate(self, page_lines: List[List[str]]) -> set:
+        """Get keys of lines that repeat on enough pages to be boilerplate"""
+        if len(page_lines) < self.min_pages:
+            return set()
+
+        counts = Counter()
+        for lines in page_lines:
+            counts.update({self._line_key(lines[index]) for index in self._candidate_lines(lines)})
+
+        threshold = max(self.min_pages, self.boilerplate_ratio * len(page_lines))
+        return {key for key, pages in counts.items() if pages >= threshold}
+
+    def _candidate_lines(self, lines: List[str]) -> set:
+        """Indexes of the lines of a page that may be running headers or footers"""
+        filled = [index for index, line in enumerate(lines) if line]
+        edges = filled[:self.edge_lines] + filled[-self.edge_lines:] if self.edge_lines else []
+        return {
+            index for index in edges
+            if len(lines[index]) <= self.max_line_length and _LETTERS.search(lines[index])
+        }
+
+    def _line_key(self, line: str) -> bytes:
+        """Hash of a line with case (and, for short non-sentence lines, numbers) masked"""
+        canonical = line.lower()
+        if len(canonical) <= self.mask_digits_max_length and not canonical.endswith(_SENTENCE_ENDS):
+            canonical = _DIGITS.sub('#', canonical)
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=8).digest()
@@ -0,0 +1,255 @@
+"""
+Context Packer
+Fits page text into a prompt token budget
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from chat_bot_api.domain.models import PageRecord
+from .tokens import TokenEstimator
+
+# End of a sentence or paragraph; truncated pages are cut right after one
+_SENTENCE_END = re.compile(r'[.!?]["\')\]]?\s|\n\s*\n')
+
+
+@dataclass
+class PackedContext:
+    """Pages selected for a prompt"""
+    pages: List[PageRecord]
+    tokens: int
+    budget_tokens: int
+    dropped_pages: List[int] = field(default_factory=list)
+    truncated_pages: List[int] = field(default_factory=list)
+    exhausted: bool = False  # Budget ran out before the input did
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary for logging"""
+        return {
+            'pages': len(self.pages),
+            'tokens': self.tokens,
+            'budget_tokens': self.budget_tokens,
+            'dropped_pages': len(self.dropped_pages),
+            'truncated_pages': self.truncated_pages,
+            'exhausted': self.exhausted,
+        }
+
+
+class ContextPacker:
+    """
+    Selects pages for a prompt within a token budget
+
+    Without scores pages are taken in document order and the input is only
+    consumed until the budget is full, so lazy page iterators stop
+    extracting early. With scores the highest-scoring pages that fit are
+    chosen and returned in document order. Either way, the page that no
+    longer fits may be included up to its last complete sentence when
+    enough budget is left, instead of being cut mid-sentence.
+    """
+
+    def __init__(
+        self,
+        budget_tokens: int,
+        estimator: Optional[TokenEstimator] = None,
+        min_fragment_tokens: int = 64
+    ):
+        """
+        Initialize packer
+
+        Args:
+            budget_tokens: Tokens the selected pages (with their markers) may use
+            estimator: Token estimator (default TokenEstimator())
+            min_fragment_tokens: Smallest truncated page worth including
+        """
+        self.budget_tokens = budget_tokens
+        self.estimator = estimator or TokenEstimator()
+        self.min_fragment_tokens = min_fragment_tokens
+
+    def page_tokens(self, page: PageRecord) -> int:
+        """Tokens a page costs in the prompt, including its marker"""
+        text_tokens = page.tokens if page.tokens is not None else self.estimator.estimate(page.text)
+        return text_tokens + self.estimator.estimate(page.marker)
+
+    def pack(self, pages: Iterable[PageRecord], scores: Optional[Dict[int, float]] = None) -> PackedContext:
+        """
+        Select pages that fit the budget
+
+        Args:
+            pages: Candidate pages in document order
+            scores: Optional page_number -> priority (higher first)
+
+        Returns:
+            PackedContext: Selected pages with recomputed offsets
+        """
+        if scores is None:
+            return self._pack_in_order(pages)
+        return self._pack_by_score(list(pages), scores)
+
+    def split(self, pages: Iterable[PageRecord]) -> List[PackedContext]:
+        """
+        Split pages into consecutive groups that each fit the budget
+
+        A page too large for a group of its own is cut at sentence
+        boundaries (word boundaries if it has none) and continues in the
+        following groups, so none of its text is lost.
+
+        Args:
+            pages: Pages in document order
+
+        Returns:
+            list: Groups in document order, each with recomputed offsets
+        """
+        groups: List[PackedContext] = []
+        current = PackedContext(pages=[], tokens=0, budget_tokens=self.budget_tokens)
+
+        for page in pages:
+            cost = self.page_tokens(page)
+            if current.pages and current.tokens + cost > self.budget_tokens:
+                groups.append(current)
+                current = PackedContext(pages=[], tokens=0, budget_tokens=self.budget_tokens)
+
+            # An oversized page starts an empty group and fills whole groups
+            while cost > self.budget_tokens:
+                head, page = self._cut(page, self.budget_tokens)
+                if head is None:
+                    current.dropped_pages.append(page.number)
+                    break
+                current.pages.append(head)
+                current.tokens += self.page_tokens(head)
+                current.truncated_pages.append(head.number)
+                groups.append(current)
+                current = PackedContext(pages=[], tokens=0, budget_tokens=self.budget_tokens)
+                cost = self.page_tokens(page) if page.text.strip() else 0
+            else:
+                if cost:
+                    current.pages.append(page)
+                    current.tokens += cost
+
+        if current.pages:
+            groups.append(current)
+
+        for group in groups:
+            group.pages = self._with_offsets(group.pages)
+        return groups
+
+    def _pack_in_order(self, pages: Iterable[PageRecord]) -> PackedContext:
+        selected: List[PageRecord] = []
+        packed = PackedContext(pages=selected, tokens=0, budget_tokens=self.budget_tokens)
+
+        for page in pages:
+            cost = self.page_tokens(page)
+            if packed.tokens + cost <= self.budget_tokens:
+                selected.append(page)
+                packed.tokens += cost
+                continue
+
+            self._add_fragment(packed, page)
+            packed.exhausted = True
+            break
+
+        packed.pages = self._with_offsets(selected)
+        return packed
+
+    def _pack_by_score(self, pages: List[PageRecord], scores: Dict[int, float]) -> PackedContext:
+        selected: List[PageRecord] = []
+        packed = PackedContext(pages=selected, tokens=0, budget_tokens=self.budget_tokens)
+        skipped: List[PageRecord] = []
+
+        for page in sorted(pages, key=lambda p: (-scores.get(p.number, 0.0), p.number)):
+            cost = self.page_tokens(page)
+            if packed.tokens + cost <= self.budget_tokens:
+                selected.append(page)
+                packed.tokens += cost
+            else:
+                skipped.append(page)
+
+        # Fill what is left with the best page that did not fit
+        if skipped and self._add_fragment(packed, skipped[0]):
+            skipped = skipped[1:]
+
+        packed.dropped_pages = sorted(page.number for page in skipped)
+        packed.exhausted = bool(skipped)
+        packed.pages = self._with_offsets(sorted(selected, key=lambda p: p.number))
+        return packed
+
+    def _add_fragment(self, packed: PackedContext, page: PageRecord) -> bool:
+        """Add the page cut at a sentence boundary if a useful part fits"""
+        fragment = self._truncate(page, self.budget_tokens - packed.tokens)
+        if fragment is None:
+            packed.dropped_pages.append(page.number)
+            return False
+
+        packed.pages.append(fragment)
+        packed.tokens += self.page_tokens(fragment)
+        packed.truncated_pages.append(page.number)
+        return True
+
+    def _truncate(self, page: PageRecord, available_tokens: int) -> Optional[PageRecord]:
+        """Longest sentence-aligned prefix of the page that fits, if worth including"""
+        available_tokens -= self.estimator.estimate(page.marker)
+        if available_tokens < self.min_fragment_tokens:
+            return None
+
+        text_tokens = page.tokens if page.tokens is not None else self.estimator.estimate(page.text)
+        if not text_tokens:
+            return None
+        limit = int(len(page.text) * available_tokens / text_tokens)
+
+        while limit > 0:
+            cut = None
+            for match in _SENTENCE_END.finditer(page.text, 0, limit):
+                cut = match.end()
+            if cut is None:
+                return None
+
+            text = page.text[:cut].rstrip() + "\n"
+            tokens = self.estimator.estimate(text)
+            if tokens < self.min_fragment_tokens:
+                return None
+            if tokens <= available_tokens:
+                return PageRecord(page.number, text, 0, len(text), tokens)
+            limit = cut - 1
+
+        return None
+
+    def _cut(self, page: PageRecord, available_tokens: int) -> Tuple[Optional[PageRecord], PageRecord]:
+        """Split a page into a prefix that fits and a page holding the rest of its text"""
+        head = self._truncate(page, available_tokens) or self._truncate_at_word(page, available_tokens)
+        if head is None:
+            return None, page
+
+        rest = page.text[len(head.text.rstrip()):].lstrip()
+        return head, PageRecord(page.number, rest, 0, len(rest))
+
+    def _truncate_at_word(self, page: PageRecord, available_tokens: int) -> Optional[PageRecord]:
+        """Longest word-aligned prefix of the page that fits, for text without sentence ends"""
+        available_tokens -= self.estimator.estimate(page.marker)
+        if available_tokens < self.min_fragment_tokens:
+            return None
+
+        text_tokens = page.tokens if page.tokens is not None else self.estimator.estimate(page.text)
+        if not text_tokens:
+            return None
+        limit = int(len(page.text) * available_tokens / text_tokens)
+
+        while limit > 0:
+            cut = page.text.rfind(' ', 0, limit)
+            if cut <= 0:
+                cut = limit
+
+            text = page.text[:cut].rstrip() + "\n"
+            tokens = self.estimator.estimate(text)
+            if 0 < tokens <= available_tokens:
+                return PageRecord(page.number, text, 0, len(text), tokens)
+            limit = cut - 1
+
+        return None
+
+    @staticmethod
+    def _with_offsets(pages: List[PageRecord]) -> List[PageRecord]:
+        """Recompute character offsets for the selected pages"""
+        result = []
+        offset = 0
+        for page in pages:
+            result.append(page._replace(start=offset, end=offset + len(page.text)))
+            offset += len(page.text)
+        return result
@@ -0,0 +1,112 @@
+"""
+Summary Tree
+Page-aligned node layout for reusable range summaries
+"""
+from typing import List, NamedTuple
+
+
+class SummaryNode(NamedTuple):
+    """
+    One summarizable page range
+
+    Aligned nodes sit on the tree grid and are shared by every range that
+    covers them; unaligned nodes are the leftover pages at the edges of a
+    range and are only reused when the same edge is requested again.
+    """
+    level: int
+    first_page: int
+    last_page: int
+    aligned: bool = True
+
+    @property
+    def is_leaf(self) -> bool:
+        """Whether the node is summarized from page text rather than from child summaries"""
+        return self.level == 0
+
+    @property
+    def title(self) -> str:
+        if self.first_page == self.last_page:
+            return f"Page {self.first_page}"
+        return f"Pages {self.first_page}-{self.last_page}"
+
+
+class SummaryTree:
+    """
+    Fixed grid of page blocks summarized bottom-up
+
+    Level 0 nodes are aligned blocks of ``leaf_pages`` pages; a level ``l``
+    node covers ``fanout`` consecutive level ``l - 1`` nodes, so its span
+    is ``leaf_pages * fanout ** l`` pages. Because node boundaries do not
+    depend on the requested range, any range decomposes into a handful of
+    nodes that other ranges share (like a segment tree): at most
+    ``fanout - 1`` nodes per level on each side, plus at most one partial
+    block at each edge.
+    """
+
+    def __init__(self, leaf_pages: int = 8, fanout: int = 4):
+        """
+        Initialize tree layout
+
+        Args:
+            leaf_pages: Pages per leaf block
+            fanout: Children per internal node
+        """
+        if leaf_pages < 1:
+            raise ValueError("leaf_pages must be at least 1")
+        if fanout < 2:
+            raise ValueError("fanout must be at least 2")
+        self.leaf_pages = leaf_pages
+        self.fanout = fanout
+
+    def span(self, level: int) -> int:
+        """Pages covered by a node of the given level"""
+        return self.leaf_pages * self.fanout ** level
+
+    def decompose(self, first_page: int, last_page: int) -> List[SummaryNode]:
+        """
+        Cover a page range with the fewest, largest nodes
+
+        Args:
+            first_page: First page of the range (1-based)
+            last_page: Last page of the range (inclusive)
+
+        Returns:
+            list: Consecutive nodes covering exactly the range
+        """
+        nodes: List[SummaryNode] = []
+        page = first_page
+
+        while page <= last_page:
+            offset = page - 1
+            if offset % self.leaf_pages or page + self.leaf_pages - 1 > last_page:
+                # Edge of the range: up to the next block boundary
+                end = min(last_page, (offset // self.leaf_pages + 1) * self.leaf_pages)
+                nodes.append(SummaryNode(0, page, end, aligned=False))
+                page = end + 1
+                continue
+
+            level = 0
+            while offset % self.span(level + 1) == 0 and page + self.span(level + 1) - 1 <= last_page:
+                level += 1
+            nodes.append(SummaryNode(level, page, page + self.span(level) - 1))
+            page += self.span(level)
+
+        return nodes
+
+    def children(self, node: SummaryNode) -> List[SummaryNode]:
+        """
+        Get the nodes an internal node is merged from
+
+        Args:
+            node: Aligned node above level 0
+
+        Returns:
+            list: ``fanout`` nodes one level down, in page order
+        """
+        if node.is_leaf or not node.aligned:
+            return []
+        span = self.span(node.level - 1)
+        return [
+            SummaryNode(node.level - 1, start, start + span - 1)
+            for start in range(node.first_page, node.last_page + 1, span)
+        ]
@@ -0,0 +1,68 @@
+"""
+Token Estimation
+Fast local token estimates and per-model prompt budgets
+"""
+import re
+from config.constants import ModelLimits
+
+_WORDS = re.compile(r'[A-Za-z]+')
+_NUMBERS = re.compile(r'\d+')
+_SYMBOLS = re.compile(r'[^\sA-Za-z\d]')
+
+
+class TokenEstimator:
+    """
+    Tokenizer-free token estimate for BPE models
+
+    Approximates a Llama-style tokenizer without loading one: ASCII words
+    cost one token plus one per further 7 letters, digits are split into
+    groups of three, and every other non-space character (punctuation,
+    non-Latin script) costs one token. The result is scaled by
+    ``safety_factor`` so budgets err on the side of fitting.
+    """
+
+    def __init__(self, safety_factor: float = 1.1):
+        """
+        Initialize estimator
+
+        Args:
+            safety_factor: Multiplier applied to the raw estimate
+        """
+        self.safety_factor = safety_factor
+
+    def estimate(self, text: str) -> int:
+        """
+        Estimate the number of tokens in a text
+
+        Args:
+            text: Text to measure
+
+        Returns:
+            int: Estimated token count
+        """
+        if not text:
+            return 0
+
+        tokens = sum(1 + len(word) // 7 for word in _WORDS.findall(text))
+        tokens += sum((len(number) + 2) // 3 for number in _NUMBERS.findall(text))
+        tokens += len(_SYMBOLS.findall(text))
+        return int(tokens * self.safety_factor + 0.5)
+
+
+def prompt_token_budget(model_id: str, reserved_output_tokens: int, limit: int = 0) -> int:
+    """
+    Get the number of prompt tokens a request to a model may use
+
+    Args:
+        model_id: Model the prompt is sent to
+        reserved_output_tokens: Tokens kept free for the completion
+        limit: Deployment cap, e.g. for rate limits (0 = none)
+
+    Returns:
+        int: Prompt token budget
+    """
+    window = ModelLimits.CONTEXT_WINDOWS.get(model_id, ModelLimits.DEFAULT_CONTEXT_WINDOW)
+    budget = window - reserved_output_tokens - ModelLimits.PROMPT_OVERHEAD_TOKENS
+    if limit > 0:
+        budget = min(budget, limit)
+    return max(budget, 0)
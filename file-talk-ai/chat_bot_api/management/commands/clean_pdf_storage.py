@@ -0,0 +1,62 @@
+"""
+Clean PDF Storage Command
+Runs one storage janitor sweep from the command line
+"""
+import json
+from django.core.management.base import BaseCommand, CommandError
+from chat_bot_api.infrastructure.storage import StorageJanitor, get_storage_janitor
+from chat_bot_api.infrastructure.storage.janitor import EVICTION_POLICIES
+
+
+class Command(BaseCommand):
+    help = "Evict cached PDFs over the byte budget or TTL and remove leftover temp files"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="Report what would be removed without removing it")
+        parser.add_argument('--max-bytes', type=int, help="Byte budget for cached downloads (overrides STORAGE_JANITOR_MAX_BYTES)")
+        parser.add_argument('--ttl', type=int, help="Expire cached downloads unused for this many seconds")
+        parser.add_argument('--policy', choices=EVICTION_POLICIES, help="Eviction order above budget")
+        parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+
+    def handle(self, *args, **options):
+        janitor = get_storage_janitor()
+
+        overrides = {
+            'max_bytes': options['max_bytes'],
+            'ttl_seconds': options['ttl'],
+            'policy': options['policy'],
+        }
+        if any(value is not None for value in overrides.values()):
+            janitor = StorageJanitor(
+                janitor.storage_path,
+                download_cache=janitor.download_cache,
+                upload_storage=janitor.upload_storage,
+                lock_dir=janitor.lock_dir,
+                max_bytes=janitor.max_bytes if overrides['max_bytes'] is None else overrides['max_bytes'],
+                ttl_seconds=janitor.ttl_seconds if overrides['ttl_seconds'] is None else overrides['ttl_seconds'],
+                policy=overrides['policy'] or janitor.policy,
+                grace_seconds=janitor.grace_seconds
+            )
+
+        report = janitor.sweep(dry_run=options['dry_run'])
+        if report.skipped:
+            raise CommandError("Another process is cleaning the storage directory; try again later")
+
+        if options['json']:
+            self.stdout.write(json.dumps(report.to_dict(), indent=2))
+            return
+
+        prefix = "[dry run] " if report.dry_run else ""
+        self.stdout.write(f"{prefix}Reclaimed {report.reclaimed_bytes} bytes in {report.duration_ms} ms")
+        self.stdout.write(
+            f"  cached PDFs: {report.expired_blobs} expired, {report.evicted_blobs} evicted, "
+            f"{report.removed_metadata} metadata files removed"
+        )
+        self.stdout.write(
+            f"  leftovers: {report.removed_temp_files} temp files, {report.removed_scratch_files} scratch files, "
+            f"{report.removed_lock_files} lock files"
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Working set: {report.working_set_bytes} bytes in {report.working_set_files} cached PDFs "
+            f"(uploads: {report.uploads_bytes} bytes)"
+        ))
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat_bot_api', '0003_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='content_sha256',
+            field=models.CharField(blank=True, db_index=True, default='', help_text='SHA-256 of the document content', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='extraction_status',
+            field=models.CharField(choices=[('pending', 'PENDING'), ('processing', 'PROCESSING'), ('completed', 'COMPLETED'), ('failed', 'FAILED')], default='pending', help_text='Status of the last text extraction', max_length=20),
+        ),
+    ]
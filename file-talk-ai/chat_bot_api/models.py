@@ -4,7 +4,7 @@ Defines data models for the application
 """
 from django.db import models
 from django.contrib.auth.models import User
-from chat_bot_api.domain.enums import ActionTypeEnum, UserTypeEnum
+from chat_bot_api.domain.enums import ActionTypeEnum, UserTypeEnum, ExtractionStatusEnum
 
 
 class BaseModel(models.Model):
@@ -26,6 +26,19 @@ class Document(BaseModel):
     file_hash = models.CharField(max_length=64, db_index=True, help_text="Hash of document URL")
     total_pages = models.IntegerField(null=True, blank=True, help_text="Total number of pages")
     file_size_bytes = models.BigIntegerField(null=True, blank=True, help_text="File size in bytes")
+    content_sha256 = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        db_index=True,
+        help_text="SHA-256 of the document content"
+    )
+    extraction_status = models.CharField(
+        max_length=20,
+        choices=ExtractionStatusEnum.choices(),
+        default=ExtractionStatusEnum.PENDING.value,
+        help_text="Status of the last text extraction"
+    )
 
     class Meta:
         db_table = 'documents'
@@ -0,0 +1,110 @@
+"""
+HTTP Server Fixture
+Local stand-in for a static file host, with or without byte range support
+"""
+import hashlib
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+_RANGE_RE = re.compile(r'bytes=(\d+)-(\d*)$')
+
+
+class LocalFileServer:
+    """
+    Serves in-memory files over HTTP on a random local port
+
+    ``ranges`` makes the server advertise and honour single byte ranges
+    with 206 responses; ``advertise_ranges`` alone advertises them but
+    answers every GET with the full file, like a misconfigured proxy.
+    ``validators`` controls whether an ETag is sent.
+    Requests are recorded as (method, path, Range header).
+
+    Use as a context manager.
+    """
+
+    def __init__(
+        self,
+        files: Dict[str, bytes],
+        ranges: bool = True,
+        advertise_ranges: Optional[bool] = None,
+        validators: bool = True
+    ):
+        self.files = files
+        self.validators = validators
+        self.ranges = ranges
+        self.advertise_ranges = ranges if advertise_ranges is None else advertise_ranges
+        self.requests: List[Tuple[str, str, str]] = []
+        self._bytes_sent = 0
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        """Absolute URL of a served path"""
+        return f"http://127.0.0.1:{self._server.server_address[1]}{path}"
+
+    @property
+    def bytes_sent(self) -> int:
+        """Body bytes sent for GET requests"""
+        return self._bytes_sent
+
+    def __enter__(self) -> 'LocalFileServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_HEAD(self):
+                self._respond(send_body=False)
+
+            def do_GET(self):
+                self._respond(send_body=True)
+
+            def _respond(self, send_body: bool):
+                range_header = self.headers.get('Range', '')
+                server.requests.append((self.command, self.path, range_header))
+
+                data = server.files.get(self.path)
+                if data is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                status, body, content_range = 200, data, None
+                match = _RANGE_RE.match(range_header)
+                if send_body and server.ranges and match:
+                    start = int(match.group(1))
+                    end = min(int(match.group(2)) if match.group(2) else len(data) - 1, len(data) - 1)
+                    status, body = 206, data[start:end + 1]
+                    content_range = f"bytes {start}-{end}/{len(data)}"
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/pdf')
+                self.send_header('Content-Length', str(len(body)))
+                if server.validators:
+                    self.send_header('ETag', f'"{hashlib.md5(data).hexdigest()}"')
+                if server.advertise_ranges:
+                    self.send_header('Accept-Ranges', 'bytes')
+                if content_range:
+                    self.send_header('Content-Range', content_range)
+                self.end_headers()
+
+                if send_body:
+                    self.wfile.write(body)
+                    server._bytes_sent += len(body)
+
+        return Handler
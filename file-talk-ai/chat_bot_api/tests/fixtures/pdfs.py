@@ -0,0 +1,32 @@
+"""
+PDF Fixtures
+Small generated documents for extraction and fetching tests
+"""
+import fitz  # PyMuPDF
+
+
+def page_text(number: int) -> str:
+    """Text written on a generated page"""
+    return f"page {number}"
+
+
+def build_pdf(pages: int, filler_lines: int = 0, **save_options) -> bytes:
+    """
+    Build a PDF whose pages say their own number
+
+    Args:
+        pages: Page count
+        filler_lines: Extra lines of text per page (makes pages larger)
+        **save_options: Options passed to fitz.Document.tobytes
+
+    Returns:
+        bytes: PDF document
+    """
+    doc = fitz.open()
+    for number in range(1, pages + 1):
+        page = doc.new_page()
+        page.insert_text((72, 72), page_text(number))
+        if filler_lines:
+            filler = "\n".join(f"filler line {line} of page {number} " * 3 for line in range(filler_lines))
+            page.insert_textbox(fitz.Rect(72, 90, 540, 800), filler, fontsize=8)
+    return doc.tobytes(**save_options)
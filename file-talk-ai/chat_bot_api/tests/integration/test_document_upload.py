@@ -0,0 +1,128 @@
+"""
+Document Upload Tests
+POST /documents/upload/ streaming into a temporary local store
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+from config.constants import ErrorCode, FileConstants
+from config.env_config import config
+from chat_bot_api.api.v1.upload_handlers import StreamingPDFUploadHandler
+from chat_bot_api.infrastructure.cache import NullCache
+from chat_bot_api.infrastructure.storage import LocalStorageBackend
+from chat_bot_api.models import Document
+from chat_bot_api.tests.fixtures.pdfs import build_pdf
+
+SERVICE = 'chat_bot_api.application.services.pdf_service'
+
+
+class DocumentUploadTests(TestCase):
+    """document_upload_handler with StreamingPDFUploadHandler"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.document = build_pdf(3, filler_lines=40)
+
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, True)
+        self.storage = LocalStorageBackend(root)
+        self.enterContext(mock.patch(f'{SERVICE}.get_storage_backend', return_value=self.storage))
+        self.enterContext(mock.patch(f'{SERVICE}.get_cache', return_value=NullCache()))
+        self.enterContext(mock.patch.object(config, 'DOCUMENT_REGISTRY_ENABLED', True))
+        # Small chunks, so a file crosses the size limit part-way through the body
+        self.enterContext(mock.patch.object(StreamingPDFUploadHandler, 'chunk_size', 4096))
+
+    def upload(self, content: bytes, field_name: str = FileConstants.UPLOAD_FIELD_NAME):
+        upload = SimpleUploadedFile('paper.pdf', content, content_type='application/pdf')
+        return self.client.post(reverse('chat_bot_document_upload'), {field_name: upload})
+
+    def stored_keys(self) -> list:
+        return [key for key, _, _ in self.storage.iter_blobs()]
+
+    def temp_files(self) -> list:
+        return os.listdir(self.storage.tmp_dir)
+
+    def assert_error(self, response, error_code: str):
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(error_code, response.content.decode())
+
+    def test_upload_is_hashed_stored_and_registered(self):
+        response = self.upload(self.document)
+
+        self.assertEqual(response.status_code, 201)
+        data = response.json()['content']['data']
+        content_hash = hashlib.sha256(self.document).hexdigest()
+        self.assertEqual(data['content_sha256'], content_hash)
+        self.assertEqual(data['size_bytes'], len(self.document))
+        self.assertEqual(data['total_pages'], 3)
+        self.assertEqual(data['file_name'], 'paper.pdf')
+
+        self.assertEqual(self.stored_keys(), [content_hash])
+        with open(self.storage.path_for(content_hash), 'rb') as f:
+            self.assertEqual(f.read(), self.document)
+        self.assertEqual(self.temp_files(), [])
+        self.assertEqual(Document.objects.get(id=data['document_id']).content_sha256, content_hash)
+
+    def test_same_content_is_stored_once(self):
+        first = self.upload(self.document).json()['content']['data']
+        second = self.upload(self.document).json()['content']['data']
+
+        self.assertEqual(first['document_id'], second['document_id'])
+        self.assertEqual(len(self.stored_keys()), 1)
+        self.assertEqual(self.temp_files(), [])
+
+    def test_oversized_file_is_rejected_while_streaming(self):
+        limit = len(self.document) - 1000
+        with mock.patch.object(FileConstants, 'MAX_FILE_SIZE_BYTES', limit):
+            response = self.upload(self.document)
+
+        self.assert_error(response, ErrorCode.PDF_TOO_LARGE)
+        self.assertEqual(self.stored_keys(), [])
+        self.assertEqual(self.temp_files(), [])
+
+    def test_oversized_body_is_rejected_before_reading(self):
+        with mock.patch.object(FileConstants, 'MAX_FILE_SIZE_BYTES', 1024), \
+                mock.patch.object(LocalStorageBackend, 'open_writer') as open_writer:
+            response = self.upload(b'%PDF-1.7\n' + b'x' * 20000)
+
+        self.assert_error(response, ErrorCode.PDF_TOO_LARGE)
+        open_writer.assert_not_called()
+
+    def test_non_pdf_is_rejected_on_the_first_chunk(self):
+        response = self.upload(b'<html>' + b'x' * 20000)
+
+        self.assert_error(response, ErrorCode.PDF_INVALID_FORMAT)
+        self.assertEqual(self.stored_keys(), [])
+        self.assertEqual(self.temp_files(), [])
+
+    def test_corrupt_pdf_is_removed_from_storage(self):
+        response = self.upload(b'%PDF-1.7\n' + b'\x00garbage' * 2000)
+
+        self.assert_error(response, ErrorCode.PDF_INVALID_FORMAT)
+        self.assertEqual(self.stored_keys(), [])
+        self.assertEqual(Document.objects.count(), 0)
+
+    def test_missing_file_field(self):
+        response = self.upload(self.document, field_name='attachment')
+
+        self.assert_error(response, ErrorCode.VALIDATION_ERROR)
+        self.assertEqual(self.stored_keys(), [])
+        self.assertEqual(self.temp_files(), [])
+
+    def test_interrupted_upload_leaves_no_temp_file(self):
+        handler = StreamingPDFUploadHandler(mock.Mock(), self.storage)
+        handler.new_file(FileConstants.UPLOAD_FIELD_NAME, 'paper.pdf', 'application/pdf', None)
+        handler.receive_data_chunk(self.document[:4096], 0)
+        self.assertEqual(len(self.temp_files()), 1)
+
+        handler.upload_interrupted()
+
+        self.assertEqual(self.temp_files(), [])
+        self.assertIsNone(handler.upload)
@@ -0,0 +1,67 @@
+"""
+Extraction Status Tests
+Registry status of documents extracted through iter_document_pages
+"""
+from unittest import mock
+from django.test import TestCase
+from config.env_config import config
+from chat_bot_api.application.services.pdf_service import PDFService
+from chat_bot_api.domain.enums import ExtractionStatusEnum
+from chat_bot_api.infrastructure.cache import NullCache
+from chat_bot_api.tests.fixtures.http_server import LocalFileServer
+from chat_bot_api.tests.fixtures.pdfs import build_pdf
+
+PAGES = 4
+
+
+@mock.patch.object(config, 'PDF_DOWNLOAD_MODE', 'memory')
+@mock.patch.object(config, 'PDF_DOWNLOAD_CACHE_ENABLED', False)
+@mock.patch.object(config, 'DOCUMENT_REGISTRY_ENABLED', True)
+class ExtractionStatusTests(TestCase):
+    """Status transitions of a registered document"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.document = build_pdf(PAGES)
+
+    def setUp(self):
+        with mock.patch('chat_bot_api.application.services.pdf_service.get_cache', return_value=NullCache()):
+            self.service = PDFService()
+        self.service.range_fetcher = None
+        server = self.enterContext(LocalFileServer({'/doc.pdf': self.document}))
+        self.url = server.url('/doc.pdf')
+
+    def status(self) -> str:
+        return self.service.lookup_document(self.url).extraction_status
+
+    def test_fully_consumed_range_is_completed(self):
+        pages = list(self.service.iter_document_pages(self.url, 1, PAGES))
+
+        self.assertEqual(len(pages), PAGES)
+        self.assertEqual(self.status(), ExtractionStatusEnum.COMPLETED.value)
+
+    def test_abandoned_iteration_reverts_to_the_previous_status(self):
+        pages = self.service.iter_document_pages(self.url, 1, PAGES)
+        next(pages)
+        self.assertEqual(self.status(), ExtractionStatusEnum.PROCESSING.value)
+
+        pages.close()
+
+        self.assertEqual(self.status(), ExtractionStatusEnum.PENDING.value)
+
+    def test_abandoned_iteration_keeps_an_earlier_completion(self):
+        list(self.service.iter_document_pages(self.url, 1, PAGES))
+
+        pages = self.service.iter_document_pages(self.url, 1, PAGES)
+        next(pages)
+        pages.close()
+
+        self.assertEqual(self.status(), ExtractionStatusEnum.COMPLETED.value)
+
+    def test_unexpected_error_marks_the_document_failed(self):
+        with mock.patch.object(self.service, 'iter_pages', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                list(self.service.iter_document_pages(self.url, 1, PAGES))
+
+        self.assertEqual(self.status(), ExtractionStatusEnum.FAILED.value)
@@ -0,0 +1,204 @@
+"""
+Range Fetcher Tests
+Partial PDF fetching against a local range-capable HTTP server
+"""
+import os
+import tempfile
+from unittest import mock
+import fitz  # PyMuPDF
+import requests
+from django.test import TestCase
+from config.env_config import config
+from chat_bot_api.application.services.pdf_service import PDFBuffer, PDFService
+from chat_bot_api.infrastructure.pdf import RangeFetcher, RangeFetchUnsupported
+from chat_bot_api.tests.fixtures.http_server import LocalFileServer
+from chat_bot_api.tests.fixtures.pdfs import build_pdf, page_text
+
+PAGES = 80
+
+
+def page_texts(data: bytes):
+    """Text of every page of a PDF"""
+    with fitz.open(stream=data, filetype='pdf') as doc:
+        return [page.get_text() for page in doc]
+
+
+class RangeFetcherTests(TestCase):
+    """RangeFetcher against a local static file host"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.document = build_pdf(PAGES, filler_lines=60)
+        cls.session = requests.Session()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.session.close()
+        super().tearDownClass()
+
+    def fetcher(self, **options) -> RangeFetcher:
+        return RangeFetcher(http_get=self.session.get, http_head=self.session.head, timeout=5, **options)
+
+    def test_fetches_only_the_requested_pages(self):
+        with LocalFileServer({'/doc.pdf': self.document}) as server:
+            partial = self.fetcher().fetch_pages(server.url('/doc.pdf'), 3, 5)
+
+        self.assertEqual(partial.page_numbers, [3, 4, 5])
+        self.assertEqual(partial.total_pages, PAGES)
+        self.assertEqual(partial.source_size, len(self.document))
+        self.assertLess(partial.bytes_fetched, len(self.document) / 2)
+        self.assertEqual(partial.bytes_fetched, server.bytes_sent)
+        self.assertTrue(all(header.startswith('bytes=') for method, _, header in server.requests if method == 'GET'))
+
+    def test_rebuilt_pages_map_to_original_pages(self):
+        with LocalFileServer({'/doc.pdf': self.document}) as server:
+            partial = self.fetcher().fetch_pages(server.url('/doc.pdf'), 7, 9)
+
+        original = page_texts(self.document)
+        rebuilt = page_texts(partial.data)
+        self.assertEqual(rebuilt, original[6:9])
+        for text, number in zip(rebuilt, partial.page_numbers):
+            self.assertIn(page_text(number), text)
+
+    def test_last_page_is_clamped_to_the_page_count(self):
+        with LocalFileServer({'/doc.pdf': self.document}) as server:
+            partial = self.fetcher().fetch_pages(server.url('/doc.pdf'), PAGES - 1, PAGES + 10)
+
+        self.assertEqual(partial.page_numbers, [PAGES - 1, PAGES])
+
+    def test_rebuilt_xref_table_is_valid(self):
+        with LocalFileServer({'/doc.pdf': self.document}) as server:
+            partial = self.fetcher().fetch_pages(server.url('/doc.pdf'), 1, 2)
+
+        self.assertTrue(partial.data.rstrip().endswith(b'%%EOF'))
+        with fitz.open(stream=partial.data, filetype='pdf') as doc:
+            self.assertFalse(doc.is_repaired)
+            self.assertEqual(len(doc), 2)
+            self.assertEqual(doc.xref_length(), int(doc.xref_get_key(-1, 'Size')[1]))
+
+    def test_follows_the_xref_chain_of_incremental_updates(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'doc.pdf')
+            with open(path, 'wb') as f:
+                f.write(self.document)
+            with fitz.open(path) as doc:
+                doc[4].insert_text((72, 700), "added in an update")
+                doc.save(path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+            with open(path, 'rb') as f:
+                updated = f.read()
+
+        self.assertEqual(updated.count(b'startxref'), 2)
+        with LocalFileServer({'/doc.pdf': updated}) as server:
+            partial = self.fetcher().fetch_pages(server.url('/doc.pdf'), 5, 6)
+
+        rebuilt = page_texts(partial.data)
+        self.assertIn("added in an update", rebuilt[0])
+        self.assertNotIn("added in an update", rebuilt[1])
+
+    def test_document_key_changes_with_the_file(self):
+        other = build_pdf(PAGES, filler_lines=61)
+        with LocalFileServer({'/a.pdf': self.document, '/b.pdf': other}) as server:
+            first = self.fetcher().fetch_pages(server.url('/a.pdf'), 1, 1)
+            again = self.fetcher().fetch_pages(server.url('/a.pdf'), 2, 2)
+            changed = self.fetcher().fetch_pages(server.url('/b.pdf'), 1, 1)
+
+        self.assertEqual(first.document_key, again.document_key)
+        self.assertNotEqual(first.document_key, changed.document_key)
+
+    def test_same_size_replacement_without_validators_changes_the_key(self):
+        # "page 1" -> "page 9" in the hex-encoded text keeps every offset
+        replaced = self.document.replace(b'706167652031', b'706167652039')
+        self.assertEqual(len(replaced), len(self.document))
+
+        with LocalFileServer({'/doc.pdf': self.document}, validators=False) as server:
+            first = self.fetcher().fetch_pages(server.url('/doc.pdf'), 1, 2)
+            again = self.fetcher().fetch_pages(server.url('/doc.pdf'), 1, 2)
+            server.files['/doc.pdf'] = replaced
+            changed = self.fetcher().fetch_pages(server.url('/doc.pdf'), 1, 2)
+
+        self.assertEqual(first.document_key, again.document_key)
+        self.assertNotEqual(first.document_key, changed.document_key)
+        self.assertIn(page_text(9), page_texts(changed.data)[0])
+
+    def test_server_without_range_support_is_refused(self):
+        with LocalFileServer({'/doc.pdf': self.document}, ranges=False) as server:
+            with self.assertRaisesMessage(RangeFetchUnsupported, "byte ranges"):
+                self.fetcher().fetch_pages(server.url('/doc.pdf'), 1, 2)
+
+        self.assertEqual([method for method, _, _ in server.requests], ['HEAD'])
+
+    def test_server_ignoring_range_headers_is_refused(self):
+        with LocalFileServer({'/doc.pdf': self.document}, ranges=False, advertise_ranges=True) as server:
+            with self.assertRaisesMessage(RangeFetchUnsupported, "returned 200"):
+                self.fetcher().fetch_pages(server.url('/doc.pdf'), 1, 2)
+
+    def test_xref_streams_are_refused(self):
+        compressed = build_pdf(PAGES, filler_lines=60, use_objstms=1)
+        with LocalFileServer({'/doc.pdf': compressed}) as server:
+            with self.assertRaises(RangeFetchUnsupported):
+                self.fetcher().fetch_pages(server.url('/doc.pdf'), 1, 2)
+
+    def test_gives_up_before_fetching_most_of_the_file(self):
+        with LocalFileServer({'/doc.pdf': self.document}) as server:
+            with self.assertRaisesMessage(RangeFetchUnsupported, "most of the file"):
+                self.fetcher(max_fetch_ratio=0.6).fetch_pages(server.url('/doc.pdf'), 1, PAGES)
+
+        self.assertLessEqual(server.bytes_sent, len(self.document) * 0.6)
+
+    def test_oversized_files_are_refused(self):
+        with LocalFileServer({'/doc.pdf': self.document}) as server:
+            with self.assertRaisesMessage(RangeFetchUnsupported, "size limit"):
+                self.fetcher(max_size_bytes=1024).fetch_pages(server.url('/doc.pdf'), 1, 2)
+
+
+@mock.patch.object(config, 'PDF_DOWNLOAD_MODE', 'memory')
+@mock.patch.object(config, 'PDF_DOWNLOAD_CACHE_ENABLED', False)
+class PartialFetchFallbackTests(TestCase):
+    """PDFService.fetch_document with partial fetching enabled"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.document = build_pdf(PAGES, filler_lines=60)
+
+    def setUp(self):
+        self.service = PDFService()
+        self.service.range_fetcher = RangeFetcher(
+            http_get=self.service.http_client.get,
+            http_head=self.service.http_client.head,
+            timeout=5
+        )
+
+    def test_small_range_is_fetched_partially(self):
+        with LocalFileServer({'/doc.pdf': self.document}) as server:
+            document = self.service.fetch_document(server.url('/doc.pdf'), 2, 3)
+
+        self.assertIsInstance(document, PDFBuffer)
+        self.assertEqual(document.page_numbers, [2, 3])
+        self.assertEqual(document.total_pages, PAGES)
+        pages = {page_number: text for page_number, text, _ in self.service.get_page_texts(document, 2, 3)}
+        self.assertIn(page_text(3), pages[3])
+
+    def test_refused_ranges_fall_back_to_a_full_download(self):
+        with LocalFileServer({'/doc.pdf': self.document}, ranges=False) as server:
+            document = self.service.fetch_document(server.url('/doc.pdf'), 2, 3)
+
+        self.assertIsInstance(document, PDFBuffer)
+        self.assertIsNone(document.page_numbers)
+        self.assertEqual(bytes(document.data), self.document)
+        self.assertEqual(server.requests[-1], ('GET', '/doc.pdf', ''))
+
+    def test_ignored_range_headers_fall_back_to_a_full_download(self):
+        with LocalFileServer({'/doc.pdf': self.document}, ranges=False, advertise_ranges=True) as server:
+            document = self.service.fetch_document(server.url('/doc.pdf'), 2, 3)
+
+        self.assertEqual(bytes(document.data), self.document)
+
+    def test_default_range_is_fetched_partially(self):
+        with LocalFileServer({'/doc.pdf': self.document}) as server:
+            pages = list(self.service.iter_document_pages(server.url('/doc.pdf'), cleanup=False))
+
+        self.assertEqual([page.number for page in pages], list(range(1, config.PDF_DEFAULT_MAX_PAGE + 1)))
+        self.assertTrue(all(header for method, _, header in server.requests if method == 'GET'))
+        self.assertLess(server.bytes_sent, len(self.document) / 2)
@@ -0,0 +1,73 @@
+"""
+Search API Tests
+GET /search/ against a temporary full-text index
+"""
+import os
+import shutil
+import tempfile
+from unittest import mock
+from django.test import TestCase
+from django.urls import reverse
+from chat_bot_api.infrastructure.search import FullTextIndex
+from chat_bot_api.models import Document
+
+CONTENT_HASH = 'c' * 64
+
+
+class SearchHandlerTests(TestCase):
+    """search_handler"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        self.index = FullTextIndex(os.path.join(directory, 'fulltext.sqlite3'))
+        patcher = mock.patch(
+            'chat_bot_api.application.services.search_service.get_fulltext_index',
+            return_value=self.index
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        Document.objects.create(
+            url='https://example.com/doc.pdf',
+            file_hash='h' * 64,
+            content_sha256=CONTENT_HASH,
+            total_pages=3
+        )
+        self.index.add_pages(CONTENT_HASH, [
+            (1, "Enzyme kinetics <b>bold</b> text"),
+            (2, "nothing here"),
+            (3, "more enzyme data"),
+        ])
+
+    def search(self, **params):
+        return self.client.get(reverse('chat_bot_search'), params)
+
+    def test_hits_are_resolved_to_documents(self):
+        response = self.search(q='enzyme')
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['content']['data']['results']
+        self.assertEqual(sorted(result['page'] for result in results), [1, 3])
+        self.assertTrue(all(result['url'] == 'https://example.com/doc.pdf' for result in results))
+
+    def test_snippets_are_html_escaped(self):
+        results = self.search(q='kinetics').json()['content']['data']['results']
+
+        self.assertIn('<mark>kinetics</mark>', results[0]['snippet'])
+        self.assertIn('&lt;b&gt;bold&lt;/b&gt;', results[0]['snippet'])
+
+    def test_pagination(self):
+        data = self.search(q='enzyme', limit=1).json()['content']['data']
+
+        self.assertEqual(len(data['results']), 1)
+        self.assertEqual(data['next_offset'], 1)
+
+    def test_missing_query_is_rejected(self):
+        self.assertEqual(self.search().status_code, 400)
+
+    def test_disabled_index_is_not_found(self):
+        with mock.patch('chat_bot_api.application.services.search_service.get_fulltext_index', return_value=None):
+            response = self.search(q='enzyme')
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,63 @@
+"""
+Session Tests
+Chat sessions are marked inactive when their warm context expires or is evicted
+"""
+import time
+from unittest import mock
+from django.test import TestCase
+from config.env_config import config
+from chat_bot_api.infrastructure.repositories import SessionRepository
+from chat_bot_api.infrastructure.sessions import SessionContext, context_store, get_session_store
+from chat_bot_api.models import ChatSession, Document
+
+
+class SessionDeactivationTests(TestCase):
+    """SessionContextStore expiry reported to SessionRepository"""
+
+    def setUp(self):
+        self.enterContext(mock.patch.object(config, 'SESSION_CONTEXT_ENABLED', True))
+        self.enterContext(mock.patch.object(config, 'SESSION_CONTEXT_MAX_BYTES', 2500))
+        self.enterContext(mock.patch.object(config, 'SESSION_CONTEXT_IDLE_TTL', 60))
+        self.enterContext(mock.patch.object(context_store, '_session_store', None))
+        self.document = Document.objects.create(url='https://example.com/doc.pdf', file_hash='h' * 64)
+        self.repository = SessionRepository()
+        self.store = get_session_store()
+
+    def warm(self, session_id: str):
+        self.store.put(SessionContext(session_id, self.document.url, None, 'v1', pdf_text='x' * 1000))
+        self.repository.bind(session_id, self.document.id)
+
+    def is_active(self, session_id: str) -> bool:
+        return ChatSession.objects.get(session_id=session_id).is_active
+
+    def test_bound_session_is_active(self):
+        self.warm('s1')
+
+        self.assertTrue(self.is_active('s1'))
+
+    def test_evicted_session_is_deactivated(self):
+        self.warm('s1')
+        self.warm('s2')
+
+        self.warm('s3')
+
+        self.assertFalse(self.is_active('s1'))
+        self.assertTrue(self.is_active('s2'))
+        self.assertTrue(self.is_active('s3'))
+
+    def test_idle_session_is_deactivated(self):
+        self.warm('s1')
+
+        with mock.patch('time.time', return_value=time.time() + 61):
+            self.assertIsNone(self.store.get('s1'))
+
+        self.assertFalse(self.is_active('s1'))
+
+    def test_rewarmed_session_is_active_again(self):
+        self.warm('s1')
+        with mock.patch('time.time', return_value=time.time() + 61):
+            self.store.get('s1')
+
+        self.warm('s1')
+
+        self.assertTrue(self.is_active('s1'))
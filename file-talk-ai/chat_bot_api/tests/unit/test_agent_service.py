@@ -0,0 +1,131 @@
+"""
+Agent Service Tests
+Cached responses shared by concurrent identical requests
+"""
+import shutil
+import tempfile
+import threading
+import time
+import zlib
+from unittest import mock
+from django.test import SimpleTestCase
+from config.env_config import config
+from chat_bot_api.application.services.agent_service import AgentService
+from chat_bot_api.core.utils.single_flight import FileLockSingleFlight, SingleFlight
+from chat_bot_api.infrastructure.cache import MemoryLRUCache
+
+KEY = 'summary:abc:response:v1:1-10'
+
+
+class CachedResponseTests(SimpleTestCase):
+    """AgentService.cached_response under a stampede of identical requests"""
+
+    def setUp(self):
+        self.enterContext(mock.patch.object(config, 'RESPONSE_CACHE_ENABLED', True))
+        self.cache = MemoryLRUCache(max_bytes=1 << 20)
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def make_service(self, flight=None) -> AgentService:
+        service = AgentService()
+        service.result_cache = self.cache
+        service.flight = flight or SingleFlight()
+        return service
+
+    def compute(self) -> str:
+        self.calls.append(threading.get_ident())
+        self.started.set()
+        self.release.wait(5)
+        return 'long summary'
+
+    def run_concurrently(self, services, followers_waiting=None) -> list:
+        results = []
+        threads = [
+            threading.Thread(target=lambda s=service: results.append(
+                s.cached_response(('summary', 'url', 1, 10), lambda: KEY, self.compute)
+            ))
+            for service in services
+        ]
+        threads[0].start()
+        self.started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while followers_waiting and not followers_waiting() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        if followers_waiting is None:
+            time.sleep(0.2)  # followers block on the lock file, which cannot be observed
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def test_concurrent_requests_compute_once(self):
+        service = self.make_service()
+
+        results = self.run_concurrently([service] * 8, lambda: service.flight.stats()['shared'] == 7)
+
+        self.assertEqual(results, ['long summary'] * 8)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(service.flight.stats()['shared'], 7)
+
+    def test_result_is_stored_compressed_and_served_from_cache(self):
+        service = self.make_service()
+        self.release.set()
+
+        service.cached_response('flight', lambda: KEY, self.compute)
+        second = service.cached_response('flight', lambda: KEY, self.compute)
+
+        self.assertEqual(second, 'long summary')
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(zlib.decompress(self.cache.get(KEY)), b'long summary')
+
+    def test_waiting_processes_find_the_stored_result(self):
+        lock_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, lock_dir, True)
+        # One coordinator per simulated worker process, sharing lock files and cache
+        services = [self.make_service(FileLockSingleFlight(lock_dir, poll_interval=0.01)) for _ in range(4)]
+
+        results = self.run_concurrently(services)
+
+        self.assertEqual(results, ['long summary'] * 4)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_key_resolved_after_compute_for_unknown_documents(self):
+        service = self.make_service()
+        self.release.set()
+        registered = []
+
+        def resolve_key():
+            return KEY if registered else None
+
+        def compute():
+            registered.append(True)
+            return self.compute()
+
+        service.cached_response('flight', resolve_key, compute)
+        service.cached_response('flight', resolve_key, compute)
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertIsNotNone(self.cache.get(KEY))
+
+    def test_empty_results_are_not_cached(self):
+        service = self.make_service()
+
+        for _ in range(2):
+            service.cached_response('flight', lambda: KEY, lambda: self.calls.append(1) or '  ')
+
+        self.assertEqual(len(self.calls), 2)
+        self.assertIsNone(self.cache.get(KEY))
+
+    def test_disabled_cache_always_computes(self):
+        service = self.make_service()
+        self.release.set()
+
+        with mock.patch.object(config, 'RESPONSE_CACHE_ENABLED', False):
+            service.cached_response('flight', lambda: KEY, self.compute)
+            service.cached_response('flight', lambda: KEY, self.compute)
+
+        self.assertEqual(len(self.calls), 2)
+        self.assertIsNone(self.cache.get(KEY))
@@ -0,0 +1,93 @@
+"""
+Answer Cache Tests
+Exact and reworded question matches, and questions that must not match
+"""
+from django.test import SimpleTestCase
+from chat_bot_api.infrastructure.cache import MemoryLRUCache
+from chat_bot_api.infrastructure.search import AnswerCache, HashingEmbedder, normalize_question
+
+DOC = 'a' * 64
+
+
+class NormalizeQuestionTests(SimpleTestCase):
+    """normalize_question"""
+
+    def test_filler_case_and_plurals_are_dropped(self):
+        self.assertEqual(normalize_question("What is the main idea?"), normalize_question("main ideas"))
+
+    def test_negations_and_numbers_are_kept(self):
+        self.assertIn("not", normalize_question("Why is it not stable?"))
+        self.assertIn("3", normalize_question("What does section 3 say?"))
+
+
+class AnswerCacheTests(SimpleTestCase):
+    """AnswerCache lookups"""
+
+    def setUp(self):
+        self.store = MemoryLRUCache(max_bytes=1_000_000)
+        self.cache = AnswerCache(self.store, HashingEmbedder(dim=256), threshold=0.5)
+
+    def test_exact_match(self):
+        self.cache.put(DOC, 'v1', "What is the main idea?", "answer")
+
+        hit = self.cache.get(DOC, 'v1', "what is the MAIN idea")
+
+        self.assertTrue(hit.exact)
+        self.assertEqual(hit.answer, "answer")
+
+    def test_exact_match_from_another_process(self):
+        self.cache.put(DOC, 'v1', "What is the main idea?", "answer")
+        other = AnswerCache(self.store, HashingEmbedder(dim=256))
+
+        self.assertEqual(other.get(DOC, 'v1', "What is the main idea?").answer, "answer")
+
+    def test_reworded_question_hits(self):
+        self.cache.put(DOC, 'v1', "What are the key findings of the study?", "answer")
+
+        hit = self.cache.get(DOC, 'v1', "The study: key findings?")
+
+        self.assertIsNotNone(hit)
+        self.assertFalse(hit.exact)
+
+    def test_different_number_misses(self):
+        self.cache.put(
+            DOC, 'v1',
+            "What does the author conclude in section 3 regarding temperature effects on enzyme activity?",
+            "answer about section 3"
+        )
+
+        self.assertIsNone(self.cache.get(
+            DOC, 'v1',
+            "What does the author conclude in section 4 regarding temperature effects on enzyme activity?"
+        ))
+
+    def test_different_entity_misses(self):
+        self.cache.put(DOC, 'v1', "How does the report describe economic growth in developing countries in Africa?", "a")
+
+        self.assertIsNone(self.cache.get(
+            DOC, 'v1', "How does the report describe economic growth in developing countries in Asia?"
+        ))
+
+    def test_extra_content_word_misses(self):
+        self.cache.put(DOC, 'v1', "What are the results of the experiment?", "answer")
+
+        self.assertIsNone(self.cache.get(DOC, 'v1', "What are the negative results of the experiment?"))
+
+    def test_negation_misses(self):
+        self.cache.put(DOC, 'v1', "Why is the method stable?", "answer")
+
+        self.assertIsNone(self.cache.get(DOC, 'v1', "Why is the method not stable?"))
+
+    def test_other_variant_or_document_misses(self):
+        self.cache.put(DOC, 'v1', "What is the main idea?", "answer")
+
+        self.assertIsNone(self.cache.get(DOC, 'v2', "What is the main idea?"))
+        self.assertIsNone(self.cache.get('b' * 64, 'v1', "What is the main idea?"))
+
+    def test_invalidate_drops_answers(self):
+        self.cache.put(DOC, 'v1', "What is the main idea?", "answer")
+
+        self.cache.invalidate(DOC)
+
+        self.assertIsNone(self.cache.get(DOC, 'v1', "What is the main idea?"))
+        self.assertEqual(self.cache.stats()['invalidations'], 1)
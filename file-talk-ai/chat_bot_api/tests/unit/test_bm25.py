@@ -0,0 +1,121 @@
+"""
+BM25 Index Tests
+CSR postings, Okapi BM25 scores and chunking of pages for retrieval
+"""
+import math
+import pickle
+from collections import Counter
+from django.test import SimpleTestCase
+from chat_bot_api.domain.models import PageRecord
+from chat_bot_api.infrastructure.search import BM25Index, TextChunk, TextChunker, tokenize
+
+TEXTS = [
+    "Enzyme activity rises with temperature until the enzyme denatures.",
+    "Temperature affects reaction rates in general.",
+    "The committee met in March to discuss the budget.",
+    "Enzyme enzyme enzyme kinetics are described by the Michaelis-Menten model.",
+]
+
+
+def chunks(texts) -> list:
+    return [TextChunk(i, text, i + 1, i + 1, 0) for i, text in enumerate(texts)]
+
+
+def reference_scores(texts, query, k1=1.2, b=0.75) -> dict:
+    """Textbook BM25 over token lists, for comparison"""
+    docs = [tokenize(text) for text in texts]
+    avg = sum(map(len, docs)) / len(docs)
+    scores = {}
+    for term in set(tokenize(query)):
+        df = sum(1 for doc in docs if term in doc)
+        if not df:
+            continue
+        idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+        for doc_id, doc in enumerate(docs):
+            tf = Counter(doc)[term]
+            if tf:
+                denominator = tf + k1 * (1 - b + b * len(doc) / avg)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / denominator
+    return scores
+
+
+class TokenizeTests(SimpleTestCase):
+    """tokenize"""
+
+    def test_lowercases_and_drops_stopwords_and_punctuation(self):
+        self.assertEqual(tokenize("The Enzyme's rate, and its_limit!"), ['enzyme', 's', 'rate', 'limit'])
+
+
+class BM25IndexTests(SimpleTestCase):
+    """BM25Index"""
+
+    def setUp(self):
+        self.index = BM25Index(chunks(TEXTS))
+
+    def test_postings_are_stored_in_csr_arrays(self):
+        term_id = self.index.terms['enzyme']
+        start, end = self.index.offsets[term_id], self.index.offsets[term_id + 1]
+
+        self.assertEqual(list(self.index.doc_ids[start:end]), [0, 3])
+        self.assertEqual(list(self.index.term_freqs[start:end]), [2, 3])
+        self.assertEqual(self.index.offsets[-1], len(self.index.doc_ids))
+        self.assertEqual(len(self.index.doc_ids), len(self.index.term_freqs))
+
+    def test_scores_match_reference_bm25(self):
+        for query in ("enzyme temperature", "budget", "kinetics model enzyme"):
+            expected = reference_scores(TEXTS, query)
+            results = self.index.search(query, top_k=10)
+
+            self.assertEqual({chunk.index for chunk, _ in results}, set(expected))
+            for chunk, score in results:
+                self.assertAlmostEqual(score, expected[chunk.index], places=9)
+
+    def test_results_are_best_first_and_limited(self):
+        results = self.index.search("enzyme temperature", top_k=2)
+
+        self.assertEqual(len(results), 2)
+        self.assertGreaterEqual(results[0][1], results[1][1])
+
+    def test_unknown_and_stopword_queries_match_nothing(self):
+        self.assertEqual(self.index.search("photosynthesis", top_k=5), [])
+        self.assertEqual(self.index.search("the and of", top_k=5), [])
+
+    def test_pickled_index_gives_the_same_results(self):
+        restored = pickle.loads(pickle.dumps(self.index))
+
+        self.assertEqual(
+            [(chunk.index, score) for chunk, score in restored.search("enzyme", 5)],
+            [(chunk.index, score) for chunk, score in self.index.search("enzyme", 5)]
+        )
+
+    def test_empty_index(self):
+        self.assertEqual(BM25Index([]).search("enzyme", 5), [])
+
+
+class TextChunkerTests(SimpleTestCase):
+    """TextChunker"""
+
+    def test_chunks_fit_and_overlap(self):
+        text = " ".join(f"Sentence number {i} talks about topic {i}." for i in range(40))
+        chunker = TextChunker(chunk_tokens=60, overlap_tokens=15)
+
+        result = chunker.chunk([PageRecord(1, text, 0, len(text))])
+
+        self.assertGreater(len(result), 2)
+        self.assertTrue(all(chunk.tokens <= 60 for chunk in result))
+        for previous, current in zip(result, result[1:]):
+            last_sentence = previous.text.rsplit(".", 2)[-2].strip()
+            self.assertIn(last_sentence, current.text)
+
+    def test_chunks_span_pages(self):
+        pages = [PageRecord(n, f"Short page {n}.", 0, 0) for n in (1, 2, 3)]
+
+        result = TextChunker(chunk_tokens=100, overlap_tokens=10).chunk(pages)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual((result[0].page_start, result[0].page_end), (1, 3))
+        self.assertEqual(result[0].marker, "\n\n--- Pages 1-3 ---\n")
+
+    def test_overlap_must_leave_room(self):
+        with self.assertRaises(ValueError):
+            TextChunker(chunk_tokens=50, overlap_tokens=50)
@@ -0,0 +1,259 @@
+"""
+Cache Tier Tests
+MemoryLRUCache, DiskCache, RedisCache (against fakeredis) and TieredCache
+"""
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+from django.test import SimpleTestCase
+from chat_bot_api.infrastructure.cache import (
+    CacheBackend,
+    DiskCache,
+    MemoryLRUCache,
+    RedisCache,
+    TieredCache
+)
+
+try:
+    import fakeredis
+except ImportError:  # pragma: no cover - optional test dependency
+    fakeredis = None
+
+
+class MemoryLRUCacheTests(SimpleTestCase):
+    """Byte-budgeted in-process tier"""
+
+    def test_round_trip_and_miss(self):
+        cache = MemoryLRUCache(max_bytes=10_000)
+        cache.set('a', 'value')
+
+        self.assertEqual(cache.get('a'), 'value')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_evicts_least_recently_used_over_budget(self):
+        value = 'x' * 400
+        cache = MemoryLRUCache(max_bytes=1200)
+        cache.set('a', value)
+        cache.set('b', value)
+        cache.get('a')  # b is now the oldest
+        cache.set('c', value)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), value)
+        self.assertEqual(cache.get('c'), value)
+        self.assertLessEqual(cache.stats()['bytes'], 1200)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_value_larger_than_budget_is_not_cached(self):
+        cache = MemoryLRUCache(max_bytes=100)
+        cache.set('big', 'x' * 1000)
+
+        self.assertIsNone(cache.get('big'))
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_ttl_expiry(self):
+        cache = MemoryLRUCache(max_bytes=10_000, default_ttl=10)
+        cache.set('a', 'value')
+
+        with mock.patch('time.time', return_value=time.time() + 11):
+            self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_replacing_key_updates_size(self):
+        cache = MemoryLRUCache(max_bytes=10_000)
+        cache.set('a', 'x' * 1000)
+        cache.set('a', 'y')
+
+        self.assertEqual(cache.get('a'), 'y')
+        self.assertLess(cache.stats()['bytes'], 1000)
+
+
+class DiskCacheTests(SimpleTestCase):
+    """Compressed file-per-key tier"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_round_trip_across_instances(self):
+        DiskCache(self.directory).set('key', {'pages': [1, 2, 3]})
+
+        self.assertEqual(DiskCache(self.directory).get('key'), {'pages': [1, 2, 3]})
+
+    def test_ttl_expiry_removes_file(self):
+        cache = DiskCache(self.directory, default_ttl=10)
+        cache.set('key', 'value')
+        path = cache._path('key')
+
+        with mock.patch('time.time', return_value=time.time() + 11):
+            self.assertIsNone(cache.get('key'))
+        self.assertFalse(os.path.exists(path))
+
+    def test_corrupt_entry_is_discarded(self):
+        cache = DiskCache(self.directory)
+        cache.set('key', 'value')
+        with open(cache._path('key'), 'wb') as f:
+            f.write(b'garbage')
+
+        self.assertIsNone(cache.get('key'))
+        self.assertFalse(os.path.exists(cache._path('key')))
+
+    def test_clear_keeps_nested_directories(self):
+        nested = DiskCache(os.path.join(self.directory, 'results'))
+        nested.set('result', 'kept')
+        cache = DiskCache(self.directory)
+        cache.set('key', 'value')
+
+        cache.clear()
+
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(nested.get('result'), 'kept')
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        value = os.urandom(4000)  # incompressible
+        cache = DiskCache(self.directory, max_bytes=10_000)
+        cache.set('a', value)
+        cache.set('b', value)
+        # Make the access order unambiguous despite coarse mtimes
+        os.utime(cache._path('a'), (1000, 1000))
+        os.utime(cache._path('b'), (2000, 2000))
+        cache.set('c', value)
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b'), value)
+        self.assertEqual(cache.get('c'), value)
+        stats = cache.stats()
+        self.assertLessEqual(stats['disk_bytes'], 10_000)
+        self.assertEqual(stats['evictions'], 1)
+
+    def test_sweep_counts_other_writers(self):
+        value = os.urandom(4000)
+        writer = DiskCache(self.directory)
+        for key in ('a', 'b', 'c', 'd'):
+            writer.set(key, value)
+
+        cache = DiskCache(self.directory, max_bytes=10_000)
+        removed = cache.sweep()
+
+        self.assertEqual(removed, 2)
+        self.assertLessEqual(cache.stats()['disk_bytes'], 9_000)
+
+    def test_sweep_drops_expired_entries_first(self):
+        cache = DiskCache(self.directory, max_bytes=1_000_000)
+        cache.set('old', 'value', ttl=10)
+        cache.set('fresh', 'value')
+
+        with mock.patch('time.time', return_value=time.time() + 11):
+            self.assertEqual(cache.sweep(), 1)
+        self.assertEqual(cache.get('fresh'), 'value')
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+class RedisCacheTests(SimpleTestCase):
+    """Optional Redis tier against a local fake"""
+
+    def setUp(self):
+        self.client = fakeredis.FakeRedis()
+        self.cache = RedisCache(client=self.client, prefix='test', default_ttl=60)
+
+    def test_round_trip_with_prefix_and_ttl(self):
+        self.cache.set('key', {'text': 'page'})
+
+        self.assertEqual(self.cache.get('key'), {'text': 'page'})
+        self.assertIsNone(self.cache.get('missing'))
+        self.assertTrue(self.client.exists('test:key'))
+        self.assertTrue(0 < self.client.ttl('test:key') <= 60)
+
+    def test_get_many(self):
+        self.cache.set_many({'a': 1, 'b': 2})
+
+        self.assertEqual(self.cache.get_many(['a', 'b', 'c']), {'a': 1, 'b': 2})
+        self.assertEqual(self.cache.stats()['hits'], 2)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_clear_only_removes_own_prefix(self):
+        self.client.set('other:key', b'kept')
+        self.cache.set('a', 1)
+
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.client.get('other:key'), b'kept')
+
+    def test_zero_ttl_means_no_expiry(self):
+        RedisCache(client=self.client, prefix='test').set('key', 'value', ttl=0)
+
+        self.assertEqual(self.client.ttl('test:key'), -1)
+
+
+class _FailingCache(CacheBackend):
+    name = 'failing'
+
+    def get(self, key):
+        raise ConnectionError("down")
+
+    def set(self, key, value, ttl=None):
+        raise ConnectionError("down")
+
+    def delete(self, key):
+        raise ConnectionError("down")
+
+    def clear(self):
+        raise ConnectionError("down")
+
+
+class TieredCacheTests(SimpleTestCase):
+    """Read-through chain of tiers"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.memory = MemoryLRUCache(max_bytes=100_000)
+        self.disk = DiskCache(self.directory)
+        self.cache = TieredCache([self.memory, self.disk])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_writes_go_to_every_tier(self):
+        self.cache.set('key', 'value')
+
+        self.assertEqual(self.memory.get('key'), 'value')
+        self.assertEqual(self.disk.get('key'), 'value')
+
+    def test_hit_in_slower_tier_backfills_faster_tiers(self):
+        self.disk.set('key', 'value')
+
+        self.assertEqual(self.cache.get('key'), 'value')
+        self.assertEqual(self.memory.get('key'), 'value')
+
+    def test_get_many_combines_tiers(self):
+        self.memory.set('a', 1)
+        self.disk.set('b', 2)
+
+        self.assertEqual(self.cache.get_many(['a', 'b', 'c']), {'a': 1, 'b': 2})
+        self.assertEqual(self.memory.get('b'), 2)
+
+    def test_failing_tier_is_skipped(self):
+        cache = TieredCache([_FailingCache(), self.disk])
+        cache.set('key', 'value')
+
+        self.assertEqual(cache.get('key'), 'value')
+        cache.delete('key')
+        self.assertIsNone(cache.get('key'))
+
+    @unittest.skipIf(fakeredis is None, "fakeredis is not installed")
+    def test_redis_tier_shared_between_processes(self):
+        client = fakeredis.FakeRedis()
+        first = TieredCache([MemoryLRUCache(100_000), RedisCache(client=client)])
+        second = TieredCache([MemoryLRUCache(100_000), RedisCache(client=client)])
+
+        first.set('key', 'value')
+
+        self.assertEqual(second.get('key'), 'value')
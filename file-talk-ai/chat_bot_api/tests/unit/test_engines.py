@@ -0,0 +1,135 @@
+"""
+Extraction Engine Tests
+Fast, structured and auto page text on small generated layouts
+"""
+import fitz  # PyMuPDF
+from django.test import SimpleTestCase
+from chat_bot_api.infrastructure.pdf import ParallelPageExtractor
+from chat_bot_api.infrastructure.pdf.engines import (
+    ExtractionEngine,
+    ExtractionStats,
+    extract_auto,
+    extract_fast,
+    extract_structured,
+    get_extractor,
+    is_textless
+)
+
+OUT_OF_ORDER, TWO_COLUMNS, BLANK, SCANNED = 1, 2, 3, 4
+
+IN_READING_ORDER = "Title at the top\nBody in the middle\nFooter written first\n"
+COLUMNS = "Left column first line\nLeft column second line\nRight column first line\nRight column second line\n"
+
+
+def build_layout_pdf() -> bytes:
+    """Pages whose content stream order differs from their reading order, plus textless pages"""
+    doc = fitz.open()
+
+    page = doc.new_page()
+    page.insert_text((72, 700), "Footer written first")
+    page.insert_text((72, 72), "Title at the top")
+    page.insert_text((72, 300), "Body in the middle")
+
+    page = doc.new_page()
+    page.insert_textbox(fitz.Rect(72, 72, 280, 400), "Left column first line\nLeft column second line")
+    page.insert_textbox(fitz.Rect(320, 72, 540, 400), "Right column first line\nRight column second line")
+
+    doc.new_page()
+
+    page = doc.new_page()
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 20, 20), 0)
+    pixmap.clear_with(128)
+    page.insert_image(fitz.Rect(72, 72, 200, 200), pixmap=pixmap)
+
+    return doc.tobytes()
+
+
+class ExtractionEngineTests(SimpleTestCase):
+    """Page text per engine"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.doc = fitz.open("pdf", build_layout_pdf())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.doc.close()
+        super().tearDownClass()
+
+    def page(self, number: int) -> fitz.Page:
+        return self.doc[number - 1]
+
+    def test_fast_keeps_content_stream_order(self):
+        self.assertEqual(
+            extract_fast(self.page(OUT_OF_ORDER)),
+            "Footer written first\nTitle at the top\nBody in the middle\n"
+        )
+
+    def test_structured_sorts_into_reading_order(self):
+        self.assertEqual(extract_structured(self.page(OUT_OF_ORDER)), IN_READING_ORDER)
+
+    def test_auto_reorders_only_out_of_order_pages(self):
+        self.assertEqual(extract_auto(self.page(OUT_OF_ORDER)), IN_READING_ORDER)
+        self.assertEqual(extract_auto(self.page(TWO_COLUMNS)), extract_fast(self.page(TWO_COLUMNS)))
+
+    def test_columns_are_read_one_after_the_other(self):
+        for engine in ExtractionEngine.get_all():
+            with self.subTest(engine=engine):
+                self.assertEqual(get_extractor(engine)(self.page(TWO_COLUMNS)), COLUMNS)
+
+    def test_textless_pages(self):
+        self.assertFalse(is_textless(self.page(OUT_OF_ORDER)))
+        self.assertTrue(is_textless(self.page(BLANK)))
+        self.assertTrue(is_textless(self.page(SCANNED)))
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            get_extractor('ocr')
+        with self.assertRaises(ValueError):
+            ParallelPageExtractor(engine='ocr')
+
+
+class EngineSelectionTests(SimpleTestCase):
+    """ParallelPageExtractor runs the configured engine and records its stats"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.data = build_layout_pdf()
+
+    def extract(self, engine: str, skip_textless: bool = True) -> ParallelPageExtractor:
+        extractor = ParallelPageExtractor(max_workers=1, engine=engine, skip_textless=skip_textless)
+        extractor.stats = ExtractionStats()
+        self.pages = extractor.extract(self.data, range(1, 5))
+        return extractor
+
+    def test_engines_differ_only_in_order(self):
+        texts = {}
+        for engine in ExtractionEngine.get_all():
+            self.extract(engine)
+            texts[engine] = self.pages
+
+        self.assertEqual(texts[ExtractionEngine.STRUCTURED][OUT_OF_ORDER], IN_READING_ORDER)
+        self.assertEqual(texts[ExtractionEngine.AUTO][OUT_OF_ORDER], IN_READING_ORDER)
+        self.assertNotEqual(texts[ExtractionEngine.FAST][OUT_OF_ORDER], IN_READING_ORDER)
+        self.assertEqual(
+            sorted(texts[ExtractionEngine.FAST][OUT_OF_ORDER].splitlines()),
+            sorted(IN_READING_ORDER.splitlines())
+        )
+
+    def test_textless_pages_are_skipped_and_counted(self):
+        extractor = self.extract(ExtractionEngine.AUTO)
+
+        self.assertEqual(self.pages[BLANK], '')
+        self.assertEqual(self.pages[SCANNED], '')
+        stats = extractor.stats.snapshot()[ExtractionEngine.AUTO]
+        self.assertEqual(stats['pages'], 4)
+        self.assertEqual(stats['skipped_pages'], 2)
+        self.assertEqual(stats['chars'], len(IN_READING_ORDER) + len(COLUMNS))
+
+    def test_textless_pages_extracted_when_not_skipping(self):
+        extractor = self.extract(ExtractionEngine.FAST, skip_textless=False)
+
+        self.assertEqual(self.pages[BLANK], '')
+        self.assertEqual(extractor.stats.snapshot()[ExtractionEngine.FAST]['skipped_pages'], 0)
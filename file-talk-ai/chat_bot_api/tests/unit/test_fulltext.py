@@ -0,0 +1,89 @@
+"""
+Full-Text Index Tests
+FTS5 query building, page deduplication and escaped snippets
+"""
+import os
+import shutil
+import tempfile
+from django.test import SimpleTestCase
+from chat_bot_api.infrastructure.search import FullTextIndex
+
+DOC_A = 'a' * 64
+DOC_B = 'b' * 64
+
+
+class BuildMatchExpressionTests(SimpleTestCase):
+    """FullTextIndex.build_match_expression"""
+
+    def test_terms_are_quoted(self):
+        self.assertEqual(FullTextIndex.build_match_expression("enzyme activity"), '"enzyme" "activity"')
+
+    def test_fts5_syntax_is_not_passed_through(self):
+        expression = FullTextIndex.build_match_expression('body:"x" OR NEAR(a b) -c * "unbalanced')
+
+        self.assertEqual(expression, '"body" "x" "OR" "NEAR" "a" "b" "c" "unbalanced"')
+
+    def test_query_without_terms_is_empty(self):
+        self.assertEqual(FullTextIndex.build_match_expression('"()*: -'), '')
+
+
+class FullTextIndexTests(SimpleTestCase):
+    """FullTextIndex against a temporary database"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.index = FullTextIndex(os.path.join(self.directory, 'fulltext.sqlite3'))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_pages_already_indexed_are_skipped(self):
+        self.assertEqual(self.index.add_pages(DOC_A, [(1, "alpha"), (2, "beta")]), 2)
+        self.assertEqual(self.index.add_pages(DOC_A, [(2, "beta"), (3, "gamma"), (3, "gamma")]), 1)
+        self.assertEqual(self.index.add_pages(DOC_B, [(1, "alpha")]), 1)
+
+        self.assertEqual(self.index.stats(), {'documents': 2, 'pages': 4})
+        self.assertEqual(len(self.index.search("alpha")), 2)
+
+    def test_empty_and_out_of_range_pages_are_ignored(self):
+        self.assertEqual(self.index.add_pages(DOC_A, [(0, "zero"), (1, "   "), (2, "kept")]), 1)
+
+    def test_search_ranks_and_filters_by_document(self):
+        self.index.add_pages(DOC_A, [(1, "enzyme activity rises with temperature"), (2, "unrelated text")])
+        self.index.add_pages(DOC_B, [(5, "enzyme enzyme activity")])
+
+        hits = self.index.search("Enzyme activity")
+        self.assertEqual({(hit.content_sha256, hit.page_number) for hit in hits}, {(DOC_A, 1), (DOC_B, 5)})
+
+        only_a = self.index.search("enzyme", content_hashes=[DOC_A])
+        self.assertEqual([(hit.content_sha256, hit.page_number) for hit in only_a], [(DOC_A, 1)])
+        self.assertEqual(self.index.search("enzyme", content_hashes=[]), [])
+
+    def test_snippet_escapes_page_text(self):
+        self.index.add_pages(DOC_A, [(1, 'payload <script>alert(1)</script> <img src=x onerror="x()"> here')])
+
+        snippet = self.index.search("payload")[0].snippet
+
+        self.assertIn('<mark>payload</mark>', snippet)
+        self.assertNotIn('<script>', snippet)
+        self.assertNotIn('<img', snippet)
+        self.assertIn('&lt;script&gt;', snippet)
+
+    def test_remove_drops_every_page(self):
+        self.index.add_pages(DOC_A, [(1, "alpha"), (2, "alpha")])
+
+        self.index.remove(DOC_A)
+
+        self.assertEqual(self.index.search("alpha"), [])
+        self.assertEqual(self.index.stats(), {'documents': 0, 'pages': 0})
+
+    def test_writer_flushes_in_batches(self):
+        self.index.batch_pages = 2
+        writer = self.index.writer(DOC_A)
+        for number in range(1, 6):
+            writer.add(number, f"page {number}")
+        self.assertEqual(writer.pages_written, 4)
+
+        writer.close()
+
+        self.assertEqual(writer.pages_written, 5)
@@ -0,0 +1,189 @@
+"""
+Storage Janitor Tests
+Expiry and budget eviction of cached downloads, and leftover file cleanup
+"""
+import fcntl
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from unittest import mock
+from django.apps import apps
+from django.core.signals import request_started
+from django.test import SimpleTestCase
+from config.env_config import config
+from chat_bot_api.infrastructure.cache.download_cache import PDFDownloadCache
+from chat_bot_api.infrastructure.storage import LocalStorageBackend
+from chat_bot_api.infrastructure.storage.janitor import StorageJanitor
+
+HOUR = 3600
+
+
+class StorageJanitorTests(SimpleTestCase):
+    """StorageJanitor.sweep"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.lock_dir = os.path.join(self.root, 'locks')
+        os.makedirs(self.lock_dir)
+        self.cache = PDFDownloadCache(os.path.join(self.root, 'cache'))
+        self.now = time.time()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def janitor(self, **options) -> StorageJanitor:
+        options.setdefault('max_bytes', 0)
+        options.setdefault('ttl_seconds', 0)
+        return StorageJanitor(self.root, download_cache=self.cache, lock_dir=self.lock_dir, **options)
+
+    def cached(self, url: str, size: int = 1000, age: float = 2 * HOUR, hits: int = 0) -> str:
+        """Cache a download last used ``age`` seconds ago, returning its blob path"""
+        data = os.urandom(size)
+        temp_path = self.cache.create_temp_file()
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        entry = self.cache.store(url, temp_path, hashlib.sha256(data).hexdigest(), size)
+
+        entry.fetched_at = entry.last_used_at = self.now - age
+        entry.hits = hits
+        self.cache._write_metadata(entry)
+        path = self.cache.blob_path(entry.content_hash)
+        os.utime(path, (self.now - age, self.now - age))
+        return path
+
+    def old_file(self, path: str, age: float = 2 * HOUR) -> str:
+        with open(path, 'wb') as f:
+            f.write(b'x' * 10)
+        os.utime(path, (self.now - age, self.now - age))
+        return path
+
+    def test_unused_downloads_expire(self):
+        stale = self.cached('https://example.com/stale.pdf', age=10 * HOUR)
+        fresh = self.cached('https://example.com/fresh.pdf', age=2 * HOUR)
+
+        report = self.janitor(ttl_seconds=5 * HOUR).sweep()
+
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(fresh))
+        self.assertEqual(report.expired_blobs, 1)
+        self.assertIsNone(self.cache.get_entry('https://example.com/stale.pdf'))
+
+    def test_least_recently_used_is_evicted_over_budget(self):
+        oldest = self.cached('https://example.com/a.pdf', age=3 * HOUR)
+        middle = self.cached('https://example.com/b.pdf', age=2 * HOUR)
+        newest = self.cached('https://example.com/c.pdf', age=1 * HOUR)
+
+        report = self.janitor(max_bytes=2500).sweep()
+
+        self.assertEqual([os.path.exists(p) for p in (oldest, middle, newest)], [False, True, True])
+        self.assertEqual(report.evicted_blobs, 1)
+        self.assertEqual(report.reclaimed_bytes, 1000)
+        self.assertEqual(report.working_set_bytes, 2000)
+
+    def test_least_frequently_used_is_evicted_with_lfu(self):
+        popular = self.cached('https://example.com/a.pdf', age=3 * HOUR, hits=10)
+        unpopular = self.cached('https://example.com/b.pdf', age=1 * HOUR, hits=1)
+
+        self.janitor(max_bytes=1500, policy='lfu').sweep()
+
+        self.assertTrue(os.path.exists(popular))
+        self.assertFalse(os.path.exists(unpopular))
+
+    def test_recently_used_downloads_are_kept_over_budget(self):
+        recent = [self.cached(f'https://example.com/{n}.pdf', age=60) for n in range(3)]
+
+        report = self.janitor(max_bytes=1000).sweep()
+
+        self.assertTrue(all(os.path.exists(path) for path in recent))
+        self.assertEqual(report.evicted_blobs, 0)
+
+    def test_dry_run_removes_nothing(self):
+        stale = self.cached('https://example.com/stale.pdf', age=10 * HOUR)
+
+        report = self.janitor(ttl_seconds=HOUR).sweep(dry_run=True)
+
+        self.assertEqual(report.expired_blobs, 1)
+        self.assertTrue(os.path.exists(stale))
+
+    def test_old_scratch_and_temp_files_are_removed(self):
+        scratch = self.old_file(os.path.join(self.root, 'pdf_abc.pdf'))
+        recent_scratch = self.old_file(os.path.join(self.root, 'pdf_def.pdf'), age=10)
+        other = self.old_file(os.path.join(self.root, 'notes.pdf'))
+        partial = self.old_file(os.path.join(self.cache.tmp_dir, 'download.part'))
+
+        report = self.janitor().sweep()
+
+        self.assertFalse(os.path.exists(scratch))
+        self.assertTrue(os.path.exists(recent_scratch))
+        self.assertTrue(os.path.exists(other))
+        self.assertFalse(os.path.exists(partial))
+        self.assertEqual((report.removed_scratch_files, report.removed_temp_files), (1, 1))
+
+    def test_store_temp_files_are_removed_without_download_cache(self):
+        storage = LocalStorageBackend(os.path.join(self.root, 'store'))
+        scratch = self.old_file(storage.create_temp_file(suffix='.pdf'))
+        recent = self.old_file(storage.create_temp_file(suffix='.pdf'), age=10)
+
+        report = StorageJanitor(self.root, upload_storage=storage, lock_dir=self.lock_dir).sweep()
+
+        self.assertFalse(os.path.exists(scratch))
+        self.assertTrue(os.path.exists(recent))
+        self.assertEqual(report.removed_temp_files, 1)
+
+    def test_held_and_recent_lock_files_are_kept(self):
+        idle = self.old_file(os.path.join(self.lock_dir, 'idle.lock'))
+        recent = self.old_file(os.path.join(self.lock_dir, 'recent.lock'), age=10)
+        held = self.old_file(os.path.join(self.lock_dir, 'held.lock'))
+        fd = os.open(held, os.O_RDWR)
+        self.addCleanup(os.close, fd)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+        report = self.janitor().sweep()
+
+        self.assertFalse(os.path.exists(idle))
+        self.assertTrue(os.path.exists(recent))
+        self.assertTrue(os.path.exists(held))
+        self.assertEqual(report.removed_lock_files, 1)
+
+    def test_concurrent_sweep_is_skipped(self):
+        stale = self.cached('https://example.com/stale.pdf', age=10 * HOUR)
+        fd = os.open(os.path.join(self.root, '.janitor.lock'), os.O_RDWR | os.O_CREAT)
+        self.addCleanup(os.close, fd)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+        report = self.janitor(ttl_seconds=HOUR).sweep()
+
+        self.assertTrue(report.skipped)
+        self.assertTrue(os.path.exists(stale))
+
+
+class JanitorStartupTests(SimpleTestCase):
+    """Periodic sweeps only run in serving processes, and only when enabled"""
+
+    def ready(self, interval: int) -> mock.Mock:
+        janitor = mock.Mock()
+        patcher = mock.patch('chat_bot_api.infrastructure.storage.get_storage_janitor', return_value=janitor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(request_started.disconnect, dispatch_uid='start_storage_janitor')
+        with mock.patch.object(config, 'STORAGE_JANITOR_INTERVAL', interval):
+            apps.get_app_config('chat_bot_api').ready()
+        return janitor
+
+    def test_zero_interval_never_starts(self):
+        janitor = self.ready(0)
+        request_started.send(sender=self.__class__)
+
+        janitor.start.assert_not_called()
+
+    def test_starts_with_the_first_request_only(self):
+        janitor = self.ready(60)
+        janitor.start.assert_not_called()
+
+        with mock.patch.object(config, 'STORAGE_JANITOR_INTERVAL', 60):
+            request_started.send(sender=self.__class__)
+            request_started.send(sender=self.__class__)
+
+        janitor.start.assert_called_once_with(60)
@@ -0,0 +1,47 @@
+"""
+LLM Client Tests
+Shared client construction and connection pool metrics
+"""
+import httpx
+from django.test import SimpleTestCase
+from config.constants import ActionType
+from chat_bot_api.infrastructure.external.llm_client import LLMClientRegistry, default_agent_templates
+
+
+class LLMClientRegistryTests(SimpleTestCase):
+    """Process-wide Groq client registry"""
+
+    def setUp(self):
+        self.registry = LLMClientRegistry('test-key', default_agent_templates('test-model'))
+        self.addCleanup(self.registry.close)
+
+    def test_agents_share_one_client(self):
+        first = self.registry.create_agent(ActionType.SUMMARIZER, "first")
+        second = self.registry.create_agent(ActionType.SUMMARIZER, "second")
+
+        self.assertIs(first.model.client, second.model.client)
+        self.assertEqual(self.registry.stats()['agents_created'], {ActionType.SUMMARIZER: 2})
+
+    def test_stats_before_first_use(self):
+        stats = self.registry.stats()
+
+        self.assertFalse(stats['client_ready'])
+        self.assertEqual((stats['connections_open'], stats['connections_idle']), (0, 0))
+
+    def test_stats_read_the_pool(self):
+        self.registry.client
+
+        stats = self.registry.stats()
+
+        self.assertTrue(stats['client_ready'])
+        self.assertEqual((stats['connections_open'], stats['connections_idle']), (0, 0))
+
+    def test_stats_survive_an_unknown_transport(self):
+        self.registry.client
+        self.registry.http_client._transport = httpx.MockTransport(lambda request: httpx.Response(200))
+
+        stats = self.registry.stats()
+
+        self.assertIsNone(stats['connections_open'])
+        self.assertIsNone(stats['connections_idle'])
+        self.assertEqual(stats['requests'], 0)
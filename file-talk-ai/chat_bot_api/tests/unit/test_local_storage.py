@@ -0,0 +1,102 @@
+"""
+Local Storage Tests
+Hash sharding, atomic writes and temp files of LocalStorageBackend
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+from django.test import SimpleTestCase
+from chat_bot_api.infrastructure.storage import LocalStorageBackend
+
+CONTENT = b'%PDF-1.7 body'
+KEY = hashlib.sha256(CONTENT).hexdigest()
+
+
+class LocalStorageBackendTests(SimpleTestCase):
+    """Blob layout and writes on local disk"""
+
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, True)
+        self.storage = LocalStorageBackend(root)
+
+    def write(self, data: bytes = CONTENT):
+        writer = self.storage.open_writer()
+        writer.write(data)
+        return writer.commit()
+
+    def temp_files(self) -> list:
+        return os.listdir(self.storage.tmp_dir)
+
+    def test_blobs_are_sharded_by_hash_prefix(self):
+        self.assertEqual(
+            self.storage.path_for(KEY),
+            os.path.join(self.storage.root, KEY[:2], KEY[2:4], f"{KEY}.pdf")
+        )
+
+        storage = LocalStorageBackend(self.storage.root, shard_depth=3, shard_width=1)
+        self.assertEqual(
+            storage.path_for(KEY),
+            os.path.join(self.storage.root, KEY[0], KEY[1], KEY[2], f"{KEY}.pdf")
+        )
+
+    def test_invalid_keys_are_rejected(self):
+        for key in ('', '../' + KEY[3:], KEY.upper(), KEY[:10]):
+            with self.subTest(key=key), self.assertRaises(ValueError):
+                self.storage.path_for(key)
+
+    def test_blob_appears_only_on_commit(self):
+        writer = self.storage.open_writer()
+        writer.write(CONTENT[:9])
+        writer.write(CONTENT[9:])
+
+        self.assertFalse(self.storage.exists(KEY))
+        self.assertEqual(len(self.temp_files()), 1)
+
+        blob = writer.commit()
+
+        self.assertEqual((blob.key, blob.size_bytes, blob.created), (KEY, len(CONTENT), True))
+        with self.storage.open(KEY) as f:
+            self.assertEqual(f.read(), CONTENT)
+        self.assertEqual(self.temp_files(), [])
+
+    def test_duplicate_content_is_stored_once(self):
+        self.write()
+
+        blob = self.write()
+
+        self.assertFalse(blob.created)
+        self.assertEqual([key for key, _, _ in self.storage.iter_blobs()], [KEY])
+        self.assertEqual(self.temp_files(), [])
+
+    def test_abort_removes_the_temp_file(self):
+        writer = self.storage.open_writer()
+        writer.write(CONTENT)
+
+        writer.abort()
+
+        self.assertFalse(self.storage.exists(KEY))
+        self.assertEqual(self.temp_files(), [])
+
+    def test_paths_and_listing_skip_temp_files(self):
+        self.write()
+        temp_path = self.storage.create_temp_file(suffix='.pdf')
+
+        self.assertEqual([key for key, _, _ in self.storage.iter_blobs()], [KEY])
+        self.assertEqual(self.storage.local_path(KEY), self.storage.path_for(KEY))
+        self.assertTrue(self.storage.contains_path(self.storage.path_for(KEY)))
+        self.assertFalse(self.storage.contains_path(temp_path))
+
+        self.storage.delete(KEY)
+        self.storage.delete(KEY)
+
+        self.assertIsNone(self.storage.local_path(KEY))
+        self.assertFalse(self.storage.exists(KEY))
+
+    def test_temp_files_are_created_inside_the_store(self):
+        temp_path = self.storage.create_temp_file(suffix='.pdf')
+
+        self.assertEqual(os.path.dirname(temp_path), self.storage.tmp_dir)
+        self.assertTrue(temp_path.endswith('.pdf'))
+        self.assertEqual(os.path.getsize(temp_path), 0)
@@ -0,0 +1,82 @@
+"""
+Text Normalizer Tests
+Boilerplate removal that keeps repeated body content
+"""
+from django.test import SimpleTestCase
+from chat_bot_api.domain.models import PageRecord
+from chat_bot_api.infrastructure.text import TextNormalizer
+
+
+def pages_from(texts) -> list:
+    return [PageRecord(number, text, 0, len(text)) for number, text in enumerate(texts, start=1)]
+
+
+def table_page(number: int) -> str:
+    return "\n".join([
+        "Annual Report of the Example Society",
+        f"Results for region {number} are summarized below.",
+        "Table 1",
+        "Year",
+        "Value",
+        "269",
+        "511.1",
+        "42 %",
+        f"Region {number} grew steadily over the period.",
+        f"Page {number} of 6",
+        "Confidential - internal use only",
+    ])
+
+
+class TextNormalizerTests(SimpleTestCase):
+    """TextNormalizer.normalize"""
+
+    def setUp(self):
+        self.normalizer = TextNormalizer()
+
+    def test_running_headers_and_footers_are_removed(self):
+        normalized, report = self.normalizer.normalize(pages_from(table_page(n) for n in range(1, 7)))
+
+        text = "".join(page.text for page in normalized)
+        self.assertNotIn("Annual Report", text)
+        self.assertNotIn("Confidential", text)
+        self.assertNotIn("Page 3 of 6", text)
+        self.assertEqual(report.boilerplate_lines_removed, 18)
+
+    def test_table_and_number_rows_survive(self):
+        normalized, _ = self.normalizer.normalize(pages_from(table_page(n) for n in range(1, 7)))
+
+        self.assertEqual(len(normalized), 6)
+        for page in normalized:
+            lines = page.text.splitlines()
+            for row in ("Table 1", "Year", "Value", "269", "511.1", "42 %"):
+                self.assertIn(row, lines)
+
+    def test_bare_numbers_at_page_edges_are_kept(self):
+        texts = [f"{n * 100}\nBody text of page {n}.\n12.5" for n in range(1, 7)]
+
+        normalized, report = self.normalizer.normalize(pages_from(texts))
+
+        self.assertEqual(report.boilerplate_lines_removed, 0)
+        self.assertTrue(all(page.text.endswith("12.5\n") for page in normalized))
+
+    def test_repeated_tables_keep_every_page(self):
+        body = "\n".join(["Header", "Intro line.", "Row", "1", "2", "3", "4", "5", "6", "Closing line.", "Footer"])
+        texts = [body.replace("Row", f"Row {n}") for n in range(1, 7)]
+
+        normalized, _ = self.normalizer.normalize(pages_from(texts))
+
+        self.assertEqual(len(normalized), 6)
+        self.assertIn("Row 1\n1\n2\n3\n4\n5\n6", normalized[0].text)
+
+    def test_short_documents_are_left_alone(self):
+        normalized, report = self.normalizer.normalize(pages_from(["Header\nOne.", "Header\nTwo."]))
+
+        self.assertEqual(report.boilerplate_lines, 0)
+        self.assertTrue(all(page.text.startswith("Header") for page in normalized))
+
+    def test_duplicate_and_empty_pages_are_dropped(self):
+        normalized, report = self.normalizer.normalize(pages_from(["Same text.", "   ", "Same text."]))
+
+        self.assertEqual([page.number for page in normalized], [1])
+        self.assertEqual(report.empty_pages_removed, 1)
+        self.assertEqual(report.duplicate_pages_removed, 1)
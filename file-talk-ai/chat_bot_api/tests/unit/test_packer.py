@@ -0,0 +1,54 @@
+"""
+Context Packer Tests
+Splitting pages into budget-sized groups
+"""
+from django.test import SimpleTestCase
+from chat_bot_api.domain.models import PageRecord
+from chat_bot_api.infrastructure.text import ContextPacker, TokenEstimator
+
+
+def page(number: int, text: str) -> PageRecord:
+    return PageRecord(number, text, 0, len(text))
+
+
+def words(group) -> list:
+    return [word for record in group.pages for word in record.text.split()]
+
+
+class ContextPackerSplitTests(SimpleTestCase):
+    """ContextPacker.split"""
+
+    def setUp(self):
+        self.packer = ContextPacker(200, TokenEstimator(safety_factor=1.0), min_fragment_tokens=10)
+
+    def test_small_pages_share_groups(self):
+        pages = [page(n, f"Sentence of page {n}. " * 10) for n in range(1, 7)]
+
+        groups = self.packer.split(pages)
+
+        self.assertEqual([record.number for group in groups for record in group.pages], list(range(1, 7)))
+        self.assertTrue(all(group.tokens <= 200 for group in groups))
+        self.assertLess(len(groups), 6)
+
+    def test_oversized_page_continues_in_following_groups(self):
+        sentences = [f"Sentence number w{i} ends here." for i in range(150)]
+        pages = [page(1, "Short first page."), page(2, " ".join(sentences)), page(3, "Short last page.")]
+
+        groups = self.packer.split(pages)
+
+        self.assertGreater(len(groups), 3)
+        self.assertTrue(all(group.tokens <= 200 for group in groups))
+        text = " ".join(word for group in groups for word in words(group))
+        for i in range(150):
+            self.assertIn(f"w{i} ", text)
+        self.assertEqual(groups[-1].pages[-1].number, 3)
+        self.assertEqual(groups[-1].pages[0].number, 2)  # the page's tail shares a group
+
+    def test_page_without_sentence_ends_is_cut_at_words(self):
+        text = " ".join(f"w{i}" for i in range(600))
+
+        groups = self.packer.split([page(1, text)])
+
+        self.assertGreater(len(groups), 1)
+        self.assertEqual([word for group in groups for word in words(group)], text.split())
+        self.assertTrue(all(group.truncated_pages == [1] for group in groups[:-1]))
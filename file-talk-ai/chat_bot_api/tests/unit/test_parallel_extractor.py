@@ -0,0 +1,49 @@
+"""
+Parallel Page Extractor Tests
+Windowing and in-memory document hand-off to worker processes
+"""
+import os
+from django.test import SimpleTestCase
+from chat_bot_api.infrastructure.pdf import ParallelPageExtractor
+from chat_bot_api.tests.fixtures.pdfs import build_pdf
+
+
+class ParallelPageExtractorTests(SimpleTestCase):
+    """Process pool extraction of in-memory documents"""
+
+    @classmethod
+    def tearDownClass(cls):
+        ParallelPageExtractor.shutdown()
+        super().tearDownClass()
+
+    def test_window_gives_every_worker_a_full_batch(self):
+        extractor = ParallelPageExtractor(max_workers=4, min_parallel_pages=24)
+
+        self.assertEqual(extractor.window_pages, 96)
+        self.assertTrue(extractor.is_parallel(24))
+        self.assertFalse(extractor.is_parallel(23))
+        self.assertFalse(ParallelPageExtractor(max_workers=1).is_parallel(1000))
+
+    def test_spill_writes_bytes_once_and_removes_the_file(self):
+        data = build_pdf(2)
+
+        with ParallelPageExtractor.spill(bytearray(data)) as path:
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), data)
+
+        self.assertFalse(os.path.exists(path))
+
+    def test_spill_passes_paths_through(self):
+        with ParallelPageExtractor.spill('/some/file.pdf') as path:
+            self.assertEqual(path, '/some/file.pdf')
+
+    def test_parallel_extraction_of_bytes_matches_in_process(self):
+        data = build_pdf(12)
+        parallel = ParallelPageExtractor(max_workers=2, min_parallel_pages=4, start_method='fork')
+        in_process = ParallelPageExtractor(max_workers=1)
+
+        pages = parallel.extract(data, range(1, 13))
+
+        self.assertEqual(list(pages), list(range(1, 13)))
+        self.assertEqual(pages, in_process.extract(data, range(1, 13)))
+        self.assertIn('page 12', pages[12])
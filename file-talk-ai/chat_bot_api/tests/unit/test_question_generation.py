@@ -0,0 +1,210 @@
+"""
+Question Generation Tests
+Section output parsing, round-robin merging and MinHash near-duplicate removal
+"""
+import re
+from unittest import mock
+from django.test import SimpleTestCase
+from config.env_config import config
+from chat_bot_api.application.services.question_generation_service import QuestionGenerationService
+from chat_bot_api.domain.exceptions import AgentProcessingError
+from chat_bot_api.domain.models import PageRecord
+from chat_bot_api.infrastructure.search import MinHasher, deduplicate, shingles
+from chat_bot_api.infrastructure.text import PackedContext
+
+_TITLE = re.compile(r'\((Pages? [\d-]+)\)')
+
+# Distinct vocabulary per section so that only intended repeats collide
+SECTION_QUESTIONS = {
+    'Pages 1-2': [
+        "What are the main ideas of photosynthesis?",
+        "How does chlorophyll absorb light?",
+        "Why do leaves change colour in autumn?",
+    ],
+    'Pages 3-4': [
+        "How do enzymes lower activation energy?",
+        "What limits the rate of an enzyme reaction?",
+        "Which factors denature proteins?",
+    ],
+    'Pages 5-6': [
+        "When did the committee approve the budget?",
+        "Who audits municipal spending?",
+        "Why are tax revenues volatile?",
+    ],
+}
+
+
+def section(first: int, last: int) -> PackedContext:
+    pages = [PageRecord(n, f"text of page {n}", 0, 0, 10) for n in range(first, last + 1)]
+    return PackedContext(pages, 20, 100)
+
+
+def numbered(questions, key_point=None) -> str:
+    lines = [f"{number}. {question}" for number, question in enumerate(questions, start=1)]
+    if key_point:
+        lines.append(f"Key point: {key_point}")
+    return "\n".join(lines)
+
+
+class ParseSectionOutputTests(SimpleTestCase):
+    """Questions and key point from free-form model output"""
+
+    parse = staticmethod(QuestionGenerationService._parse_section_output)
+
+    def test_numbered_questions_and_key_point(self):
+        output = "Here are the questions:\n\n1. What is A?\n2) Why is B?\n\nKey point: A causes B."
+
+        self.assertEqual(self.parse(output), (['What is A?', 'Why is B?'], 'A causes B.'))
+
+    def test_bullets_and_q_labels(self):
+        output = "- What is A?\n* How is B?\n• Where is C?\nQ4: When is D?"
+
+        questions, key_point = self.parse(output)
+
+        self.assertEqual(questions, ['What is A?', 'How is B?', 'Where is C?', 'When is D?'])
+        self.assertIsNone(key_point)
+
+    def test_markdown_emphasis_is_removed(self):
+        output = "1. **What is A?**\n**Key Points:** A matters."
+
+        self.assertEqual(self.parse(output), (['What is A?'], 'A matters.'))
+
+    def test_non_questions_are_skipped(self):
+        output = "1. Explain A.\n2. What is B?\nWhat is C?\n2024. Budget year"
+
+        self.assertEqual(self.parse(output)[0], ['What is B?'])
+
+    def test_empty_output(self):
+        self.assertEqual(self.parse(""), ([], None))
+
+
+class GenerateSectionedTests(SimpleTestCase):
+    """Per-section questions merged round-robin without near-duplicates"""
+
+    def setUp(self):
+        with mock.patch('chat_bot_api.application.services.question_generation_service.PDFService'):
+            self.service = QuestionGenerationService()
+        self.service.pdf_service.render_pages.side_effect = lambda pages, header, footer: header + footer
+        self.service.create_agent = mock.Mock()
+        self.outputs = {
+            title: numbered(questions, f"key point of {title}")
+            for title, questions in SECTION_QUESTIONS.items()
+        }
+        self.service.run_agent = mock.Mock(
+            side_effect=lambda agent, prompt: self.outputs[_TITLE.search(prompt).group(1)]
+        )
+        self.sections = [section(1, 2), section(3, 4), section(5, 6)]
+
+    def generate(self, count: int) -> str:
+        with mock.patch.object(config, 'QUESTIONS_COUNT', count):
+            return self.service._generate_sectioned(self.sections, 3000)
+
+    @staticmethod
+    def questions(output: str) -> list:
+        return re.findall(r'^\d+\. (.+)$', output, re.MULTILINE)
+
+    def test_every_section_is_covered(self):
+        questions = self.questions(self.generate(4))
+
+        # Round-robin picks the first question of each section, then the second of the first
+        self.assertEqual(questions, [
+            SECTION_QUESTIONS['Pages 1-2'][0],
+            SECTION_QUESTIONS['Pages 1-2'][1],
+            SECTION_QUESTIONS['Pages 3-4'][0],
+            SECTION_QUESTIONS['Pages 5-6'][0],
+        ])
+        self.assertEqual(self.service.run_agent.call_count, 3)
+
+    def test_selected_questions_keep_document_order(self):
+        questions = self.questions(self.generate(9))
+
+        self.assertEqual(questions, [q for qs in SECTION_QUESTIONS.values() for q in qs])
+
+    def test_near_duplicates_keep_first_section(self):
+        self.outputs['Pages 3-4'] = numbered([
+            "What is the main idea of photosynthesis?",
+            *SECTION_QUESTIONS['Pages 3-4'][1:],
+        ])
+
+        questions = self.questions(self.generate(20))
+
+        self.assertIn("What are the main ideas of photosynthesis?", questions)
+        self.assertNotIn("What is the main idea of photosynthesis?", questions)
+        self.assertEqual(len(questions), 8)
+
+    def test_short_sections_do_not_stall_round_robin(self):
+        self.outputs['Pages 1-2'] = numbered(SECTION_QUESTIONS['Pages 1-2'][:1])
+
+        questions = self.questions(self.generate(3))
+
+        self.assertEqual(questions, [
+            SECTION_QUESTIONS['Pages 1-2'][0],
+            SECTION_QUESTIONS['Pages 3-4'][0],
+            SECTION_QUESTIONS['Pages 5-6'][0],
+        ])
+
+    def test_key_points_are_listed_per_section(self):
+        self.outputs['Pages 3-4'] = numbered(SECTION_QUESTIONS['Pages 3-4'])
+
+        output = self.generate(3)
+
+        self.assertIn("## Most Important Points", output)
+        self.assertIn("- **Pages 1-2:** key point of Pages 1-2", output)
+        self.assertNotIn("Pages 3-4:", output)
+        self.assertIn("- **Pages 5-6:** key point of Pages 5-6", output)
+
+    def test_no_questions_is_an_error(self):
+        self.outputs = dict.fromkeys(self.outputs, "I cannot help with that.")
+
+        with self.assertRaises(AgentProcessingError):
+            self.generate(5)
+
+
+class DeduplicateTests(SimpleTestCase):
+    """MinHash near-duplicate removal"""
+
+    def test_rewordings_are_duplicates(self):
+        texts = [
+            "What are the main ideas of photosynthesis?",
+            "How do enzymes lower activation energy?",
+            "What is the main idea of photosynthesis?",
+            "main ideas photosynthesis",
+        ]
+
+        self.assertEqual(deduplicate(texts), [0, 1])
+
+    def test_distinct_texts_are_kept(self):
+        texts = SECTION_QUESTIONS['Pages 1-2']
+
+        self.assertEqual(deduplicate(texts), [0, 1, 2])
+
+    def test_stopword_only_texts_match_exactly(self):
+        texts = ["What is it?", "what  is IT?", "Is it?"]
+
+        self.assertEqual(deduplicate(texts), [0, 2])
+
+    def test_threshold_one_only_drops_identical_shingles(self):
+        texts = [
+            "How does photosynthesis convert light energy?",
+            "How does photosynthesis store light energy?",
+            "photosynthesis convert light energy",
+        ]
+
+        self.assertEqual(deduplicate(texts, threshold=1.0), [0, 1])
+
+    def test_shingles_drop_stopwords_and_plurals(self):
+        self.assertEqual(
+            shingles("What are the main ideas of the class?"),
+            {'main', 'idea', 'class', 'main idea', 'idea class'}
+        )
+
+    def test_similarity_estimates_jaccard(self):
+        first = shingles("alpha beta gamma delta epsilon zeta eta theta")
+        second = shingles("alpha beta gamma delta iota kappa lambda mu")
+        jaccard = len(first & second) / len(first | second)
+        hasher = MinHasher(num_perm=256)
+
+        estimate = hasher.similarity(hasher.signature(first), hasher.signature(second))
+
+        self.assertAlmostEqual(estimate, jaccard, delta=0.1)
+        self.assertEqual(hasher.similarity(hasher.signature(first), hasher.signature(set(first))), 1.0)
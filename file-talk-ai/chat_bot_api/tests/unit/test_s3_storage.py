@@ -0,0 +1,181 @@
+"""
+S3 Storage Tests
+Blob uploads and reads against an in-memory S3 client
+"""
+import hashlib
+import io
+import itertools
+from django.test import SimpleTestCase
+from chat_bot_api.infrastructure.storage.s3_storage import MIN_PART_SIZE, S3StorageBackend
+
+
+class _ClientError(Exception):
+    """Error shaped like botocore's ClientError"""
+
+    def __init__(self, code: str):
+        super().__init__(code)
+        self.response = {'Error': {'Code': code}}
+
+
+class InMemoryS3Client:
+    """The subset of the S3 API used by S3StorageBackend, kept in dicts"""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = {}
+        self.calls = []
+        self.fail_on = set()
+        self._ids = itertools.count(1)
+
+    def _call(self, name: str):
+        self.calls.append(name)
+        if name in self.fail_on:
+            raise _ClientError('InternalError')
+
+    def head_object(self, Bucket, Key):
+        self._call('head_object')
+        if Key not in self.objects:
+            raise _ClientError('404')
+        return {'ContentLength': len(self.objects[Key])}
+
+    def get_object(self, Bucket, Key):
+        self._call('get_object')
+        if Key not in self.objects:
+            raise _ClientError('NoSuchKey')
+        return {'Body': io.BytesIO(self.objects[Key])}
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self._call('put_object')
+        self.objects[Key] = bytes(Body)
+
+    def delete_object(self, Bucket, Key):
+        self._call('delete_object')
+        self.objects.pop(Key, None)
+
+    def create_multipart_upload(self, Bucket, Key, ContentType=None):
+        self._call('create_multipart_upload')
+        upload_id = str(next(self._ids))
+        self.uploads[upload_id] = {}
+        return {'UploadId': upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self._call('upload_part')
+        self.uploads[UploadId][PartNumber] = bytes(Body)
+        return {'ETag': f'"{PartNumber}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self._call('complete_multipart_upload')
+        parts = self.uploads.pop(UploadId)
+        self.objects[Key] = b''.join(parts[part['PartNumber']] for part in MultipartUpload['Parts'])
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self._call('abort_multipart_upload')
+        self.uploads.pop(UploadId, None)
+
+    def copy_object(self, Bucket, Key, CopySource, **kwargs):
+        self._call('copy_object')
+        self.objects[Key] = self.objects[CopySource['Key']]
+
+
+class S3BlobWriterTests(SimpleTestCase):
+    """Uploads through S3BlobWriter"""
+
+    def setUp(self):
+        self.client = InMemoryS3Client()
+        self.storage = S3StorageBackend('bucket', client=self.client, part_size=MIN_PART_SIZE)
+
+    def write(self, data: bytes, chunk_size: int = 1024 * 1024):
+        writer = self.storage.open_writer()
+        for start in range(0, len(data), chunk_size):
+            writer.write(data[start:start + chunk_size])
+        return writer, writer.commit()
+
+    def test_small_blob_is_sent_with_one_put(self):
+        data = b'%PDF small'
+
+        _, blob = self.write(data)
+
+        self.assertEqual(blob.key, hashlib.sha256(data).hexdigest())
+        self.assertTrue(blob.created)
+        self.assertEqual(self.client.objects, {f'pdfs/{blob.key}': data})
+        self.assertNotIn('create_multipart_upload', self.client.calls)
+
+    def test_large_blob_is_uploaded_in_parts(self):
+        data = bytes(range(256)) * (MIN_PART_SIZE * 2 // 256 + 100)
+
+        _, blob = self.write(data)
+
+        self.assertEqual(self.client.calls.count('upload_part'), 3)
+        self.assertEqual(self.client.objects, {f'pdfs/{blob.key}': data})
+        self.assertEqual(self.storage.read(blob.key), data)
+        self.assertEqual(self.client.uploads, {})
+
+    def test_failed_upload_is_aborted(self):
+        data = b'x' * (MIN_PART_SIZE + 10)
+        self.client.fail_on.add('complete_multipart_upload')
+
+        with self.assertRaises(_ClientError):
+            self.write(data)
+
+        self.assertIn('abort_multipart_upload', self.client.calls)
+        self.assertEqual(self.client.uploads, {})
+        self.assertEqual(self.client.objects, {})
+
+    def test_failed_copy_removes_the_temporary_object(self):
+        data = b'x' * (MIN_PART_SIZE + 10)
+        self.client.fail_on.add('copy_object')
+
+        with self.assertRaises(_ClientError):
+            self.write(data)
+
+        self.assertEqual(self.client.objects, {})
+
+    def test_existing_content_is_not_uploaded_again(self):
+        data = b'y' * (MIN_PART_SIZE + 10)
+        _, first = self.write(data)
+        self.client.calls.clear()
+
+        _, again = self.write(data)
+
+        self.assertEqual(again.key, first.key)
+        self.assertFalse(again.created)
+        self.assertIn('abort_multipart_upload', self.client.calls)
+        self.assertNotIn('complete_multipart_upload', self.client.calls)
+        self.assertEqual(list(self.client.objects), [f'pdfs/{first.key}'])
+
+    def test_aborted_writer_leaves_nothing_behind(self):
+        writer = self.storage.open_writer()
+        writer.write(b'z' * (MIN_PART_SIZE + 10))
+        writer.abort()
+
+        self.assertEqual(self.client.uploads, {})
+        self.assertEqual(self.client.objects, {})
+
+
+class S3StorageBackendTests(SimpleTestCase):
+    """Reads from S3StorageBackend"""
+
+    def setUp(self):
+        self.client = InMemoryS3Client()
+        self.storage = S3StorageBackend('bucket', client=self.client)
+        self.data = b'%PDF content'
+        writer = self.storage.open_writer()
+        writer.write(self.data)
+        self.key = writer.commit().key
+
+    def test_read_buffer_streams_into_a_bytearray(self):
+        buffer = self.storage.read_buffer(self.key, chunk_size=4)
+
+        self.assertIsInstance(buffer, bytearray)
+        self.assertEqual(buffer, self.data)
+
+    def test_missing_blob(self):
+        missing = '0' * 64
+
+        self.assertFalse(self.storage.exists(missing))
+        with self.assertRaises(FileNotFoundError):
+            self.storage.read_buffer(missing)
+
+    def test_blobs_are_not_local(self):
+        self.assertIsNone(self.storage.local_path(self.key))
+        self.assertEqual(self.storage.size(self.key), len(self.data))
@@ -0,0 +1,169 @@
+"""
+Session Context Store Tests
+Idle timeout, byte-budget eviction and expiry notifications
+"""
+import time
+from unittest import mock
+import numpy as np
+from django.test import SimpleTestCase
+from chat_bot_api.infrastructure.cache import MemoryLRUCache
+from chat_bot_api.infrastructure.search import TextChunk, VectorIndex
+from chat_bot_api.infrastructure.sessions import SessionContext, SessionContextStore
+
+IDLE_TTL = 60
+
+
+def context(session_id: str, size: int = 1000, document_url: str = 'https://example.com/doc.pdf') -> SessionContext:
+    return SessionContext(session_id, document_url, 'a' * 64, 'v1', pdf_text='x' * size)
+
+
+class Clock:
+    """Patched time.time that only moves when told to"""
+
+    def __init__(self, test: SimpleTestCase):
+        self.now = time.time()
+        test.enterContext(mock.patch('time.time', side_effect=lambda: self.now))
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class SessionContextStoreTests(SimpleTestCase):
+    """Idle TTL and LRU byte budget"""
+
+    def setUp(self):
+        self.clock = Clock(self)
+        self.expired = []
+        self.store = SessionContextStore(max_bytes=3500, idle_ttl=IDLE_TTL, on_expire=self.expired.append)
+
+    def test_round_trip(self):
+        self.store.put(context('s1'))
+
+        self.assertEqual(self.store.get('s1').session_id, 's1')
+        self.assertIsNone(self.store.get('s2'))
+
+    def test_idle_session_expires(self):
+        self.store.put(context('s1'))
+        self.clock.advance(IDLE_TTL + 1)
+
+        self.assertIsNone(self.store.get('s1'))
+        self.assertEqual(self.expired, ['s1'])
+
+    def test_use_renews_idle_timeout(self):
+        self.store.put(context('s1'))
+        for _ in range(3):
+            self.clock.advance(IDLE_TTL - 10)
+            self.assertIsNotNone(self.store.get('s1'))
+
+        self.clock.advance(IDLE_TTL + 1)
+
+        self.assertIsNone(self.store.get('s1'))
+
+    def test_storing_a_session_sweeps_idle_ones(self):
+        self.store.put(context('s1'))
+        self.clock.advance(IDLE_TTL - 10)
+        self.store.put(context('s2'))
+        self.clock.advance(20)
+
+        self.store.put(context('s3'))
+
+        self.assertEqual(self.expired, ['s1'])
+        self.assertEqual(self.store.stats()['entries'], 2)
+
+    def test_budget_evicts_least_recently_used(self):
+        for session_id in ('s1', 's2', 's3'):
+            self.store.put(context(session_id))
+        self.store.get('s1')
+
+        self.store.put(context('s4'))
+
+        self.assertIsNone(self.store.get('s2'))
+        self.assertIsNotNone(self.store.get('s1'))
+        self.assertIsNotNone(self.store.get('s3'))
+        self.assertEqual(self.expired, ['s2'])
+        self.assertLessEqual(self.store.stats()['bytes'], 3500)
+        self.assertEqual(self.store.stats()['evictions'], 1)
+
+    def test_large_context_evicts_several(self):
+        self.store.put(context('s1'))
+        self.store.put(context('s2'))
+
+        self.store.put(context('big', size=3000))
+
+        self.assertEqual(self.expired, ['s1', 's2'])
+
+    def test_context_over_budget_is_not_kept(self):
+        self.store.put(context('s1'))
+
+        self.store.put(context('huge', size=5000))
+
+        self.assertIsNone(self.store.get('huge'))
+        self.assertIsNotNone(self.store.get('s1'))
+        self.assertEqual(self.expired, [])
+
+    def test_replacing_or_evicting_explicitly_is_not_expiry(self):
+        self.store.put(context('s1'))
+        self.store.put(context('s1', document_url='https://example.com/other.pdf'))
+        self.store.put(context('s2'))
+
+        self.store.evict('s2')
+
+        self.assertEqual(self.store.get('s1').document_url, 'https://example.com/other.pdf')
+        self.assertIsNone(self.store.get('s2'))
+        self.assertEqual(self.expired, [])
+
+    def test_without_callback(self):
+        store = SessionContextStore(max_bytes=1500, idle_ttl=IDLE_TTL)
+        store.put(context('s1'))
+        store.put(context('s2'))
+
+        self.assertIsNone(store.get('s1'))
+
+
+class SessionContextSizeTests(SimpleTestCase):
+    """Bytes counted against the store budget"""
+
+    def test_heap_vectors_count_but_memory_mapped_do_not(self):
+        chunks = [TextChunk(0, 'x' * 100, 1, 1, 0)]
+        vectors = np.zeros((1, 256), dtype=np.float32)
+        in_heap = SessionContext('s', 'url', None, 'v1', vector_index=VectorIndex(vectors, chunks, 'sig'))
+
+        mapped = mock.Mock(spec=np.memmap)
+        memory_mapped = SessionContext('s', 'url', None, 'v1', vector_index=VectorIndex(mapped, chunks, 'sig'))
+
+        self.assertEqual(in_heap.nbytes, 1024 + 100)
+        self.assertEqual(memory_mapped.nbytes, 100)
+
+    def test_matches_document_and_settings(self):
+        session = context('s1')
+
+        self.assertTrue(session.matches('https://example.com/doc.pdf', 'v1'))
+        self.assertFalse(session.matches('https://example.com/doc.pdf', 'v2'))
+        self.assertFalse(session.matches('https://example.com/other.pdf', 'v1'))
+
+
+class MemoryLRUCacheEvictionCallbackTests(SimpleTestCase):
+    """on_evict reports dropped entries, outside the cache lock"""
+
+    def test_callback_may_use_the_cache(self):
+        cache = MemoryLRUCache(max_bytes=200, default_ttl=10)
+        dropped = []
+        cache.on_evict = lambda key, value: dropped.append((key, value, cache.get(key)))
+        cache.set('a', 'x' * 60)
+
+        cache.set('b', 'y' * 60)
+
+        self.assertEqual(dropped, [('a', 'x' * 60, None)])
+
+    def test_purge_expired(self):
+        cache = MemoryLRUCache(max_bytes=10_000, default_ttl=10)
+        dropped = []
+        cache.on_evict = lambda key, value: dropped.append(key)
+        cache.set('a', 1)
+        cache.set('b', 2, ttl=100)
+
+        with mock.patch('time.time', return_value=time.time() + 11):
+            self.assertEqual(cache.purge_expired(), 1)
+
+        self.assertEqual(dropped, ['a'])
+        self.assertEqual(cache.get('b'), 2)
@@ -0,0 +1,150 @@
+"""
+Single Flight Tests
+In-process deduplication and file-lock coordination between processes
+"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import mock
+from django.test import SimpleTestCase
+from chat_bot_api.application.services.pdf_service import PDFService
+from chat_bot_api.core.utils.single_flight import FileLockSingleFlight, SingleFlight
+from chat_bot_api.infrastructure.cache import MemoryLRUCache, NullCache, TieredCache
+
+
+class SingleFlightTests(SimpleTestCase):
+    """In-process coordinator"""
+
+    def test_concurrent_callers_share_one_execution(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 'result'
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do('key', work))) for _ in range(5)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        while flight.stats()['shared'] < 4:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['result'] * 5)
+        self.assertEqual(flight.stats(), {'executions': 1, 'shared': 4, 'in_flight': 0})
+
+    def test_errors_are_shared_and_not_remembered(self):
+        flight = SingleFlight()
+
+        with self.assertRaises(ValueError):
+            flight.do('key', lambda: (_ for _ in ()).throw(ValueError("boom")))
+        self.assertEqual(flight.do('key', lambda: 'ok'), 'ok')
+
+
+class FileLockSingleFlightTests(SimpleTestCase):
+    """Coordination through lock files (each instance stands in for a process)"""
+
+    def setUp(self):
+        self.lock_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.lock_dir, ignore_errors=True)
+
+    def hold_lock(self, key, seconds: float) -> threading.Event:
+        """Hold the key's lock from another coordinator for a while; the event is set on release"""
+        other = FileLockSingleFlight(self.lock_dir)
+        held = threading.Event()
+        released = threading.Event()
+
+        def run():
+            other.do(key, lambda: (held.set(), time.sleep(seconds)))
+            released.set()
+
+        threading.Thread(target=run, daemon=True).start()
+        held.wait(5)
+        return released
+
+    def test_waits_for_the_lock_held_elsewhere(self):
+        self.hold_lock('key', 0.3)
+        flight = FileLockSingleFlight(self.lock_dir, timeout=5)
+
+        start = time.monotonic()
+        flight.do('key', lambda: None)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_per_call_timeout_overrides_the_default(self):
+        self.hold_lock('key', 2)
+        flight = FileLockSingleFlight(self.lock_dir, timeout=60)
+
+        start = time.monotonic()
+        self.assertEqual(flight.do('key', lambda: 'ran anyway', timeout=0.1), 'ran anyway')
+
+        self.assertLess(time.monotonic() - start, 1.5)
+
+    def test_acquiring_touches_the_lock_file(self):
+        flight = FileLockSingleFlight(self.lock_dir)
+        flight.do('key', lambda: None)
+        path = os.path.join(self.lock_dir, os.listdir(self.lock_dir)[0])
+        os.utime(path, (1000, 1000))
+
+        flight.do('key', lambda: None)
+
+        self.assertGreater(os.path.getmtime(path), time.time() - 60)
+
+    def test_lock_file_removed_while_waiting_is_reopened(self):
+        self.hold_lock('key', 0.3)
+        path = os.path.join(self.lock_dir, os.listdir(self.lock_dir)[0])
+        flight = FileLockSingleFlight(self.lock_dir, timeout=5)
+        newcomer = {}
+        ran_after_newcomer = []
+        waiter = threading.Thread(
+            target=lambda: flight.do('key', lambda: ran_after_newcomer.append(newcomer['released'].is_set()))
+        )
+        waiter.start()
+        time.sleep(0.1)  # the waiter now has the old file open
+
+        # What the janitor does to an idle lock file, then a newcomer locks the new file
+        os.unlink(path)
+        newcomer['released'] = self.hold_lock('key', 0.6)
+        waiter.join(5)
+
+        self.assertEqual(ran_after_newcomer, [True])
+
+    def test_in_process_calls_skip_the_file_lock(self):
+        self.hold_lock('key', 2)
+        flight = FileLockSingleFlight(self.lock_dir, timeout=60)
+
+        start = time.monotonic()
+        flight.do('key', lambda: None, cross_process=False)
+
+        self.assertLess(time.monotonic() - start, 1)
+
+
+class ProcessPDFFlightTests(SimpleTestCase):
+    """process_pdf only coordinates across processes when results are shared"""
+
+    def run_process_pdf(self, text_cache):
+        with mock.patch('chat_bot_api.application.services.pdf_service.get_cache', return_value=text_cache):
+            service = PDFService()
+        service.flight = mock.Mock()
+        service.process_pdf('https://example.com/doc.pdf', 1, 2)
+        return service.flight.do.call_args.kwargs['cross_process']
+
+    def test_without_text_cache_only_this_process_is_deduplicated(self):
+        self.assertFalse(self.run_process_pdf(NullCache()))
+
+    def test_with_text_cache_other_processes_wait_for_the_result(self):
+        self.assertTrue(self.run_process_pdf(TieredCache([MemoryLRUCache(1024)])))
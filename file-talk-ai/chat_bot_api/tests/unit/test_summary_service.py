@@ -0,0 +1,295 @@
+"""
+Summary Service Tests
+Map-reduce summaries, summary tree layout and node reuse, with the agent calls stubbed out
+"""
+import re
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+from django.test import SimpleTestCase
+from config.env_config import config
+from chat_bot_api.application.services.summary_service import SummaryService
+from chat_bot_api.domain.models import PageRecord
+from chat_bot_api.infrastructure.cache import MemoryLRUCache
+from chat_bot_api.infrastructure.text import PackedContext, SummaryNode, SummaryTree
+
+_TITLE = re.compile(r'\((Pages? [\d-]+)\)')
+
+
+def pages(first: int, last: int) -> list:
+    return [PageRecord(n, f"text of page {n}", 0, 0, 10) for n in range(first, last + 1)]
+
+
+class StubbedAgentMixin:
+    """SummaryService whose agent answers with the title of what it was asked to summarize"""
+
+    def make_service(self, total_pages: int = 40) -> SummaryService:
+        with mock.patch('chat_bot_api.application.services.summary_service.PDFService'):
+            service = SummaryService()
+
+        pdf = service.pdf_service
+        pdf.lookup_fresh_document.return_value = SimpleNamespace(
+            id=1, content_sha256='a' * 64, total_pages=total_pages
+        )
+        pdf.resolve_page_range.side_effect = lambda min_page, max_page, total: (min_page or 1, max_page or total)
+        pdf.page_extractor.engine = 'fast'
+        pdf.pack_pages.side_effect = lambda records, budget: PackedContext(records, 0, budget)
+        pdf.render_pages.side_effect = lambda records, header, footer: (
+            header + "".join(page.marker + page.text for page in records) + footer
+        )
+        pdf.split_pages.side_effect = lambda records, section_tokens: [
+            PackedContext(records[start:start + 2], 1000, section_tokens) for start in range(0, len(records), 2)
+        ]
+
+        service.result_cache = MemoryLRUCache(max_bytes=1 << 20)
+        service.tree = SummaryTree(leaf_pages=4, fanout=2)
+        service.create_agent = mock.Mock()
+        self.prompts = []
+        self.prompts_lock = threading.Lock()
+        service.run_agent = mock.Mock(side_effect=self.answer)
+        service._load_pages = mock.Mock(side_effect=lambda url, first, last: pages(first, last))
+        return service
+
+    def answer(self, agent, prompt: str) -> str:
+        with self.prompts_lock:
+            self.prompts.append(prompt)
+        match = _TITLE.search(prompt)
+        return f"summary of {match.group(1)}" if match else "overview"
+
+
+class SummaryTreeTests(SimpleTestCase):
+    """Page-aligned decomposition"""
+
+    def setUp(self):
+        self.tree = SummaryTree(leaf_pages=4, fanout=2)
+
+    def assert_covers(self, nodes, first_page, last_page):
+        self.assertEqual(nodes[0].first_page, first_page)
+        self.assertEqual(nodes[-1].last_page, last_page)
+        for before, after in zip(nodes, nodes[1:]):
+            self.assertEqual(after.first_page, before.last_page + 1)
+
+    def test_aligned_range_is_one_node(self):
+        self.assertEqual(self.tree.decompose(1, 16), [SummaryNode(2, 1, 16)])
+
+    def test_largest_aligned_nodes_first(self):
+        nodes = self.tree.decompose(1, 28)
+
+        self.assertEqual(nodes, [SummaryNode(2, 1, 16), SummaryNode(1, 17, 24), SummaryNode(0, 25, 28)])
+
+    def test_edges_are_unaligned_leaves(self):
+        nodes = self.tree.decompose(3, 18)
+
+        self.assertEqual(nodes, [
+            SummaryNode(0, 3, 4, aligned=False),
+            SummaryNode(0, 5, 8),
+            SummaryNode(1, 9, 16),
+            SummaryNode(0, 17, 18, aligned=False),
+        ])
+
+    def test_single_page_and_short_ranges(self):
+        self.assertEqual(self.tree.decompose(6, 6), [SummaryNode(0, 6, 6, aligned=False)])
+        self.assertEqual(self.tree.decompose(2, 3), [SummaryNode(0, 2, 3, aligned=False)])
+
+    def test_ranges_share_grid_nodes(self):
+        for first_page, last_page in [(1, 100), (7, 93), (33, 64), (2, 5)]:
+            nodes = self.tree.decompose(first_page, last_page)
+            self.assert_covers(nodes, first_page, last_page)
+            for node in nodes:
+                if node.aligned:
+                    self.assertEqual((node.first_page - 1) % self.tree.span(node.level), 0)
+                    self.assertEqual(node.last_page - node.first_page + 1, self.tree.span(node.level))
+
+    def test_node_count_is_logarithmic(self):
+        tree = SummaryTree(leaf_pages=8, fanout=4)
+
+        self.assertLessEqual(len(tree.decompose(3, 5000)), 2 * 3 * 4 + 2)
+
+    def test_children(self):
+        self.assertEqual(
+            self.tree.children(SummaryNode(2, 17, 32)),
+            [SummaryNode(1, 17, 24), SummaryNode(1, 25, 32)]
+        )
+        self.assertEqual(self.tree.children(SummaryNode(0, 1, 4)), [])
+        self.assertEqual(self.tree.children(SummaryNode(0, 3, 4, aligned=False)), [])
+
+    def test_titles(self):
+        self.assertEqual(SummaryNode(0, 5, 5).title, 'Page 5')
+        self.assertEqual(SummaryNode(1, 1, 8).title, 'Pages 1-8')
+
+    def test_invalid_layout(self):
+        with self.assertRaises(ValueError):
+            SummaryTree(leaf_pages=0)
+        with self.assertRaises(ValueError):
+            SummaryTree(fanout=1)
+
+
+class SummarizeTreeTests(StubbedAgentMixin, SimpleTestCase):
+    """SummaryService._summarize_tree reusing cached nodes"""
+
+    URL = 'https://example.com/doc.pdf'
+
+    def setUp(self):
+        self.service = self.make_service()
+
+    def test_first_range_summarizes_leaves_then_merges(self):
+        summary = self.service._summarize_tree(self.URL, 1, 16)
+
+        self.assertEqual(summary, 'summary of Pages 1-16')
+        # 4 leaves, 2 level-1 merges, 1 level-2 merge; no overview for a single part
+        self.assertEqual(self.service.run_agent.call_count, 7)
+        self.service._load_pages.assert_called_once_with(self.URL, 1, 16)
+        merge_prompt = self.prompts[-1]
+        self.assertIn('summary of Pages 1-8', merge_prompt)
+        self.assertIn('summary of Pages 9-16', merge_prompt)
+
+    def test_covered_range_needs_no_calls_or_download(self):
+        self.service._summarize_tree(self.URL, 1, 16)
+        self.service.run_agent.reset_mock()
+        self.service._load_pages.reset_mock()
+
+        summary = self.service._summarize_tree(self.URL, 9, 16)
+
+        self.assertEqual(summary, 'summary of Pages 9-16')
+        self.service.run_agent.assert_not_called()
+        self.service._load_pages.assert_not_called()
+
+    def test_extended_range_only_summarizes_new_pages(self):
+        self.service._summarize_tree(self.URL, 1, 16)
+        self.service.run_agent.reset_mock()
+        self.service._load_pages.reset_mock()
+        self.prompts.clear()
+
+        summary = self.service._summarize_tree(self.URL, 1, 20)
+
+        # One new leaf plus the overview of the two parts
+        self.assertEqual(self.service.run_agent.call_count, 2)
+        self.service._load_pages.assert_called_once_with(self.URL, 17, 20)
+        self.assertIn('--- Page 17 ---', self.prompts[0])
+        self.assertNotIn('--- Page 16 ---', self.prompts[0])
+        self.assertTrue(summary.startswith('overview\n\n## Pages 1-16\n\nsummary of Pages 1-16'))
+        self.assertTrue(summary.endswith('## Pages 17-20\n\nsummary of Pages 17-20'))
+
+    def test_cached_children_are_merged_without_resummarizing(self):
+        self.service._summarize_tree(self.URL, 1, 8)
+        self.service._summarize_tree(self.URL, 9, 16)
+        self.service.run_agent.reset_mock()
+        self.service._load_pages.reset_mock()
+
+        summary = self.service._summarize_tree(self.URL, 1, 16)
+
+        self.assertEqual(summary, 'summary of Pages 1-16')
+        self.assertEqual(self.service.run_agent.call_count, 1)
+        self.service._load_pages.assert_not_called()
+
+    def test_overview_is_cached_per_range(self):
+        self.service._summarize_tree(self.URL, 3, 12)
+        self.service.run_agent.reset_mock()
+
+        summary = self.service._summarize_tree(self.URL, 3, 12)
+
+        self.service.run_agent.assert_not_called()
+        self.assertTrue(summary.startswith('overview\n\n## Pages 3-4\n\n'))
+
+    def test_prompt_variant_change_invalidates_nodes(self):
+        self.service._summarize_tree(self.URL, 1, 16)
+        self.service.run_agent.reset_mock()
+
+        with mock.patch.object(config, 'SUMMARY_TREE_LEAF_WORDS', config.SUMMARY_TREE_LEAF_WORDS + 1):
+            self.service._summarize_tree(self.URL, 1, 16)
+
+        self.assertEqual(self.service.run_agent.call_count, 7)
+
+    def test_other_document_content_does_not_reuse_nodes(self):
+        self.service._summarize_tree(self.URL, 1, 16)
+        self.service.run_agent.reset_mock()
+        self.service.pdf_service.lookup_fresh_document.return_value = SimpleNamespace(
+            id=1, content_sha256='b' * 64, total_pages=40
+        )
+
+        self.service._summarize_tree(self.URL, 1, 16)
+
+        self.assertEqual(self.service.run_agent.call_count, 7)
+
+
+class SummarizeMapReduceTests(StubbedAgentMixin, SimpleTestCase):
+    """Long documents summarized per section, then an overview of the sections"""
+
+    def setUp(self):
+        self.service = self.make_service()
+        self.sections = [PackedContext(pages(n, n + 1), 1000, 6000) for n in (1, 3, 5, 7)]
+
+    def section_prompts(self) -> dict:
+        return {
+            _TITLE.search(prompt).group(1): prompt
+            for prompt in self.prompts if 'one section (' in prompt
+        }
+
+    def test_overview_first_then_sections_in_document_order(self):
+        # The first section answers last; the output order must not follow completion order
+        answer = self.answer
+
+        def slow_first(agent, prompt):
+            if '(Pages 1-2)' in prompt:
+                time.sleep(0.1)
+            return answer(agent, prompt)
+
+        self.service.run_agent.side_effect = slow_first
+
+        with mock.patch.object(config, 'SUMMARY_MAP_WORKERS', 4):
+            summary = self.service._summarize_map_reduce(self.sections, 4000)
+
+        self.assertEqual(summary.split("\n\n"), [
+            'overview',
+            '## Pages 1-2', 'summary of Pages 1-2',
+            '## Pages 3-4', 'summary of Pages 3-4',
+            '## Pages 5-6', 'summary of Pages 5-6',
+            '## Pages 7-8', 'summary of Pages 7-8',
+        ])
+        self.assertEqual(self.service.run_agent.call_count, 5)
+
+    def test_overview_is_written_from_section_summaries_in_order(self):
+        self.service._summarize_map_reduce(self.sections, 4000)
+
+        overview_prompt = self.prompts[-1]
+        positions = [overview_prompt.index(f"### Pages {n}-{n + 1}\nsummary of Pages {n}-{n + 1}") for n in (1, 3, 5, 7)]
+        self.assertEqual(positions, sorted(positions))
+        self.assertNotIn('--- Page', overview_prompt)
+
+    def test_sections_only_see_their_own_pages(self):
+        self.service._summarize_map_reduce(self.sections, 4000)
+
+        prompt = self.section_prompts()['Pages 3-4']
+        self.assertIn('--- Page 3 ---', prompt)
+        self.assertIn('--- Page 4 ---', prompt)
+        self.assertNotIn('--- Page 2 ---', prompt)
+        self.assertNotIn('--- Page 5 ---', prompt)
+
+    def test_section_words_split_the_minimum(self):
+        with mock.patch.object(config, 'SUMMARY_MIN_WORDS', 2000):
+            self.service._summarize_map_reduce(self.sections, 4000)
+
+        for prompt in self.section_prompts().values():
+            self.assertIn('about 500 words', prompt)
+
+    def test_section_words_have_a_floor(self):
+        with mock.patch.object(config, 'SUMMARY_MIN_WORDS', 100):
+            self.service._summarize_map_reduce(self.sections, 4000)
+
+        for prompt in self.section_prompts().values():
+            self.assertIn('about 150 words', prompt)
+
+    def test_long_documents_use_map_reduce(self):
+        with mock.patch.object(config, 'SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS', 3000):
+            summary = self.service._summarize_pages(pages(1, 8))
+
+        self.assertTrue(summary.startswith('overview\n\n## Pages 1-2'))
+        self.assertEqual(self.service.run_agent.call_count, 5)
+
+    def test_short_documents_use_one_call(self):
+        with mock.patch.object(config, 'SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS', 5000):
+            self.service._summarize_pages(pages(1, 4))
+
+        self.assertEqual(self.service.run_agent.call_count, 1)
+        self.assertNotIn('one section (', self.prompts[0])
@@ -0,0 +1,232 @@
+"""
+Vector Search Tests
+Hashing embedder, memory-mapped vector store and reciprocal rank fusion
+"""
+import os
+import shutil
+import tempfile
+import numpy as np
+from django.test import SimpleTestCase
+from chat_bot_api.infrastructure.search import (
+    HashingEmbedder,
+    TextChunk,
+    VectorIndex,
+    VectorStore,
+    build_embedder,
+    reciprocal_rank_fusion
+)
+
+
+def chunks(count: int) -> list:
+    return [TextChunk(i, f"chunk {i}", i + 1, i + 1, 0) for i in range(count)]
+
+
+class HashingEmbedderTests(SimpleTestCase):
+    """Feature-hashed sparse vectors"""
+
+    def setUp(self):
+        self.embedder = HashingEmbedder(dim=256)
+
+    def test_rows_are_unit_length_float32(self):
+        vectors = self.embedder.embed(["enzyme activity rises", "the budget meeting"])
+
+        self.assertEqual(vectors.shape, (2, 256))
+        self.assertEqual(vectors.dtype, np.float32)
+        np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), [1.0, 1.0], rtol=1e-6)
+
+    def test_stopword_only_text_gives_zero_row(self):
+        vectors = self.embedder.embed(["the and of", "enzyme"])
+
+        self.assertFalse(vectors[0].any())
+        self.assertAlmostEqual(float(np.linalg.norm(vectors[1])), 1.0, places=6)
+
+    def test_stable_across_instances(self):
+        text = ["Michaelis-Menten kinetics of enzymes"]
+
+        np.testing.assert_array_equal(
+            self.embedder.embed(text),
+            HashingEmbedder(dim=256).embed(text)
+        )
+
+    def test_shared_vocabulary_scores_higher(self):
+        query, related, unrelated = self.embedder.embed([
+            "enzyme reaction temperature",
+            "temperature changes the enzyme reaction rate",
+            "the committee approved the budget in march",
+        ])
+
+        self.assertGreater(float(query @ related), 0.5)
+        self.assertGreater(float(query @ related), float(query @ unrelated))
+
+    def test_bigrams_distinguish_word_order(self):
+        unigram = HashingEmbedder(dim=256, bigrams=False)
+        texts = ["heat shock protein", "protein shock heat"]
+
+        forward, backward = unigram.embed(texts)
+        self.assertAlmostEqual(float(forward @ backward), 1.0, places=5)
+
+        forward, backward = self.embedder.embed(texts)
+        self.assertLess(float(forward @ backward), 0.99)
+
+    def test_signature_reflects_parameters(self):
+        self.assertEqual(HashingEmbedder(dim=64).signature, 'hashing-64-bi')
+        self.assertEqual(HashingEmbedder(dim=64, bigrams=False).signature, 'hashing-64')
+
+    def test_build_embedder(self):
+        self.assertEqual(build_embedder('hashing', 128).dim, 128)
+        with self.assertRaises(ValueError):
+            build_embedder('missing', 128)
+
+
+class VectorIndexTests(SimpleTestCase):
+    """Batched cosine top-k"""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        vectors = rng.standard_normal((50, 16)).astype(np.float32)
+        self.vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        self.index = VectorIndex(self.vectors, chunks(50), 'test')
+
+    def test_matches_brute_force_across_batches(self):
+        queries = self.vectors[[3, 17]]
+
+        results = self.index.search(queries, top_k=5, batch_rows=7)
+
+        for query, result in zip(queries, results):
+            scores = self.vectors @ query
+            expected = [int(i) for i in np.argsort(-scores)[:5] if scores[i] > 0]
+            self.assertEqual([chunk.index for chunk, _ in result], expected)
+            for chunk, score in result:
+                self.assertAlmostEqual(score, float(scores[chunk.index]), places=5)
+
+    def test_single_query_vector(self):
+        result = self.index.search(self.vectors[9], top_k=1)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0][0][0].index, 9)
+
+    def test_drops_non_positive_scores(self):
+        vectors = np.array([[1, 0], [0, 1], [-1, 0]], dtype=np.float32)
+        index = VectorIndex(vectors, chunks(3), 'test')
+
+        result = index.search(np.array([1, 0], dtype=np.float32), top_k=3)[0]
+
+        self.assertEqual([chunk.index for chunk, _ in result], [0])
+
+    def test_empty_index(self):
+        index = VectorIndex(np.zeros((0, 16), dtype=np.float32), [], 'test')
+
+        self.assertEqual(index.search(self.vectors[:2], top_k=3), [[], []])
+
+
+class VectorStoreTests(SimpleTestCase):
+    """Raw float32 files plus JSON sidecars"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        self.store = VectorStore(self.directory, max_open=2)
+        self.vectors = np.eye(3, 4, dtype=np.float32)
+
+    def test_save_then_reload_is_memory_mapped(self):
+        self.store.save('doc', 'sig', chunks(3), self.vectors)
+
+        index = VectorStore(self.directory).load('doc', 'sig')
+
+        self.assertIsInstance(index.vectors, np.memmap)
+        np.testing.assert_array_equal(np.asarray(index.vectors), self.vectors)
+        self.assertEqual([chunk.text for chunk in index.chunks], ['chunk 0', 'chunk 1', 'chunk 2'])
+        self.assertEqual(index.dim, 4)
+        self.assertEqual(index.search(self.vectors[1], top_k=1)[0][0][0].index, 1)
+
+    def test_files_have_raw_layout(self):
+        self.store.save('doc', 'sig', chunks(3), self.vectors)
+
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            ['doc.sig.f32', 'doc.sig.json']
+        )
+        self.assertEqual(os.path.getsize(os.path.join(self.directory, 'doc.sig.f32')), 3 * 4 * 4)
+
+    def test_missing_index_and_other_signature(self):
+        self.store.save('doc', 'sig', chunks(3), self.vectors)
+
+        self.assertIsNone(self.store.load('other', 'sig'))
+        self.assertIsNone(self.store.load('doc', 'other-sig'))
+
+    def test_truncated_vectors_are_rejected(self):
+        self.store.save('doc', 'sig', chunks(3), self.vectors)
+        with open(os.path.join(self.directory, 'doc.sig.f32'), 'r+b') as f:
+            f.truncate(8)
+
+        with self.assertRaises(ValueError):
+            VectorStore(self.directory).load('doc', 'sig')
+
+    def test_row_count_must_match_chunks(self):
+        with self.assertRaises(ValueError):
+            self.store.save('doc', 'sig', chunks(2), self.vectors)
+
+    def test_empty_index_round_trip(self):
+        self.store.save('empty', 'sig', [], np.zeros((0, 4), dtype=np.float32))
+
+        index = VectorStore(self.directory).load('empty', 'sig')
+
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.dim, 4)
+
+    def test_resave_replaces_open_index(self):
+        self.store.save('doc', 'sig', chunks(3), self.vectors)
+        self.store.load('doc', 'sig')
+
+        index = self.store.save('doc', 'sig', chunks(3), self.vectors * 2)
+
+        np.testing.assert_array_equal(np.asarray(index.vectors), self.vectors * 2)
+
+    def test_open_indexes_are_bounded(self):
+        for name in ('a', 'b', 'c'):
+            self.store.save(name, 'sig', chunks(3), self.vectors)
+
+        self.assertEqual(list(self.store._open), ['b.sig.f32', 'c.sig.f32'])
+
+    def test_delete(self):
+        self.store.save('doc', 'sig', chunks(3), self.vectors)
+
+        self.store.delete('doc', 'sig')
+        self.store.delete('doc', 'sig')
+
+        self.assertIsNone(self.store.load('doc', 'sig'))
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+class ReciprocalRankFusionTests(SimpleTestCase):
+    """Rank-only merging of retriever results"""
+
+    def setUp(self):
+        self.chunks = chunks(4)
+
+    def test_agreement_beats_single_first_place(self):
+        a, b, c, d = self.chunks
+
+        fused = reciprocal_rank_fusion([[a, b, c], [d, b, c]])
+
+        self.assertEqual(fused[0], b)
+        self.assertEqual([chunk.index for chunk in fused], [1, 2, 0, 3])
+
+    def test_scores_follow_formula(self):
+        a, b, c, _ = self.chunks
+
+        # a: 1/2 + 1/4, b: 1/3 + 1/3, c: 1/4 + 1/2 -> a and c tie, index breaks it
+        fused = reciprocal_rank_fusion([[a, b, c], [c, b, a]], k=1)
+
+        self.assertEqual([chunk.index for chunk in fused], [0, 2, 1])
+
+    def test_chunks_appear_once(self):
+        a, b, _, _ = self.chunks
+
+        fused = reciprocal_rank_fusion([[a, b], [a], [b, a]])
+
+        self.assertEqual(len(fused), 2)
+
+    def test_empty_rankings(self):
+        self.assertEqual(reciprocal_rank_fusion([]), [])
+        self.assertEqual(reciprocal_rank_fusion([[], []]), [])
@@ -1,7 +1,9 @@
 from django.urls import path
-from .api.v1.views import conversation_handler, options_handler
+from .api.v1.views import conversation_handler, document_upload_handler, options_handler, search_handler
 
 urlpatterns = [
     path("conversation/", conversation_handler, name="chat_bot_message"),
-    path("options/", options_handler, name="chat_bot_options")
+    path("options/", options_handler, name="chat_bot_options"),
+    path("documents/upload/", document_upload_handler, name="chat_bot_document_upload"),
+    path("search/", search_handler, name="chat_bot_search")
 ]
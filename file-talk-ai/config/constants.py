@@ -88,6 +88,15 @@ class FileConstants:
     TEMP_FILE_PREFIX = 'temp_'
     PDF_FILE_EXTENSION = '.pdf'
 
+    # Download streaming
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    PDF_MAGIC_BYTES = b'%PDF-'
+    PDF_MAGIC_SEARCH_BYTES = 1024  # readers accept the signature anywhere in the first 1 KB
+
+    # Uploaded documents are addressed as upload://<sha256>
+    UPLOAD_URL_PREFIX = 'upload://'
+    UPLOAD_FIELD_NAME = 'file'
+
 
 # Agent Configuration
 class AgentConstants:
@@ -106,6 +115,23 @@ class AgentConstants:
     QUESTION_GEN_AGENT_ROLE = "PDF educational assistant"
 
 
+# Model Limits
+class ModelLimits:
+    """Context windows of the Groq models we use (tokens)"""
+    CONTEXT_WINDOWS = {
+        'llama-3.3-70b-versatile': 131072,
+        'llama-3.1-8b-instant': 131072,
+        'llama3-70b-8192': 8192,
+        'llama3-8b-8192': 8192,
+        'mixtral-8x7b-32768': 32768,
+        'gemma2-9b-it': 8192,
+    }
+    DEFAULT_CONTEXT_WINDOW = 8192
+
+    # Room for agent description, role, instructions and message framing
+    PROMPT_OVERHEAD_TOKENS = 512
+
+
 # Cache Keys
 class CacheKey:
     """Cache Key Prefixes"""
@@ -113,6 +139,7 @@ class CacheKey:
     KNOWLEDGE_BASE = 'knowledge_base'
     SUMMARY = 'summary'
     QUESTIONS = 'questions'
+    ANSWER = 'answer'
 
     @staticmethod
     def pdf_content_key(url: str) -> str:
@@ -121,6 +148,59 @@ class CacheKey:
         url_hash = hashlib.md5(url.encode()).hexdigest()
         return f"{CacheKey.PDF_CONTENT}:{url_hash}"
 
+    @staticmethod
+    def pdf_page_key(document_hash: str, page_number: int, engine: str = '') -> str:
+        """Generate cache key for the extracted text of one page (per extraction engine)"""
+        key = f"{CacheKey.pdf_content_key(document_hash)}:page:{page_number}"
+        return f"{key}:{engine}" if engine else key
+
+    @staticmethod
+    def pdf_page_tokens_key(document_hash: str, page_number: int, engine: str = '') -> str:
+        """Generate cache key for the estimated token count of one page"""
+        return f"{CacheKey.pdf_page_key(document_hash, page_number, engine)}:tokens"
+
+    @staticmethod
+    def search_index_key(document_hash: str, engine: str, chunk_tokens: int, overlap_tokens: int) -> str:
+        """Generate cache key for the BM25 index of a document (per extraction engine and chunking)"""
+        return f"{CacheKey.pdf_content_key(document_hash)}:bm25:{engine}:{chunk_tokens}:{overlap_tokens}"
+
+    @staticmethod
+    def summary_node_key(
+        document_hash: str,
+        engine: str,
+        variant: str,
+        level: int,
+        first_page: int,
+        last_page: int
+    ) -> str:
+        """Generate cache key for the summary of one summary tree node (per engine and prompt variant)"""
+        return f"{CacheKey.SUMMARY}:{document_hash}:{engine}:{variant}:{level}:{first_page}-{last_page}"
+
+    @staticmethod
+    def summary_overview_key(document_hash: str, engine: str, variant: str, first_page: int, last_page: int) -> str:
+        """Generate cache key for the overview of a summarized page range"""
+        return f"{CacheKey.SUMMARY}:{document_hash}:{engine}:{variant}:overview:{first_page}-{last_page}"
+
+    @staticmethod
+    def response_key(kind: str, document_hash: str, variant: str, first_page: int, last_page: int) -> str:
+        """Generate cache key for a complete response (SUMMARY or QUESTIONS) over a page range"""
+        return f"{kind}:{document_hash}:response:{variant}:{first_page}-{last_page}"
+
+    @staticmethod
+    def answer_key(document_hash: str, variant: str, generation: int, question_hash: str) -> str:
+        """Generate cache key for the answer to a normalized question about a document"""
+        return f"{CacheKey.ANSWER}:{document_hash}:{variant}:{generation}:{question_hash}"
+
+    @staticmethod
+    def answer_generation_key(document_hash: str) -> str:
+        """Generate cache key for the invalidation counter of a document's answers"""
+        return f"{CacheKey.ANSWER}:{document_hash}:generation"
+
+    @staticmethod
+    def pdf_meta_key(document_hash: str) -> str:
+        """Generate cache key for document metadata (page count, etc.)"""
+        return f"{CacheKey.pdf_content_key(document_hash)}:meta"
+
     @staticmethod
     def knowledge_base_key(url: str) -> str:
         """Generate cache key for knowledge base"""
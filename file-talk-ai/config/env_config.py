@@ -42,6 +42,7 @@ class EnvironmentConfig:
         self.GROQ_MODEL_ID: str = os.getenv('GROQ_MODEL_ID', 'llama-3.3-70b-versatile')
         self.AI_TEMPERATURE: float = float(os.getenv('AI_TEMPERATURE', '0.7'))
         self.AI_MAX_TOKENS: int = int(os.getenv('AI_MAX_TOKENS', '8000'))
+        self.PROMPT_MAX_TOKENS: int = int(os.getenv('PROMPT_MAX_TOKENS', '24000'))  # 0 = model context window
 
         # PDF Processing Configuration
         self.PDF_DOWNLOAD_TIMEOUT: int = int(os.getenv('PDF_DOWNLOAD_TIMEOUT', '30'))
@@ -49,17 +50,112 @@ class EnvironmentConfig:
         self.PDF_DEFAULT_MIN_PAGE: int = int(os.getenv('PDF_DEFAULT_MIN_PAGE', '1'))
         self.PDF_DEFAULT_MAX_PAGE: int = int(os.getenv('PDF_DEFAULT_MAX_PAGE', '5'))
         self.PDF_STORAGE_PATH: str = os.getenv('PDF_STORAGE_PATH', 'media/pdfs')
+        self.PDF_DOWNLOAD_MODE: str = os.getenv('PDF_DOWNLOAD_MODE', 'file')  # 'file' or 'memory'
+
+        # PDF Extraction Configuration
+        self.PDF_EXTRACTION_WORKERS: int = int(os.getenv('PDF_EXTRACTION_WORKERS', '0'))  # 0 = one per CPU
+        self.PDF_PARALLEL_MIN_PAGES: int = int(os.getenv('PDF_PARALLEL_MIN_PAGES', '24'))
+        self.PDF_PAGE_ERROR_POLICY: str = os.getenv('PDF_PAGE_ERROR_POLICY', 'skip')  # 'skip', 'placeholder' or 'raise'
+        self.PDF_EXTRACTION_START_METHOD: str = os.getenv('PDF_EXTRACTION_START_METHOD', 'spawn')
+        self.PDF_EXTRACTION_ENGINE: str = os.getenv('PDF_EXTRACTION_ENGINE', 'auto')  # 'fast', 'structured' or 'auto'
+        self.PDF_SKIP_TEXTLESS_PAGES: bool = os.getenv('PDF_SKIP_TEXTLESS_PAGES', 'True').lower() == 'true'
+
+        # Text Normalization Configuration
+        self.TEXT_NORMALIZATION_ENABLED: bool = os.getenv('TEXT_NORMALIZATION_ENABLED', 'True').lower() == 'true'
+        self.TEXT_BOILERPLATE_MIN_PAGES: int = int(os.getenv('TEXT_BOILERPLATE_MIN_PAGES', '3'))
+        self.TEXT_BOILERPLATE_PAGE_RATIO: float = float(os.getenv('TEXT_BOILERPLATE_PAGE_RATIO', '0.5'))
+        self.TEXT_BOILERPLATE_EDGE_LINES: int = int(os.getenv('TEXT_BOILERPLATE_EDGE_LINES', '2'))
+
+        # PDF Download Cache Configuration
+        self.PDF_DOWNLOAD_CACHE_ENABLED: bool = os.getenv('PDF_DOWNLOAD_CACHE_ENABLED', 'True').lower() == 'true'
+        self.PDF_DOWNLOAD_CACHE_PATH: str = os.getenv(
+            'PDF_DOWNLOAD_CACHE_PATH', os.path.join(self.PDF_STORAGE_PATH, 'cache')
+        )
+        self.PDF_DOWNLOAD_CACHE_FRESHNESS: int = int(os.getenv('PDF_DOWNLOAD_CACHE_FRESHNESS', '60'))
+
+        # HTTP Client Configuration
+        self.HTTP_POOL_CONNECTIONS: int = int(os.getenv('HTTP_POOL_CONNECTIONS', '10'))  # hosts kept alive
+        self.HTTP_POOL_MAXSIZE: int = int(os.getenv('HTTP_POOL_MAXSIZE', '10'))  # connections per host
+        self.HTTP_CONNECT_TIMEOUT: float = float(os.getenv('HTTP_CONNECT_TIMEOUT', '5'))
+
+        # LLM Client Configuration
+        self.GROQ_POOL_MAX_CONNECTIONS: int = int(os.getenv('GROQ_POOL_MAX_CONNECTIONS', '20'))
+        self.GROQ_POOL_KEEPALIVE_CONNECTIONS: int = int(os.getenv('GROQ_POOL_KEEPALIVE_CONNECTIONS', '10'))
+        self.GROQ_KEEPALIVE_EXPIRY: float = float(os.getenv('GROQ_KEEPALIVE_EXPIRY', '30'))
+        self.GROQ_TIMEOUT: float = float(os.getenv('GROQ_TIMEOUT', '60'))
+        self.GROQ_MAX_RETRIES: int = int(os.getenv('GROQ_MAX_RETRIES', '2'))
+
+        # Single-Flight Configuration
+        self.SINGLE_FLIGHT_FILE_LOCKS: bool = os.getenv('SINGLE_FLIGHT_FILE_LOCKS', 'True').lower() == 'true'
+        self.SINGLE_FLIGHT_LOCK_PATH: str = os.getenv(
+            'SINGLE_FLIGHT_LOCK_PATH', os.path.join(self.PDF_STORAGE_PATH, 'locks')
+        )
+        self.SINGLE_FLIGHT_LOCK_TIMEOUT: float = float(os.getenv('SINGLE_FLIGHT_LOCK_TIMEOUT', '120'))
+        self.SINGLE_FLIGHT_RESPONSE_TIMEOUT: float = float(os.getenv('SINGLE_FLIGHT_RESPONSE_TIMEOUT', '900'))
+
+        # Document Registry Configuration
+        self.DOCUMENT_REGISTRY_ENABLED: bool = os.getenv('DOCUMENT_REGISTRY_ENABLED', 'True').lower() == 'true'
+        self.DOCUMENT_REGISTRY_FRESHNESS: int = int(os.getenv('DOCUMENT_REGISTRY_FRESHNESS', '300'))
+
+        # PDF Partial Fetch Configuration
+        self.PDF_PARTIAL_FETCH_ENABLED: bool = os.getenv('PDF_PARTIAL_FETCH_ENABLED', 'False').lower() == 'true'
+        self.PDF_PARTIAL_FETCH_MAX_PAGES: int = int(os.getenv('PDF_PARTIAL_FETCH_MAX_PAGES', '20'))
 
         # Summary Configuration
         self.SUMMARY_MIN_WORDS: int = int(os.getenv('SUMMARY_MIN_WORDS', '8000'))
+        self.SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS: int = int(os.getenv('SUMMARY_MAP_REDUCE_THRESHOLD_TOKENS', '16000'))  # 0 = never
+        self.SUMMARY_SECTION_TOKENS: int = int(os.getenv('SUMMARY_SECTION_TOKENS', '6000'))
+        self.SUMMARY_MAP_WORKERS: int = int(os.getenv('SUMMARY_MAP_WORKERS', '4'))
+        self.SUMMARY_OVERVIEW_WORDS: int = int(os.getenv('SUMMARY_OVERVIEW_WORDS', '500'))
+        self.SUMMARY_TREE_ENABLED: bool = os.getenv('SUMMARY_TREE_ENABLED', 'False').lower() == 'true'
+        self.SUMMARY_TREE_LEAF_PAGES: int = int(os.getenv('SUMMARY_TREE_LEAF_PAGES', '8'))
+        self.SUMMARY_TREE_FANOUT: int = int(os.getenv('SUMMARY_TREE_FANOUT', '4'))
+        self.SUMMARY_TREE_LEAF_WORDS: int = int(os.getenv('SUMMARY_TREE_LEAF_WORDS', '300'))
+        self.SUMMARY_TREE_NODE_WORDS: int = int(os.getenv('SUMMARY_TREE_NODE_WORDS', '600'))
 
         # Question Generation Configuration
         self.QUESTIONS_COUNT: int = int(os.getenv('QUESTIONS_COUNT', '20'))
+        self.QUESTIONS_SECTIONED_THRESHOLD_TOKENS: int = int(os.getenv('QUESTIONS_SECTIONED_THRESHOLD_TOKENS', '12000'))  # 0 = never
+        self.QUESTIONS_SECTION_TOKENS: int = int(os.getenv('QUESTIONS_SECTION_TOKENS', '6000'))
+        self.QUESTIONS_MAP_WORKERS: int = int(os.getenv('QUESTIONS_MAP_WORKERS', '4'))
+        self.QUESTIONS_DEDUPE_THRESHOLD: float = float(os.getenv('QUESTIONS_DEDUPE_THRESHOLD', '0.5'))
+
+        # Question Answering Retrieval Configuration
+        self.QA_RETRIEVAL_ENABLED: bool = os.getenv('QA_RETRIEVAL_ENABLED', 'True').lower() == 'true'
+        self.QA_RETRIEVAL_TOP_K: int = int(os.getenv('QA_RETRIEVAL_TOP_K', '8'))
+        self.QA_CHUNK_TOKENS: int = int(os.getenv('QA_CHUNK_TOKENS', '300'))
+        self.QA_CHUNK_OVERLAP_TOKENS: int = int(os.getenv('QA_CHUNK_OVERLAP_TOKENS', '60'))
+        self.QA_INDEX_CACHE_MAX_BYTES: int = int(os.getenv('QA_INDEX_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+        self.QA_RETRIEVAL_METHOD: str = os.getenv('QA_RETRIEVAL_METHOD', 'bm25')  # 'bm25', 'vector' or 'hybrid'
+        self.QA_EMBEDDER: str = os.getenv('QA_EMBEDDER', 'hashing')
+        self.QA_EMBEDDING_DIM: int = int(os.getenv('QA_EMBEDDING_DIM', '1024'))
+        self.VECTOR_STORE_PATH: str = os.getenv('VECTOR_STORE_PATH', 'media/vectors')
+        self.ANSWER_CACHE_ENABLED: bool = os.getenv('ANSWER_CACHE_ENABLED', 'True').lower() == 'true'
+        self.ANSWER_CACHE_TTL: int = int(os.getenv('ANSWER_CACHE_TTL', '86400'))
+        self.ANSWER_CACHE_SIMILARITY_THRESHOLD: float = float(os.getenv('ANSWER_CACHE_SIMILARITY_THRESHOLD', '0.85'))
+        self.ANSWER_CACHE_MAX_ENTRIES: int = int(os.getenv('ANSWER_CACHE_MAX_ENTRIES', '256'))
+        self.ANSWER_CACHE_MAX_DOCUMENTS: int = int(os.getenv('ANSWER_CACHE_MAX_DOCUMENTS', '128'))
+        self.SESSION_CONTEXT_ENABLED: bool = os.getenv('SESSION_CONTEXT_ENABLED', 'True').lower() == 'true'
+        self.SESSION_CONTEXT_IDLE_TTL: int = int(os.getenv('SESSION_CONTEXT_IDLE_TTL', '1800'))
+        self.SESSION_CONTEXT_MAX_BYTES: int = int(os.getenv('SESSION_CONTEXT_MAX_BYTES', str(256 * 1024 * 1024)))
+
+        # Full-Text Search Configuration
+        self.FULLTEXT_INDEX_ENABLED: bool = os.getenv('FULLTEXT_INDEX_ENABLED', 'True').lower() == 'true'
+        self.FULLTEXT_INDEX_PATH: str = os.getenv('FULLTEXT_INDEX_PATH', 'media/search/fulltext.sqlite3')
+        self.FULLTEXT_INDEX_BATCH_PAGES: int = int(os.getenv('FULLTEXT_INDEX_BATCH_PAGES', '500'))
 
         # Cache Configuration
         self.CACHE_ENABLED: bool = os.getenv('CACHE_ENABLED', 'False').lower() == 'true'
         self.CACHE_TTL: int = int(os.getenv('CACHE_TTL', '3600'))
         self.REDIS_URL: Optional[str] = os.getenv('REDIS_URL')
+        self.CACHE_MEMORY_MAX_BYTES: int = int(os.getenv('CACHE_MEMORY_MAX_BYTES', str(64 * 1024 * 1024)))
+        self.CACHE_DISK_PATH: str = os.getenv('CACHE_DISK_PATH', 'media/cache')
+        self.CACHE_DISK_MAX_BYTES: int = int(os.getenv('CACHE_DISK_MAX_BYTES', str(1024 * 1024 * 1024)))  # 0 = unbounded
+        self.RESULT_CACHE_PATH: str = os.getenv('RESULT_CACHE_PATH', 'media/cache/results')
+        self.RESULT_CACHE_TTL: int = int(os.getenv('RESULT_CACHE_TTL', str(7 * 24 * 3600)))
+        self.RESULT_CACHE_DISK_MAX_BYTES: int = int(os.getenv('RESULT_CACHE_DISK_MAX_BYTES', str(512 * 1024 * 1024)))  # 0 = unbounded
+        self.RESPONSE_CACHE_ENABLED: bool = os.getenv('RESPONSE_CACHE_ENABLED', 'True').lower() == 'true'
+        self.RESULT_CACHE_MEMORY_MAX_BYTES: int = int(os.getenv('RESULT_CACHE_MEMORY_MAX_BYTES', str(16 * 1024 * 1024)))
 
         # Storage Configuration
         self.STORAGE_BACKEND: str = os.getenv('STORAGE_BACKEND', 'local')  # 'local' or 's3'
@@ -67,6 +163,18 @@ class EnvironmentConfig:
         self.AWS_SECRET_ACCESS_KEY: Optional[str] = os.getenv('AWS_SECRET_ACCESS_KEY')
         self.AWS_STORAGE_BUCKET_NAME: Optional[str] = os.getenv('AWS_STORAGE_BUCKET_NAME')
         self.AWS_S3_REGION_NAME: Optional[str] = os.getenv('AWS_S3_REGION_NAME', 'us-east-1')
+        self.AWS_S3_ENDPOINT_URL: Optional[str] = os.getenv('AWS_S3_ENDPOINT_URL')  # S3-compatible services
+        self.STORAGE_LOCAL_PATH: str = os.getenv('STORAGE_LOCAL_PATH', os.path.join(self.PDF_STORAGE_PATH, 'store'))
+        self.STORAGE_SHARD_DEPTH: int = int(os.getenv('STORAGE_SHARD_DEPTH', '2'))
+        self.STORAGE_S3_PREFIX: str = os.getenv('STORAGE_S3_PREFIX', 'pdfs/')
+        self.STORAGE_S3_PART_SIZE: int = int(os.getenv('STORAGE_S3_PART_SIZE', str(8 * 1024 * 1024)))
+
+        # Storage Janitor Configuration
+        self.STORAGE_JANITOR_INTERVAL: int = int(os.getenv('STORAGE_JANITOR_INTERVAL', '0'))  # 0 = no periodic sweeps
+        self.STORAGE_JANITOR_MAX_BYTES: int = int(os.getenv('STORAGE_JANITOR_MAX_BYTES', str(1024 * 1024 * 1024)))
+        self.STORAGE_JANITOR_TTL: int = int(os.getenv('STORAGE_JANITOR_TTL', str(7 * 24 * 3600)))
+        self.STORAGE_JANITOR_POLICY: str = os.getenv('STORAGE_JANITOR_POLICY', 'lru')  # 'lru' or 'lfu'
+        self.STORAGE_JANITOR_GRACE: int = int(os.getenv('STORAGE_JANITOR_GRACE', '300'))
 
         # Logging Configuration
         self.LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')